@@ -36,6 +36,18 @@ US_MARKET_EXCHANGE = "AMEX"  # [FIX] SOXL 거래소: AMEX (주문/거래 API용
 US_MARKET_CURRENCY = "USD"  # 거래 통화
 US_MARKET_TIMEZONE = "America/New_York"  # 미국 동부 시간대
 
+# [v4.3] 시세 조회 거래소 사전 등록 (시세 API 3글자 코드: NAS, AMS, NYS)
+# 등록된 종목은 첫 조회부터 해당 거래소로 조회하고, 주문 거래소 코드도 여기서 결정 (AMS → AMEX)
+# 형식: KIS_EXCHANGE_PRELOAD=SOXL:AMS,TQQQ:NAS
+KIS_EXCHANGE_PRELOAD = {
+    ticker.strip().upper(): excd.strip().upper()
+    for ticker, _, excd in (
+        item.partition(":") for item in os.getenv("KIS_EXCHANGE_PRELOAD", "SOXL:AMS").split(",")
+    )
+    if ticker.strip()
+}
+KIS_EXCHANGE_CACHE_TTL = float(os.getenv("KIS_EXCHANGE_CACHE_TTL", "86400"))  # 조회 성공 거래소 캐시 유지 시간 (초)
+
 # 그리드 파라미터 (기본값, Excel에서 오버라이드 가능)
 DEFAULT_SEED_RATIO = 0.05      # 5% 시드 비율
 DEFAULT_BUY_INTERVAL = 0.005   # 0.5% 매수 간격
@@ -89,6 +101,63 @@ KIS_ACCOUNT_NO = os.getenv("KIS_ACCOUNT_NO", os.getenv("KIWOOM_ACCOUNT_NO", ""))
 KIS_API_MODE = os.getenv("KIS_API_MODE", "REAL")  # REAL: 실전, PAPER: 모의투자
 KIS_API_BASE_URL = "https://openapi.koreainvestment.com:9443" if KIS_API_MODE == "REAL" else "https://openapivts.koreainvestment.com:29443"
 
+# [v4.3] KIS Access Token 백그라운드 갱신 (요청 경로에서 OAuth 대기 제거)
+KIS_TOKEN_REFRESH_AHEAD_MINUTES = float(os.getenv("KIS_TOKEN_REFRESH_AHEAD_MINUTES", "60"))  # 만료 몇 분 전 갱신
+KIS_TOKEN_RETRY_SECONDS = float(os.getenv("KIS_TOKEN_RETRY_SECONDS", "60"))                  # 갱신 실패 시 재시도 간격 (KIS 발급 분당 1회)
+
+# [v4.3] 주문 Hashkey 모드
+# ALWAYS: 주문마다 /uapi/hashkey 발급 (기존 동작)
+# CACHE: 같은 주문 내용이면 이전 hashkey 재사용
+# SKIP: hashkey 생략 (KIS 주문 API 선택 항목) → 주문 왕복 1회 절감
+KIS_HASHKEY_MODE = os.getenv("KIS_HASHKEY_MODE", "ALWAYS").upper()
+
+# [v4.3] KIS API 요청 속도 제한 (Token Bucket, 주문 → 체결 → 시세 → 잔고 우선순위)
+# 1초 구간 최대 요청 수 ≈ 초당 충전 수 + 최대 연속 요청 수 → KIS 초당 한도 이하로 설정
+KIS_RATE_LIMIT_PER_SEC = float(os.getenv("KIS_RATE_LIMIT_PER_SEC", "5"))  # 초당 토큰 충전 수
+KIS_RATE_LIMIT_BURST = int(os.getenv("KIS_RATE_LIMIT_BURST", "1"))        # 최대 연속 요청 수
+
+# [v4.3] KIS REST 연결 풀 설정 (keep-alive 세션 공유)
+KIS_HTTP_POOL_SIZE = int(os.getenv("KIS_HTTP_POOL_SIZE", "4"))              # 최대 동시 연결 수
+KIS_HTTP_CONNECT_RETRIES = int(os.getenv("KIS_HTTP_CONNECT_RETRIES", "2"))  # 연결 실패 재시도 (전 메서드)
+KIS_HTTP_STATUS_RETRIES = int(os.getenv("KIS_HTTP_STATUS_RETRIES", "2"))    # 5xx 재시도 (GET만)
+KIS_HTTP_BACKOFF = float(os.getenv("KIS_HTTP_BACKOFF", "0.3"))              # 재시도 대기 배수 (초)
+KIS_HTTP_TIMEOUTS = {                                                        # 엔드포인트 종류별 타임아웃 (초)
+    "auth": float(os.getenv("KIS_TIMEOUT_AUTH", "10")),        # 토큰/Approval 발급
+    "order": float(os.getenv("KIS_TIMEOUT_ORDER", "10")),      # Hashkey/주문
+    "quote": float(os.getenv("KIS_TIMEOUT_QUOTE", "5")),       # 시세
+    "account": float(os.getenv("KIS_TIMEOUT_ACCOUNT", "10")),  # 잔고/매수가능/체결내역
+}
+
+# [v4.3] 비동기 HTTP 동시 조회 (aiohttp 설치 시, 초기화/잔고 동기화의 시세·예수금 조회를 동시에 수행)
+KIS_ASYNC_HTTP = os.getenv("KIS_ASYNC_HTTP", "true").lower() == "true"
+
+# [v4.3] 실시간 체결통보 (WebSocket H0GSCNI0, STREAM 모드에서 시세와 같은 연결로 구독)
+# 체결 대기는 통보를 먼저 기다리고, 통보가 없으면 REST 체결내역 조회로 확인 (pycryptodome 필요)
+KIS_HTS_ID = os.getenv("KIS_HTS_ID", "")                                                   # 체결통보 구독 키 (HTS ID)
+KIS_FILL_NOTICE_ENABLED = os.getenv("KIS_FILL_NOTICE_ENABLED", "true").lower() == "true"  # 체결통보 구독 여부
+
+# [v4.3] 당일 체결내역 일괄 조회 캐시 (체결 대기 주문들이 ccnl 조회 1회를 공유, 체결 확인 간격보다 짧게)
+KIS_FILL_STATUS_CACHE_TTL = float(os.getenv("KIS_FILL_STATUS_CACHE_TTL", "1.5"))
+
+# [v4.3] Excel 저장 최소 간격 (초, 백그라운드 저장 스레드가 이 간격 안의 갱신을 병합해 한 번 저장)
+EXCEL_SAVE_MIN_INTERVAL = float(os.getenv("EXCEL_SAVE_MIN_INTERVAL", "5.0"))
+
+# [v4.3] 운용 히스토리 (전체 기록은 JSONL, 시트 2에는 최근 구간만 유지 - export_history.py로 전체 보기 생성)
+HISTORY_LOG_DIR = PROJECT_ROOT / os.getenv("HISTORY_LOG_DIR", "logs/history")                # 상대 경로는 프로젝트 기준
+HISTORY_LOG_MAX_BYTES = int(os.getenv("HISTORY_LOG_MAX_BYTES", str(10 * 1024 * 1024)))  # 파일당 최대 크기
+HISTORY_SHEET_MAX_ROWS = int(os.getenv("HISTORY_SHEET_MAX_ROWS", "500"))                # 0이면 제한 없음
+
+# [v4.3] SQLite 상태 저장소 (Tier 상태/주문/체결, WAL 모드 - Excel은 주기적 보기)
+# 재시작 시 보유 포지션 / 진행 중 주문 / Tier 1 기준가를 이 저장소에서 자동 복구
+STATE_DB_ENABLED = os.getenv("STATE_DB_ENABLED", "true").lower() == "true"
+STATE_DB_PATH = PROJECT_ROOT / os.getenv("STATE_DB_PATH", "data/phoenix_state.db")            # 상대 경로는 프로젝트 기준
+
+# [v4.3] 시세 수신 방식
+# POLL: REST 폴링 (Excel B22 간격, 기본 40초)
+# STREAM: WebSocket 실시간 시세로 즉시 처리 + 시세가 끊기면 REST 조회 (Watchdog)
+PRICE_FEED_MODE = os.getenv("PRICE_FEED_MODE", "POLL").upper()
+STREAM_STALE_SECONDS = float(os.getenv("STREAM_STALE_SECONDS", "15"))  # 이 시간 동안 실시간 시세 없으면 REST 조회
+
 # 경고 설정
 WARNING_BALANCE_THRESHOLD = 100.0  # 잔고 경고 임계값 (USD)
 WARNING_POSITION_COUNT = 200       # 포지션 수 경고 임계값
@@ -136,6 +205,45 @@ def validate_config():
     if exchange not in ["AMEX", "NASD", "NYSE"]:
         errors.append(f"지원하지 않는 거래소 코드: {exchange}. AMEX, NASD, NYSE만 지원합니다.")
 
+    # [v4.3] 거래소 사전 등록 검증
+    for ticker, excd in KIS_EXCHANGE_PRELOAD.items():
+        if excd not in ["NAS", "AMS", "NYS"]:
+            errors.append(f"지원하지 않는 시세 거래소 코드: {ticker}:{excd}. NAS, AMS, NYS만 지원합니다.")
+
+    # [v4.3] 토큰 갱신 설정 검증
+    if KIS_TOKEN_REFRESH_AHEAD_MINUTES <= 5:
+        errors.append(f"KIS_TOKEN_REFRESH_AHEAD_MINUTES는 5분보다 커야 합니다: {KIS_TOKEN_REFRESH_AHEAD_MINUTES}")
+
+    # [v4.3] Hashkey 모드 검증
+    if KIS_HASHKEY_MODE not in ["ALWAYS", "CACHE", "SKIP"]:
+        errors.append(f"지원하지 않는 Hashkey 모드: {KIS_HASHKEY_MODE}. ALWAYS, CACHE, SKIP만 지원합니다.")
+
+    # [v4.3] 요청 속도 제한 검증
+    if KIS_RATE_LIMIT_PER_SEC <= 0:
+        errors.append(f"KIS_RATE_LIMIT_PER_SEC는 0보다 커야 합니다: {KIS_RATE_LIMIT_PER_SEC}")
+    if KIS_RATE_LIMIT_BURST < 1:
+        errors.append(f"KIS_RATE_LIMIT_BURST는 1 이상이어야 합니다: {KIS_RATE_LIMIT_BURST}")
+
+    # [v4.3] 연결 풀 설정 검증
+    if KIS_HTTP_POOL_SIZE < 1:
+        errors.append(f"KIS_HTTP_POOL_SIZE는 1 이상이어야 합니다: {KIS_HTTP_POOL_SIZE}")
+    if min(KIS_HTTP_TIMEOUTS.values()) <= 0:
+        errors.append(f"KIS 타임아웃은 0보다 커야 합니다: {KIS_HTTP_TIMEOUTS}")
+
+    # [v4.3] 시세 수신 방식 검증
+    if PRICE_FEED_MODE not in ["POLL", "STREAM"]:
+        errors.append(f"지원하지 않는 시세 수신 방식: {PRICE_FEED_MODE}. POLL, STREAM만 지원합니다.")
+    if KIS_FILL_STATUS_CACHE_TTL < 0:
+        errors.append(f"KIS_FILL_STATUS_CACHE_TTL은 0 이상이어야 합니다: {KIS_FILL_STATUS_CACHE_TTL}")
+    if EXCEL_SAVE_MIN_INTERVAL < 0:
+        errors.append(f"EXCEL_SAVE_MIN_INTERVAL은 0 이상이어야 합니다: {EXCEL_SAVE_MIN_INTERVAL}")
+    if HISTORY_LOG_MAX_BYTES <= 0:
+        errors.append(f"HISTORY_LOG_MAX_BYTES는 0보다 커야 합니다: {HISTORY_LOG_MAX_BYTES}")
+    if HISTORY_SHEET_MAX_ROWS < 0:
+        errors.append(f"HISTORY_SHEET_MAX_ROWS는 0 이상이어야 합니다: {HISTORY_SHEET_MAX_ROWS}")
+    if STREAM_STALE_SECONDS <= 0:
+        errors.append(f"STREAM_STALE_SECONDS는 0보다 커야 합니다: {STREAM_STALE_SECONDS}")
+
     if errors:
         return False, errors
     return True, []
@@ -157,6 +265,7 @@ if __name__ == "__main__":
         print(f"거래소: {os.getenv('US_MARKET_EXCHANGE', US_MARKET_EXCHANGE)}")
         print(f"통화: {os.getenv('US_MARKET_CURRENCY', US_MARKET_CURRENCY)}")
         print(f"API 모드: {KIS_API_MODE}")
+        print(f"시세 수신: {PRICE_FEED_MODE}")
         print(f"버전: {VERSION} ({VERSION_DATE})")
     else:
         print("[ERROR] 설정 오류 발견:")
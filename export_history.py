@@ -0,0 +1,30 @@
+"""
+Phoenix Trading System v4.3 - 운용 히스토리 전체 내보내기
+
+Excel 시트 2 "02_운용로그_히스토리"에는 최근 구간(HISTORY_SHEET_MAX_ROWS)만 남으므로,
+전체 기록이 필요하면 JSONL 히스토리(HISTORY_LOG_DIR)에서 같은 컬럼의 xlsx를 만든다.
+
+사용 예:
+    python export_history.py                         # history_full.xlsx
+    python export_history.py out.xlsx --since 2026-01-01
+"""
+import argparse
+
+import config
+from src.history_log import HistoryLog, export_history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="운용 히스토리 전체를 xlsx로 내보내기")
+    parser.add_argument("output", nargs="?", default="history_full.xlsx", help="출력 파일 (.xlsx)")
+    parser.add_argument("--since", help="이 날짜(YYYY-MM-DD) 이후만")
+    parser.add_argument("--dir", default=str(config.HISTORY_LOG_DIR), help="히스토리 폴더")
+    args = parser.parse_args()
+
+    history = HistoryLog(args.dir)
+    count = export_history(history, args.output, since=args.since)
+    print(f"[OK] 히스토리 {count}행 내보내기 완료: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
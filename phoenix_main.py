@@ -7,11 +7,13 @@ Excel + EXE 독립 실행 모드
 import os
 import sys
 import time
+import asyncio
 import signal
 import logging
 from enum import Enum
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 
 # 프로젝트 루트를 Python 경로에 추가 (PyInstaller 빌드 시에도 동작)
 if getattr(sys, 'frozen', False):
@@ -24,9 +26,17 @@ else:
 sys.path.insert(0, str(BASE_DIR))
 
 from src.excel_bridge import ExcelBridge
+from src.excel_writer import ExcelWriter
+from src.history_log import HistoryLog
+from src.state_store import StateStore
+from src.state_recovery import LiveOrder, RecoveryPlan, load_recovered_state, reconcile
 from src.grid_engine_v4_state_machine import GridEngineV4 as GridEngine
 from src.kis_rest_adapter import KisRestAdapter
+from src.kis_async_adapter import AsyncKisRunner, AIOHTTP_AVAILABLE
+from src.fill_registry import FillRegistry
+from src.order_manager import OrderManager, OrderOutcome
 from src.telegram_notifier import TelegramNotifier
+from src.price_mailbox import TickMailbox, TickBatch
 from src.models import GridSettings, SystemState
 import config
 
@@ -90,6 +100,11 @@ class PhoenixTradingSystem:
         self.kis_adapter = None
         self.telegram = None
         self.settings = None
+        self.order_manager = None
+        self.excel_writer = None  # [v4.3] Excel 백그라운드 저장
+        self.history_log = None   # [v4.3] 운용 히스토리 전체 기록 (JSONL)
+        self.state_store = None   # [v4.3] SQLite 상태 저장소 (Tier/주문/체결)
+        self.async_http = None    # [v4.3] 비동기 HTTP 클라이언트 (최초 동시 조회 시 생성, 종료까지 유지)
 
         # 통계
         self.daily_buy_count = 0
@@ -286,7 +301,7 @@ class PhoenixTradingSystem:
         # 2. Excel 설정 로드
         try:
             logger.info("Excel 설정 로드 중...")
-            self.excel_bridge = ExcelBridge(self.excel_file)
+            self.excel_bridge = ExcelBridge(self.excel_file, history_window=config.HISTORY_SHEET_MAX_ROWS)
             self.settings = self.excel_bridge.load_settings()
 
             logger.info(f"  - 계좌번호: {self.settings.kis_account_no or self.settings.account_no}")
@@ -351,9 +366,12 @@ class PhoenixTradingSystem:
 
             logger.info("[OK] KIS API 로그인 성공")
 
-            # 7. 초기 시세 조회 (실시간 시세 또는 전일 종가)
-            logger.info(f"{self.settings.ticker} 초기 시세 조회 중...")
-            price_data = self.kis_adapter.get_overseas_price(self.settings.ticker)
+            # [v4.3] 토큰 만료 전 백그라운드 갱신 (주문/시세 요청이 OAuth를 기다리지 않도록)
+            self.kis_adapter.token_manager.start()
+
+            # 7. 초기 시세 + USD 예수금 + 보유 주식 조회 ([v4.3] aiohttp 있으면 동시 조회)
+            logger.info(f"{self.settings.ticker} 초기 시세 / USD 예수금 / 보유 주식 조회 중...")
+            price_data, balance = self._fetch_price_and_cash(include_holdings=True)
 
             if not price_data:
                 logger.error(f"{self.settings.ticker} 시세 조회 실패!")
@@ -367,10 +385,7 @@ class PhoenixTradingSystem:
             logger.info(f"  - 고가: ${price_data['high']:.2f}")
             logger.info(f"  - 저가: ${price_data['low']:.2f}")
 
-            # 8. USD 예수금 조회 (매수가능금액조회 API)
-            logger.info("USD 예수금 조회 중...")
-            balance = self.kis_adapter.get_cash_balance(ticker=self.settings.ticker, price=current_price)
-
+            # 8. USD 예수금 (매수가능금액조회 API)
             if balance is None:
                 logger.error("USD 예수금 조회 실패!")
                 return InitStatus.ERROR_BALANCE
@@ -391,15 +406,25 @@ class PhoenixTradingSystem:
                 logger.warning("  2. 또는 해외주식을 1회 이상 거래하여 계좌 활성화")
                 logger.warning("=" * 60)
 
-            # 9. 보유 주식 정보 조회 (참고용)
-            logger.info("보유 주식 조회 중...")
-            self.kis_adapter.get_balance()
-
             # 10. GridEngine 초기값 설정
             self.grid_engine.tier1_price = current_price
             self.grid_engine.account_balance = balance
             self.grid_engine.current_price = current_price
 
+            # [v4.3] SQLite 상태 저장소: 이전 상태 복구 (보유 포지션 / 진행 중 주문 / Tier 1 기준가)
+            # + 체결내역·브로커 보유 수량 확인 1회 후 Tier 변경 시마다 기록
+            self.state_store, live_orders = self._create_state_store(current_price)
+
+            # [v4.3] 주문 관리자 (체결 확인을 거래 루프 밖에서 수행) + 재시작 전 주문 체결 확인 재개
+            self.order_manager = self._create_order_manager()
+            for order in live_orders:
+                self.order_manager.resume(order.signal, order.order_id)
+
+            # [v4.3] Excel 저장은 백그라운드 스레드에서 (이후 워크북은 저장 스레드만 수정)
+            self.excel_writer = ExcelWriter(self.excel_bridge, config.EXCEL_SAVE_MIN_INTERVAL)
+            self.excel_writer.start()
+            self.history_log = HistoryLog(config.HISTORY_LOG_DIR, config.HISTORY_LOG_MAX_BYTES)
+
             # 10. 텔레그램 알림 초기화
             logger.info("텔레그램 알림 초기화 중...")
             self.telegram = TelegramNotifier.from_settings(self.settings)
@@ -420,6 +445,55 @@ class PhoenixTradingSystem:
             logger.error(f"초기화 중 예외 발생: {e}", exc_info=True)
             return InitStatus.ERROR_EXCEL  # 일반 에러
 
+    def _fetch_price_and_cash(self, price_hint: float = 0.0, include_holdings: bool = False):
+        """
+        [v4.3] 현재가 + USD 예수금 (+ 보유 주식) 조회
+
+        aiohttp가 있으면 종료까지 유지하는 비동기 클라이언트(AsyncKisRunner)로 조회한다
+        (Rate limiter 공유, 연결 재사용). price_hint(직전 시세)가 있으면 시세와 예수금을 동시에
+        조회하고, 없으면(시작 시) 시세를 먼저 받아 그 가격으로 예수금을 조회한다.
+        aiohttp가 없으면 동기 어댑터로 시세 → 예수금(현재가 기준) 순서로 조회한다.
+
+        Args:
+            price_hint: 예수금 조회용 단가 (0 이하면 조회한 현재가)
+            include_holdings: 보유 주식 조회(get_balance, 로그용) 포함 여부
+
+        Returns:
+            tuple: (시세 dict 또는 None, USD 예수금 또는 None)
+        """
+        ticker = self.settings.ticker
+
+        if config.KIS_ASYNC_HTTP and AIOHTTP_AVAILABLE:
+            async def fetch(client):
+                holdings = asyncio.ensure_future(client.get_balance()) if include_holdings else None
+                if price_hint > 0:
+                    price_data, balance = await asyncio.gather(
+                        client.get_overseas_price(ticker),
+                        client.get_cash_balance(ticker=ticker, price=price_hint),
+                    )
+                else:
+                    price_data = await client.get_overseas_price(ticker)
+                    balance = (
+                        await client.get_cash_balance(ticker=ticker, price=price_data['price'])
+                        if price_data else None
+                    )
+                if holdings is not None:
+                    await holdings
+                return price_data, balance
+
+            if self.async_http is None:
+                self.async_http = AsyncKisRunner(self.kis_adapter)
+            return self.async_http.run(fetch)
+
+        price_data = self.kis_adapter.get_overseas_price(ticker)
+        if not price_data:
+            return None, None
+
+        balance = self.kis_adapter.get_cash_balance(ticker=ticker, price=price_data['price'])
+        if include_holdings:
+            self.kis_adapter.get_balance()
+        return price_data, balance
+
     def sync_balance_from_kis(self):
         """
         KIS API에서 잔고를 조회하여 GridEngine 상태 머신과 동기화
@@ -429,20 +503,12 @@ class PhoenixTradingSystem:
                 logger.warning("KIS API 또는 GridEngine이 초기화되지 않아 잔고 동기화 불가")
                 return False
 
-            # 현재가 조회
-            price_data = self.kis_adapter.get_overseas_price(self.settings.ticker)
+            # 현재가 + USD 예수금 조회 ([v4.3] aiohttp 있으면 동시 조회)
+            price_data, balance = self._fetch_price_and_cash(price_hint=self.grid_engine.current_price)
             if not price_data:
                 logger.error("시세 조회 실패로 잔고 동기화 불가")
                 return False
 
-            current_price = price_data['price']
-            
-            # USD 예수금 조회
-            balance = self.kis_adapter.get_cash_balance(
-                ticker=self.settings.ticker, 
-                price=current_price
-            )
-            
             if balance is None:
                 logger.error("USD 예수금 조회 실패")
                 return False
@@ -510,73 +576,14 @@ class PhoenixTradingSystem:
 
         try:
             # 잔고 동기화 타이머 설정
-            last_balance_sync = datetime.now()
-            balance_sync_interval = int(os.getenv("BALANCE_SYNC_INTERVAL", "60"))  # 기본 60초
-            
-            while self.is_running and not self.stop_requested:
-                # 1. 현재 시세 조회
-                price_data = self.kis_adapter.get_overseas_price(self.settings.ticker)
-
-                if not price_data:
-                    logger.warning(f"{self.settings.ticker} 시세 조회 실패. 재시도...")
-                    time.sleep(5)
-                    continue
-
-                current_price = price_data['price']
-                
-                # 1.5 주기적 잔고 동기화 (설정 간격마다)
-                now = datetime.now()
-                if (now - last_balance_sync).total_seconds() >= balance_sync_interval:
-                    logger.info(f"잔고 동기화 실행 (간격: {balance_sync_interval}초)")
-                    if self.sync_balance_from_kis():
-                        last_balance_sync = now
-                    else:
-                        logger.warning("잔고 동기화 실패, 다음 주기에 재시도")
-
-                # 시세가 0이면 시장 마감 체크
-                if current_price <= 0:
-                    is_open, message = self._is_market_open()
-                    if not is_open:
-                        logger.warning(f"시세 $0.00 감지 - {message}")
-                        logger.info("시장 개장 시간까지 대기합니다...")
-                        self._wait_for_market_open()
-                        continue
-
-                # 2. [P0 FIX] Tier 240 도달 긴급 정지 확인 (Risk-03 완화)
-                if any(pos.tier == 240 for pos in self.grid_engine.positions):
-                    logger.error("🛑 Tier 240 도달: 시스템 긴급 정지")
-
-                    if self.telegram:
-                        self.telegram.notify_emergency(
-                            f"🛑 Tier 240 도달 - 긴급 정지\n"
-                            f"현재가: ${current_price:.2f}\n"
-                            f"Tier 1: ${self.grid_engine.tier1_price:.2f}\n"
-                            f"하락률: {((current_price / self.grid_engine.tier1_price) - 1) * 100:.1f}%\n"
-                            f"수동 개입 필요: 손절매 또는 Tier 1 재설정"
-                        )
+            self.last_balance_sync = datetime.now()
+            self.balance_sync_interval = int(os.getenv("BALANCE_SYNC_INTERVAL", "60"))  # 기본 60초
 
-                    # Excel B15 "시스템 가동" FALSE로 변경
-                    logger.warning("시스템 긴급 정지 (Excel B15 → FALSE)")
-                    self.excel_bridge.update_cell("B15", False)
-                    self.excel_bridge.save_workbook()
-                    self.stop_signal = True
-                    break
-
-                # 3. 매매 신호 확인
-                signals = self.grid_engine.process_tick(current_price)
-
-                # 4. 매매 신호 처리
-                for signal in signals:
-                    self._process_signal(signal)
-
-                # 4. Excel 업데이트 (주기적)
-                now = datetime.now()
-                if (now - self.last_update_time).total_seconds() >= self.settings.excel_update_interval:
-                    self._update_system_state(current_price)
-                    self.last_update_time = now
-
-                # 5. 시세 조회 주기 대기 (Excel B22 설정값, 기본 40초)
-                time.sleep(self.settings.price_check_interval)
+            # [v4.3] 시세 수신 방식 선택 (config.PRICE_FEED_MODE)
+            if config.PRICE_FEED_MODE == "STREAM":
+                asyncio.run(self._run_stream_loop())
+            else:
+                self._run_poll_loop()
 
         except KeyboardInterrupt:
             logger.info("\n사용자에 의한 종료 요청")
@@ -590,8 +597,145 @@ class PhoenixTradingSystem:
         # 정상 종료
         return 0
 
+    def _run_poll_loop(self):
+        """REST 폴링 거래 루프 (Excel B22 간격마다 시세 조회)"""
+        while self.is_running and not self.stop_requested:
+            # 1. 현재 시세 조회
+            price_data = self.kis_adapter.get_overseas_price(self.settings.ticker)
+
+            if not price_data:
+                logger.warning(f"{self.settings.ticker} 시세 조회 실패. 재시도...")
+                time.sleep(5)
+                continue
+
+            if not self._handle_price(price_data['price']):
+                break
+
+            # 5. 시세 조회 주기 대기 (Excel B22 설정값, 기본 40초)
+            time.sleep(self.settings.price_check_interval)
+
+    async def _run_stream_loop(self):
+        """
+        [v4.3] WebSocket 실시간 시세 거래 루프
+
+        수신 코루틴은 TickMailbox에 시세만 넣고, 거래 처리는 별도 스레드에서
+        Mailbox를 비우며 수행한다 (주문/체결 대기 중에도 수신은 계속됨).
+        STREAM_STALE_SECONDS 동안 시세가 없으면 REST로 한 번 조회한다 (Watchdog).
+        """
+        mailbox = TickMailbox()
+        ticker = self.settings.ticker
+        stale_seconds = config.STREAM_STALE_SECONDS
+
+        feed_task = asyncio.create_task(
+            self.kis_adapter.subscribe_realtime_price(ticker, lambda tick: mailbox.post(tick.price))
+        )
+        logger.info(f"[STREAM] 실시간 시세 모드 시작: {ticker} (Watchdog {stale_seconds:.0f}초)")
+
+        try:
+            while self.is_running and not self.stop_requested:
+                batch = await asyncio.to_thread(mailbox.take, stale_seconds)
+
+                if batch is None:
+                    # Watchdog: 스트림 지연/중단 → REST 시세로 대체
+                    if feed_task.done():
+                        logger.warning("[STREAM] 실시간 시세 연결 종료 상태 - REST 시세로 계속 진행")
+                    else:
+                        logger.warning(f"[STREAM] {stale_seconds:.0f}초간 시세 없음 - REST 시세 조회")
+
+                    price_data = await asyncio.to_thread(self.kis_adapter.get_overseas_price, ticker)
+                    if not price_data:
+                        logger.warning(f"{ticker} 시세 조회 실패. 재시도...")
+                        continue
+                    keep_running = await asyncio.to_thread(self._handle_price, price_data['price'])
+                else:
+                    keep_running = await asyncio.to_thread(self._handle_price, batch.last, batch)
+
+                if not keep_running:
+                    break
+        finally:
+            mailbox.close()
+            self.kis_adapter.unsubscribe_realtime_price()
+            feed_task.cancel()
+            try:
+                await feed_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            logger.info(f"[STREAM] 실시간 시세 모드 종료 (수신 {mailbox.posted_count}건, 처리 {mailbox.batch_count}회)")
+
+    def _handle_price(self, current_price: float, batch: TickBatch = None) -> bool:
+        """
+        시세 1건 처리 (잔고 동기화 → 긴급 정지 확인 → 매매 → Excel 갱신)
+
+        Args:
+            current_price: 현재가
+            batch: [v4.3] 실시간 모드의 병합 시세 (고가/저가 포함, 폴링 모드는 None)
+
+        Returns:
+            bool: 거래 루프 계속 여부 (False = 종료)
+        """
+        # 1.5 주기적 잔고 동기화 (설정 간격마다)
+        now = datetime.now()
+        # [v4.3] 체결 대기 중인 주문이 있으면 건너뜀 (KIS 예수금에는 반영, 엔진 잔고에는 미반영 상태)
+        if (now - self.last_balance_sync).total_seconds() >= self.balance_sync_interval \
+                and self.order_manager.pending_count == 0:
+            logger.info(f"잔고 동기화 실행 (간격: {self.balance_sync_interval}초)")
+            if self.sync_balance_from_kis():
+                self.last_balance_sync = now
+            else:
+                logger.warning("잔고 동기화 실패, 다음 주기에 재시도")
+
+        # 시세가 0이면 시장 마감 체크
+        if current_price <= 0:
+            is_open, message = self._is_market_open()
+            if not is_open:
+                logger.warning(f"시세 $0.00 감지 - {message}")
+                logger.info("시장 개장 시간까지 대기합니다...")
+                self._wait_for_market_open()
+                return True
+
+        # 2. [P0 FIX] Tier 240 도달 긴급 정지 확인 (Risk-03 완화)
+        if any(pos.tier == 240 for pos in self.grid_engine.positions):
+            logger.error("🛑 Tier 240 도달: 시스템 긴급 정지")
+
+            if self.telegram:
+                self.telegram.notify_emergency(
+                    f"🛑 Tier 240 도달 - 긴급 정지\n"
+                    f"현재가: ${current_price:.2f}\n"
+                    f"Tier 1: ${self.grid_engine.tier1_price:.2f}\n"
+                    f"하락률: {((current_price / self.grid_engine.tier1_price) - 1) * 100:.1f}%\n"
+                    f"수동 개입 필요: 손절매 또는 Tier 1 재설정"
+                )
+
+            # Excel B15 "시스템 가동" FALSE로 변경
+            logger.warning("시스템 긴급 정지 (Excel B15 → FALSE)")
+            self._write_system_stopped()
+            self.stop_signal = True
+            return False
+
+        # 3. 매매 신호 확인
+        if batch is not None:
+            signals = self.grid_engine.process_tick_batch(batch)
+        else:
+            signals = self.grid_engine.process_tick(current_price)
+
+        # 4. 매매 신호 처리
+        for signal in signals:
+            self._process_signal(signal)
+
+        # 4. Excel 업데이트 (주기적)
+        now = datetime.now()
+        if (now - self.last_update_time).total_seconds() >= self.settings.excel_update_interval:
+            self._update_system_state(current_price)
+            self.last_update_time = now
+
+        return True
+
     def _process_signal(self, signal):
-        """매매 신호 처리 (배치 주문 지원)"""
+        """
+        매매 신호 처리 (배치 주문 지원)
+
+        [v4.3] 주문 전송까지만 수행하고, 체결 확인은 OrderManager 작업 스레드에서 진행한다.
+        """
         try:
             if signal.action == "BUY":
                 if signal.tiers:
@@ -618,81 +762,18 @@ class PhoenixTradingSystem:
 
                     # 긴급 정지 (Excel B15 "시스템 가동" FALSE로 변경)
                     logger.warning("시스템 긴급 정지 (Excel B15 → FALSE)")
-                    self.excel_bridge.update_cell("B15", False)
-                    self.excel_bridge.save_workbook()
+                    self._write_system_stopped()
                     self.stop_signal = True
                     return
 
-                # 매수 주문 (지정가 - 현재가 이하 보장)
-                result = self.kis_adapter.send_order(
-                    side="BUY",
-                    ticker=self.settings.ticker,
-                    quantity=signal.quantity,
-                    price=signal.price  # 지정가 (현재가)
-                )
-
-                if result["status"] == "SUCCESS":
-                    order_id = result["order_id"]
-                    logger.info(f"[ORDER] 주문 접수 완료: Tier {signal.tier}, 주문번호 {order_id}")
-
-                    # 체결 확인 (설정에 따라)
-                    if self.settings.fill_check_enabled:
-                        filled_price, filled_qty = self._wait_for_fill(order_id, signal.quantity)
-
-                        # [FIX] _wait_for_fill 타임아웃 시 주문 응답의 체결 정보를 fallback으로 사용
-                        if filled_qty == 0:
-                            order_filled_qty = result.get("filled_qty", 0)
-                            order_filled_price = result.get("filled_price", 0)
-                            if order_filled_qty > 0:
-                                logger.warning(
-                                    f"[FALLBACK] 체결확인 타임아웃, 주문응답 체결정보 사용: "
-                                    f"{order_filled_qty}주 @ ${order_filled_price:.2f}"
-                                )
-                                filled_qty = order_filled_qty
-                                filled_price = order_filled_price
-
-                        if filled_qty > 0:
-                            # 체결 완료 → GridEngine 상태 업데이트
-                            position = self.grid_engine.execute_buy(
-                                signal=signal,
-                                actual_filled_price=filled_price,
-                                actual_filled_qty=filled_qty
-                            )
-
-                            if position:  # 포지션이 실제로 생성된 경우에만
-                                self.daily_buy_count += 1
-
-                                logger.info(
-                                    f"[OK] 매수 체결: Tier {signal.tier} - "
-                                    f"체결 {filled_qty}주 @ ${filled_price:.2f} "
-                                    f"(주문번호: {order_id})"
-                                )
-
-                                if self.telegram:
-                                    is_tier1 = signal.tier == 1 and self.settings.tier1_trading_enabled
-                                    self.telegram.notify_buy_executed(signal, is_tier1)
-                        else:
-                            logger.error(f"[FAIL] 매수 체결 실패: Tier {signal.tier}, 주문번호 {order_id} (체결 수량 0)")
-                    else:
-                        # 체결 확인 비활성화 (기존 동작: 즉시 처리, 위험)
-                        logger.warning("[WARN] 체결 확인이 비활성화되어 있습니다. 주문 접수 = 체결로 간주합니다.")
-                        position = self.grid_engine.execute_buy(
-                            signal=signal,
-                            actual_filled_price=result.get("filled_price", signal.price),
-                            actual_filled_qty=result.get("filled_qty", signal.quantity)
-                        )
-                        self.daily_buy_count += 1
-                else:
-                    logger.error(f"[FAIL] 매수 주문 실패: Tier {signal.tier} - {result['message']}")
-                    # [FIX] GridEngine에 실패 알림 → Lock 해제
-                    self.grid_engine.confirm_order(
-                        signal=signal,
-                        order_id="",
-                        filled_qty=0,
-                        filled_price=0,
-                        success=False,
-                        error_message=result.get("message", "주문 실패")
+                # [v4.3] 체결 대기 중인 매수 금액만큼 잔고 예약 → 부족하면 이번 신호만 취소 (다음 틱에서 재시도)
+                reserved = self.order_manager.reserved_buy_amount
+                if self.grid_engine.account_balance - reserved < required_capital:
+                    logger.warning(
+                        f"체결 대기 중인 매수 ${reserved:.2f} 제외 시 잔고 부족 → 매수 보류: Tiers {signal.tiers}"
                     )
+                    self.grid_engine.cancel_signal(signal)
+                    return
 
             elif signal.action == "SELL":
                 if signal.tiers:
@@ -700,88 +781,137 @@ class PhoenixTradingSystem:
                 else:
                     logger.info(f"[SELL] 매도 신호: Tier {signal.tier}, {signal.quantity}주 @ ${signal.price:.2f}")
 
-                # 매도 주문 (지정가 - 현재가 이상 보장)
-                result = self.kis_adapter.send_order(
-                    side="SELL",
-                    ticker=self.settings.ticker,
-                    quantity=signal.quantity,
-                    price=signal.price  # 지정가 (현재가)
-                )
-
-                if result["status"] == "SUCCESS":
-                    order_id = result["order_id"]
-                    logger.info(f"[ORDER] 주문 접수 완료: Tier {signal.tier}, 주문번호 {order_id}")
-
-                    # 수익 계산용 포지션 (삭제 전)
-                    position = next((p for p in self.grid_engine.positions if p.tier == signal.tier), None)
-
-                    # 체결 확인 (설정에 따라)
-                    if self.settings.fill_check_enabled:
-                        filled_price, filled_qty = self._wait_for_fill(order_id, signal.quantity)
-
-                        # [FIX] _wait_for_fill 타임아웃 시 주문 응답의 체결 정보를 fallback으로 사용
-                        if filled_qty == 0:
-                            order_filled_qty = result.get("filled_qty", 0)
-                            order_filled_price = result.get("filled_price", 0)
-                            if order_filled_qty > 0:
-                                logger.warning(
-                                    f"[FALLBACK] 체결확인 타임아웃, 주문응답 체결정보 사용: "
-                                    f"{order_filled_qty}주 @ ${order_filled_price:.2f}"
-                                )
-                                filled_qty = order_filled_qty
-                                filled_price = order_filled_price
-
-                        if filled_qty > 0:
-                            # 체결 완료 → GridEngine 상태 업데이트
-                            profit = self.grid_engine.execute_sell(
-                                signal=signal,
-                                actual_filled_price=filled_price,
-                                actual_filled_qty=filled_qty
-                            )
-                            profit_rate = profit / position.invested_amount if position else 0.0
-                            self.daily_sell_count += 1
-
-                            logger.info(
-                                f"[OK] 매도 체결: Tier {signal.tier} - "
-                                f"체결 {filled_qty}주 @ ${filled_price:.2f}, "
-                                f"수익 ${profit:.2f} ({profit_rate*100:.2f}%) "
-                                f"(주문번호: {order_id})"
-                            )
-
-                            if self.telegram:
-                                self.telegram.notify_sell_executed(signal, profit, profit_rate)
-                        else:
-                            logger.error(f"[FAIL] 매도 체결 실패: Tier {signal.tier}, 주문번호 {order_id} (체결 수량 0)")
-                    else:
-                        # 체결 확인 비활성화 (기존 동작: 즉시 처리, 위험)
-                        logger.warning("[WARN] 체결 확인이 비활성화되어 있습니다. 주문 접수 = 체결로 간주합니다.")
-                        profit = self.grid_engine.execute_sell(
-                            signal=signal,
-                            actual_filled_price=result.get("filled_price", signal.price),
-                            actual_filled_qty=result.get("filled_qty", signal.quantity)
-                        )
-                        profit_rate = profit / position.invested_amount if position else 0.0
-                        self.daily_sell_count += 1
-                else:
-                    logger.error(f"[FAIL] 매도 주문 실패: Tier {signal.tier} - {result['message']}")
-                    # [FIX] GridEngine에 실패 알림 → 상태 복구
-                    self.grid_engine.confirm_order(
-                        signal=signal,
-                        order_id="",
-                        filled_qty=0,
-                        filled_price=0,
-                        success=False,
-                        error_message=result.get("message", "주문 실패")
-                    )
+            # 지정가 주문 (매수: 현재가 이하, 매도: 현재가 이상 보장) + 체결 확인 예약
+            self.order_manager.submit(signal)
 
         except Exception as e:
             logger.error(f"매매 신호 처리 에러: {e}", exc_info=True)
+            # [v4.3] 전송되지 않은 신호의 Tier 예약 해제 (LOCKED / 주문번호 없는 SELLING)
+            self.grid_engine.cancel_signal(signal)
             if self.telegram:
                 self.telegram.notify_error("주문 처리 에러", str(e))
 
+    def _create_order_manager(self) -> OrderManager:
+        """[v4.3] 주문 관리자 생성 (체결 확인 설정 반영)"""
+        return OrderManager(
+            adapter=self.kis_adapter,
+            engine=self.grid_engine,
+            ticker=self.settings.ticker,
+            wait_for_fill=self._wait_for_fill if self.settings.fill_check_enabled else None,
+            on_filled=self._on_order_filled,
+            on_failed=self._on_order_failed,
+            store=self.state_store
+        )
+
+    def _create_state_store(self, current_price: float) -> Tuple[Optional[StateStore], List[LiveOrder]]:
+        """
+        [v4.3] 상태 저장소 연결 + 이전 상태 복구 + 현재 Tier 상태 기록 + 변경 리스너 등록
+
+        연결/복구에 실패하면 저장소 없이 계속한다 (기존 기록은 덮어쓰지 않음).
+
+        Returns:
+            tuple: (기록 중인 저장소 - 비활성화/실패 시 None, 체결 확인을 재개할 주문)
+        """
+        if not config.STATE_DB_ENABLED:
+            return None, []
+        try:
+            store = StateStore(config.STATE_DB_PATH)
+        except Exception as e:
+            logger.error(f"상태 저장소 초기화 실패 (저장소 없이 계속): {e}", exc_info=True)
+            return None, []
+
+        try:
+            live_orders = self._recover_state(store, current_price)
+
+            state_machine = self.grid_engine.state_machine
+            store.save_tiers(state_machine.snapshot().tiers)
+            store.set_meta(tier1_price=self.grid_engine.tier1_price, account_balance=self.grid_engine.account_balance)
+            state_machine.add_listener(store.save_tier)
+            return store, live_orders
+        except Exception as e:
+            logger.error(f"상태 복구/기록 시작 실패 (저장소 없이 계속): {e}", exc_info=True)
+            store.close()
+            return None, []
+
+    def _recover_state(self, store: StateStore, current_price: float) -> List[LiveOrder]:
+        """
+        [v4.3] 저장소의 마지막 상태 복구
+
+        저장된 주문번호는 당일 체결내역 1회 조회로 주문별 결과를 확인하고(체결/종료 → 복원,
+        진행 중 → 재추적), 확인하지 못한 주문만 브로커 보유 수량과 대조해 추정한다.
+        기록이 없으면(최초 실행) 현재가를 Tier 1 기준가로 그대로 사용한다.
+
+        Args:
+            store: 상태 저장소 (Tier 변경 리스너 등록 전)
+            current_price: 현재가
+
+        Returns:
+            list: 엔진에 다시 건 진행 중 주문 (OrderManager.resume 대상)
+        """
+        recovered = load_recovered_state(store)
+
+        plan = RecoveryPlan()
+        if recovered.tiers:
+            has_orders = any(record["order_id"] for record in recovered.tiers.values())
+            statuses = self.kis_adapter.fetch_fill_statuses() if has_orders else None
+            broker_qty = self.kis_adapter.get_holding_quantity(self.settings.ticker)
+            plan = reconcile(recovered, broker_qty, statuses)
+
+            if has_orders and statuses is None:
+                logger.warning("[RECOVERY] 체결내역 조회 실패 - 진행 중이던 주문은 보유 수량으로 추정")
+            if broker_qty is None:
+                logger.warning("[RECOVERY] 보유 수량 조회 실패 - 저장된 보유 Tier만 복원")
+            elif plan.unmatched:
+                logger.error(
+                    f"[RECOVERY] 보유 수량 불일치: 브로커 {broker_qty}주, 복원 "
+                    f"{sum(p.quantity for p in plan.positions)}주 (차이 {plan.unmatched:+d}주) - 수동 확인 필요"
+                )
+            else:
+                logger.info(f"[RECOVERY] 브로커 보유 수량 일치: {broker_qty}주 (주문 {plan.resolved}건 체결내역 확인)")
+
+        tier1_price = recovered.meta.get("tier1_price")
+        if tier1_price or plan.positions:
+            self.grid_engine.restore_positions(tier1_price or current_price, plan.positions)
+
+        live_orders = []
+        for order in plan.live_orders:
+            if self.grid_engine.restore_order(order.signal, order.order_id):
+                live_orders.append(order)
+            else:
+                logger.error(
+                    f"[RECOVERY] 진행 중 주문 복원 실패: {order.signal.action} Tiers {order.signal.tiers}, "
+                    f"주문번호 {order.order_id} - 수동 확인 필요"
+                )
+        return live_orders
+
+    def _on_order_filled(self, outcome: OrderOutcome):
+        """[v4.3] 체결 반영 후 통계/알림 (체결 확인 스레드에서 호출)"""
+        signal = outcome.signal
+        if signal.action == "BUY":
+            self.daily_buy_count += 1
+            if self.telegram:
+                is_tier1 = signal.tier == 1 and self.settings.tier1_trading_enabled
+                self.telegram.notify_buy_executed(signal, is_tier1)
+        else:
+            self.daily_sell_count += 1
+            principal = outcome.filled_price * outcome.filled_qty - outcome.profit
+            profit_rate = outcome.profit / principal if principal > 0 else 0.0
+            logger.info(f"[OK] 매도 수익 ${outcome.profit:.2f} ({profit_rate*100:.2f}%)")
+            if self.telegram:
+                self.telegram.notify_sell_executed(signal, outcome.profit, profit_rate)
+
+    def _on_order_failed(self, outcome: OrderOutcome):
+        """[v4.3] 주문 실패/미체결 로그 (체결 확인 스레드에서 호출)"""
+        logger.error(
+            f"[FAIL] {outcome.signal.action} 체결 실패: Tiers {outcome.signal.tiers}, "
+            f"주문번호 {outcome.order_id or '-'} ({outcome.error_message})"
+        )
+
     def _wait_for_fill(self, order_id: str, expected_qty: int) -> tuple[float, int]:
         """
-        주문 체결 대기 (폴링 방식)
+        주문 체결 대기
+
+        [v4.3] 체결통보 수신 중이면 통보를 기다리고, 아니면 REST 체결내역을 폴링한다.
 
         Args:
             order_id: 주문번호
@@ -793,6 +923,13 @@ class PhoenixTradingSystem:
         max_retries = self.settings.fill_check_max_retries
         check_interval = self.settings.fill_check_interval
 
+        # [v4.3] 실시간 체결통보 우선
+        registry = getattr(self.kis_adapter, "fill_registry", None)
+        if isinstance(registry, FillRegistry) and registry.is_live:
+            result = self._wait_for_fill_notice(registry, order_id, expected_qty, max_retries * check_interval)
+            if result is not None:
+                return result
+
         for attempt in range(1, max_retries + 1):
             time.sleep(check_interval)
 
@@ -877,36 +1014,115 @@ class PhoenixTradingSystem:
 
         return 0.0, 0
 
+    def _wait_for_fill_notice(
+        self,
+        registry: FillRegistry,
+        order_id: str,
+        expected_qty: int,
+        timeout: float
+    ) -> Optional[tuple[float, int]]:
+        """
+        [v4.3] 체결통보 대기 + REST 체결내역 1회 확인
+
+        Args:
+            registry: 체결통보 레지스트리
+            order_id: 주문번호
+            expected_qty: 예상 체결 수량
+            timeout: 최대 대기 시간 (초, 폴링 방식의 전체 대기 시간과 동일)
+
+        Returns:
+            tuple[float, int]: (체결가, 체결 수량), 대기 중 통보 연결이 끊겼으면 None (폴링으로 계속)
+        """
+        started = time.monotonic()
+        state = registry.wait(order_id, expected_qty, timeout)
+        elapsed_ms = (time.monotonic() - started) * 1000
+
+        if state is not None and state.rejected:
+            logger.error(f"[REJECT] 주문 거부 통보: 주문번호 {order_id}")
+            return 0.0, 0
+
+        if state is not None and state.filled_qty >= expected_qty:
+            logger.info(
+                f"[FILL] 체결통보 전량 체결: {state.filled_qty}/{expected_qty}주 @ ${state.avg_price:.2f} "
+                f"({elapsed_ms:.0f}ms)"
+            )
+            return state.avg_price, state.filled_qty
+
+        if not registry.is_live:
+            logger.warning(f"[FILL] 체결통보 연결 종료 - REST 체결 조회로 전환: 주문번호 {order_id}")
+            return None
+
+        # 통보 미수신 또는 부분 체결 → REST 체결내역으로 확인 (통보 누락 대비)
+        pushed_qty = state.filled_qty if state is not None else 0
+        fill_status = self.kis_adapter.get_order_fill_status(order_id)
+
+        if fill_status["filled_qty"] > pushed_qty:
+            logger.info(
+                f"[FILL RECOVERED] 체결내역 조회에서 체결 발견: "
+                f"{fill_status['filled_qty']}/{expected_qty}주 @ ${fill_status['filled_price']:.2f}"
+            )
+            return fill_status["filled_price"], fill_status["filled_qty"]
+
+        if pushed_qty > 0:
+            logger.warning(
+                f"[PARTIAL] 부분 체결로 처리: {pushed_qty}/{expected_qty}주 @ ${state.avg_price:.2f}"
+            )
+            return state.avg_price, pushed_qty
+
+        if fill_status["status"] == "거부":
+            logger.error(f"[REJECT] 주문 거부: {fill_status['reject_reason']}")
+        else:
+            logger.error(f"[TIMEOUT] 체결통보/체결내역 모두 미체결: 주문번호 {order_id}, {timeout:.0f}초 경과")
+        return 0.0, 0
+
+    def _write_system_stopped(self):
+        """[v4.3] Excel B15 "시스템 가동" FALSE 기록 (저장 스레드가 있으면 즉시 저장 요청만)"""
+        if self.excel_writer:
+            self.excel_writer.submit(cells={"B15": False})
+            self.excel_writer.request_flush()  # 간격 제한 없이 저장 (완료는 기다리지 않음)
+        else:
+            self.excel_bridge.update_cell("B15", False)
+            self.excel_bridge.save_workbook()
+
     def _update_system_state(self, current_price: float):
-        """시스템 상태 업데이트 및 Excel 저장"""
+        """
+        시스템 상태 업데이트 및 Excel 저장
+
+        [v4.3] 워크북 반영/저장은 ExcelWriter 스레드에서 수행 (거래 스레드는 요청만 전달)
+        """
         try:
             state = self.grid_engine.get_system_state(current_price)
 
-            # Excel 업데이트
-            self.excel_bridge.update_program_info(state)
-            self.excel_bridge.update_program_area(
-                self.grid_engine.positions,
-                self.grid_engine.tier1_price,
-                self.settings.buy_interval
-            )
-
-            # 로그 엔트리 추가
+            # 로그 엔트리 (저장 시점과 무관하게 지금 상태로 생성)
             log_entry = self.excel_bridge.create_history_log_entry(
                 state,
                 self.settings,
                 buy_qty=self.daily_buy_count,
                 sell_qty=self.daily_sell_count
             )
-            self.excel_bridge.append_history_log(log_entry)
 
-            # 저장
-            self.excel_bridge.save_workbook()
+            # [v4.3] 전체 기록은 JSONL (시트 2에는 최근 구간만)
+            self.history_log.append(log_entry)
+            if self.state_store:
+                self.state_store.set_meta(
+                    tier1_price=self.grid_engine.tier1_price,
+                    account_balance=self.grid_engine.account_balance
+                )
+
+            # Excel 업데이트 요청 (연속 요청은 병합되어 최소 간격마다 저장)
+            self.excel_writer.submit(
+                state=state,
+                positions=self.grid_engine.positions,
+                tier1_price=self.grid_engine.tier1_price,
+                buy_interval=self.settings.buy_interval,
+                history_entry=log_entry
+            )
 
             # [v4.0] 상태 머신 상태 로깅
             status = self.grid_engine.get_status()
             state_summary = status.get('state_summary', {})
             logger.debug(
-                f"[SAVE] Excel 업데이트: 가격 ${current_price:.2f}, "
+                f"[SAVE] Excel 업데이트 요청: 가격 ${current_price:.2f}, "
                 f"포지션 {len(self.grid_engine.positions)}개 | "
                 f"상태머신[EMPTY:{state_summary.get('EMPTY',0)} "
                 f"FILLED:{state_summary.get('FILLED',0)} "
@@ -927,17 +1143,31 @@ class PhoenixTradingSystem:
         self.is_running = False
 
         try:
+            # [v4.3] 체결 확인 중인 주문 반영 후 저장
+            if self.order_manager:
+                self.order_manager.shutdown(wait=True)
+
             # 최종 상태 저장
             if self.grid_engine and self.excel_bridge:
                 final_state = self.grid_engine.get_system_state(self.grid_engine.current_price)
 
-                self.excel_bridge.update_program_info(final_state)
-                self.excel_bridge.update_program_area(
-                    self.grid_engine.positions,
-                    self.grid_engine.tier1_price,
-                    self.settings.buy_interval
-                )
-                self.excel_bridge.save_workbook()
+                if self.excel_writer:
+                    # [v4.3] 대기 중인 갱신과 함께 강제 저장 후 저장 스레드 종료
+                    self.excel_writer.submit(
+                        state=final_state,
+                        positions=self.grid_engine.positions,
+                        tier1_price=self.grid_engine.tier1_price,
+                        buy_interval=self.settings.buy_interval
+                    )
+                    self.excel_writer.stop()
+                else:
+                    self.excel_bridge.update_program_info(final_state)
+                    self.excel_bridge.update_program_area(
+                        self.grid_engine.positions,
+                        self.grid_engine.tier1_price,
+                        self.settings.buy_interval
+                    )
+                    self.excel_bridge.save_workbook()
                 self.excel_bridge.close_workbook()
 
                 logger.info("[OK] 최종 상태 저장 완료")
@@ -946,8 +1176,21 @@ class PhoenixTradingSystem:
                 if self.telegram:
                     self.telegram.notify_system_stop(final_state)
 
+            if self.history_log:
+                self.history_log.close()
+
+            if self.state_store:
+                # [v4.3] 다음 시작 시 복구할 Tier 1 기준가 기록
+                self.state_store.set_meta(tier1_price=self.grid_engine.tier1_price)
+                self.grid_engine.state_machine.remove_listener(self.state_store.save_tier)
+                self.state_store.close()
+
+            if self.async_http:
+                self.async_http.close()
+
             # KIS API 연결 해제
             if self.kis_adapter:
+                logger.info(self.kis_adapter.order_latency.format_summary())  # [v4.3]
                 self.kis_adapter.disconnect()
                 logger.info("[OK] KIS API 연결 해제")
 
@@ -15,6 +15,37 @@ from .models import GridSettings, Position, SystemState
 logger = logging.getLogger(__name__)
 
 
+# [v4.3] 시트 2 "02_운용로그_히스토리" 컬럼 (로그 키, 헤더, 기본값) - 히스토리 내보내기와 공유
+HISTORY_COLUMNS = (
+    # A. 시간·기본 정보
+    ("update_time", "업데이트", None),
+    ("date", "날짜", None),
+    ("sheet", "시트", "Main"),
+    ("ticker", "종목", "SOXL"),
+    ("tier", "티어", None),
+    # B. 포지션 상태
+    ("total_tiers", "총티어", None),
+    ("quantity_diff", "잔고량(차)", None),
+    ("invested", "투자금", None),
+    ("tier_amount", "1티어", None),
+    # C. 손익·성과 지표
+    ("balance", "예수금", None),
+    ("stock_value", "주식평가금", None),
+    ("holding_profit", "잔고수익", None),
+    ("buy_ready", "매수예정", None),
+    ("withdrawable", "인출가능", None),
+    ("arbitrage_profit", "아비타수익", None),
+    # D. 실제 체결 수량
+    ("buy_qty", "매수", 0),
+    ("sell_qty", "매도", 0),
+)
+
+
+def history_row(log_entry: Dict) -> List:
+    """[v4.3] 로그 엔트리 → 시트 2 한 행 값 (HISTORY_COLUMNS 순서)"""
+    return [log_entry.get(key, default) for key, _, default in HISTORY_COLUMNS]
+
+
 class ExcelBridge:
     """
     Excel 파일과 그리드 엔진 간 데이터 브리지
@@ -26,28 +57,34 @@ class ExcelBridge:
     - 영역 D (G17:N257): 프로그램 시뮬레이션 영역 (쓰기)
 
     시트 2: "02_운용로그_히스토리"
-    - 시간 순 누적 로그 (append-only)
+    - 시간 순 누적 로그 (append-only, [v4.3] history_window 설정 시 최근 구간만 유지)
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, history_window: int = 0):
         """
         Excel 브리지 초기화
 
         Args:
             file_path: Excel 파일 경로
+            history_window: [v4.3] 시트 2에 유지할 최근 로그 행 수 (0이면 제한 없음)
         """
         self.file_path = file_path
+        self.history_window = history_window
         self.wb = None
         self.ws_master = None
         self.ws_history = None
         self.ws_config = None  # [v4.2] 시스템설정 시트
 
+        # [v4.3] 영역 D 마지막 기록값 (행 → G~N 값), 워크북을 새로 열면 초기화
+        self._program_area_cache: Dict[int, tuple] = {}
+
     def load_workbook(self):
         """Excel 파일 열기"""
         try:
             self.wb = openpyxl.load_workbook(self.file_path)
             self.ws_master = self.wb["01_매매전략_기준설정"]
             self.ws_history = self.wb["02_운용로그_히스토리"]
+            self._program_area_cache = {}
 
             # [v4.2] 시스템설정 시트 (선택사항, 없으면 None)
             if "03_시스템설정" in self.wb.sheetnames:
@@ -105,6 +142,7 @@ class ExcelBridge:
             self.ws_master = None
             self.ws_history = None
             self.ws_config = None  # [v4.2] 시스템설정 시트
+            self._program_area_cache = {}
 
     def _read_bool(self, cell) -> bool:
         """
@@ -406,12 +444,28 @@ class ExcelBridge:
 
         logger.debug(f"프로그램 정보 업데이트: Tier {state.current_tier}, ${state.current_price:.2f}")
 
+    def update_cell(self, cell_ref: str, value):
+        """
+        [v4.3] 시트 1 단일 셀 값 변경 (예: B15 "시스템 가동" 긴급 정지)
+
+        Args:
+            cell_ref: 셀 주소 (예: "B15")
+            value: 기록할 값
+        """
+        if not self.ws_master:
+            self.load_workbook()
+
+        self.ws_master[cell_ref].value = value
+        logger.info(f"셀 업데이트: {cell_ref} = {value}")
+
     def update_program_area(self, positions: List[Position], tier1_price: float, buy_interval: float = 0.005):
         """
         시트 1 영역 D (G17:N257) 프로그램 시뮬레이션 영역 업데이트
 
         컬럼: G=티어, H=잔고량, I=투자금, J=티어평단, K=매수(가), L=매수(량), M=매도(가), N=매도(량)
 
+        [v4.3] 마지막으로 기록한 값과 비교해 바뀐 셀만 기록 (워크북 로드 후 첫 호출은 전체 기록)
+
         Args:
             positions: 현재 보유 포지션 리스트
             tier1_price: Tier 1 기준가
@@ -420,52 +474,46 @@ class ExcelBridge:
         if not self.ws_master:
             self.load_workbook()
 
-        # 240개 티어 초기화
+        positions_by_tier = {p.tier: p for p in positions}
+        written = 0
+
         for tier in range(1, 241):
             row_idx = 17 + tier  # 18~257행
+            values = self._program_area_row(tier, positions_by_tier.get(tier), tier1_price, buy_interval)
 
-            # 티어 번호
-            self.ws_master.cell(row=row_idx, column=7, value=tier)
-
-            # 해당 티어 포지션 찾기
-            position = next((p for p in positions if p.tier == tier), None)
-
-            if position:
-                # 보유 중인 티어
-                self.ws_master.cell(row=row_idx, column=8, value=position.quantity)  # 잔고량
-                self.ws_master.cell(row=row_idx, column=9, value=position.invested_amount)  # 투자금
-                self.ws_master.cell(row=row_idx, column=10, value=position.avg_price)  # 티어평단
+            previous = self._program_area_cache.get(row_idx)
+            if previous == values:
+                continue
 
-                # 매수(가), 매수(량) - 이미 보유 중이므로 빈값
-                self.ws_master.cell(row=row_idx, column=11, value="")
-                self.ws_master.cell(row=row_idx, column=12, value="")
-
-                # 매도(가), 매도(량) - 목표가 계산
-                sell_price = position.avg_price * 1.03  # 3% 익절
-                self.ws_master.cell(row=row_idx, column=13, value=sell_price)
-                self.ws_master.cell(row=row_idx, column=14, value=position.quantity)
-            else:
-                # 미보유 티어 - 매수 대기 상태
-                self.ws_master.cell(row=row_idx, column=8, value=0)  # 잔고량
-                self.ws_master.cell(row=row_idx, column=9, value=0)  # 투자금
-                self.ws_master.cell(row=row_idx, column=10, value=0)  # 티어평단
-
-                # 매수(가), 매수(량) - 예상 매수가 계산
-                if tier == 1:
-                    buy_price = tier1_price
-                else:
-                    decline_rate = (tier - 1) * buy_interval
-                    buy_price = tier1_price * (1 - decline_rate)
+            for offset, value in enumerate(values):
+                if previous is None or previous[offset] != value:
+                    self.ws_master.cell(row=row_idx, column=7 + offset, value=value)
+                    written += 1
+            self._program_area_cache[row_idx] = values
 
-                # 예상 매수 수량 (tier_amount는 settings에서 가져와야 하므로 생략, 실제 구현 시 전달 필요)
-                self.ws_master.cell(row=row_idx, column=11, value=buy_price)
-                self.ws_master.cell(row=row_idx, column=12, value="")  # 수량은 체결 시 업데이트
+        logger.debug(f"프로그램 영역 업데이트 완료: {len(positions)}개 포지션, {written}개 셀 변경")
 
-                # 매도(가), 매도(량) - 빈값
-                self.ws_master.cell(row=row_idx, column=13, value="")
-                self.ws_master.cell(row=row_idx, column=14, value="")
+    @staticmethod
+    def _program_area_row(tier: int, position: Optional[Position], tier1_price: float, buy_interval: float) -> tuple:
+        """
+        영역 D 한 행의 값 (G~N)
 
-        logger.debug(f"프로그램 영역 업데이트 완료: {len(positions)}개 포지션")
+        Returns:
+            tuple: (티어, 잔고량, 투자금, 티어평단, 매수(가), 매수(량), 매도(가), 매도(량))
+        """
+        if position:
+            # 보유 중인 티어: 매수(가/량)는 빈값, 매도는 목표가 (3% 익절)
+            sell_price = position.avg_price * 1.03
+            return (tier, position.quantity, position.invested_amount, position.avg_price,
+                    "", "", sell_price, position.quantity)
+
+        # 미보유 티어 - 매수 대기 상태 (예상 매수가, 수량은 체결 시 업데이트)
+        if tier == 1:
+            buy_price = tier1_price
+        else:
+            decline_rate = (tier - 1) * buy_interval
+            buy_price = tier1_price * (1 - decline_rate)
+        return (tier, 0, 0, 0, buy_price, "", "", "")
 
     def append_history_log(self, log_entry: Dict):
         """
@@ -497,33 +545,18 @@ class ExcelBridge:
         # 다음 빈 행 찾기
         next_row = self.ws_history.max_row + 1
 
-        # A. 시간·기본 정보
-        self.ws_history.cell(row=next_row, column=1, value=log_entry.get("update_time"))  # 업데이트
-        self.ws_history.cell(row=next_row, column=2, value=log_entry.get("date"))  # 날짜
-        self.ws_history.cell(row=next_row, column=3, value=log_entry.get("sheet", "Main"))  # 시트
-        self.ws_history.cell(row=next_row, column=4, value=log_entry.get("ticker", "SOXL"))  # 종목
-        self.ws_history.cell(row=next_row, column=5, value=log_entry.get("tier"))  # 티어
-
-        # B. 포지션 상태
-        self.ws_history.cell(row=next_row, column=6, value=log_entry.get("total_tiers"))  # 총티어
-        self.ws_history.cell(row=next_row, column=7, value=log_entry.get("quantity_diff"))  # 잔고량(차)
-        self.ws_history.cell(row=next_row, column=8, value=log_entry.get("invested"))  # 투자금
-        self.ws_history.cell(row=next_row, column=9, value=log_entry.get("tier_amount"))  # 1티어
-
-        # C. 손익·성과 지표
-        self.ws_history.cell(row=next_row, column=10, value=log_entry.get("balance"))  # 예수금
-        self.ws_history.cell(row=next_row, column=11, value=log_entry.get("stock_value"))  # 주식평가금
-        self.ws_history.cell(row=next_row, column=12, value=log_entry.get("holding_profit"))  # 잔고수익
-        self.ws_history.cell(row=next_row, column=13, value=log_entry.get("buy_ready"))  # 매수예정
-        self.ws_history.cell(row=next_row, column=14, value=log_entry.get("withdrawable"))  # 인출가능
-        self.ws_history.cell(row=next_row, column=15, value=log_entry.get("arbitrage_profit"))  # 아비타수익
-
-        # D. 실제 체결 수량
-        self.ws_history.cell(row=next_row, column=16, value=log_entry.get("buy_qty", 0))  # 매수
-        self.ws_history.cell(row=next_row, column=17, value=log_entry.get("sell_qty", 0))  # 매도
+        for col_idx, value in enumerate(history_row(log_entry), start=1):
+            self.ws_history.cell(row=next_row, column=col_idx, value=value)
 
         logger.info(f"히스토리 로그 추가: 행 {next_row}, Tier {log_entry.get('tier')}")
 
+        # [v4.3] 최근 구간만 유지 (전체 기록은 HistoryLog JSONL)
+        if self.history_window > 0:
+            excess = self.ws_history.max_row - 1 - self.history_window  # 1행은 헤더
+            if excess > 0:
+                self.ws_history.delete_rows(2, excess)
+                logger.debug(f"히스토리 시트 오래된 행 {excess}개 제거 (최근 {self.history_window}행 유지)")
+
     def create_history_log_entry(self, state: SystemState,
                                  settings: GridSettings,
                                  buy_qty: int = 0,
@@ -0,0 +1,252 @@
+"""
+Phoenix Trading System v4.3 - Excel 백그라운드 저장 (ExcelBridge 비동기 래퍼)
+
+ExcelBridge.save_workbook()은 통합 문서 전체를 직렬화하고, Excel이 파일을 잡고 있으면
+재시도 대기(time.sleep)까지 하므로 거래 스레드에서 호출하면 틱/주문 처리가 멈춘다.
+ExcelWriter는 상태 갱신 요청만 받아 두고 별도 스레드에서 워크북 반영 + 저장을 수행한다.
+
+- 연속 요청은 병합: 상태/프로그램 영역/셀 값은 최신값만, 히스토리 로그는 순서대로 모두 추가
+- 저장 간격 제한 (min_interval): 마지막 저장 이후 간격이 지나기 전에는 모아 두기만 함
+- 저장 실패(파일 잠금 등) 시 워크북 메모리 내용은 유지하고 다음 주기에 다시 저장
+- flush(): 대기 중인 갱신을 즉시 저장하고 완료까지 대기 (종료 시 사용)
+
+워커 시작 후에는 워크북을 워커 스레드만 수정한다.
+
+사용 예:
+    writer = ExcelWriter(excel_bridge, min_interval=5.0)
+    writer.start()
+    writer.submit(state=state, positions=positions, tier1_price=30.0, buy_interval=0.005)
+    writer.submit(cells={"B15": False})      # 긴급 정지
+    writer.stop()                             # 남은 갱신 저장 후 종료
+"""
+import threading
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from .excel_bridge import ExcelBridge
+from .models import Position, SystemState
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingUpdate:
+    """저장 전까지 모아 둔 갱신 (병합 결과)"""
+    state: Optional[SystemState] = None
+    area: Optional[tuple] = None                      # (positions, tier1_price, buy_interval)
+    history: List[Dict] = field(default_factory=list)
+    cells: Dict[str, Any] = field(default_factory=dict)
+
+
+class ExcelWriter:
+    """
+    Excel 저장 전용 스레드
+
+    submit()은 거래 스레드에서 호출되며 워크북을 건드리지 않고 즉시 반환한다.
+    """
+
+    def __init__(self, bridge: ExcelBridge, min_interval: float = 5.0):
+        """
+        Args:
+            bridge: 로드된 ExcelBridge
+            min_interval: 최소 저장 간격 (초)
+        """
+        self.bridge = bridge
+        self.min_interval = min_interval
+
+        self._cond = threading.Condition()
+        self._pending: Optional[_PendingUpdate] = None
+        self._needs_save = False           # 이전 저장 실패 → 다음 주기에 재저장
+        self._flush_requested = False
+        self._stopping = False
+        self._submitted_seq = 0            # submit() 횟수
+        self._written_seq = 0              # 저장 시도까지 끝난 submit() 순번
+        self._last_save = float("-inf")    # time.monotonic
+        self._thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.save_count = 0
+        self.failed_count = 0
+        self.merged_count = 0              # 다른 요청과 병합되어 저장이 생략된 요청 수
+        self.last_save_ok = True
+
+    @property
+    def is_running(self) -> bool:
+        """워커 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """워커 시작"""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="ExcelWriter", daemon=True)
+        self._thread.start()
+        logger.info(f"Excel 백그라운드 저장 시작 (최소 간격 {self.min_interval:.1f}초)")
+
+    def submit(self,
+               state: Optional[SystemState] = None,
+               positions: Optional[Sequence[Position]] = None,
+               tier1_price: float = 0.0,
+               buy_interval: float = 0.005,
+               history_entry: Optional[Dict] = None,
+               cells: Optional[Dict[str, Any]] = None):
+        """
+        갱신 요청 (즉시 반환)
+
+        Args:
+            state: 영역 B 프로그램 정보
+            positions: 영역 D 프로그램 영역 (None이면 갱신 안 함)
+            tier1_price: Tier 1 기준가 (positions와 함께 사용)
+            buy_interval: 티어 간 하락 간격 (positions와 함께 사용)
+            history_entry: 히스토리 로그 1행
+            cells: 시트 1 셀 값 ({"B15": False} 등)
+        """
+        with self._cond:
+            pending = self._pending
+            if pending is None:
+                pending = self._pending = _PendingUpdate()
+            else:
+                self.merged_count += 1
+
+            if state is not None:
+                pending.state = state
+            if positions is not None:
+                pending.area = (tuple(positions), tier1_price, buy_interval)
+            if history_entry is not None:
+                pending.history.append(history_entry)
+            if cells:
+                pending.cells.update(cells)
+
+            self._submitted_seq += 1
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """
+        대기 중인 갱신을 간격 제한 없이 즉시 저장하고 완료까지 대기
+
+        워커가 동작하지 않으면 호출 스레드에서 직접 저장한다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 마지막 저장 성공 여부 (타임아웃 시 False)
+        """
+        if not self.is_running:
+            with self._cond:
+                update, self._pending = self._pending, None
+                seq = self._submitted_seq
+                needs_save = self._needs_save
+            if update is not None or needs_save:
+                self._write(update, seq)
+            return self.last_save_ok
+
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            target = self._request_flush_locked()
+            while self._written_seq < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error(f"Excel 저장 대기 시간 초과 ({timeout:.0f}초)")
+                    return False
+                self._cond.wait(remaining)
+            return self.last_save_ok
+
+    def request_flush(self):
+        """대기 중인 갱신을 간격 제한 없이 저장하도록 요청 (완료를 기다리지 않음, 긴급 정지 시 사용)"""
+        with self._cond:
+            self._request_flush_locked()
+
+    def _request_flush_locked(self) -> int:
+        """flush 요청 표시 후 완료 기준 순번 반환 (_cond 보유 상태에서 호출)"""
+        target = self._submitted_seq
+        if self._needs_save and self._pending is None:
+            self._pending = _PendingUpdate()   # 실패한 저장만 다시 시도
+            target = self._submitted_seq = self._submitted_seq + 1
+        if self._written_seq < target:
+            self._flush_requested = True
+            self._cond.notify_all()
+        return target
+
+    def stop(self, timeout: float = 30.0) -> bool:
+        """
+        남은 갱신 저장 후 워커 종료
+
+        Returns:
+            bool: 마지막 저장 성공 여부
+        """
+        saved = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        return saved
+
+    # ============================================
+    # 워커
+    # ============================================
+
+    def _run(self):
+        """저장 루프 (간격 제한 + 병합)"""
+        while True:
+            with self._cond:
+                while not self._has_work() and not self._stopping:
+                    self._cond.wait()
+                if self._stopping and not self._has_work():
+                    return
+
+                # 저장 간격 제한 (flush/종료 요청 시 즉시)
+                while not self._flush_requested and not self._stopping:
+                    remaining = self._last_save + self.min_interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                update, self._pending = self._pending, None
+                seq = self._submitted_seq
+                self._flush_requested = False
+
+            self._write(update, seq)
+
+    def _has_work(self) -> bool:
+        return self._pending is not None or self._needs_save
+
+    def _write(self, update: Optional[_PendingUpdate], seq: int):
+        """워크북 반영 + 저장 (워커 스레드, 또는 워커 미동작 시 호출 스레드)"""
+        saved = False
+        try:
+            if update is not None:
+                self._apply(update)
+            saved = self.bridge.save_workbook()
+        except Exception as e:
+            logger.error(f"Excel 갱신 실패: {e}", exc_info=True)
+
+        with self._cond:
+            self._last_save = time.monotonic()
+            self._needs_save = not saved
+            self.last_save_ok = saved
+            if saved:
+                self.save_count += 1
+            else:
+                self.failed_count += 1
+                logger.warning(f"Excel 저장 실패 - {self.min_interval:.1f}초 후 재시도 (실패 {self.failed_count}회)")
+            self._written_seq = max(self._written_seq, seq)
+            self._cond.notify_all()
+
+    def _apply(self, update: _PendingUpdate):
+        """병합된 갱신을 워크북에 반영"""
+        if update.state is not None:
+            self.bridge.update_program_info(update.state)
+        if update.area is not None:
+            positions, tier1_price, buy_interval = update.area
+            self.bridge.update_program_area(list(positions), tier1_price, buy_interval)
+        for entry in update.history:
+            self.bridge.append_history_log(entry)
+        for cell_ref, value in update.cells.items():
+            self.bridge.update_cell(cell_ref, value)
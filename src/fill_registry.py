@@ -0,0 +1,231 @@
+"""
+Phoenix Trading System v4.3 - 실시간 체결통보 레지스트리
+
+WebSocket 체결통보(해외주식 H0GSCNI0)를 주문번호별로 누적하고,
+체결 대기 측(_wait_for_fill)은 REST 체결내역을 폴링하는 대신 통보를 기다린다.
+통보는 주문 접수 응답보다 먼저 도착할 수 있으므로 대기 등록 여부와 관계없이 보관한다.
+
+체결통보 본문은 AES-256-CBC로 암호화되어 오며, 복호화 키/IV는 구독 응답으로 받는다.
+복호화에는 pycryptodome(선택 의존성)이 필요하다. 설치되지 않았으면
+CRYPTO_AVAILABLE이 False이며 체결 대기는 REST 조회로 동작한다.
+
+사용 예:
+    registry = FillRegistry()
+    registry.set_live(True)                       # 체결통보 구독 성공 시
+    registry.record(parse_fill_notice(fields))    # WebSocket 수신 스레드
+    state = registry.wait("0030123456", 10, timeout=20.0)  # 거래 스레드
+"""
+import base64
+import threading
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import List, Optional
+
+try:
+    from Crypto.Cipher import AES
+    from Crypto.Util.Padding import unpad
+    CRYPTO_AVAILABLE = True
+except ImportError:
+    AES = None
+    unpad = None
+    CRYPTO_AVAILABLE = False
+
+from .fill_status_poller import normalize_order_no
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# 체결통보 필드 (H0GSCNI0, '^' 구분)
+# ============================================
+
+FIELD_ORDER_NO = 2        # ODER_NO 주문번호
+FIELD_SIDE = 4            # SELN_BYOV_CLS 매도매수구분 (01: 매도, 02: 매수)
+FIELD_TICKER = 7          # STCK_SHRN_ISCD 종목코드
+FIELD_QTY = 8             # CNTG_QTY 체결수량 (체결통보) / 주문수량 (접수통보)
+FIELD_PRICE = 9           # CNTG_UNPR 체결단가
+FIELD_REJECTED = 11       # RFUS_YN 거부여부 (0: 정상, 1: 거부)
+FIELD_FILLED = 12         # CNTG_YN 체결여부 (1: 주문/정정/취소/거부, 2: 체결)
+MIN_FIELD_COUNT = 13
+
+
+@dataclass(frozen=True)
+class FillNotice:
+    """체결통보 1건"""
+    order_no: str
+    side: str            # "BUY" 또는 "SELL"
+    ticker: str
+    qty: int             # 이번 통보의 체결 수량
+    price: float         # 이번 통보의 체결 단가
+    filled: bool         # 체결 통보 여부 (False면 접수/거부 통보)
+    rejected: bool       # 주문 거부 여부
+
+
+@dataclass(frozen=True)
+class FillState:
+    """주문번호별 누적 체결 상태 (불변)"""
+    order_no: str
+    filled_qty: int = 0
+    avg_price: float = 0.0
+    rejected: bool = False
+    notice_count: int = 0
+
+
+def parse_fill_notice(fields: List[str]) -> Optional[FillNotice]:
+    """
+    체결통보 필드 목록을 FillNotice로 변환
+
+    Args:
+        fields: 복호화된 본문을 '^'로 나눈 값
+
+    Returns:
+        FillNotice: 해석 결과 (필드 부족/형식 오류 시 None)
+    """
+    if len(fields) < MIN_FIELD_COUNT:
+        logger.warning(f"[체결통보] 필드 수 부족: {len(fields)}개")
+        return None
+
+    try:
+        return FillNotice(
+            order_no=fields[FIELD_ORDER_NO].strip(),
+            side="SELL" if fields[FIELD_SIDE] == "01" else "BUY",
+            ticker=fields[FIELD_TICKER].strip(),
+            qty=int(float(fields[FIELD_QTY] or 0)),
+            price=float(fields[FIELD_PRICE] or 0),
+            filled=fields[FIELD_FILLED] == "2",
+            rejected=fields[FIELD_REJECTED] == "1"
+        )
+    except ValueError as e:
+        logger.warning(f"[체결통보] 형식 오류: {e}")
+        return None
+
+
+def decrypt_notice(cipher_text: str, key: str, iv: str) -> str:
+    """
+    체결통보 본문 복호화 (AES-256-CBC, Base64)
+
+    Args:
+        cipher_text: 암호화된 본문
+        key: 구독 응답의 output.key
+        iv: 구독 응답의 output.iv
+
+    Returns:
+        str: 복호화된 본문 ('^' 구분)
+    """
+    if not CRYPTO_AVAILABLE:
+        raise ImportError("pycryptodome이 설치되지 않았습니다: pip install pycryptodome")
+
+    cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
+    plain = unpad(cipher.decrypt(base64.b64decode(cipher_text)), AES.block_size)
+    return plain.decode("utf-8")
+
+
+class FillRegistry:
+    """
+    주문번호별 체결통보 누적 + 대기 (스레드 안전)
+
+    record()는 WebSocket 수신 측에서, wait()는 거래 스레드에서 호출한다.
+    is_live가 False(체결통보 미구독/연결 끊김)이면 wait()는 바로 반환하므로
+    호출 측은 REST 체결내역 조회로 확인한다.
+    """
+
+    # 보관할 최대 주문 수 (오래된 주문부터 제거)
+    MAX_ORDERS = 200
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._orders: "OrderedDict[str, FillState]" = OrderedDict()
+        self._live = False
+
+        # 통계
+        self.notice_count = 0
+
+    @staticmethod
+    def _key(order_no: str) -> str:
+        """주문번호 정규화 (REST 응답과 통보의 앞자리 0 표기 차이 제거)"""
+        return normalize_order_no(order_no)
+
+    @property
+    def is_live(self) -> bool:
+        """체결통보 수신 중 여부"""
+        return self._live
+
+    def set_live(self, live: bool):
+        """
+        체결통보 수신 상태 변경 (구독 성공 시 True, 연결 종료 시 False)
+
+        False로 바뀌면 대기 중인 wait()를 깨워 REST 조회로 넘어가게 한다.
+        """
+        with self._cond:
+            self._live = live
+            self._cond.notify_all()
+
+    def record(self, notice: FillNotice) -> FillState:
+        """
+        체결통보 반영
+
+        Args:
+            notice: 체결통보
+
+        Returns:
+            FillState: 반영 후 누적 상태
+        """
+        key = self._key(notice.order_no)
+        with self._cond:
+            state = self._orders.pop(key, None) or FillState(order_no=notice.order_no)
+
+            if notice.rejected:
+                state = replace(state, rejected=True)
+            elif notice.filled and notice.qty > 0:
+                total_qty = state.filled_qty + notice.qty
+                avg_price = (state.avg_price * state.filled_qty + notice.price * notice.qty) / total_qty
+                state = replace(state, filled_qty=total_qty, avg_price=avg_price)
+
+            state = replace(state, notice_count=state.notice_count + 1)
+            self._orders[key] = state
+            while len(self._orders) > self.MAX_ORDERS:
+                self._orders.popitem(last=False)
+
+            self.notice_count += 1
+            self._cond.notify_all()
+
+        logger.debug(
+            f"[체결통보] {notice.side} {notice.ticker} 주문번호 {notice.order_no}: "
+            f"{'거부' if notice.rejected else '체결' if notice.filled else '접수'} "
+            f"{notice.qty}주 @ ${notice.price:.2f} (누적 {state.filled_qty}주)"
+        )
+        return state
+
+    def get(self, order_no: str) -> Optional[FillState]:
+        """주문번호의 누적 상태 (통보 없으면 None)"""
+        with self._cond:
+            return self._orders.get(self._key(order_no))
+
+    def wait(self, order_no: str, expected_qty: int, timeout: float) -> Optional[FillState]:
+        """
+        전량 체결 또는 거부 통보까지 대기
+
+        Args:
+            order_no: 주문번호
+            expected_qty: 전량 체결 수량
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            FillState: 마지막 누적 상태 (타임아웃 시 부분 체결일 수 있음, 통보가 없으면 None)
+        """
+        key = self._key(order_no)
+        deadline = time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                state = self._orders.get(key)
+                if state is not None and (state.rejected or state.filled_qty >= expected_qty):
+                    return state
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._live:
+                    return state
+                self._cond.wait(remaining)
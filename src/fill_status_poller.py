@@ -0,0 +1,99 @@
+"""
+Phoenix Trading System v4.3 - 체결내역 일괄 조회 (주문별 ccnl 조회 대체)
+
+주문마다 inquire-ccnl을 호출하지 않고, 당일 체결내역 전체(연속조회 포함)를 한 번 조회해
+짧은 TTL 동안 캐시한 뒤 대기 중인 모든 주문이 자기 행을 꺼내 쓴다.
+여러 체결 확인 스레드가 동시에 요청해도 조회는 한 번만 수행된다 (single-flight).
+
+사용 예:
+    poller = FillStatusPoller(fetch=adapter.fetch_fill_statuses, ttl=1.5)
+    status = poller.get("0030123456")   # 캐시가 오래됐으면 전체 조회 1회
+"""
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_order_no(order_no: str) -> str:
+    """주문번호 정규화 (앞자리 0 표기 차이 제거)"""
+    return order_no.strip().lstrip("0") or "0"
+
+
+class FillStatusPoller:
+    """
+    당일 체결내역 캐시 (스레드 안전)
+
+    fetch()는 {정규화 주문번호: 체결 상태 dict}를 반환하고, 실패 시 None을 반환한다.
+    체결 상태 dict 형식은 KisRestAdapter.get_order_fill_status와 같다.
+    """
+
+    def __init__(self, fetch: Callable[[], Optional[Dict[str, dict]]], ttl: float = 1.5):
+        """
+        Args:
+            fetch: 당일 체결내역 전체 조회 함수
+            ttl: 캐시 유지 시간 (초, 체결 확인 간격보다 짧게)
+        """
+        self._fetch = fetch
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, dict] = {}
+        self._fetched_at = float("-inf")  # time.monotonic
+
+        # 통계
+        self.fetch_count = 0
+        self.hit_count = 0
+
+    def invalidate(self):
+        """캐시 폐기 (다음 get()에서 다시 조회)"""
+        with self._lock:
+            self._fetched_at = float("-inf")
+
+    def get(self, order_no: str) -> dict:
+        """
+        주문번호의 체결 상태
+
+        Args:
+            order_no: 주문번호 (ODNO)
+
+        Returns:
+            dict: status, filled_qty, filled_price, unfilled_qty, reject_reason
+        """
+        with self._lock:
+            if time.monotonic() - self._fetched_at < self.ttl:
+                self.hit_count += 1
+            else:
+                statuses = self._fetch()
+                self.fetch_count += 1
+                if statuses is None:
+                    return self.error_status("체결내역 조회 실패")
+                self._statuses = statuses
+                self._fetched_at = time.monotonic()
+
+            status = self._statuses.get(normalize_order_no(order_no))
+            if status is not None:
+                return dict(status)
+
+            logger.warning(f"주문번호 {order_no}를 찾을 수 없음 (조회된 주문 {len(self._statuses)}건)")
+            return {
+                "status": "접수",
+                "filled_qty": 0,
+                "filled_price": 0.0,
+                "unfilled_qty": 0,
+                "reject_reason": "주문번호를 찾을 수 없음"
+            }
+
+    @staticmethod
+    def error_status(reason: str) -> dict:
+        """체결 조회 실패 결과"""
+        return {
+            "status": "오류",
+            "filled_qty": 0,
+            "filled_price": 0.0,
+            "unfilled_qty": 0,
+            "reject_reason": reason
+        }
@@ -9,6 +9,7 @@ from dataclasses import replace
 import logging
 
 from .models import Position, TradeSignal, GridSettings, SystemState
+from .position_book import PositionBook
 
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,7 @@ class GridEngine:
             settings: 그리드 시스템 설정
         """
         self.settings = settings
-        self.positions: List[Position] = []
+        self._positions = PositionBook()  # [v4.3] 집계 증분 관리 리스트
         self.tier1_price: float = settings.tier1_price  # High Water Mark (초기값: settings에서 가져옴)
         self.current_price: float = 0.0
         self.account_balance: float = settings.investment_usd
@@ -46,6 +47,16 @@ class GridEngine:
         else:
             logger.info(f"[기본 모드] Tier 1은 추적 전용, Tier 2부터 매수 시작")
 
+    @property
+    def positions(self) -> PositionBook:
+        """보유 포지션 리스트 (list 호환)"""
+        return self._positions
+
+    @positions.setter
+    def positions(self, value: List[Position]):
+        """[v4.3] 리스트 대입 시 PositionBook으로 감싸 집계 재계산"""
+        self._positions = value if isinstance(value, PositionBook) else PositionBook(value)
+
     def calculate_tier_price(self, tier: int) -> float:
         """
         특정 티어의 매수 기준가 계산
@@ -112,8 +123,7 @@ class GridEngine:
             return False, None
 
         # 보유 중일 때는 갱신 안함
-        total_quantity = sum(pos.quantity for pos in self.positions)
-        if total_quantity > 0:
+        if self.positions.total_quantity > 0:
             return False, None
 
         # 초기 설정 또는 상승 시 갱신
@@ -156,19 +166,20 @@ class GridEngine:
         start_tier = 1 if self.settings.tier1_trading_enabled else 2
 
         # [P0 FIX] Tier 230 도달 조기 경고 (Risk-03 완화)
-        max_tier_held = max([pos.tier for pos in self.positions], default=0)
+        max_tier_held = self.positions.max_tier
         if max_tier_held >= 230:
             logger.warning(f"⚠️ Tier {max_tier_held} 도달: 위험 수준 접근 (Tier 240까지 {240 - max_tier_held}개 티어 남음)")
 
         # [P0 FIX] Tier 240 도달 시 매수 중단 (Risk-03 완화)
-        if any(pos.tier == 240 for pos in self.positions):
+        if self.positions.holds(240):
             logger.error("🛑 Tier 240 도달: 추가 매수 중단")
             return None
 
-        # 티어 순회 (낮은 티어부터)
-        for tier in range(start_tier, self.settings.total_tiers + 1):
+        # 티어 순회 (낮은 티어부터, [v4.3] 현재가로 도달 가능한 티어까지만)
+        end_tier = min(self.calculate_current_tier(current_price) + 1, self.settings.total_tiers)
+        for tier in range(start_tier, end_tier + 1):
             # 이미 보유 중인 티어는 제외
-            if any(pos.tier == tier for pos in self.positions):
+            if self.positions.holds(tier):
                 continue
 
             # [CUSTOM v3.1] Tier 1 매수 조건
@@ -268,7 +279,7 @@ class GridEngine:
             매도 신호
         """
         # 해당 티어 포지션 찾기
-        position = next((p for p in self.positions if p.tier == tier), None)
+        position = self.positions.get_tier(tier)
         if not position:
             raise ValueError(f"Tier {tier} 포지션을 찾을 수 없음")
 
@@ -440,7 +451,7 @@ class GridEngine:
             tier_positions = []
             total_quantity = 0
             for tier in signal.tiers:
-                position = next((p for p in self.positions if p.tier == tier), None)
+                position = self.positions.get_tier(tier)
                 if not position:
                     logger.warning(f"Tier {tier} 포지션을 찾을 수 없음 (배치 매도 중)")
                     continue
@@ -553,7 +564,7 @@ class GridEngine:
         else:
             # 단일 티어 처리 (기존 로직)
             # 해당 티어 포지션 찾기
-            position = next((p for p in self.positions if p.tier == signal.tier), None)
+            position = self.positions.get_tier(signal.tier)
             if not position:
                 raise ValueError(f"Tier {signal.tier} 포지션을 찾을 수 없음")
 
@@ -624,12 +635,12 @@ class GridEngine:
         """
         self.current_price = current_price
 
-        # 집계 계산
-        total_quantity = sum(pos.quantity for pos in self.positions)
-        total_invested = sum(pos.invested_amount for pos in self.positions)
+        # [v4.3] 집계값은 PositionBook에서 증분 관리 (O(1))
+        total_quantity = self.positions.total_quantity
+        total_invested = self.positions.total_invested
 
-        # 주식 평가액 (수정: Position.current_value 메서드 사용)
-        stock_value = sum(pos.current_value(current_price) for pos in self.positions)
+        # 주식 평가액 (Position.current_value = 수량 × 현재가)
+        stock_value = total_quantity * current_price
 
         # 총 자산 = 현금 + 주식 (실현 손익 반영)
         equity = self.account_balance + stock_value
@@ -713,9 +724,12 @@ class GridEngine:
             buy_batch = []  # (tier, quantity) 튜플 리스트
             start_tier = 1 if self.settings.tier1_trading_enabled else 2
 
-            for tier in range(start_tier, self.settings.total_tiers + 1):
+            # [v4.3] 매수가는 티어 번호에 대해 단조 감소 → 현재 티어까지만 확인 (경계 오차 대비 +1)
+            end_tier = min(self.calculate_current_tier(current_price) + 1, self.settings.total_tiers)
+
+            for tier in range(start_tier, end_tier + 1):
                 # 이미 보유 중인 티어는 제외
-                if any(pos.tier == tier for pos in self.positions):
+                if self.positions.holds(tier):
                     continue
 
                 # 티어 매수 조건 확인
@@ -10,7 +10,7 @@ Phoenix Grid Engine v4.0 - State Machine Edition
 ✅ H7. 예외 발생 시 안전한 복구 (ERROR 상태)
 """
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from math import floor
 from dataclasses import replace
@@ -18,6 +18,7 @@ import logging
 import threading
 
 from .models import Position, TradeSignal, GridSettings, SystemState
+from .price_mailbox import TickBatch
 
 # 상태 머신 import
 import sys
@@ -66,6 +67,15 @@ class GridEngineV4:
         self._process_lock = threading.RLock()  # process_tick 동시 호출 방지
         self._buy_cooldown_until: Optional[datetime] = None  # 잔고 부족 시 매수 재시도 쿨다운
         self._last_known_balance: float = 0.0  # 쿨다운 설정 시점의 잔고
+
+        # [v4.3] 다음 트리거 가격 캐시 (상태 머신 version 기준으로 무효화)
+        self._trigger_version: int = -1
+        self._next_buy_trigger: float = float("-inf")   # EMPTY Tier 중 최고 매수가
+        self._next_sell_trigger: float = float("inf")   # FILLED Tier 중 최저 매도가
+
+        # [v4.3] positions 호환 프로퍼티 캐시 (상태 머신 version 기준으로 무효화)
+        self._positions_version: int = -1
+        self._positions_cache: Tuple[Position, ...] = ()
         self._init_state_machine()
 
         # 검증
@@ -81,27 +91,44 @@ class GridEngineV4:
         상태 머신 초기화 - 모든 Tier 설정
 
         [v4.1] FILLED 상태 Tier는 보존하고, EMPTY Tier만 가격 재계산
+        [v4.3] 가격표를 한 번에 계산해 상태머신에 일괄 반영 (단일 Lock)
         """
-        preserved = 0
-        for tier in range(1, self.settings.total_tiers + 1):
-            buy_price = self.calculate_tier_price(tier)
-            sell_price = buy_price * (1 + self.settings.sell_target)
-
-            # [v4.1] FILLED 상태 Tier 보존 (update_tier1 재호출 시)
-            existing = self.state_machine.get_tier(tier)
-            if existing and existing.state == TierState.FILLED and existing.quantity > 0:
-                # 가격만 업데이트하고 상태/포지션 정보는 보존
-                with self.state_machine._lock:
-                    real_tier = self.state_machine._tiers.get(tier)
-                    if real_tier:
-                        real_tier.buy_price = buy_price
-                        real_tier.sell_price = sell_price
-                preserved += 1
-            else:
-                self.state_machine.initialize_tier(tier, buy_price, sell_price)
+        buy_prices, sell_prices = self._build_price_table()
+        preserved = self.state_machine.reprice_tiers(buy_prices, sell_prices, reset_unfilled=True)
 
         logger.info(f"상태 머신: {self.settings.total_tiers}개 Tier 초기화 완료 (보존: {preserved}개)")
 
+    def _build_price_table(self) -> Tuple[List[float], List[float]]:
+        """
+        [v4.3] 전체 Tier 매수가/매도가 표 계산 (Tier 1부터 순서대로)
+
+        calculate_tier_price()와 같은 공식이며, 최소가 미만 경고는 한 번만 남긴다.
+
+        Returns:
+            Tuple[List[float], List[float]]: (매수가 목록, 매도가 목록)
+        """
+        tier1_price = self.tier1_price
+        buy_interval = self.settings.buy_interval
+        sell_multiplier = 1 + self.settings.sell_target
+
+        buy_prices = [tier1_price]
+        clamped = 0
+        for tier in range(2, self.settings.total_tiers + 1):
+            tier_price = tier1_price * (1 - (tier - 1) * buy_interval)
+            if tier_price < self.MIN_PRICE:
+                tier_price = self.MIN_PRICE
+                clamped += 1
+            buy_prices.append(tier_price)
+
+        if clamped:
+            logger.warning(
+                f"Tier {self.settings.total_tiers - clamped + 1}~{self.settings.total_tiers} "
+                f"계산 가격이 최소값 미만, ${self.MIN_PRICE}로 조정"
+            )
+
+        sell_prices = [price * sell_multiplier for price in buy_prices]
+        return buy_prices, sell_prices
+
     def calculate_tier_price(self, tier: int) -> float:
         """
         특정 티어의 매수 기준가 계산
@@ -126,20 +153,24 @@ class GridEngineV4:
 
         return tier_price
 
-    def calculate_current_tier(self, current_price: float) -> int:
+    def calculate_current_tier(self, current_price: float, tier1_price: Optional[float] = None) -> int:
         """
         현재가 기준으로 현재 티어 계산
 
         Args:
             current_price: 현재가 (USD)
+            tier1_price: [v4.3] 기준 Tier 1 가격 (None이면 self.tier1_price)
 
         Returns:
             현재 티어 (1~240)
         """
-        if self.tier1_price == 0 or current_price >= self.tier1_price:
+        if tier1_price is None:
+            tier1_price = self.tier1_price
+
+        if tier1_price == 0 or current_price >= tier1_price:
             return 1
 
-        decline_rate = (self.tier1_price - current_price) / self.tier1_price
+        decline_rate = (tier1_price - current_price) / tier1_price
         tier = int(decline_rate / self.settings.buy_interval) + 1
 
         return min(tier, self.settings.total_tiers)
@@ -218,47 +249,132 @@ class GridEngineV4:
             # 1. Tier 1 갱신 확인
             self.update_tier1(current_price)
 
-            # 2. 매도 조건 확인 (배치)
-            if not self.settings.sell_limit:
-                sell_signal = self._process_sell_batch(current_price)
-                if sell_signal:
-                    signals.append(sell_signal)
+            return self._scan_signals(current_price, current_price, current_price)
+
+    def process_tick_batch(self, batch: TickBatch) -> List[TradeSignal]:
+        """
+        [v4.3] Mailbox에서 꺼낸 병합 시세 처리
+
+        구간의 극값을 발생 순서대로(TickBatch.prices()) 확인해 틱을 하나씩 처리한 것과 같은 격자에서
+        트리거를 판단한다 (저가 후 고가면 Tier 1 갱신 전 격자로 매수 판단).
+        주문 가격은 마지막 가격 기준이되 매수는 Tier 매수가 이하, 매도는 Tier 매도가 이상으로 제한한다.
+        신호가 생성된 Tier는 매수 LOCKED / 매도 SELLING으로 예약되므로 같은 구간에서 중복 신호가 없다.
+
+        Args:
+            batch: TickMailbox.take()가 반환한 병합 시세
 
-            # 3. 매수 조건 확인 (배치, 제한 적용)
-            if not self.settings.buy_limit:
-                buy_signal = self._process_buy_batch(current_price)
-                if buy_signal:
-                    signals.append(buy_signal)
+        Returns:
+            생성된 거래 신호 리스트
+        """
+        with self._process_lock:
+            if batch.last <= 0 or batch.low <= 0:
+                logger.warning(f"유효하지 않은 시세 구간: ${batch.low:.4f}~${batch.high:.4f}, 처리 건너뜀")
+                return []
 
+            self.current_price = batch.last
+
+            signals = []
+            for price in batch.prices():
+                # 1. Tier 1 갱신 확인 (발생 순서대로 → 먼저 스친 저가는 갱신 전 격자로 판단)
+                self.update_tier1(price)
+                signals.extend(self._scan_signals(batch.last, price, price))
+            return signals
+
+    def _scan_signals(self, order_price: float, low: float, high: float) -> List[TradeSignal]:
+        """
+        [v4.3] 매도/매수 트리거 확인 (_process_lock 보유 상태에서 호출)
+
+        Args:
+            order_price: 주문 가격 (현재가)
+            low: 매수 트리거 판단 가격
+            high: 매도 트리거 판단 가격
+
+        Returns:
+            생성된 거래 신호 리스트
+        """
+        signals = []
+
+        # [v4.3] 다음 매수/매도 트리거 사이의 가격이면 즉시 반환 (대부분의 틱)
+        if self._is_between_triggers(low, high):
             return signals
 
-    def _process_sell_batch(self, current_price: float) -> Optional[TradeSignal]:
+        # 2. 매도 조건 확인 (배치)
+        if not self.settings.sell_limit:
+            sell_signal = self._process_sell_batch(order_price, high)
+            if sell_signal:
+                signals.append(sell_signal)
+
+        # 3. 매수 조건 확인 (배치, 제한 적용)
+        if not self.settings.buy_limit:
+            buy_signal = self._process_buy_batch(order_price, low)
+            if buy_signal:
+                signals.append(buy_signal)
+
+        return signals
+
+    def _refresh_trigger_bounds(self):
+        """[v4.3] 상태 머신이 바뀐 경우에만 다음 트리거 가격 재계산"""
+        version = self.state_machine.version
+        if version == self._trigger_version:
+            return
+
+        start_tier = 1 if self.settings.tier1_trading_enabled else 2
+        self._next_buy_trigger, self._next_sell_trigger = self.state_machine.get_trigger_bounds(start_tier)
+        self._trigger_version = version
+
+    def _is_between_triggers(self, low: float, high: float) -> bool:
+        """
+        [v4.3] 가격 구간이 매수/매도 트리거 사이에 있는지 확인
+
+        매수: low <= EMPTY Tier 매수가 / 매도: high >= FILLED Tier 매도가
+        두 조건 모두 불가능하면 배치 스캔을 생략해도 결과가 같다 (단일 틱은 low == high).
+
+        Args:
+            low: 매수 트리거 판단 가격
+            high: 매도 트리거 판단 가격
+
+        Returns:
+            bool: True면 이번 틱에서 생성될 신호 없음
+        """
+        self._refresh_trigger_bounds()
+
+        next_buy = float("-inf") if self.settings.buy_limit else self._next_buy_trigger
+        next_sell = float("inf") if self.settings.sell_limit else self._next_sell_trigger
+
+        return next_buy < low and high < next_sell
+
+    def _process_sell_batch(self, current_price: float, trigger_price: Optional[float] = None) -> Optional[TradeSignal]:
         """
         [v4.1] 매도 배치 처리 - 상태머신에서 포지션 정보 조회
 
+        [v4.3] 신호에 포함된 Tier는 FILLED → SELLING으로 예약한다 (cancel_signal로 복원).
+        주문 가격은 현재가이되 포함된 Tier의 매도가 미만으로 내려가지 않는다.
+
         Args:
-            current_price: 현재가
+            current_price: 현재가 (주문 가격 기준)
+            trigger_price: 매도가 도달 판단 가격 (병합 시세의 구간 고가, None이면 현재가)
 
         Returns:
             매도 신호 (없으면 None)
         """
-        sell_batch = []  # (tier, quantity, avg_price)
+        if trigger_price is None:
+            trigger_price = current_price
 
-        # [v4.1] 상태머신에서 FILLED + quantity > 0 인 Tier 조회
-        filled_tiers = self.state_machine.get_filled_tiers()
+        sell_batch = []  # (tier, quantity, avg_price)
+        order_price = current_price
 
-        for tier_info in sorted(filled_tiers, key=lambda t: t.tier_id, reverse=True):
+        # [v4.3] 매도가 인덱스에서 트리거 가격 이상으로 도달한 FILLED Tier만 조회 (높은 Tier부터)
+        for tier_info in self.state_machine.get_sell_candidates(trigger_price):
             tier = tier_info.tier_id
-            sell_price = tier_info.sell_price
-
-            if current_price >= sell_price:
-                if tier_info.quantity > 0:
-                    sell_batch.append((tier, tier_info.quantity, tier_info.avg_price))
-                    actual_profit_rate = (current_price - tier_info.avg_price) / tier_info.avg_price if tier_info.avg_price > 0 else 0
-                    logger.debug(
-                        f"매도 배치 추가: Tier {tier}, {tier_info.quantity}주 "
-                        f"(실제수익률: {actual_profit_rate:.2%})"
-                    )
+            if not self.state_machine.try_lock_for_sell(tier):
+                continue
+            sell_batch.append((tier, tier_info.quantity, tier_info.avg_price))
+            order_price = max(order_price, tier_info.sell_price)
+            actual_profit_rate = (current_price - tier_info.avg_price) / tier_info.avg_price if tier_info.avg_price > 0 else 0
+            logger.debug(
+                f"매도 배치 추가: Tier {tier}, {tier_info.quantity}주 "
+                f"(실제수익률: {actual_profit_rate:.2%})"
+            )
 
         # 매도 배치 신호 생성
         if sell_batch:
@@ -267,31 +383,35 @@ class GridEngineV4:
 
             # 실제 평균 수익률 계산
             weighted_avg_price = sum(qty * avg_price for _, qty, avg_price in sell_batch) / total_qty
-            avg_profit_rate = (current_price - weighted_avg_price) / weighted_avg_price
+            avg_profit_rate = (order_price - weighted_avg_price) / weighted_avg_price
 
             signal = TradeSignal(
                 action="SELL",
                 tier=tiers[0],
                 tiers=tiers,
-                price=current_price,
+                price=order_price,
                 quantity=total_qty,
                 reason=f"배치 매도 {len(tiers)}개 Tier (평균수익률: {avg_profit_rate:.2%})"
             )
-            logger.info(f"[BATCH SELL] {len(tiers)}개 Tier, 총 {total_qty}주 @ ${current_price:.2f}")
+            logger.info(f"[BATCH SELL] {len(tiers)}개 Tier, 총 {total_qty}주 @ ${order_price:.2f}")
             return signal
 
         return None
 
-    def _process_buy_batch(self, current_price: float) -> Optional[TradeSignal]:
+    def _process_buy_batch(self, current_price: float, trigger_price: Optional[float] = None) -> Optional[TradeSignal]:
         """
         [v4.0] 매수 배치 처리 - Gap Trading 제한 적용
 
         Args:
-            current_price: 현재가
+            current_price: 현재가 (주문 가격/수량 기준, [v4.3] 포함된 Tier의 매수가를 넘지 않음)
+            trigger_price: [v4.3] 매수가 도달 판단 가격 (병합 시세의 구간 극값, None이면 현재가)
 
         Returns:
             매수 신호 (없으면 None)
         """
+        if trigger_price is None:
+            trigger_price = current_price
+
         # [FIX] 잔고 부족 쿨다운 체크 - 잔고가 변하지 않으면 재시도 안 함
         if self._buy_cooldown_until is not None:
             balance_changed = self.state_machine.account_balance != self._last_known_balance
@@ -306,33 +426,46 @@ class GridEngineV4:
                 return None  # 쿨다운 중 - 조용히 스킵
 
         buy_batch = []  # (tier, quantity)
+        order_price = current_price
         start_tier = 1 if self.settings.tier1_trading_enabled else 2
 
-        for tier in range(start_tier, self.settings.total_tiers + 1):
+        # [v4.3] 매수가는 Tier 번호에 대해 단조 감소 → 현재가로 도달 가능한 마지막 Tier까지만 확인
+        # (상태머신 가격표의 Tier 1 가격 기준, 경계 오차 대비 +1)
+        tier1_info = self.state_machine.get_tier(1)
+        if not tier1_info:
+            return None
+        end_tier = min(
+            self.calculate_current_tier(trigger_price, tier1_info.buy_price) + 1,
+            self.settings.total_tiers
+        )
+
+        for tier in self.state_machine.iter_empty_tiers(start_tier, end_tier):
             tier_info = self.state_machine.get_tier(tier)
             if not tier_info:
                 continue
 
             # Tier 매수 조건 확인
             tier_price = tier_info.buy_price
-            if current_price <= tier_price:
+            if trigger_price <= tier_price:
                 # [v4.0 FIX] Race Condition 방지: EMPTY 체크와 LOCK을 원자적으로 수행
                 if not self.state_machine.try_lock_for_buy(tier):
                     # 이미 다른 스레드가 처리 중이거나 EMPTY가 아님
                     continue
 
-                # 수량 계산
-                raw_qty = self.settings.tier_amount / current_price
+                # 수량 계산 ([v4.3] 주문 가격은 Tier 매수가 이하)
+                price = min(order_price, tier_price)
+                raw_qty = self.settings.tier_amount / price
                 quantity = max(1, floor(raw_qty))
 
                 # [v4.0] 수량 검증
-                if not self._validate_order_quantity(tier, quantity, current_price):
+                if not self._validate_order_quantity(tier, quantity, price):
                     logger.warning(f"Tier {tier}: 수량 검증 실패, 매수 건너뜀")
                     # Lock 해제 (원래 상태로 복원)
                     self.state_machine.unlock(tier, TierState.EMPTY)
                     continue
 
                 buy_batch.append((tier, quantity))
+                order_price = price
                 logger.debug(f"매수 배치 추가: Tier {tier}, {quantity}주 (LOCKED)")
 
                 # [v4.0] 배치 제한 확인
@@ -346,7 +479,7 @@ class GridEngineV4:
         # 매수 배치 신호 생성
         if buy_batch:
             total_qty = sum(qty for _, qty in buy_batch)
-            total_cost = total_qty * current_price
+            total_cost = total_qty * order_price
 
             # [v4.1] 잔고 확인 (상태머신에서 관리)
             if self.state_machine.account_balance >= total_cost:
@@ -356,13 +489,13 @@ class GridEngineV4:
                     action="BUY",
                     tier=tiers[0],
                     tiers=tiers,
-                    price=current_price,
+                    price=order_price,
                     quantity=total_qty,
                     reason=f"배치 매수 {len(tiers)}개 Tier"
                 )
                 logger.info(
                     f"[BATCH BUY] {len(tiers)}개 Tier, 총 {total_qty}주 @ "
-                    f"${current_price:.2f} (비용: ${total_cost:.2f})"
+                    f"${order_price:.2f} (비용: ${total_cost:.2f})"
                 )
                 return signal
             else:
@@ -382,6 +515,139 @@ class GridEngineV4:
 
         return None
 
+    @staticmethod
+    def _tier_share(total_qty: int, num_tiers: int, idx: int) -> int:
+        """배치 주문의 Tier별 수량 (나머지는 첫 Tier에 할당)"""
+        return total_qty // num_tiers + (total_qty % num_tiers if idx == 0 else 0)
+
+    def reserve_signal(self, signal: TradeSignal, reservation_id: str) -> bool:
+        """
+        [v4.3] 주문 전송 전 Tier 예약 (매수 LOCKED → ORDERING, 매도 FILLED/예약 SELLING → SELLING)
+
+        예약 번호를 주문번호 자리에 기록해 두므로, 같은 Tier에 대한 두 번째 신호는 예약에 실패한다.
+        일부 Tier만 예약된 경우 예약한 Tier를 되돌리고 False를 반환한다.
+
+        Args:
+            signal: 전송할 신호
+            reservation_id: 예약 번호 (브로커 접수 후 submit_order에서 주문번호로 교체)
+
+        Returns:
+            bool: 모든 Tier 예약 성공 여부
+        """
+        with self._process_lock:
+            reserved = []
+            for idx, tier in enumerate(signal.tiers):
+                if signal.action == "BUY":
+                    tier_ordered_qty = self._tier_share(signal.quantity, len(signal.tiers), idx)
+                    marked = self.state_machine.mark_ordering(tier, reservation_id, tier_ordered_qty)
+                else:
+                    marked = self.state_machine.mark_selling(tier, reservation_id)
+
+                if not marked:
+                    tier_info = self.state_machine.get_tier(tier)
+                    logger.warning(
+                        f"Tier {tier}: 주문 전 예약 실패 ({signal.action}, "
+                        f"상태={tier_info.state.value if tier_info else '없음'}, "
+                        f"주문번호={tier_info.order_id if tier_info else ''})"
+                    )
+                    self._release_tiers(signal.action, reserved, reservation_id)
+                    return False
+                reserved.append(tier)
+            return True
+
+    def submit_order(self, signal: TradeSignal, order_id: str, reservation_id: Optional[str] = None) -> bool:
+        """
+        [v4.3] 주문 접수 완료 마킹 (체결 확인 전)
+
+        매수 Tier는 LOCKED → ORDERING, 매도 Tier는 FILLED → SELLING으로 전이해
+        체결을 기다리는 동안 다음 틱에서 같은 Tier로 신호가 다시 생성되지 않게 한다.
+        reserve_signal()로 예약한 경우 예약 번호를 주문번호로 교체한다.
+
+        Args:
+            signal: 원래 신호
+            order_id: 주문 번호
+            reservation_id: reserve_signal()에 사용한 예약 번호 (None이면 예약 없이 전이)
+
+        Returns:
+            bool: 모든 Tier 전이 성공 여부
+        """
+        with self._process_lock:
+            ok = True
+            for idx, tier in enumerate(signal.tiers):
+                if reservation_id is not None:
+                    marked = self.state_machine.reassign_order(tier, reservation_id, order_id)
+                elif signal.action == "BUY":
+                    tier_ordered_qty = self._tier_share(signal.quantity, len(signal.tiers), idx)
+                    marked = self.state_machine.mark_ordering(tier, order_id, tier_ordered_qty)
+                else:
+                    marked = self.state_machine.mark_selling(tier, order_id)
+
+                if not marked:
+                    logger.warning(f"Tier {tier}: 주문 접수 상태 전이 실패 ({signal.action}, 주문번호 {order_id})")
+                    ok = False
+            return ok
+
+    def release_signal(self, signal: TradeSignal, reservation_id: str, error_message: str = ""):
+        """
+        [v4.3] reserve_signal() 예약 해제 (예약 번호가 그대로 남아 있는 Tier만)
+
+        Args:
+            signal: 예약한 신호
+            reservation_id: 예약 번호
+            error_message: 지정하면 원래 상태로 되돌리지 않고 ERROR로 마킹 (수동 확인 필요)
+        """
+        with self._process_lock:
+            self._release_tiers(signal.action, signal.tiers, reservation_id, error_message)
+
+    def _release_tiers(self, action: str, tiers: Sequence[int], reservation_id: str, error_message: str = ""):
+        """예약 해제 (_process_lock 보유 상태에서 호출)"""
+        for tier in tiers:
+            tier_info = self.state_machine.get_tier(tier)
+            if not tier_info or tier_info.order_id != reservation_id:
+                continue
+            if error_message:
+                self.state_machine.mark_error(tier, error_message)
+            elif action == "BUY" and tier_info.state == TierState.ORDERING:
+                self.state_machine.transition(tier, TierState.EMPTY)
+            elif action == "SELL" and tier_info.state == TierState.SELLING:
+                self.state_machine.transition(tier, TierState.FILLED)
+
+    def cancel_signal(self, signal: TradeSignal):
+        """
+        [v4.3] 주문 전송 전 신호 취소 (오류 마킹 없음)
+
+        매수는 LOCKED Tier를 EMPTY로, 매도는 예약된 SELLING Tier를 FILLED로 복원한다.
+
+        Args:
+            signal: 전송하지 않을 신호
+        """
+        with self._process_lock:
+            for tier in signal.tiers:
+                if signal.action == "BUY":
+                    self.state_machine.unlock(tier, TierState.EMPTY)
+                else:
+                    tier_info = self.state_machine.get_tier(tier)
+                    if tier_info and tier_info.state == TierState.SELLING and not tier_info.order_id:
+                        self.state_machine.transition(tier, TierState.FILLED)
+
+    def estimate_sell_profit(self, signal: TradeSignal, filled_price: float) -> float:
+        """
+        [v4.3] 매도 신호 Tier들의 예상 수익금 (매도 확정 전 상태머신 기준)
+
+        Args:
+            signal: 매도 신호
+            filled_price: 체결가
+
+        Returns:
+            float: 수익금 (USD)
+        """
+        profit = 0.0
+        for tier in (signal.tiers or [signal.tier]):
+            tier_info = self.state_machine.get_tier(tier)
+            if tier_info and tier_info.quantity > 0:
+                profit += (filled_price - tier_info.avg_price) * tier_info.quantity
+        return profit
+
     def confirm_order(
         self,
         signal: TradeSignal,
@@ -394,6 +660,8 @@ class GridEngineV4:
         """
         [v4.0] 주문 결과 확인 및 상태 업데이트
 
+        [v4.3] 체결 확인 스레드에서 호출되므로 틱 처리와 같은 Lock으로 보호한다.
+
         Args:
             signal: 원래 신호
             order_id: 주문 번호
@@ -402,10 +670,11 @@ class GridEngineV4:
             success: 성공 여부
             error_message: 오류 메시지 (실패 시)
         """
-        if signal.action == "BUY":
-            self._confirm_buy_order(signal, order_id, filled_qty, filled_price, success, error_message)
-        elif signal.action == "SELL":
-            self._confirm_sell_order(signal, order_id, filled_qty, filled_price, success, error_message)
+        with self._process_lock:
+            if signal.action == "BUY":
+                self._confirm_buy_order(signal, order_id, filled_qty, filled_price, success, error_message)
+            elif signal.action == "SELL":
+                self._confirm_sell_order(signal, order_id, filled_qty, filled_price, success, error_message)
 
     def _confirm_buy_order(
         self,
@@ -431,22 +700,21 @@ class GridEngineV4:
 
         # [FIX] 배치 주문 수량 분배
         num_tiers = len(signal.tiers)
-        # 원래 주문 수량 (signal.quantity)과 실제 체결 수량 (filled_qty) 분리
-        ordered_base_qty = signal.quantity // num_tiers
-        ordered_remainder = signal.quantity % num_tiers
-
-        filled_base_qty = filled_qty // num_tiers
-        filled_remainder = filled_qty % num_tiers
-
         total_filled = 0  # 검증용
 
         for idx, tier in enumerate(signal.tiers):
-            # 각 Tier별 원래 주문 수량과 실제 체결 수량
-            tier_ordered_qty = ordered_base_qty + (ordered_remainder if idx == 0 else 0)
-            tier_filled_qty = filled_base_qty + (filled_remainder if idx == 0 else 0)
+            # 각 Tier별 원래 주문 수량 (signal.quantity)과 실제 체결 수량 (filled_qty)
+            tier_ordered_qty = self._tier_share(signal.quantity, num_tiers, idx)
+            tier_filled_qty = self._tier_share(filled_qty, num_tiers, idx)
 
-            # 1. ORDERING 상태로 전이 (원래 주문 수량 기록)
-            if not self.state_machine.mark_ordering(tier, order_id, tier_ordered_qty):
+            # 1. ORDERING 상태로 전이 (원래 주문 수량 기록, [v4.3] submit_order로 이미 전이된 경우 유지)
+            tier_info = self.state_machine.get_tier(tier)
+            already_ordering = (
+                tier_info is not None
+                and tier_info.state == TierState.ORDERING
+                and tier_info.order_id == order_id
+            )
+            if not already_ordering and not self.state_machine.mark_ordering(tier, order_id, tier_ordered_qty):
                 logger.warning(f"Tier {tier}: ORDERING 상태 전이 실패")
                 continue
 
@@ -480,7 +748,12 @@ class GridEngineV4:
         """매도 주문 확인"""
         if not success:
             for tier in signal.tiers:
-                self.state_machine.mark_error(tier, error_message)
+                tier_info = self.state_machine.get_tier(tier)
+                if tier_info and tier_info.state == TierState.SELLING:
+                    # [v4.3] 접수 후 미체결 → 보유 포지션 유지 (다음 틱에서 다시 매도 대상)
+                    self.state_machine.transition(tier, TierState.FILLED)
+                else:
+                    self.state_machine.mark_error(tier, error_message)
                 logger.error(f"Tier {tier} 매도 실패: {error_message}")
             return
 
@@ -491,8 +764,9 @@ class GridEngineV4:
                 logger.warning(f"Tier {tier} 매도 대상 포지션 없음")
                 continue
 
-            # 2. SELLING 상태로
-            self.state_machine.transition(tier, TierState.SELLING, order_id=order_id)
+            # 2. SELLING 상태로 ([v4.3] submit_order로 이미 전이된 경우 유지)
+            if tier_info.state != TierState.SELLING:
+                self.state_machine.transition(tier, TierState.SELLING, order_id=order_id)
 
             # 3. [v4.1] 상태머신에서 잔고 복구 + 포지션 초기화 원자적 처리
             profit, total_proceeds = self.state_machine.sell_tier(tier, filled_price)
@@ -525,38 +799,84 @@ class GridEngineV4:
 
         return False, None
 
+    def restore_positions(self, tier1_price: float, positions: Sequence[Position]) -> int:
+        """
+        [v4.3] 재시작 복구: Tier 1 기준가 + 보유 포지션 복원 (잔고 변경 없음)
+
+        기준가로 가격표를 다시 계산한 뒤 각 Tier를 FILLED로 복원한다.
+
+        Args:
+            tier1_price: 복구한 Tier 1 기준가 (High Water Mark)
+            positions: 복원할 포지션
+
+        Returns:
+            int: 복원한 포지션 수
+        """
+        with self._process_lock:
+            self.tier1_price = tier1_price
+            self._update_tier_prices()
+
+            restored = 0
+            for pos in positions:
+                if self.state_machine.restore_position(
+                    pos.tier, pos.quantity, pos.avg_price, pos.invested_amount, pos.opened_at
+                ):
+                    restored += 1
+
+        logger.info(f"[RECOVERY] Tier 1 ${tier1_price:.2f}, 포지션 {restored}개 복원")
+        return restored
+
+    def restore_order(self, signal: TradeSignal, order_id: str) -> bool:
+        """
+        [v4.3] 재시작 복구: 브로커에서 진행 중인 주문을 Tier에 다시 걸기
+
+        매수 Tier는 EMPTY → LOCKED → ORDERING, 매도 Tier는 FILLED → SELLING (restore_positions 이후 호출).
+
+        Args:
+            signal: 주문 신호 (Tier/수량은 저장된 주문 기준)
+            order_id: 브로커 주문번호
+
+        Returns:
+            bool: 모든 Tier 전이 성공 여부 (실패 시 변경 없음)
+        """
+        with self._process_lock:
+            if signal.action == "BUY":
+                locked = [tier for tier in signal.tiers if self.state_machine.try_lock_for_buy(tier)]
+                if len(locked) != len(signal.tiers):
+                    for tier in locked:
+                        self.state_machine.unlock(tier, TierState.EMPTY)
+                    return False
+            if not self.reserve_signal(signal, order_id):
+                self.cancel_signal(signal)
+                return False
+
+        logger.info(f"[RECOVERY] 진행 중 주문 복원: {signal.action} Tiers {signal.tiers}, 주문번호 {order_id}")
+        return True
+
     def _update_tier_prices(self):
         """기존 상태를 보존하면서 모든 Tier의 가격만 재계산"""
-        with self.state_machine._lock:
-            for tier in range(1, self.settings.total_tiers + 1):
-                buy_price = self.calculate_tier_price(tier)
-                sell_price = buy_price * (1 + self.settings.sell_target)
-
-                tier_info = self.state_machine._tiers.get(tier)
-                if tier_info:
-                    # 가격만 갱신, 상태/주문정보는 보존
-                    tier_info.buy_price = buy_price
-                    tier_info.sell_price = sell_price
-                else:
-                    # 새 티어면 초기화
-                    self.state_machine.initialize_tier(tier, buy_price, sell_price)
+        # [v4.3] 가격만 일괄 갱신, 상태/주문정보는 보존 (새 티어면 초기화)
+        buy_prices, sell_prices = self._build_price_table()
+        self.state_machine.reprice_tiers(buy_prices, sell_prices)
 
         logger.info(f"Tier 가격 재계산 완료 (상태 보존)")
 
     def get_status(self) -> dict:
         """[v4.1] 시스템 상태 조회 - 상태 머신 정보 포함"""
         totals = self.state_machine.get_total_positions(self.current_price)
+        # [v4.3] 상태별 개수는 스냅샷의 증분 카운터 사용 (Tier 복사 없음)
+        counts = self.state_machine.snapshot().state_counts
         return {
             'tier1_price': self.tier1_price,
             'current_price': self.current_price,
             'account_balance': self.state_machine.account_balance,
             'total_positions': totals['position_count'],
             'state_summary': {
-                'EMPTY': len(self.state_machine.get_tiers_by_state(TierState.EMPTY)),
-                'ORDERING': len(self.state_machine.get_tiers_by_state(TierState.ORDERING)),
-                'FILLED': len(self.state_machine.get_tiers_by_state(TierState.FILLED)),
-                'PARTIAL_FILLED': len(self.state_machine.get_tiers_by_state(TierState.PARTIAL_FILLED)),
-                'ERROR': len(self.state_machine.get_tiers_by_state(TierState.ERROR)),
+                'EMPTY': counts[TierState.EMPTY],
+                'ORDERING': counts[TierState.ORDERING],
+                'FILLED': counts[TierState.FILLED],
+                'PARTIAL_FILLED': counts[TierState.PARTIAL_FILLED],
+                'ERROR': counts[TierState.ERROR],
             }
         }
 
@@ -569,18 +889,23 @@ class GridEngineV4:
         """
         [v4.1 호환성] 상태머신에서 Position 리스트 생성
         phoenix_main.py 등에서 engine.positions 접근 시 호환성 유지
+
+        [v4.3] 상태 스냅샷 버전이 같으면 이전에 만든 Position을 재사용
         """
-        filled_tiers = self.state_machine.get_filled_tiers()
-        return [
-            Position(
-                tier=t.tier_id,
-                quantity=t.quantity,
-                avg_price=t.avg_price,
-                invested_amount=t.invested_amount,
-                opened_at=t.opened_at or datetime.now()
+        snapshot = self.state_machine.snapshot()
+        if snapshot.version != self._positions_version:
+            self._positions_cache = tuple(
+                Position(
+                    tier=t.tier_id,
+                    quantity=t.quantity,
+                    avg_price=t.avg_price,
+                    invested_amount=t.invested_amount,
+                    opened_at=t.opened_at or datetime.now()
+                )
+                for t in snapshot.filled()
             )
-            for t in filled_tiers
-        ]
+            self._positions_version = snapshot.version
+        return list(self._positions_cache)
 
     @positions.setter
     def positions(self, value):
@@ -588,27 +913,20 @@ class GridEngineV4:
         [v4.1 호환성] positions 설정 시 상태머신에 반영
         테스트 등에서 engine.positions = [...] 할 때 호환성 유지
         """
-        # 기존 FILLED Tier 모두 초기화
-        for tier_id, tier in list(self.state_machine._tiers.items()):
-            if tier.state == TierState.FILLED:
-                with self.state_machine._lock:
-                    tier.state = TierState.EMPTY
-                    tier.quantity = 0
-                    tier.avg_price = 0.0
-                    tier.invested_amount = 0.0
-                    tier.opened_at = None
-
-        # 새 positions 반영
-        for pos in value:
-            tier_info = self.state_machine.get_tier(pos.tier)
-            if tier_info:
-                with self.state_machine._lock:
-                    real_tier = self.state_machine._tiers[pos.tier]
-                    real_tier.state = TierState.FILLED
-                    real_tier.quantity = pos.quantity
-                    real_tier.avg_price = pos.avg_price
-                    real_tier.invested_amount = pos.invested_amount
-                    real_tier.opened_at = pos.opened_at
+        with self.state_machine._lock:
+            # 기존 FILLED Tier 모두 초기화
+            for tier in self.state_machine.get_tiers_by_state(TierState.FILLED):
+                self.state_machine.reset_tier(tier.tier_id)
+
+            # 새 positions 반영
+            for pos in value:
+                self.state_machine.restore_position(
+                    pos.tier,
+                    quantity=pos.quantity,
+                    avg_price=pos.avg_price,
+                    invested_amount=pos.invested_amount,
+                    opened_at=pos.opened_at
+                )
 
     @property
     def account_balance(self) -> float:
@@ -702,11 +1020,7 @@ class GridEngineV4:
         filled_qty = actual_filled_qty if actual_filled_qty is not None else signal.quantity
 
         # [v4.1] 수익 계산 (매도 전에, 상태머신에서 조회)
-        profit = 0.0
-        for tier in (signal.tiers or [signal.tier]):
-            tier_info = self.state_machine.get_tier(tier)
-            if tier_info and tier_info.quantity > 0:
-                profit += (filled_price - tier_info.avg_price) * tier_info.quantity
+        profit = self.estimate_sell_profit(signal, filled_price)
 
         # 더미 order_id
         order_id = f"COMPAT_SELL_{signal.tier}_{datetime.now().strftime('%H%M%S')}"
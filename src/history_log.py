@@ -0,0 +1,142 @@
+"""
+Phoenix Trading System v4.3 - 운용 히스토리 로그 (append-only JSONL)
+
+시트 2 "02_운용로그_히스토리"에 모든 행을 쌓으면 openpyxl이 저장할 때마다 통합 문서 전체를
+다시 쓰므로, 운용 기간이 길어질수록 저장 시간과 메모리가 계속 늘어난다.
+전체 기록은 이 JSONL 파일을 기준으로 하고, 시트에는 최근 구간만 유지한다 (ExcelBridge.history_window).
+
+- 한 줄에 로그 엔트리 1건 (append + flush, 비정상 종료 시 마지막 줄만 깨질 수 있음)
+- 파일 크기가 max_bytes를 넘으면 history_YYYYMMDD_HHMMSS_ffffff.jsonl로 넘기고 새 파일 시작 (삭제하지 않음)
+- export_history(): 전체 기록을 시트 2와 같은 컬럼의 xlsx로 내보내기
+
+사용 예:
+    history = HistoryLog(config.HISTORY_LOG_DIR)
+    history.append(log_entry)                              # 거래 스레드
+    export_history(history, "history_full.xlsx")           # 필요할 때 전체 보기 생성
+"""
+import json
+import threading
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+import openpyxl
+
+from .excel_bridge import HISTORY_COLUMNS, history_row
+
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryLog:
+    """
+    운용 히스토리 JSONL 저장소 (스레드 안전)
+    """
+
+    FILE_PREFIX = "history"
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 10 * 1024 * 1024):
+        """
+        Args:
+            directory: 저장 폴더 (없으면 생성)
+            max_bytes: 파일 하나의 최대 크기 (넘으면 새 파일로 교체)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.path = self.directory / f"{self.FILE_PREFIX}.jsonl"
+
+        self._lock = threading.Lock()
+        self._file = None
+
+        # 통계
+        self.append_count = 0
+        self.rotate_count = 0
+
+    def append(self, entry: Dict):
+        """
+        로그 엔트리 1건 추가
+
+        Args:
+            entry: ExcelBridge.create_history_log_entry() 결과
+        """
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            elif self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+            self._file.write(line)
+            self._file.flush()
+            self.append_count += 1
+
+    def _rotate(self):
+        """현재 파일을 타임스탬프 이름으로 넘기고 새 파일 시작 (_lock 보유 상태에서 호출)"""
+        self._file.close()
+        rotated = self.directory / f"{self.FILE_PREFIX}_{datetime.now():%Y%m%d_%H%M%S_%f}.jsonl"
+        self.path.rename(rotated)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self.rotate_count += 1
+        logger.info(f"히스토리 로그 파일 교체: {rotated.name}")
+
+    def close(self):
+        """파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def segments(self) -> List[Path]:
+        """기록 파일 목록 (오래된 순, 현재 파일이 마지막)"""
+        files = sorted(self.directory.glob(f"{self.FILE_PREFIX}_*.jsonl"))
+        if self.path.exists():
+            files.append(self.path)
+        return files
+
+    def iter_entries(self) -> Iterator[Dict]:
+        """전체 로그 엔트리 (기록 순서, 깨진 줄은 건너뜀)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            files = self.segments()
+
+        for path in files:
+            with open(path, encoding="utf-8") as f:
+                for line_no, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        logger.warning(f"히스토리 로그 형식 오류 (건너뜀): {path.name}:{line_no}")
+
+
+def export_history(history: HistoryLog, output_path: Union[str, Path],
+                   since: Optional[str] = None) -> int:
+    """
+    전체 히스토리를 시트 2와 같은 컬럼의 xlsx로 내보내기
+
+    Args:
+        history: 히스토리 로그
+        output_path: 출력 파일 경로 (.xlsx)
+        since: 이 날짜(YYYY-MM-DD) 이후만 (None이면 전체)
+
+    Returns:
+        int: 내보낸 행 수
+    """
+    wb = openpyxl.Workbook(write_only=True)  # 행 단위로 기록 (전체를 메모리에 두지 않음)
+    ws = wb.create_sheet("02_운용로그_히스토리")
+    ws.append([header for _, header, _ in HISTORY_COLUMNS])
+
+    count = 0
+    for entry in history.iter_entries():
+        if since and str(entry.get("date", "")) < since:
+            continue
+        ws.append(history_row(entry))
+        count += 1
+
+    wb.save(str(output_path))
+    logger.info(f"히스토리 내보내기 완료: {count}행 → {output_path}")
+    return count
@@ -0,0 +1,400 @@
+"""
+Phoenix Trading System v4.3 - KIS REST API 비동기 클라이언트 (aiohttp)
+
+KisRestAdapter와 같은 메서드(시세, 주문, 체결, 잔고, 매수가능금액)를 코루틴으로 제공한다.
+인증 토큰/헤더 캐시/거래소 캐시/Rate limiter는 원본 어댑터와 공유하고,
+요청 구성과 응답 해석도 원본 어댑터의 헬퍼를 그대로 사용한다.
+
+동기 코드에서는 AsyncKisRunner로 호출한다. 전용 이벤트 루프 스레드에서 클라이언트 하나를
+계속 유지하므로 호출마다 새 세션/TLS 연결을 만들지 않는다.
+
+aiohttp는 선택 의존성이다. 설치되지 않았으면 AIOHTTP_AVAILABLE이 False이며
+호출 측은 동기 어댑터로 순차 조회한다.
+
+사용 예:
+    async with AsyncKisRestAdapter(kis_adapter) as client:
+        quote, cash = await asyncio.gather(
+            client.get_overseas_price("SOXL"),
+            client.get_cash_balance("SOXL"),
+        )
+
+    runner = AsyncKisRunner(kis_adapter)                  # 동기 코드 (프로그램 종료 시 close)
+    quote = runner.run(lambda client: client.get_overseas_price("SOXL"))
+"""
+import asyncio
+import json
+import time
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+from .kis_rest_adapter import KisRestAdapter, OrderResult, AuthenticationError
+from .rate_limiter import RequestPriority
+
+try:
+    import config
+except ImportError:
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    import config
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncKisRestAdapter:
+    """
+    KisRestAdapter 비동기 버전
+
+    aiohttp 연결 풀(ClientSession)은 생성한 이벤트 루프에 묶이므로
+    `async with` 또는 close()로 같은 루프 안에서 정리한다.
+    HTTP 재시도는 하지 않는다 (동기 어댑터의 연결 재시도와 달리 실패 시 바로 반환).
+    """
+
+    def __init__(self, rest: KisRestAdapter):
+        """
+        Args:
+            rest: 로그인된 동기 어댑터 (토큰/캐시/Rate limiter 공유)
+        """
+        self.rest = rest
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncKisRestAdapter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # ============================================
+    # HTTP
+    # ============================================
+
+    def _ensure_session(self):
+        """연결 풀 세션 (최초 요청 시 생성)"""
+        if self._session is None or self._session.closed:
+            if not AIOHTTP_AVAILABLE:
+                raise ImportError("aiohttp가 설치되지 않았습니다: pip install aiohttp")
+            connector = aiohttp.TCPConnector(limit=config.KIS_HTTP_POOL_SIZE)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        kind: str,
+        headers: dict,
+        params: Optional[dict] = None,
+        json_body: Optional[dict] = None
+    ) -> Tuple[int, Optional[dict], str]:
+        """
+        HTTP 요청
+
+        Args:
+            method: "GET" 또는 "POST"
+            url: 요청 URL
+            kind: 타임아웃 구분 (auth/order/quote/account)
+            headers: 요청 헤더
+            params: 쿼리 파라미터
+            json_body: POST body
+
+        Returns:
+            tuple: (HTTP 상태 코드, JSON 응답 - 200이 아니면 None, 응답 본문)
+        """
+        session = self._ensure_session()
+        timeout = aiohttp.ClientTimeout(total=self.rest.http_timeouts[kind])
+        async with session.request(
+            method, url, headers=headers, params=params, json=json_body, timeout=timeout
+        ) as response:
+            status = response.status
+            text = await response.text()
+
+        data = json.loads(text) if status == 200 else None
+        return status, data, text
+
+    async def close(self):
+        """연결 풀 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _headers(self, tr_id: str, custtype: str = "P", hashkey: str = "") -> dict:
+        """요청 헤더 (토큰은 백그라운드 갱신되므로 보통 캐시 조회만 수행)"""
+        return self.rest._get_headers(tr_id=tr_id, custtype=custtype, hashkey=hashkey)
+
+    # ============================================
+    # 시세
+    # ============================================
+
+    async def get_overseas_price(self, ticker: str) -> Optional[Dict]:
+        """
+        미국 주식 현재가 조회 (KisRestAdapter.get_overseas_price와 동일 결과)
+
+        Args:
+            ticker: 종목코드 (예: SOXL)
+
+        Returns:
+            dict: 시세 정보 또는 None
+        """
+        rest = self.rest
+        exchanges_to_try = rest._quote_exchange_order(ticker)
+
+        for excd in exchanges_to_try:
+            if excd != exchanges_to_try[0]:
+                rest._forget_exchange(ticker, exchanges_to_try[0])  # 우선 거래소 조회 실패
+
+            try:
+                await rest.rate_limiter.acquire_async(RequestPriority.QUOTE)
+
+                url, params = rest._price_request(ticker, excd)
+                headers = self._headers(rest.TR_ID_OVERSEAS_PRICE)
+                status, data, text = await self._request("GET", url, "quote", headers, params=params)
+
+                if status != 200:
+                    logger.debug(f"{ticker}: {excd} 거래소 HTTP {status} 에러 - {text[:200]}")
+                    continue
+                if data.get("rt_cd") != "0":
+                    logger.debug(f"{ticker}: {excd} 거래소 API 응답 실패 - rt_cd={data.get('rt_cd')}, msg={data.get('msg1')}")
+                    continue
+
+                quote = rest._parse_price_output(ticker, data["output"])
+                if quote is not None:
+                    rest._on_quote_exchange_found(ticker, excd)
+                    return quote
+                logger.debug(f"{ticker}: {excd} 거래소에서 시세 없음 (다음 거래소 시도)")
+
+            except AuthenticationError:
+                raise
+            except Exception as e:
+                logger.warning(f"{ticker}: {excd} 거래소 조회 중 예외: {e}")
+
+        # 모든 거래소에서 실패 - 기간별 시세 조회 (장 마감 후, 드문 경로라 동기 어댑터 사용)
+        logger.warning(f"{ticker}: 실시간 시세 조회 실패 - 기간별 시세(일봉) 조회 시도")
+        return await asyncio.to_thread(rest.get_overseas_daily_price_last, ticker)
+
+    # ============================================
+    # 주문
+    # ============================================
+
+    async def _order_hashkey(self, payload: dict) -> str:
+        """주문 Hashkey (config.KIS_HASHKEY_MODE에 따라 생략/캐시/발급)"""
+        rest = self.rest
+        hashkey, cache_key = rest._hashkey_lookup(payload)
+        if hashkey is not None:
+            return hashkey
+
+        try:
+            await rest.rate_limiter.acquire_async(RequestPriority.ORDER)
+            url, headers = rest._hashkey_request()
+            status, data, _ = await self._request("POST", url, "order", headers, json_body=payload)
+            hashkey = data.get("HASH", "") if status == 200 else ""
+            if status != 200:
+                logger.error(f"Hashkey 생성 실패: {status}")
+        except Exception as e:
+            logger.error(f"Hashkey 생성 예외: {e}")
+            hashkey = ""
+
+        rest._hashkey_store(cache_key, hashkey)
+        return hashkey
+
+    async def _send_order_internal(
+        self,
+        ticker: str,
+        order_type: str,
+        quantity: int,
+        price: float,
+        order_kind: str = "limit"
+    ) -> Optional[OrderResult]:
+        """
+        미국 주식 주문 실행
+
+        Args:
+            ticker: 종목코드
+            order_type: 주문 유형 ("buy" 또는 "sell")
+            quantity: 주문 수량
+            price: 주문 가격 (시장가 주문 시 0)
+            order_kind: 주문 종류 ("limit": 지정가, "market": 시장가)
+
+        Returns:
+            OrderResult: 주문 결과 또는 None
+        """
+        rest = self.rest
+        started = time.perf_counter()
+        try:
+            await rest.rate_limiter.acquire_async(RequestPriority.ORDER)
+
+            url, tr_id, payload = rest._order_request(ticker, order_type, quantity, price, order_kind)
+
+            hashkey_started = time.perf_counter()
+            hashkey = await self._order_hashkey(payload)
+            hashkey_ms = (time.perf_counter() - hashkey_started) * 1000
+
+            headers = self._headers(tr_id, hashkey=hashkey)
+
+            sent = time.perf_counter()
+            status, data, text = await self._request("POST", url, "order", headers, json_body=payload)
+            acked = time.perf_counter()
+            rest.order_latency.record(
+                hashkey_ms=hashkey_ms,
+                ack_ms=(acked - sent) * 1000,
+                total_ms=(acked - started) * 1000
+            )
+
+            if status == 200:
+                return rest._parse_order_response(data, ticker, order_type, quantity, price)
+            logger.error(f"주문 HTTP 오류: {status} - {text}")
+            return None
+
+        except AuthenticationError as e:
+            logger.error(f"인증 오류: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"주문 예외: {e}")
+            return None
+
+    async def send_buy_order(self, ticker: str, quantity: int, price: float) -> Optional[OrderResult]:
+        """매수 주문 (지정가)"""
+        return await self._send_order_internal(ticker, "buy", quantity, price, "limit")
+
+    async def send_sell_order(self, ticker: str, quantity: int, price: float) -> Optional[OrderResult]:
+        """매도 주문 (지정가)"""
+        return await self._send_order_internal(ticker, "sell", quantity, price, "limit")
+
+    # ============================================
+    # 체결/계좌
+    # ============================================
+
+    async def get_order_fill_status(self, order_no: str, order_date: str = None) -> dict:
+        """
+        주문 체결 상태 조회 (KisRestAdapter.get_order_fill_status와 동일 형식)
+
+        당일 주문은 동기 어댑터의 체결내역 일괄 조회 캐시(fill_poller)를 공유한다.
+        주문마다 체결내역을 조회하지 않도록 동기 경로를 스레드에서 그대로 호출한다.
+
+        Args:
+            order_no: 주문번호 (ODNO)
+            order_date: 주문일자 YYYYMMDD (None이면 오늘)
+
+        Returns:
+            dict: status, filled_qty, filled_price, unfilled_qty, reject_reason
+        """
+        return await asyncio.to_thread(self.rest.get_order_fill_status, order_no, order_date)
+
+    async def get_balance(self, account_no: str = "") -> float:
+        """
+        계좌 잔고 조회
+
+        Args:
+            account_no: 계좌번호 (미지정 시 기본 계좌)
+
+        Returns:
+            float: 잔고 (USD)
+        """
+        rest = self.rest
+        try:
+            await rest.rate_limiter.acquire_async(RequestPriority.BALANCE)
+
+            url, params = rest._balance_request(account_no)
+            headers = self._headers(rest.TR_ID_OVERSEAS_ACCOUNT)
+            status, data, text = await self._request("GET", url, "account", headers, params=params)
+
+            if status == 200:
+                return rest._parse_balance_response(data)
+            logger.error(f"잔고 조회 HTTP 오류: {status}, 응답: {text}")
+            return 0.0
+
+        except AuthenticationError as e:
+            logger.error(f"인증 오류: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"잔고 조회 예외: {e}")
+            return 0.0
+
+    async def get_cash_balance(self, ticker: str = "SOXL", price: float = 1.0, account_no: str = "") -> float:
+        """
+        USD 예수금 조회 (매수가능금액조회 API)
+
+        Args:
+            ticker: 조회할 종목코드
+            price: 조회할 주문단가
+            account_no: 계좌번호 (미지정 시 기본 계좌)
+
+        Returns:
+            float: USD 예수금 (주문가능외화금액)
+        """
+        rest = self.rest
+        try:
+            await rest.rate_limiter.acquire_async(RequestPriority.BALANCE)
+
+            url, params = rest._psamount_request(ticker, price, account_no)
+            headers = self._headers(rest.TR_ID_OVERSEAS_BUYABLE)
+            status, data, text = await self._request("GET", url, "account", headers, params=params)
+
+            if status == 200:
+                return rest._parse_psamount_response(data, params)
+            logger.error(f"예수금 조회 HTTP 오류: {status}, 응답: {text}")
+            return 0.0
+
+        except AuthenticationError as e:
+            logger.error(f"인증 오류: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"예수금 조회 예외: {e}")
+            return 0.0
+
+
+class AsyncKisRunner:
+    """
+    [v4.3] AsyncKisRestAdapter를 전용 이벤트 루프 스레드에서 유지하는 동기 호출 래퍼
+
+    aiohttp 세션은 만든 이벤트 루프에 묶이므로 호출마다 asyncio.run()을 쓰면 매번 새 세션/연결을 만든다.
+    루프와 클라이언트를 한 번 만들어 close()까지 유지해 연결 풀(keep-alive)을 재사용한다.
+    """
+
+    def __init__(self, rest: KisRestAdapter):
+        """
+        Args:
+            rest: 로그인된 동기 어댑터 (토큰/캐시/Rate limiter 공유)
+        """
+        self.client = AsyncKisRestAdapter(rest)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="KisAsyncHttp", daemon=True)
+        self._thread.start()
+
+    def run(self, call: Callable[[AsyncKisRestAdapter], Awaitable[Any]]) -> Any:
+        """
+        전용 루프에서 코루틴 실행 후 결과 반환 (호출 스레드는 완료까지 대기)
+
+        Args:
+            call: 클라이언트를 받아 코루틴을 만드는 함수
+
+        Returns:
+            코루틴 결과 (예외는 그대로 전달)
+        """
+        if self._loop.is_closed():
+            raise RuntimeError("AsyncKisRunner가 이미 종료되었습니다")
+
+        async def invoke():
+            return await call(self.client)
+
+        return asyncio.run_coroutine_threadsafe(invoke(), self._loop).result()
+
+    def close(self):
+        """연결 풀 정리 후 루프 스레드 종료 (여러 번 호출해도 안전)"""
+        if self._loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.client.close(), self._loop).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"비동기 HTTP 세션 정리 실패: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
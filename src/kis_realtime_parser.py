@@ -0,0 +1,213 @@
+"""
+Phoenix Trading System v4.3 - KIS 실시간(WebSocket) 메시지 파서
+
+KIS 실시간 데이터는 JSON이 아니라 '|'와 '^'로 구분된 프레임으로 온다.
+
+    데이터 프레임:  "0|HDFSCNT0|002|f0^f1^...^f25^f0^f1^...^f25"
+                    (암호화여부|TR_ID|레코드 수|본문, 암호화 시 첫 글자 "1")
+    제어 메시지:    JSON (구독 응답, PINGPONG)
+
+본문은 프레임당 한 번만 split하고, 여러 레코드는 같은 리스트에서 오프셋으로 읽는다.
+TR_ID별 필드 위치는 아래 표(HDFSCNT0_FIELDS 등)로 관리한다.
+
+사용 예:
+    if is_data_frame(message):
+        frame = split_frame(message)
+        if frame.tr_id == TR_ID_PRICE:
+            for tick in parse_price_ticks(frame.payload, frame.count):
+                mailbox.post(tick.price)
+    else:
+        control = parse_control(message)
+        if is_pingpong(control):
+            await ws.send(message)  # 그대로 돌려보냄
+"""
+import json
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+TR_ID_PRICE = "HDFSCNT0"            # 해외주식 실시간지연체결가
+TR_ID_PINGPONG = "PINGPONG"         # 서버 연결 확인 (받은 메시지를 그대로 회신)
+
+
+# ============================================
+# 필드 위치표 (TR_ID별, '^' 구분 순서)
+# ============================================
+
+# 해외주식 실시간체결가 (HDFSCNT0) - 레코드당 26개 필드
+HDFSCNT0_FIELDS: Dict[str, int] = {
+    "RSYM": 0,    # 실시간종목코드 (D+거래소+종목, 예: DAMSSOXL)
+    "SYMB": 1,    # 종목코드
+    "ZDIV": 2,    # 소수점자리수
+    "TYMD": 3,    # 현지영업일자
+    "XYMD": 4,    # 현지일자
+    "XHMS": 5,    # 현지시간
+    "KYMD": 6,    # 한국일자
+    "KHMS": 7,    # 한국시간
+    "OPEN": 8,    # 시가
+    "HIGH": 9,    # 고가
+    "LOW": 10,    # 저가
+    "LAST": 11,   # 현재가
+    "SIGN": 12,   # 대비구분
+    "DIFF": 13,   # 전일대비
+    "RATE": 14,   # 등락율
+    "PBID": 15,   # 매수호가
+    "PASK": 16,   # 매도호가
+    "VBID": 17,   # 매수잔량
+    "VASK": 18,   # 매도잔량
+    "EVOL": 19,   # 체결량
+    "TVOL": 20,   # 거래량
+    "TAMT": 21,   # 거래대금
+    "BIVL": 22,   # 매도체결량
+    "ASVL": 23,   # 매수체결량
+    "STRN": 24,   # 체결강도
+    "MTYP": 25,   # 시장구분 (1: 장중, 2: 장전, 3: 장후)
+}
+HDFSCNT0_FIELD_COUNT = len(HDFSCNT0_FIELDS)
+
+# 자주 쓰는 위치는 상수로 (레코드 오프셋에 더해 사용)
+_SYMB = HDFSCNT0_FIELDS["SYMB"]
+_XYMD = HDFSCNT0_FIELDS["XYMD"]
+_XHMS = HDFSCNT0_FIELDS["XHMS"]
+_LAST = HDFSCNT0_FIELDS["LAST"]
+_PBID = HDFSCNT0_FIELDS["PBID"]
+_PASK = HDFSCNT0_FIELDS["PASK"]
+_EVOL = HDFSCNT0_FIELDS["EVOL"]
+_TVOL = HDFSCNT0_FIELDS["TVOL"]
+
+
+class Frame(NamedTuple):
+    """데이터 프레임 헤더 + 본문"""
+    encrypted: bool
+    tr_id: str
+    count: int      # 레코드 수
+    payload: str    # '^' 구분 본문 (암호화 시 Base64)
+
+
+class RealtimeTick(NamedTuple):
+    """실시간 체결가 1건"""
+    symbol: str
+    price: float
+    size: int            # 체결량
+    bid: float           # 매수호가
+    ask: float           # 매도호가
+    volume: int          # 누적 거래량
+    exchange_time: str   # 현지 일시 YYYYMMDDHHMMSS
+
+
+# ============================================
+# 데이터 프레임
+# ============================================
+
+def is_data_frame(message: str) -> bool:
+    """데이터 프레임 여부 (JSON 제어 메시지는 '{'로 시작)"""
+    return message[:1] in ("0", "1")
+
+
+def split_frame(message: str) -> Optional[Frame]:
+    """
+    데이터 프레임 헤더 분리
+
+    Args:
+        message: WebSocket 수신 메시지
+
+    Returns:
+        Frame: 헤더 + 본문 (형식 오류 시 None)
+    """
+    parts = message.split("|", 3)
+    if len(parts) < 4:
+        logger.debug(f"실시간 프레임 형식 오류: {message[:100]}")
+        return None
+
+    encrypted, tr_id, count, payload = parts
+    try:
+        record_count = int(count)
+    except ValueError:
+        logger.debug(f"실시간 프레임 레코드 수 오류: {count!r}")
+        return None
+    return Frame(encrypted == "1", tr_id, max(record_count, 1), payload)
+
+
+def split_records(payload: str, count: int, min_fields: int = 1) -> Tuple[List[str], int]:
+    """
+    본문을 한 번 split하고 레코드 폭 계산
+
+    Args:
+        payload: '^' 구분 본문
+        count: 레코드 수
+        min_fields: 레코드당 최소 필드 수 (TR_ID 필드표 기준)
+
+    Returns:
+        tuple: (전체 필드 리스트, 레코드 폭 - 형식 오류 시 0)
+            레코드 i의 필드 j는 fields[i * width + j]
+    """
+    fields = payload.split("^")
+    width, remainder = divmod(len(fields), count)
+    if remainder or width < min_fields:
+        logger.warning(f"실시간 프레임 필드 수 불일치: {len(fields)}개 / {count}건 (최소 {min_fields}개)")
+        return fields, 0
+    return fields, width
+
+
+def parse_price_ticks(payload: str, count: int = 1) -> List[RealtimeTick]:
+    """
+    HDFSCNT0 본문 → RealtimeTick 목록 (수신 순서)
+
+    Args:
+        payload: '^' 구분 본문
+        count: 레코드 수
+
+    Returns:
+        list: 체결가 목록 (형식 오류 레코드는 제외)
+    """
+    fields, width = split_records(payload, count, HDFSCNT0_FIELD_COUNT)
+    if not width:
+        return []
+
+    ticks = []
+    for base in range(0, width * count, width):
+        try:
+            ticks.append(RealtimeTick(
+                fields[base + _SYMB],
+                float(fields[base + _LAST]),
+                int(fields[base + _EVOL] or 0),
+                float(fields[base + _PBID] or 0),
+                float(fields[base + _PASK] or 0),
+                int(fields[base + _TVOL] or 0),
+                fields[base + _XYMD] + fields[base + _XHMS],
+            ))
+        except ValueError as e:
+            logger.warning(f"실시간 체결가 형식 오류: {e}")
+    return ticks
+
+
+# ============================================
+# 제어 메시지 (JSON)
+# ============================================
+
+def parse_control(message: str) -> dict:
+    """
+    JSON 제어 메시지 해석
+
+    Returns:
+        dict: 메시지 (JSON 형식이 아니면 빈 dict)
+    """
+    try:
+        data = json.loads(message)
+    except ValueError:
+        logger.debug(f"실시간 제어 메시지 형식 오류: {message[:100]}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def control_tr_id(control: dict) -> str:
+    """제어 메시지의 TR_ID"""
+    return control.get("header", {}).get("tr_id", "")
+
+
+def is_pingpong(control: dict) -> bool:
+    """서버 PINGPONG 여부 (받은 원문을 그대로 회신해야 연결 유지)"""
+    return control_tr_id(control) == TR_ID_PINGPONG
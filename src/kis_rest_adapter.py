@@ -19,9 +19,22 @@ v4.1 개선 사항:
 - 토큰 관리 강화
 - WebSocket 재연결 로직
 - Rate limiting 적용
+
+v4.3 개선 사항:
+- Keep-alive 연결 풀 (requests.Session) 공유 - 요청마다 TCP/TLS 핸드셰이크 제거
+- 엔드포인트 종류별 타임아웃, 연결 실패 재시도 (상태코드 재시도는 GET만)
+- 종목별 거래소 코드 캐시 (TTL + 실패 시 재탐색, config 사전 등록) - 시세 조회 왕복 절감
+- 스레드 안전 Token Bucket Rate Limiter (주문 → 체결 → 시세 → 잔고 우선순위)
+- 토큰 백그라운드 선제 갱신 + tr_id별 헤더 캐시 (요청 경로에서 OAuth 대기 없음)
+- Hashkey 모드 (ALWAYS/CACHE/SKIP) + 주문 지연 통계 (주문 → 접수 응답)
+- WebSocket 실시간 체결통보 (H0GSCNI0) 구독 → FillRegistry (체결 대기 시 REST 폴링 대체)
+- 당일 체결내역 일괄 조회 (연속조회 + 짧은 TTL 캐시) - 대기 중인 주문 수와 관계없이 ccnl 1회
+- 실시간 프레임 파서 ('|'/'^' 구분, 다건 레코드) + PINGPONG 회신, 시세 구독 키 D+거래소+종목
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import asyncio
 import websockets
@@ -31,10 +44,20 @@ import threading
 import hashlib
 import os
 from datetime import datetime, timedelta
+from collections import OrderedDict, deque
 from typing import Optional, Dict, Callable, List
 from dataclasses import dataclass
 from pathlib import Path
 
+from .rate_limiter import TokenBucketRateLimiter, RequestPriority
+from .kis_token_manager import KisTokenManager
+from .fill_registry import FillRegistry, CRYPTO_AVAILABLE, MIN_FIELD_COUNT, decrypt_notice, parse_fill_notice
+from .fill_status_poller import FillStatusPoller, normalize_order_no
+from .kis_realtime_parser import (
+    RealtimeTick, is_data_frame, split_frame, split_records, parse_price_ticks,
+    parse_control, control_tr_id, is_pingpong
+)
+
 logger = logging.getLogger(__name__)
 
 # config import
@@ -49,6 +72,10 @@ except ImportError:
     import config
 
 
+# [v4.3] CACHE 모드 Hashkey 캐시 최대 항목 수 (초과 시 가장 오래 쓰지 않은 항목부터 제거)
+HASHKEY_CACHE_SIZE = 256
+
+
 @dataclass
 class OrderResult:
     """주문 결과"""
@@ -60,6 +87,86 @@ class OrderResult:
     total_qty: int = 0         # 주문 총 수량
 
 
+def _safe_float(value, default=0.0):
+    """빈 문자열을 안전하게 float로 변환"""
+    if value == "" or value is None:
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+class OrderLatencyStats:
+    """
+    [v4.3] 주문 지연 통계 (최근 N건, 스레드 안전)
+
+    구간:
+    - hashkey: Hashkey 발급 소요 (SKIP/캐시 적중 시 0)
+    - ack: 주문 POST 전송 → 접수 응답
+    - total: 주문 함수 진입 → 접수 응답 (Rate limit 대기 포함)
+    """
+
+    def __init__(self, maxlen: int = 500):
+        self._samples: deque = deque(maxlen=maxlen)  # (hashkey_ms, ack_ms, total_ms)
+        self._lock = threading.Lock()
+        self.hashkey_failures = 0
+        self.hashkey_cache_hits = 0
+
+    def record(self, hashkey_ms: float, ack_ms: float, total_ms: float):
+        with self._lock:
+            self._samples.append((hashkey_ms, ack_ms, total_ms))
+
+    def count_hashkey_cache_hit(self):
+        with self._lock:
+            self.hashkey_cache_hits += 1
+
+    def count_hashkey_failure(self):
+        with self._lock:
+            self.hashkey_failures += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        구간별 통계
+
+        Returns:
+            dict: {"hashkey"|"ack"|"total": {"count", "mean", "p50", "p95", "max"}} (ms)
+        """
+        with self._lock:
+            samples = list(self._samples)
+
+        result: Dict[str, Dict[str, float]] = {}
+        for index, name in enumerate(("hashkey", "ack", "total")):
+            values = sorted(sample[index] for sample in samples)
+            if not values:
+                result[name] = {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+                continue
+            result[name] = {
+                "count": len(values),
+                "mean": sum(values) / len(values),
+                "p50": values[(len(values) - 1) // 2],
+                "p95": values[min(int(len(values) * 0.95), len(values) - 1)],
+                "max": values[-1],
+            }
+        return result
+
+    def format_summary(self) -> str:
+        """로그용 한 줄 요약"""
+        stats = self.summary()
+        with self._lock:
+            cache_hits, failures = self.hashkey_cache_hits, self.hashkey_failures
+        if not stats["total"]["count"]:
+            return "주문 지연 통계: 기록 없음"
+        return (
+            f"주문 지연 통계 ({stats['total']['count']}건, ms): "
+            + ", ".join(
+                f"{name} p50={stats[name]['p50']:.0f} p95={stats[name]['p95']:.0f} max={stats[name]['max']:.0f}"
+                for name in ("hashkey", "ack", "total")
+            )
+            + f" | hashkey 캐시 적중 {cache_hits}, 실패 {failures}"
+        )
+
+
 class AuthenticationError(Exception):
     """인증 오류"""
     pass
@@ -95,6 +202,14 @@ class KisRestAdapter:
     TR_ID_OVERSEAS_ACCOUNT = "TTTS3012R"        # 해외주식 잔고 (실전: TTTS3012R, 모의: VTTS3012R)
     TR_ID_OVERSEAS_BUYABLE = "TTTS3007R"        # 해외주식 매수가능금액조회 (USD 예수금)
     TR_ID_WS_REALTIME = "HDFSCNT0"              # 실시간 체결가
+    TR_ID_WS_FILL_NOTICE = "H0GSCNI0"           # [v4.3] 실시간 체결통보 (모의: H0GSCNI9)
+    TR_ID_WS_FILL_NOTICE_MOCK = "H0GSCNI9"
+
+    CCNL_MAX_PAGES = 20                         # [v4.3] 체결내역 연속조회 최대 페이지
+
+    # [v4.3] 거래소 코드 (시세 API: 3글자, 주문/계좌 API: 4글자)
+    QUOTE_EXCHANGES = ("NAS", "AMS", "NYS")     # 시세 조회 탐색 순서
+    ORDER_EXCHANGE_BY_QUOTE = {"NAS": "NASD", "AMS": "AMEX", "NYS": "NYSE"}
 
     def __init__(self, app_key: str, app_secret: str, account_no: str = "", error_callback: Optional[Callable] = None):
         """
@@ -115,6 +230,16 @@ class KisRestAdapter:
         self.token_expires_at: Optional[datetime] = None
         self.approval_key: Optional[str] = None
 
+        # [v4.3] 토큰 백그라운드 갱신 + 헤더 캐시 (토큰, {(tr_id, custtype): headers})
+        self._token_lock = threading.Lock()
+        self._header_state: tuple[Optional[str], Dict[tuple, dict]] = (None, {})
+        self.token_manager = KisTokenManager(
+            renew=self.renew_token,
+            get_expires_at=lambda: self.token_expires_at,
+            refresh_ahead=timedelta(minutes=config.KIS_TOKEN_REFRESH_AHEAD_MINUTES),
+            retry_interval=config.KIS_TOKEN_RETRY_SECONDS
+        )
+
         # WebSocket 연결
         self.ws_connection = None
         self.ws_running = False
@@ -122,16 +247,148 @@ class KisRestAdapter:
         self.ws_reconnect_count = 0
         self.ws_max_reconnect = 5
 
+        # [v4.3] 실시간 체결통보 (구독 응답의 복호화 키/IV, 주문번호별 체결 누적)
+        self.fill_registry = FillRegistry()
+        self._fill_notice_cipher: Optional[tuple[str, str]] = None
+
+        # [v4.3] 당일 체결내역 캐시 (대기 중인 주문들이 ccnl 조회 1회를 공유)
+        self.fill_poller = FillStatusPoller(fetch=self.fetch_fill_statuses, ttl=config.KIS_FILL_STATUS_CACHE_TTL)
+
         # 콜백
         self.price_callback: Optional[Callable] = None
         self.error_callback: Optional[Callable] = error_callback  # [v4.1] 치명적 오류 콜백
 
-        # Rate limiting
-        self.last_request_time = 0
-        self.request_interval = 0.2  # 초당 5회 (200ms 간격)
+        # [v4.3] Rate limiting (Token Bucket, 모든 스레드 공유)
+        self.rate_limiter = TokenBucketRateLimiter(
+            rate=config.KIS_RATE_LIMIT_PER_SEC,
+            burst=config.KIS_RATE_LIMIT_BURST
+        )
+
+        # [v4.3] 종목별 시세 거래소 캐시 {ticker: (거래소 코드, 만료 시각 monotonic)}
+        self.exchange_cache_ttl = config.KIS_EXCHANGE_CACHE_TTL
+        self._exchange_cache: Dict[str, tuple[str, float]] = {}
+        self._exchange_lock = threading.Lock()
+
+        # [v4.3] 주문 Hashkey 모드 + 지연 통계
+        self.hashkey_mode = config.KIS_HASHKEY_MODE
+        self._hashkey_cache: "OrderedDict[str, str]" = OrderedDict()  # {정렬된 payload JSON: hashkey} (LRU 순서)
+        self._hashkey_lock = threading.Lock()
+        self.order_latency = OrderLatencyStats()
+
+        # [v4.3] HTTP 연결 풀 (모든 REST 호출이 공유)
+        self.http_timeouts: Dict[str, float] = dict(config.KIS_HTTP_TIMEOUTS)
+        self.session = self._create_session()
 
         logger.info("KisRestAdapter 초기화 완료 (한국투자증권 REST API)")
 
+    def _create_session(self) -> requests.Session:
+        """
+        [v4.3] Keep-alive 연결 풀 세션 생성
+
+        재시도 정책:
+        - 연결 실패: 모든 메서드 재시도 (요청이 서버에 도달하지 않은 경우)
+        - 읽기 실패: 재시도 안 함 (주문 중복 방지)
+        - 5xx 응답: GET만 재시도
+        """
+        retry = Retry(
+            total=None,
+            connect=config.KIS_HTTP_CONNECT_RETRIES,
+            read=0,
+            status=config.KIS_HTTP_STATUS_RETRIES,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            backoff_factor=config.KIS_HTTP_BACKOFF,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=config.KIS_HTTP_POOL_SIZE,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _http_get(self, url: str, kind: str, **kwargs) -> requests.Response:
+        """[v4.3] 연결 풀 GET (kind: auth/order/quote/account - 타임아웃 구분)"""
+        kwargs.setdefault("timeout", self.http_timeouts[kind])
+        return self.session.get(url, **kwargs)
+
+    def _http_post(self, url: str, kind: str, **kwargs) -> requests.Response:
+        """[v4.3] 연결 풀 POST (kind: auth/order/quote/account - 타임아웃 구분)"""
+        kwargs.setdefault("timeout", self.http_timeouts[kind])
+        return self.session.post(url, **kwargs)
+
+    # ============================================
+    # [v4.3] 거래소 코드 캐시
+    # ============================================
+
+    def _cached_exchange(self, ticker: str) -> Optional[str]:
+        """
+        종목의 시세 거래소 코드 (캐시 → config 사전 등록 순, 없으면 None)
+
+        만료된 캐시 항목은 제거하고 사전 등록값으로 대체한다.
+        """
+        with self._exchange_lock:
+            entry = self._exchange_cache.get(ticker)
+            if entry is not None:
+                excd, expires_at = entry
+                if time.monotonic() < expires_at:
+                    return excd
+                del self._exchange_cache[ticker]
+        return config.KIS_EXCHANGE_PRELOAD.get(ticker)
+
+    def _quote_exchange_order(self, ticker: str) -> List[str]:
+        """
+        시세 조회 거래소 탐색 순서 (알고 있는 거래소 우선, 실패 시 나머지 재탐색)
+
+        Args:
+            ticker: 종목코드
+
+        Returns:
+            list: 거래소 코드 목록 (예: ["AMS", "NAS", "NYS"])
+        """
+        known = self._cached_exchange(ticker)
+        if known is None:
+            return list(self.QUOTE_EXCHANGES)
+        return [known] + [excd for excd in self.QUOTE_EXCHANGES if excd != known]
+
+    def _remember_exchange(self, ticker: str, excd: str):
+        """조회에 성공한 거래소 기록 (TTL 동안 첫 번째로 조회)"""
+        with self._exchange_lock:
+            self._exchange_cache[ticker] = (excd, time.monotonic() + self.exchange_cache_ttl)
+
+    def _forget_exchange(self, ticker: str, excd: str):
+        """캐시된 거래소 조회 실패 시 제거 (다음 조회부터 재탐색)"""
+        with self._exchange_lock:
+            entry = self._exchange_cache.get(ticker)
+            if entry is not None and entry[0] == excd:
+                del self._exchange_cache[ticker]
+                logger.info(f"[거래소 캐시] {ticker} {excd} 조회 실패 - 재탐색")
+
+    def get_order_exchange(self, ticker: str) -> str:
+        """
+        주문/계좌 API용 거래소 코드 (4글자)
+
+        시세 조회로 확인된 거래소(또는 config 사전 등록값)를 우선 사용하고,
+        모르는 종목은 US_MARKET_EXCHANGE 설정을 사용한다.
+
+        Args:
+            ticker: 종목코드
+
+        Returns:
+            str: "NASD", "AMEX", "NYSE" 중 하나
+        """
+        order_code = self.ORDER_EXCHANGE_BY_QUOTE.get(self._cached_exchange(ticker))
+        if order_code is not None:
+            return order_code
+
+        exchange_code = os.getenv("US_MARKET_EXCHANGE", config.US_MARKET_EXCHANGE)
+        if exchange_code not in self.ORDER_EXCHANGE_BY_QUOTE.values():
+            exchange_code = "NASD"  # 기본값: 나스닥
+        return exchange_code
+
     def _parse_account_no(self, raw_account: str) -> tuple[str, str]:
         """
         계좌번호 파싱 (KIS REST API 사양)
@@ -204,6 +461,28 @@ class KisRestAdapter:
                 except Exception as e:
                     logger.warning(f"[캐시] 토큰 캐시 로드 실패: {e}, 재발급 시도...")
 
+            with self._token_lock:
+                self._issue_token(token_cache_file)
+            return True
+
+        except AuthenticationError:
+            raise
+        except Exception as e:
+            error_msg = f"로그인 예외: {e}"
+            logger.error(error_msg)
+            raise AuthenticationError(error_msg)
+
+    def _issue_token(self, token_cache_file: Path = Path("kis_token_cache.json")):
+        """
+        [v4.3] Access Token + Approval Key 신규 발급 (캐시 무시) 후 캐시 파일 저장
+
+        Args:
+            token_cache_file: 토큰 캐시 파일 경로
+
+        Raises:
+            AuthenticationError: Access Token 발급 실패 시
+        """
+        try:
             # 2. Access Token 발급 (실계좌: /oauth2/tokenP, 모의: /oauth2/token)
             url = f"{self.BASE_URL}/oauth2/tokenP"
 
@@ -217,15 +496,15 @@ class KisRestAdapter:
                 "Content-Type": "application/json; charset=utf-8"
             }
 
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            response = self._http_post(url, "auth", json=payload, headers=headers)
 
             if response.status_code == 200:
                 data = response.json()
-                self.access_token = data["access_token"]
+                access_token = data["access_token"]
                 expires_in = data["expires_in"]  # 초 단위
-                self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+                token_expires_at = datetime.now() + timedelta(seconds=expires_in)
 
-                logger.info(f"Access Token 발급 성공 (만료: {self.token_expires_at})")
+                logger.info(f"Access Token 발급 성공 (만료: {token_expires_at})")
             else:
                 error_msg = f"Access Token 발급 실패: {response.status_code} - {response.text}"
                 logger.error(error_msg)
@@ -240,16 +519,22 @@ class KisRestAdapter:
                 "secretkey": self.app_secret
             }
 
-            approval_response = requests.post(approval_url, json=approval_payload, timeout=10)
+            approval_response = self._http_post(approval_url, "auth", json=approval_payload)
 
+            approval_key = self.approval_key
             if approval_response.status_code == 200:
                 approval_data = approval_response.json()
-                self.approval_key = approval_data.get("approval_key")
+                approval_key = approval_data.get("approval_key")
                 logger.info("Approval Key 발급 성공")
             else:
                 logger.warning(f"Approval Key 발급 실패: {approval_response.status_code}")
                 # Approval key 없어도 REST API는 사용 가능 (WebSocket만 불가)
 
+            # [v4.3] 발급 완료 후 한 번에 교체 (요청 스레드는 이전 토큰 또는 새 토큰만 봄)
+            self.access_token = access_token
+            self.token_expires_at = token_expires_at
+            self.approval_key = approval_key
+
             # 3. 토큰 캐시 저장
             try:
                 cache_data = {
@@ -264,30 +549,42 @@ class KisRestAdapter:
             except Exception as e:
                 logger.warning(f"[캐시] 토큰 저장 실패: {e} (무시하고 계속)")
 
-            return True
-
         except AuthenticationError:
             raise
         except Exception as e:
-            error_msg = f"로그인 예외: {e}"
+            error_msg = f"토큰 발급 예외: {e}"
             logger.error(error_msg)
             raise AuthenticationError(error_msg)
 
+    def renew_token(self):
+        """
+        [v4.3] 토큰 재발급 (백그라운드 갱신 스레드에서 호출)
+
+        Raises:
+            AuthenticationError: 발급 실패 시
+        """
+        with self._token_lock:
+            self._issue_token()
+
     def _refresh_token_if_needed(self):
         """토큰 만료 확인 및 갱신
 
+        [v4.3] 정상 상황에서는 token_manager가 만료 전에 미리 갱신하므로 통과만 한다.
+        백그라운드 갱신이 계속 실패해 만료 5분 전까지 온 경우에만 여기서 직접 갱신한다.
+
         Raises:
             AuthenticationError: 토큰이 없거나 갱신 실패 시
         """
         if not self.token_expires_at:
             raise AuthenticationError("토큰이 발급되지 않았습니다. login()을 먼저 호출하세요.")
 
-        # 만료 5분 전에 갱신
+        # 만료 5분 전에 갱신 (백그라운드 갱신 실패 시 대비)
         if datetime.now() >= self.token_expires_at - timedelta(minutes=5):
-            logger.info("토큰 갱신 중...")
-            success = self.login()
-            if not success:
-                raise AuthenticationError("토큰 갱신 실패")
+            with self._token_lock:
+                # 대기 중 다른 스레드가 이미 갱신했으면 생략
+                if datetime.now() >= self.token_expires_at - timedelta(minutes=5):
+                    logger.warning("토큰 갱신 중... (백그라운드 갱신 미완료, 요청 경로에서 직접 갱신)")
+                    self._issue_token()
 
     def _get_hashkey(self, body: dict) -> str:
         """
@@ -300,15 +597,11 @@ class KisRestAdapter:
             str: hashkey 값
         """
         try:
-            url = f"{self.BASE_URL}/uapi/hashkey"
+            self._apply_rate_limit(RequestPriority.ORDER)  # [v4.3] Hashkey도 초당 한도에 포함
 
-            headers = {
-                "Content-Type": "application/json",
-                "appkey": self.app_key,
-                "appsecret": self.app_secret
-            }
+            url, headers = self._hashkey_request()
 
-            response = requests.post(url, headers=headers, json=body, timeout=10)
+            response = self._http_post(url, "order", headers=headers, json=body)
 
             if response.status_code == 200:
                 data = response.json()
@@ -321,6 +614,73 @@ class KisRestAdapter:
             logger.error(f"Hashkey 생성 예외: {e}")
             return ""
 
+    def _hashkey_request(self) -> tuple[str, dict]:
+        """Hashkey 발급 URL, 헤더"""
+        url = f"{self.BASE_URL}/uapi/hashkey"
+        headers = {
+            "Content-Type": "application/json",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret
+        }
+        return url, headers
+
+    def _hashkey_lookup(self, payload: dict) -> tuple[Optional[str], str]:
+        """
+        [v4.3] 발급 없이 정할 수 있는 Hashkey 조회 (SKIP 모드/캐시 적중)
+
+        Returns:
+            tuple: (hashkey - 발급 필요 시 None, 캐시 키 - CACHE 모드가 아니면 빈 문자열)
+        """
+        if self.hashkey_mode == "SKIP":
+            return "", ""
+
+        if self.hashkey_mode != "CACHE":
+            return None, ""
+
+        cache_key = json.dumps(payload, sort_keys=True)
+        with self._hashkey_lock:
+            hashkey = self._hashkey_cache.get(cache_key)
+            if hashkey:
+                self._hashkey_cache.move_to_end(cache_key)
+        if hashkey:
+            self.order_latency.count_hashkey_cache_hit()
+            return hashkey, cache_key
+        return None, cache_key
+
+    def _hashkey_store(self, cache_key: str, hashkey: str):
+        """[v4.3] 발급 결과 기록 (실패 시 경고, CACHE 모드면 LRU 캐시에 저장)"""
+        if not hashkey:
+            self.order_latency.count_hashkey_failure()
+            logger.warning("Hashkey 발급 실패 - hashkey 없이 주문 전송")
+        elif cache_key:
+            with self._hashkey_lock:
+                self._hashkey_cache[cache_key] = hashkey
+                self._hashkey_cache.move_to_end(cache_key)
+                while len(self._hashkey_cache) > HASHKEY_CACHE_SIZE:
+                    self._hashkey_cache.popitem(last=False)
+
+    def _order_hashkey(self, payload: dict) -> str:
+        """
+        [v4.3] 주문용 Hashkey (config.KIS_HASHKEY_MODE에 따라)
+
+        - ALWAYS: 주문마다 발급 (기존 동작)
+        - CACHE: 같은 주문 내용(재주문 등)은 이전 발급값 재사용
+        - SKIP: 발급 생략 (KIS 주문 API에서 hashkey는 선택 항목) → 왕복 1회 절감
+
+        Args:
+            payload: 주문 body
+
+        Returns:
+            str: hashkey (생략/실패 시 빈 문자열)
+        """
+        hashkey, cache_key = self._hashkey_lookup(payload)
+        if hashkey is not None:
+            return hashkey
+
+        hashkey = self._get_hashkey(payload)
+        self._hashkey_store(cache_key, hashkey)
+        return hashkey
+
     def _get_headers(self, tr_id: str, custtype: str = "P", hashkey: str = "") -> dict:
         """
         API 요청 헤더 생성
@@ -331,7 +691,7 @@ class KisRestAdapter:
             hashkey: POST 요청 시 hashkey (선택)
 
         Returns:
-            dict: Authorization 헤더
+            dict: Authorization 헤더 ([v4.3] 캐시된 dict - 수정 금지)
 
         Raises:
             AuthenticationError: 토큰이 없는 경우
@@ -339,36 +699,84 @@ class KisRestAdapter:
         # 토큰 갱신 확인
         self._refresh_token_if_needed()
 
-        if not self.access_token:
+        access_token = self.access_token
+        if not access_token:
             raise AuthenticationError("Access Token이 없습니다. login()을 먼저 호출하세요.")
 
-        headers = {
-            "Content-Type": "application/json; charset=utf-8",
-            "authorization": f"Bearer {self.access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": custtype
-        }
+        # [v4.3] 토큰이 바뀌면 캐시 전체를 새 dict로 교체 (원자적 할당)
+        cached_token, cache = self._header_state
+        if cached_token != access_token:
+            cache = {}
+            self._header_state = (access_token, cache)
 
-        # POST 요청 시 hashkey 추가
+        headers = cache.get((tr_id, custtype))
+        if headers is None:
+            headers = {
+                "Content-Type": "application/json; charset=utf-8",
+                "authorization": f"Bearer {access_token}",
+                "appkey": self.app_key,
+                "appsecret": self.app_secret,
+                "tr_id": tr_id,
+                "custtype": custtype
+            }
+            cache[(tr_id, custtype)] = headers
+
+        # POST 요청 시 hashkey 추가 (요청마다 다르므로 복사본에 추가)
         if hashkey:
-            headers["hashkey"] = hashkey
+            headers = {**headers, "hashkey": hashkey}
 
         return headers
 
-    def _apply_rate_limit(self):
-        """Rate Limiting 적용 (초당 5회)"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_interval:
-            sleep_time = self.request_interval - elapsed
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+    def _apply_rate_limit(self, priority: RequestPriority = RequestPriority.QUOTE):
+        """
+        [v4.3] Rate Limiting 적용 (Token Bucket, 스레드 안전)
+
+        Args:
+            priority: 요청 우선순위 (주문 → 체결 확인 → 시세 → 잔고)
+        """
+        self.rate_limiter.acquire(priority)
 
     # =====================================
     # 2. 시세 조회
     # =====================================
 
+    # [v4.3] 요청 구성/응답 해석 (동기/비동기 어댑터 공용)
+
+    def _price_request(self, ticker: str, excd: str) -> tuple[str, dict]:
+        """현재가 조회 URL, 파라미터"""
+        url = f"{self.BASE_URL}/uapi/overseas-price/v1/quotations/price"
+        params = {
+            "EXCD": excd,
+            "SYMB": ticker
+        }
+        return url, params
+
+    @staticmethod
+    def _parse_price_output(ticker: str, output: dict) -> Optional[Dict]:
+        """
+        현재가 응답 output 해석
+
+        Returns:
+            dict: 시세 정보 (현재가가 0 이하이면 None - 다른 거래소 조회 필요)
+        """
+        price = _safe_float(output.get("last"))
+        if price <= 0:
+            return None
+        return {
+            "ticker": ticker,
+            "price": price,
+            "open": _safe_float(output.get("open")),
+            "high": _safe_float(output.get("high")),
+            "low": _safe_float(output.get("low")),
+            "volume": int(output.get("tvol") or 0)
+        }
+
+    def _on_quote_exchange_found(self, ticker: str, excd: str):
+        """시세 조회에 성공한 거래소 기록"""
+        if self._cached_exchange(ticker) != excd:
+            logger.info(f"[거래소 자동 감지] {ticker}는 {excd} 거래소에서 조회됨")
+        self._remember_exchange(ticker, excd)
+
     def get_overseas_price(self, ticker: str) -> Optional[Dict]:
         """
         미국 주식 현재가 조회 (자동 거래소 감지)
@@ -387,39 +795,28 @@ class KisRestAdapter:
                 "volume": 1234567
             }
         """
-        # 빈 문자열 처리 함수 (안전한 float 변환)
-        def safe_float(value, default=0.0):
-            """빈 문자열을 안전하게 float로 변환"""
-            if value == "" or value is None:
-                return default
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return default
-
         # 거래소 코드 우선순위: NAS → AMS → NYS
         # 대부분 종목: NAS (나스닥)
         # 일부 ETF (SOXL, SPY, SPXL 등): AMS (아멕스/NYSE Arca)
-        exchanges_to_try = ["NAS", "AMS", "NYS"]
+        # [v4.3] 캐시/사전 등록된 거래소가 있으면 먼저 조회 (실패 시 나머지 재탐색)
+        exchanges_to_try = self._quote_exchange_order(ticker)
 
         for excd in exchanges_to_try:
+            if excd != exchanges_to_try[0]:
+                self._forget_exchange(ticker, exchanges_to_try[0])  # 우선 거래소 조회 실패
+
             try:
                 self._apply_rate_limit()
 
-                url = f"{self.BASE_URL}/uapi/overseas-price/v1/quotations/price"
-
-                params = {
-                    "EXCD": excd,
-                    "SYMB": ticker
-                }
+                url, params = self._price_request(ticker, excd)
 
                 headers = self._get_headers(tr_id=self.TR_ID_OVERSEAS_PRICE)
 
-                response = requests.get(
+                response = self._http_get(
                     url,
+                    "quote",
                     headers=headers,
-                    params=params,
-                    timeout=10
+                    params=params
                 )
 
                 if response.status_code == 200:
@@ -431,21 +828,12 @@ class KisRestAdapter:
                         # 디버깅: 실제 API 응답 확인
                         logger.debug(f"KIS API 시세 응답 ({excd}): {output}")
 
-                        price = safe_float(output.get("last"))
+                        quote = self._parse_price_output(ticker, output)
 
                         # 가격이 0보다 크면 성공
-                        if price > 0:
-                            if excd != "NAS":
-                                logger.info(f"[거래소 자동 감지] {ticker}는 {excd} 거래소에서 조회됨")
-
-                            return {
-                                "ticker": ticker,
-                                "price": price,
-                                "open": safe_float(output.get("open")),
-                                "high": safe_float(output.get("high")),
-                                "low": safe_float(output.get("low")),
-                                "volume": int(output.get("tvol") or 0)
-                            }
+                        if quote is not None:
+                            self._on_quote_exchange_found(ticker, excd)
+                            return quote
                         else:
                             # 가격이 0이면 다음 거래소 시도
                             logger.debug(f"{ticker}: {excd} 거래소에서 시세 없음 (다음 거래소 시도)")
@@ -489,8 +877,8 @@ class KisRestAdapter:
             except (ValueError, TypeError):
                 return default
 
-        # 거래소 코드 우선순위
-        exchanges_to_try = ["NAS", "AMS", "NYS"]
+        # 거래소 코드 우선순위 (캐시/사전 등록된 거래소 우선)
+        exchanges_to_try = self._quote_exchange_order(ticker)
 
         for excd in exchanges_to_try:
             try:
@@ -509,11 +897,11 @@ class KisRestAdapter:
 
                 headers = self._get_headers(tr_id=self.TR_ID_OVERSEAS_DAILY_PRICE)
 
-                response = requests.get(
+                response = self._http_get(
                     url,
+                    "quote",
                     headers=headers,
-                    params=params,
-                    timeout=10
+                    params=params
                 )
 
                 if response.status_code == 200:
@@ -584,52 +972,16 @@ class KisRestAdapter:
         Returns:
             OrderResult: 주문 결과 또는 None
         """
+        started = time.perf_counter()
         try:
-            self._apply_rate_limit()
-
-            url = f"{self.BASE_URL}/uapi/overseas-stock/v1/trading/order"
-
-            # 주문 구분 코드
-            ord_dvsn_map = {
-                "buy": {
-                    "limit": "00",   # 지정가 매수
-                    "market": "01"   # 시장가 매수
-                },
-                "sell": {
-                    "limit": "00",   # 지정가 매도
-                    "market": "01"   # 시장가 매도
-                }
-            }
-
-            ord_dvsn = ord_dvsn_map.get(order_type, {}).get(order_kind, "00")
+            self._apply_rate_limit(RequestPriority.ORDER)
 
-            # 계좌번호 파싱 (CANO, ACNT_PRDT_CD 분리)
-            cano, acnt_prdt_cd = self._parse_account_no(self.account_no)
+            url, tr_id, payload = self._order_request(ticker, order_type, quantity, price, order_kind)
 
-            # [FIX] 거래소 코드 자동 감지 (SOXL → AMEX)
-            # 주의: 거래/주문 API는 4글자 코드 사용 (시세 조회 API와 다름)
-            exchange_code = os.getenv("US_MARKET_EXCHANGE", config.US_MARKET_EXCHANGE)
-            if ticker == "SOXL":
-                exchange_code = "AMEX"  # 4글자 코드
-            elif exchange_code not in ["AMEX", "NASD", "NYSE"]:
-                exchange_code = "NASD"  # 기본값
-
-            payload = {
-                "CANO": cano,                       # 계좌번호 (8자리)
-                "ACNT_PRDT_CD": acnt_prdt_cd,       # 계좌상품코드 (2자리)
-                "OVRS_EXCG_CD": exchange_code,      # [FIX] 거래소코드 (자동 감지)
-                "PDNO": ticker,                      # 종목코드
-                "ORD_QTY": str(quantity),            # 주문수량
-                "OVRS_ORD_UNPR": f"{price:.2f}" if order_kind == "limit" else "0",  # 주문단가 (소수점 2자리)
-                "ORD_SVR_DVSN_CD": "0",             # 주문서버구분코드
-                "ORD_DVSN": ord_dvsn                # 주문구분
-            }
-
-            # Hashkey 생성
-            hashkey = self._get_hashkey(payload)
-
-            # TR_ID 선택 (매수/매도 구분)
-            tr_id = self.TR_ID_OVERSEAS_BUY if order_type == "buy" else self.TR_ID_OVERSEAS_SELL
+            # Hashkey 생성 ([v4.3] 모드에 따라 생략/캐시)
+            hashkey_started = time.perf_counter()
+            hashkey = self._order_hashkey(payload)
+            hashkey_ms = (time.perf_counter() - hashkey_started) * 1000
 
             # 헤더 생성
             headers = self._get_headers(
@@ -638,52 +990,22 @@ class KisRestAdapter:
                 hashkey=hashkey
             )
 
-            response = requests.post(
+            sent = time.perf_counter()
+            response = self._http_post(
                 url,
+                "order",
                 headers=headers,
-                json=payload,
-                timeout=10
+                json=payload
+            )
+            acked = time.perf_counter()
+            self.order_latency.record(
+                hashkey_ms=hashkey_ms,
+                ack_ms=(acked - sent) * 1000,
+                total_ms=(acked - started) * 1000
             )
 
             if response.status_code == 200:
-                data = response.json()
-
-                if data.get("rt_cd") == "0":  # 성공
-                    output = data.get("output", {})
-                    order_no = output.get("ODNO", "")
-
-                    # 체결 정보 추출 (KIS REST API 응답 필드)
-                    # [FIX] 기본값 0: 주문 응답에 체결 정보가 없으면 미체결로 처리 (허위 체결 방지)
-                    filled_price = float(output.get("AVG_PRVS", 0))   # 평균 체결가 (없으면 0)
-                    filled_qty = int(output.get("TOT_CCLD_QTY", 0))   # 총 체결 수량 (없으면 0)
-
-                    logger.info(
-                        f"주문 성공: {order_type} {ticker} - "
-                        f"주문 {quantity}주 @ ${price}, "
-                        f"체결 {filled_qty}주 @ ${filled_price:.2f} "
-                        f"(주문번호: {order_no})"
-                    )
-
-                    return OrderResult(
-                        order_no=order_no,
-                        status="success",
-                        message=data.get("msg1", ""),
-                        filled_price=filled_price,
-                        filled_qty=filled_qty,
-                        total_qty=quantity
-                    )
-                else:
-                    error_msg = data.get("msg1", "Unknown error")
-                    logger.error(f"주문 실패: {error_msg}")
-
-                    return OrderResult(
-                        order_no="",
-                        status="failed",
-                        message=error_msg,
-                        filled_price=0.0,
-                        filled_qty=0,
-                        total_qty=quantity
-                    )
+                return self._parse_order_response(response.json(), ticker, order_type, quantity, price)
             else:
                 logger.error(f"주문 HTTP 오류: {response.status_code} - {response.text}")
                 return None
@@ -695,6 +1017,105 @@ class KisRestAdapter:
             logger.error(f"주문 예외: {e}")
             return None
 
+    def _order_request(
+        self,
+        ticker: str,
+        order_type: str,
+        quantity: int,
+        price: float,
+        order_kind: str
+    ) -> tuple[str, str, dict]:
+        """
+        [v4.3] 주문 URL, TR_ID, Body 구성
+
+        Returns:
+            tuple: (url, tr_id, payload)
+        """
+        url = f"{self.BASE_URL}/uapi/overseas-stock/v1/trading/order"
+
+        # 주문 구분 코드
+        ord_dvsn_map = {
+            "buy": {
+                "limit": "00",   # 지정가 매수
+                "market": "01"   # 시장가 매수
+            },
+            "sell": {
+                "limit": "00",   # 지정가 매도
+                "market": "01"   # 시장가 매도
+            }
+        }
+
+        ord_dvsn = ord_dvsn_map.get(order_type, {}).get(order_kind, "00")
+
+        # 계좌번호 파싱 (CANO, ACNT_PRDT_CD 분리)
+        cano, acnt_prdt_cd = self._parse_account_no(self.account_no)
+
+        # [v4.3] 거래소 코드: 시세 조회 거래소 캐시와 동일 소스 (SOXL → AMS → AMEX)
+        # 주의: 거래/주문 API는 4글자 코드 사용 (시세 조회 API와 다름)
+        exchange_code = self.get_order_exchange(ticker)
+
+        payload = {
+            "CANO": cano,                       # 계좌번호 (8자리)
+            "ACNT_PRDT_CD": acnt_prdt_cd,       # 계좌상품코드 (2자리)
+            "OVRS_EXCG_CD": exchange_code,      # [FIX] 거래소코드 (자동 감지)
+            "PDNO": ticker,                      # 종목코드
+            "ORD_QTY": str(quantity),            # 주문수량
+            "OVRS_ORD_UNPR": f"{price:.2f}" if order_kind == "limit" else "0",  # 주문단가 (소수점 2자리)
+            "ORD_SVR_DVSN_CD": "0",             # 주문서버구분코드
+            "ORD_DVSN": ord_dvsn                # 주문구분
+        }
+
+        # TR_ID 선택 (매수/매도 구분)
+        tr_id = self.TR_ID_OVERSEAS_BUY if order_type == "buy" else self.TR_ID_OVERSEAS_SELL
+
+        return url, tr_id, payload
+
+    @staticmethod
+    def _parse_order_response(
+        data: dict,
+        ticker: str,
+        order_type: str,
+        quantity: int,
+        price: float
+    ) -> OrderResult:
+        """[v4.3] 주문 응답 해석"""
+        if data.get("rt_cd") == "0":  # 성공
+            output = data.get("output", {})
+            order_no = output.get("ODNO", "")
+
+            # 체결 정보 추출 (KIS REST API 응답 필드)
+            # [FIX] 기본값 0: 주문 응답에 체결 정보가 없으면 미체결로 처리 (허위 체결 방지)
+            filled_price = float(output.get("AVG_PRVS", 0))   # 평균 체결가 (없으면 0)
+            filled_qty = int(output.get("TOT_CCLD_QTY", 0))   # 총 체결 수량 (없으면 0)
+
+            logger.info(
+                f"주문 성공: {order_type} {ticker} - "
+                f"주문 {quantity}주 @ ${price}, "
+                f"체결 {filled_qty}주 @ ${filled_price:.2f} "
+                f"(주문번호: {order_no})"
+            )
+
+            return OrderResult(
+                order_no=order_no,
+                status="success",
+                message=data.get("msg1", ""),
+                filled_price=filled_price,
+                filled_qty=filled_qty,
+                total_qty=quantity
+            )
+        else:
+            error_msg = data.get("msg1", "Unknown error")
+            logger.error(f"주문 실패: {error_msg}")
+
+            return OrderResult(
+                order_no="",
+                status="failed",
+                message=error_msg,
+                filled_price=0.0,
+                filled_qty=0,
+                total_qty=quantity
+            )
+
     def send_buy_order(self, ticker: str, quantity: int, price: float) -> Optional[OrderResult]:
         """매수 주문 (지정가)"""
         return self._send_order_internal(ticker, "buy", quantity, price, "limit")
@@ -718,78 +1139,21 @@ class KisRestAdapter:
             float: 잔고 (USD)
         """
         try:
-            self._apply_rate_limit()
-
-            account = account_no or self.account_no
-            # [P0 FIX] 계좌번호 파싱 사용
-            cano, acnt_prdt_cd = self._parse_account_no(account)
+            self._apply_rate_limit(RequestPriority.BALANCE)
 
-            # 환경 변수에서 거래소 코드 가져오기
-            exchange_code = os.getenv("US_MARKET_EXCHANGE", config.US_MARKET_EXCHANGE)
-            logger.info(f"잔고 조회 거래소 코드: {exchange_code}")
-
-            url = f"{self.BASE_URL}/uapi/overseas-stock/v1/trading/inquire-balance"
-
-            params = {
-                "CANO": cano,
-                "ACNT_PRDT_CD": acnt_prdt_cd,
-                "OVRS_EXCG_CD": exchange_code,     # 해외거래소코드 (환경 변수/설정에서 가져옴)
-                "TR_CRCY_CD": "USD",        # 거래통화코드
-                "CTX_AREA_FK200": "",       # 연속조회검색조건200 (최초 조회시 공란)
-                "CTX_AREA_NK200": ""        # 연속조회키200 (최초 조회시 공란)
-            }
+            url, params = self._balance_request(account_no)
 
             headers = self._get_headers(tr_id=self.TR_ID_OVERSEAS_ACCOUNT)
 
-            response = requests.get(
+            response = self._http_get(
                 url,
+                "account",
                 headers=headers,
-                params=params,
-                timeout=10
+                params=params
             )
 
             if response.status_code == 200:
-                data = response.json()
-
-                if data.get("rt_cd") == "0":
-                    output1 = data.get("output1", [])
-                    output2 = data.get("output2")  # list 또는 dict 가능
-
-                    # 디버그: API 응답 구조 확인
-                    logger.info(f"KIS API 잔고조회 성공: output1 {len(output1)}건, output2 타입={type(output2)}")
-                    logger.info(f"[DEBUG] output2 내용: {output2}")
-
-                    # output2에서 예수금 조회 (list 또는 dict 처리)
-                    cash = 0.0
-
-                    if output2:
-                        # output2가 dict인 경우 (잔고 없을 때)
-                        if isinstance(output2, dict):
-                            cash = float(output2.get("frcr_drwg_psbl_amt_1", 0) or 0)
-                            logger.info(f"USD 예수금 (dict): ${cash:.2f}")
-
-                        # output2가 list인 경우 (잔고 있을 때)
-                        elif isinstance(output2, list) and len(output2) > 0:
-                            if isinstance(output2[0], dict):
-                                cash = float(output2[0].get("frcr_drwg_psbl_amt_1", 0) or 0)
-                                logger.info(f"USD 예수금 (list): ${cash:.2f}")
-
-                    # output1에서 보유 종목 확인
-                    if len(output1) > 0:
-                        for item in output1:
-                            if item.get("ovrs_pdno"):  # 종목코드가 있으면 실제 보유
-                                ticker = item.get("ovrs_pdno", "")
-                                qty = item.get("ovrs_cblc_qty", "0")
-                                logger.info(f"  보유종목: {ticker} {qty}주")
-                    else:
-                        logger.info("  보유종목: 없음")
-
-                    return cash  # 예수금 반환
-                else:
-                    error_msg = data.get('msg1', 'Unknown error')
-                    logger.error(f"잔고 조회 실패: rt_cd={data.get('rt_cd')}, msg1={error_msg}")
-                    logger.error(f"전체 응답: {data}")
-                    return 0.0
+                return self._parse_balance_response(response.json())
             else:
                 logger.error(f"잔고 조회 HTTP 오류: {response.status_code}, 응답: {response.text}")
                 return 0.0
@@ -801,6 +1165,117 @@ class KisRestAdapter:
             logger.error(f"잔고 조회 예외: {e}")
             return 0.0
 
+    def _balance_request(self, account_no: str = "") -> tuple[str, dict]:
+        """[v4.3] 잔고 조회 URL, 파라미터"""
+        account = account_no or self.account_no
+        # [P0 FIX] 계좌번호 파싱 사용
+        cano, acnt_prdt_cd = self._parse_account_no(account)
+
+        # 환경 변수에서 거래소 코드 가져오기
+        exchange_code = os.getenv("US_MARKET_EXCHANGE", config.US_MARKET_EXCHANGE)
+        logger.info(f"잔고 조회 거래소 코드: {exchange_code}")
+
+        url = f"{self.BASE_URL}/uapi/overseas-stock/v1/trading/inquire-balance"
+
+        params = {
+            "CANO": cano,
+            "ACNT_PRDT_CD": acnt_prdt_cd,
+            "OVRS_EXCG_CD": exchange_code,     # 해외거래소코드 (환경 변수/설정에서 가져옴)
+            "TR_CRCY_CD": "USD",        # 거래통화코드
+            "CTX_AREA_FK200": "",       # 연속조회검색조건200 (최초 조회시 공란)
+            "CTX_AREA_NK200": ""        # 연속조회키200 (최초 조회시 공란)
+        }
+        return url, params
+
+    @staticmethod
+    def _parse_balance_response(data: dict) -> float:
+        """[v4.3] 잔고 조회 응답 해석 (USD 예수금 반환)"""
+        if data.get("rt_cd") == "0":
+            output1 = data.get("output1", [])
+            output2 = data.get("output2")  # list 또는 dict 가능
+
+            # 디버그: API 응답 구조 확인
+            logger.info(f"KIS API 잔고조회 성공: output1 {len(output1)}건, output2 타입={type(output2)}")
+            logger.info(f"[DEBUG] output2 내용: {output2}")
+
+            # output2에서 예수금 조회 (list 또는 dict 처리)
+            cash = 0.0
+
+            if output2:
+                # output2가 dict인 경우 (잔고 없을 때)
+                if isinstance(output2, dict):
+                    cash = float(output2.get("frcr_drwg_psbl_amt_1", 0) or 0)
+                    logger.info(f"USD 예수금 (dict): ${cash:.2f}")
+
+                # output2가 list인 경우 (잔고 있을 때)
+                elif isinstance(output2, list) and len(output2) > 0:
+                    if isinstance(output2[0], dict):
+                        cash = float(output2[0].get("frcr_drwg_psbl_amt_1", 0) or 0)
+                        logger.info(f"USD 예수금 (list): ${cash:.2f}")
+
+            # output1에서 보유 종목 확인
+            if len(output1) > 0:
+                for item in output1:
+                    if item.get("ovrs_pdno"):  # 종목코드가 있으면 실제 보유
+                        ticker = item.get("ovrs_pdno", "")
+                        qty = item.get("ovrs_cblc_qty", "0")
+                        logger.info(f"  보유종목: {ticker} {qty}주")
+            else:
+                logger.info("  보유종목: 없음")
+
+            return cash  # 예수금 반환
+        else:
+            error_msg = data.get('msg1', 'Unknown error')
+            logger.error(f"잔고 조회 실패: rt_cd={data.get('rt_cd')}, msg1={error_msg}")
+            logger.error(f"전체 응답: {data}")
+            return 0.0
+
+    def get_holding_quantity(self, ticker: str, account_no: str = "") -> Optional[int]:
+        """
+        [v4.3] 종목 보유 수량 조회 (잔고 조회 output1, 재시작 복구 대조용)
+
+        Args:
+            ticker: 종목코드
+            account_no: 계좌번호 (미지정 시 self.account_no 사용)
+
+        Returns:
+            int: 보유 수량 (보유 없으면 0, 조회 실패 시 None)
+        """
+        try:
+            self._apply_rate_limit(RequestPriority.BALANCE)
+
+            url, params = self._balance_request(account_no)
+            headers = self._get_headers(tr_id=self.TR_ID_OVERSEAS_ACCOUNT)
+            response = self._http_get(url, "account", headers=headers, params=params)
+
+            if response.status_code != 200:
+                logger.error(f"보유 수량 조회 HTTP 오류: {response.status_code}, 응답: {response.text}")
+                return None
+
+            data = response.json()
+            if data.get("rt_cd") != "0":
+                logger.error(f"보유 수량 조회 실패: rt_cd={data.get('rt_cd')}, msg1={data.get('msg1')}")
+                return None
+
+            return self._parse_holdings(data).get(ticker, 0)
+
+        except AuthenticationError as e:
+            logger.error(f"인증 오류: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"보유 수량 조회 예외: {e}")
+            return None
+
+    @staticmethod
+    def _parse_holdings(data: dict) -> Dict[str, int]:
+        """[v4.3] 잔고 조회 응답 output1 → {종목코드: 보유 수량}"""
+        holdings = {}
+        for item in data.get("output1", []) or []:
+            ticker = item.get("ovrs_pdno", "")
+            if ticker:
+                holdings[ticker] = holdings.get(ticker, 0) + int(float(item.get("ovrs_cblc_qty", 0) or 0))
+        return holdings
+
     def get_cash_balance(self, ticker: str = "SOXL", price: float = 1.0, account_no: str = "") -> float:
         """
         USD 예수금 조회 (매수가능금액조회 API 사용)
@@ -814,69 +1289,21 @@ class KisRestAdapter:
             float: USD 예수금 (주문가능외화금액)
         """
         try:
-            account = account_no or self.account_no
-            cano, acnt_prdt_cd = self._parse_account_no(account)
-
-            # 환경 변수에서 거래소 코드 가져오기 (기본값: config.US_MARKET_EXCHANGE)
-            exchange_code = os.getenv("US_MARKET_EXCHANGE", config.US_MARKET_EXCHANGE)
-            
-            # ticker 기반으로 거래소 자동 감지 (SOXL → AMEX)
-            # 주의: 거래/주문 API는 4글자 코드 사용 (시세 조회 API와 다름)
-            if ticker == "SOXL":
-                exchange_code = "AMEX"  # 4글자 코드
-            elif exchange_code not in ["AMEX", "NASD", "NYSE"]:
-                exchange_code = "NASD"  # 기본값: 나스닥
-            
-            logger.info(f"예수금 조회 거래소 코드: {exchange_code} (종목: {ticker})")
-
-            url = f"{self.BASE_URL}/uapi/overseas-stock/v1/trading/inquire-psamount"
-
-            params = {
-                "CANO": cano,
-                "ACNT_PRDT_CD": acnt_prdt_cd,
-                "OVRS_EXCG_CD": exchange_code,    # 거래소 코드 (환경 변수/설정에서 가져옴)
-                "OVRS_ORD_UNPR": f"{price:.2f}",  # 주문단가 (소수점 2자리면 충분)
-                "ITEM_CD": ticker                 # 종목코드
-            }
+            self._apply_rate_limit(RequestPriority.BALANCE)
+
+            url, params = self._psamount_request(ticker, price, account_no)
 
             headers = self._get_headers(tr_id=self.TR_ID_OVERSEAS_BUYABLE)
 
-            response = requests.get(
+            response = self._http_get(
                 url,
+                "account",
                 headers=headers,
-                params=params,
-                timeout=10
+                params=params
             )
 
             if response.status_code == 200:
-                data = response.json()
-
-                logger.info(f"[DEBUG] 매수가능금액조회 응답 rt_cd: {data.get('rt_cd')}")
-                logger.info(f"[DEBUG] 매수가능금액조회 응답 msg1: {data.get('msg1')}")
-
-                if data.get("rt_cd") == "0":
-                    output = data.get("output", {})
-
-                    logger.info(f"[DEBUG] output 타입: {type(output)}")
-                    logger.info(f"[DEBUG] output 내용: {output}")
-
-                    # ord_psbl_frcr_amt: 주문가능외화금액 (USD 예수금)
-                    cash_balance = float(output.get("ord_psbl_frcr_amt", 0))
-
-                    logger.info(f"USD 예수금 조회 성공: ${cash_balance:.2f} (거래소: {exchange_code})")
-                    return cash_balance
-                elif data.get("rt_cd") == "7":
-                    # rt_cd=7: "상품이 없습니다" → 거래 이력 없음 or 잔고 0
-                    msg = data.get('msg1', '').strip()
-                    logger.info(f"예수금 조회: {msg} → USD 잔고 $0.00으로 처리")
-                    return 0.0
-                else:
-                    error_msg = data.get('msg1', 'Unknown error')
-                    logger.error(f"예수금 조회 실패: rt_cd={data.get('rt_cd')}, msg1={error_msg}")
-                    # 상세 디버그 정보 출력
-                    logger.debug(f"요청 파라미터: {params}")
-                    logger.debug(f"응답 전체: {data}")
-                    return 0.0
+                return self._parse_psamount_response(response.json(), params)
             else:
                 logger.error(f"예수금 조회 HTTP 오류: {response.status_code}, 응답: {response.text}")
                 return 0.0
@@ -888,6 +1315,58 @@ class KisRestAdapter:
             logger.error(f"예수금 조회 예외: {e}")
             return 0.0
 
+    def _psamount_request(self, ticker: str, price: float, account_no: str = "") -> tuple[str, dict]:
+        """[v4.3] 매수가능금액 조회 URL, 파라미터"""
+        account = account_no or self.account_no
+        cano, acnt_prdt_cd = self._parse_account_no(account)
+
+        # [v4.3] ticker 기반 거래소 코드 (시세 조회 거래소 캐시와 동일 소스)
+        # 주의: 거래/주문 API는 4글자 코드 사용 (시세 조회 API와 다름)
+        exchange_code = self.get_order_exchange(ticker)
+
+        logger.info(f"예수금 조회 거래소 코드: {exchange_code} (종목: {ticker})")
+
+        url = f"{self.BASE_URL}/uapi/overseas-stock/v1/trading/inquire-psamount"
+
+        params = {
+            "CANO": cano,
+            "ACNT_PRDT_CD": acnt_prdt_cd,
+            "OVRS_EXCG_CD": exchange_code,    # 거래소 코드 (환경 변수/설정에서 가져옴)
+            "OVRS_ORD_UNPR": f"{price:.2f}",  # 주문단가 (소수점 2자리면 충분)
+            "ITEM_CD": ticker                 # 종목코드
+        }
+        return url, params
+
+    @staticmethod
+    def _parse_psamount_response(data: dict, params: dict) -> float:
+        """[v4.3] 매수가능금액 조회 응답 해석 (USD 예수금 반환)"""
+        logger.info(f"[DEBUG] 매수가능금액조회 응답 rt_cd: {data.get('rt_cd')}")
+        logger.info(f"[DEBUG] 매수가능금액조회 응답 msg1: {data.get('msg1')}")
+
+        if data.get("rt_cd") == "0":
+            output = data.get("output", {})
+
+            logger.info(f"[DEBUG] output 타입: {type(output)}")
+            logger.info(f"[DEBUG] output 내용: {output}")
+
+            # ord_psbl_frcr_amt: 주문가능외화금액 (USD 예수금)
+            cash_balance = float(output.get("ord_psbl_frcr_amt", 0))
+
+            logger.info(f"USD 예수금 조회 성공: ${cash_balance:.2f} (거래소: {params['OVRS_EXCG_CD']})")
+            return cash_balance
+        elif data.get("rt_cd") == "7":
+            # rt_cd=7: "상품이 없습니다" → 거래 이력 없음 or 잔고 0
+            msg = data.get('msg1', '').strip()
+            logger.info(f"예수금 조회: {msg} → USD 잔고 $0.00으로 처리")
+            return 0.0
+        else:
+            error_msg = data.get('msg1', 'Unknown error')
+            logger.error(f"예수금 조회 실패: rt_cd={data.get('rt_cd')}, msg1={error_msg}")
+            # 상세 디버그 정보 출력
+            logger.debug(f"요청 파라미터: {params}")
+            logger.debug(f"응답 전체: {data}")
+            return 0.0
+
     def get_account_list(self) -> List[str]:
         """
         계좌 목록 조회
@@ -910,14 +1389,14 @@ class KisRestAdapter:
     async def subscribe_realtime_price(
         self,
         ticker: str,
-        callback: Callable[[Dict], None]
+        callback: Callable[[RealtimeTick], None]
     ):
         """
         실시간 시세 구독 (WebSocket)
 
         Args:
             ticker: 종목코드
-            callback: 시세 수신 시 호출할 콜백 함수
+            callback: 체결가 수신 시 호출할 콜백 함수 ([v4.3] 인자: RealtimeTick, 다건 프레임은 레코드마다 호출)
         """
         if not self.approval_key:
             logger.error("Approval Key가 없습니다. WebSocket을 사용할 수 없습니다.")
@@ -926,6 +1405,7 @@ class KisRestAdapter:
         self.price_callback = callback
         self.ws_running = True
         self.ws_reconnect_count = 0
+        price_tr_key = self._price_tr_key(ticker)  # [v4.3] D+거래소+종목 (예: DAMSSOXL)
 
         while self.ws_running and self.ws_reconnect_count < self.ws_max_reconnect:
             try:
@@ -944,13 +1424,19 @@ class KisRestAdapter:
                         "body": {
                             "input": {
                                 "tr_id": self.TR_ID_WS_REALTIME,
-                                "tr_key": ticker
+                                "tr_key": price_tr_key
                             }
                         }
                     }
 
                     await ws.send(json.dumps(subscribe_msg))
-                    logger.info(f"WebSocket 구독 시작: {ticker}")
+                    logger.info(f"WebSocket 구독 시작: {ticker} ({price_tr_key})")
+
+                    # [v4.3] 체결통보 구독 (같은 연결, 구독 응답 수신 시 FillRegistry 활성화)
+                    fill_notice_key = self._fill_notice_tr_key()
+                    if fill_notice_key:
+                        await ws.send(json.dumps(self._fill_notice_message(fill_notice_key, "1")))
+                        logger.info("WebSocket 체결통보 구독 요청")
 
                     # 준비 완료 이벤트 설정
                     self.ws_ready_event.set()
@@ -962,7 +1448,6 @@ class KisRestAdapter:
                     while self.ws_running:
                         try:
                             message = await asyncio.wait_for(ws.recv(), timeout=60)
-                            data = json.loads(message)
 
                             # [v4.1] 첫 메시지 수신 = 안정적 연결 확인
                             if not stable_connection_confirmed:
@@ -970,19 +1455,18 @@ class KisRestAdapter:
                                 stable_connection_confirmed = True
                                 logger.info("WebSocket 안정적 연결 확인 - 재연결 카운터 리셋")
 
-                            # 시세 데이터 파싱
-                            if "body" in data and "output" in data["body"]:
-                                output = data["body"]["output"]
+                            # [v4.3] 실시간 데이터 프레임 ("0|TR_ID|건수|본문", 암호화 시 "1|...")
+                            if is_data_frame(message):
+                                self._handle_ws_frame(message)
+                                continue
 
-                                price_data = {
-                                    "ticker": ticker,
-                                    "price": float(output.get("last", 0)),
-                                    "timestamp": datetime.now().isoformat()
-                                }
-
-                                # 콜백 호출
-                                if self.price_callback:
-                                    self.price_callback(price_data)
+                            # [v4.3] JSON 제어 메시지 (PINGPONG은 원문 그대로 회신)
+                            control = parse_control(message)
+                            if is_pingpong(control):
+                                await ws.send(message)
+                                logger.debug("WebSocket PINGPONG 회신")
+                            else:
+                                self._handle_ws_control(control)
 
                         except asyncio.TimeoutError:
                             # 핑 전송 (연결 유지)
@@ -993,6 +1477,9 @@ class KisRestAdapter:
                             logger.error(f"WebSocket 수신 오류: {e}")
                             break
 
+                    # [v4.3] 연결 종료 → 체결 대기는 REST 조회로 (재연결 후 구독 응답 시 다시 활성화)
+                    self.fill_registry.set_live(False)
+
                     # 구독 해제 메시지 전송 (정상 종료 시에만)
                     if self.ws_connection and not self.ws_running:
                         try:
@@ -1006,11 +1493,13 @@ class KisRestAdapter:
                                 "body": {
                                     "input": {
                                         "tr_id": self.TR_ID_WS_REALTIME,
-                                        "tr_key": ticker
+                                        "tr_key": price_tr_key
                                     }
                                 }
                             }
                             await ws.send(json.dumps(unsubscribe_msg))
+                            if fill_notice_key:
+                                await ws.send(json.dumps(self._fill_notice_message(fill_notice_key, "2")))
                             logger.info("WebSocket 구독 해제 메시지 전송")
                         except Exception as e:
                             logger.warning(f"구독 해제 메시지 전송 실패: {e}")
@@ -1022,6 +1511,7 @@ class KisRestAdapter:
 
             except Exception as e:
                 logger.error(f"WebSocket 연결 오류: {e}")
+                self.fill_registry.set_live(False)
 
                 # unsubscribe 요청이면 재연결 안 함
                 if not self.ws_running:
@@ -1049,6 +1539,7 @@ class KisRestAdapter:
         self.ws_running = False
         self.ws_connection = None
         self.ws_ready_event.clear()
+        self.fill_registry.set_live(False)
         logger.info("WebSocket 연결 종료")
 
     def unsubscribe_realtime_price(self):
@@ -1056,6 +1547,120 @@ class KisRestAdapter:
         self.ws_running = False
         logger.info("WebSocket 구독 해제 요청")
 
+    def _price_tr_key(self, ticker: str) -> str:
+        """[v4.3] 실시간 시세 구독 키 (D + 시세 거래소 코드 + 종목코드, 거래소는 캐시/사전 등록 기준)"""
+        return f"D{self._quote_exchange_order(ticker)[0]}{ticker}"
+
+    def _handle_ws_frame(self, message: str):
+        """
+        [v4.3] 실시간 데이터 프레임 처리 ("암호화여부|TR_ID|건수|본문")
+
+        체결가(HDFSCNT0)는 레코드마다 price_callback 호출, 체결통보는 FillRegistry 반영.
+        """
+        frame = split_frame(message)
+        if frame is None:
+            return
+
+        if frame.tr_id == self.TR_ID_WS_REALTIME:
+            callback = self.price_callback
+            for tick in parse_price_ticks(frame.payload, frame.count):
+                if callback:
+                    callback(tick)
+        elif frame.tr_id in (self.TR_ID_WS_FILL_NOTICE, self.TR_ID_WS_FILL_NOTICE_MOCK):
+            self._handle_fill_notice_frame(frame.encrypted, frame.payload, frame.count)
+
+    def _handle_ws_control(self, control: dict):
+        """[v4.3] JSON 제어 메시지 처리 (구독 응답)"""
+        tr_id = control_tr_id(control)
+        if tr_id in (self.TR_ID_WS_FILL_NOTICE, self.TR_ID_WS_FILL_NOTICE_MOCK):
+            self._on_fill_notice_subscribed(control)  # 복호화 키/IV
+            return
+
+        body = control.get("body", {})
+        if body.get("rt_cd", "0") != "0":
+            logger.error(f"WebSocket 구독 실패 ({tr_id}): {body.get('msg1', control)}")
+        else:
+            logger.info(f"WebSocket 응답 ({tr_id}): {body.get('msg1', '')}")
+
+    # ============================================
+    # [v4.3] 실시간 체결통보 (H0GSCNI0)
+    # ============================================
+
+    def _fill_notice_tr_key(self) -> str:
+        """
+        체결통보 구독 키 (HTS ID)
+
+        Returns:
+            str: HTS ID (구독하지 않으면 빈 문자열)
+        """
+        if not config.KIS_FILL_NOTICE_ENABLED:
+            return ""
+        if not config.KIS_HTS_ID:
+            logger.warning("KIS_HTS_ID 미설정 - 체결통보 구독 안 함 (체결 확인은 REST 조회)")
+            return ""
+        if not CRYPTO_AVAILABLE:
+            logger.warning("pycryptodome 미설치 - 체결통보 구독 안 함 (체결 확인은 REST 조회)")
+            return ""
+        return config.KIS_HTS_ID
+
+    def _fill_notice_message(self, hts_id: str, tr_type: str) -> dict:
+        """
+        체결통보 구독/해제 메시지
+
+        Args:
+            hts_id: HTS ID
+            tr_type: "1" 등록, "2" 해제
+        """
+        is_mock = len(self.app_key) != 36  # 체결내역 조회와 같은 기준
+        return {
+            "header": {
+                "approval_key": self.approval_key,
+                "custtype": "P",
+                "tr_type": tr_type,
+                "content-type": "utf-8"
+            },
+            "body": {
+                "input": {
+                    "tr_id": self.TR_ID_WS_FILL_NOTICE_MOCK if is_mock else self.TR_ID_WS_FILL_NOTICE,
+                    "tr_key": hts_id
+                }
+            }
+        }
+
+    def _on_fill_notice_subscribed(self, data: dict):
+        """체결통보 구독 응답 처리 (복호화 키/IV 보관 후 FillRegistry 활성화)"""
+        body = data.get("body", {})
+        output = body.get("output") or {}
+
+        if body.get("rt_cd") != "0" or not output.get("key") or not output.get("iv"):
+            logger.error(f"체결통보 구독 실패: {body.get('msg1', data)} - 체결 확인은 REST 조회")
+            self.fill_registry.set_live(False)
+            return
+
+        self._fill_notice_cipher = (output["key"], output["iv"])
+        self.fill_registry.set_live(True)
+        logger.info(f"체결통보 구독 완료: {body.get('msg1', '')}")
+
+    def _handle_fill_notice_frame(self, encrypted: bool, payload: str, count: int):
+        """체결통보 프레임 처리 (복호화 → 레코드별 FillRegistry 반영)"""
+        try:
+            if encrypted:
+                if self._fill_notice_cipher is None:
+                    logger.warning("체결통보 복호화 키 없음 - 통보 무시")
+                    return
+                payload = decrypt_notice(payload, *self._fill_notice_cipher)
+
+            fields, width = split_records(payload, count, MIN_FIELD_COUNT)
+            if not width:
+                return
+            for base in range(0, width * count, width):
+                notice = parse_fill_notice(fields[base:base + width])
+                if notice is not None:
+                    self.fill_registry.record(notice)
+
+        except Exception as e:
+            logger.error(f"체결통보 처리 오류: {e}")
+
     # =====================================
     # 6. 유틸리티
     # =====================================
@@ -1069,6 +1674,8 @@ class KisRestAdapter:
     def disconnect(self):
         """연결 해제"""
         self.unsubscribe_realtime_price()
+        self.token_manager.stop()  # [v4.3] 백그라운드 토큰 갱신 중지
+        self.session.close()  # [v4.3] 연결 풀 정리 (이후 요청 시 새 연결 생성)
         self.access_token = None
         self.token_expires_at = None
         self.approval_key = None
@@ -1099,9 +1706,9 @@ class KisRestAdapter:
             ticker: 종목코드
             callback: 가격 수신 시 호출할 콜백 함수 (인자: price)
         """
-        # 콜백 래퍼 (Dict -> float 변환)
-        def wrapped_callback(data: Dict):
-            callback(data["price"])
+        # 콜백 래퍼 (RealtimeTick -> float 변환)
+        def wrapped_callback(tick: RealtimeTick):
+            callback(tick.price)
 
         # 비동기 구독을 백그라운드 스레드에서 실행
         def run_async_subscription():
@@ -1208,8 +1815,97 @@ class KisRestAdapter:
                 "reject_reason": 거부 사유 (str)
             }
         """
+        # [v4.3] 당일 주문은 체결내역 일괄 조회 캐시에서 조회
+        if not order_date or order_date == datetime.now().strftime("%Y%m%d"):
+            return self.fill_poller.get(order_no)
+
+        url, tr_id, params = self._ccnl_request(order_no, order_date)
+
+        headers = self._get_headers(
+            tr_id=tr_id,
+            custtype="P"
+        )
+
+        try:
+            # [FIX] Rate limit 보호
+            self._apply_rate_limit(RequestPriority.FILL)
+
+            response = self._http_get(url, "account", headers=headers, params=params)
+            response.raise_for_status()
+
+            return self._parse_fill_status(response.json(), order_no)
+
+        except Exception as e:
+            logger.error(f"체결 조회 예외: {e}", exc_info=True)
+            return self._fill_status_error(str(e))
+
+    def fetch_fill_statuses(self, order_date: str = None) -> Optional[Dict[str, dict]]:
+        """
+        [v4.3] 당일 체결내역 전체 조회 (연속조회 CTX_AREA_* 포함)
+
+        Args:
+            order_date: 주문일자 YYYYMMDD (None이면 오늘)
+
+        Returns:
+            dict: {정규화 주문번호: 체결 상태} (조회 실패 시 None)
+        """
+        statuses: Dict[str, dict] = {}
+        ctx_fk, ctx_nk = "", ""
+
+        try:
+            for page in range(1, self.CCNL_MAX_PAGES + 1):
+                url, tr_id, params = self._ccnl_request("", order_date, ctx_fk, ctx_nk)
+                headers = self._get_headers(tr_id=tr_id, custtype="P")
+                if page > 1:
+                    headers = {**headers, "tr_cont": "N"}  # 연속조회
+
+                self._apply_rate_limit(RequestPriority.FILL)
+                response = self._http_get(url, "account", headers=headers, params=params)
+                response.raise_for_status()
+                data = response.json()
+
+                if data.get("rt_cd") != "0":
+                    logger.error(f"체결 조회 실패: {data.get('msg1', 'Unknown error')}")
+                    return None
+
+                for item in data.get("output", []):
+                    statuses[normalize_order_no(item.get("odno", ""))] = self._fill_status_from_row(item)
+
+                # 응답 헤더 tr_cont: F/M = 다음 페이지 있음, D/E = 마지막
+                if response.headers.get("tr_cont") not in ("F", "M"):
+                    break
+                ctx_fk = data.get("ctx_area_fk200", "").strip()
+                ctx_nk = data.get("ctx_area_nk200", "").strip()
+            else:
+                logger.warning(f"체결내역 연속조회 {self.CCNL_MAX_PAGES}페이지 초과 - 이후 주문 생략")
+
+        except Exception as e:
+            logger.error(f"체결 조회 예외: {e}", exc_info=True)
+            return None
+
+        logger.debug(f"체결내역 일괄 조회: {len(statuses)}건 ({page}페이지)")
+        return statuses
+
+    def _ccnl_request(
+        self,
+        order_no: str,
+        order_date: str = None,
+        ctx_area_fk: str = "",
+        ctx_area_nk: str = ""
+    ) -> tuple[str, str, dict]:
+        """
+        [v4.3] 체결내역 조회 URL, TR_ID, 파라미터
+
+        Args:
+            order_no: 주문번호 (빈 문자열이면 당일 전체)
+            order_date: 주문일자 YYYYMMDD (None이면 오늘)
+            ctx_area_fk: 연속조회 검색조건 (이전 응답의 ctx_area_fk200)
+            ctx_area_nk: 연속조회 키 (이전 응답의 ctx_area_nk200)
+
+        Returns:
+            tuple: (url, tr_id, params)
+        """
         if not order_date:
-            from datetime import datetime
             order_date = datetime.now().strftime("%Y%m%d")
 
         # 모의투자 여부 확인 (app_key 길이로 판단, 실전=36자, 모의=다를 수 있음)
@@ -1238,73 +1934,53 @@ class KisRestAdapter:
             "ORD_DT": "",
             "ORD_GNO_BRNO": "",
             "ODNO": order_no,  # [FIX] 주문번호 직접 전달
-            "CTX_AREA_NK200": "",
-            "CTX_AREA_FK200": ""
+            "CTX_AREA_NK200": ctx_area_nk,
+            "CTX_AREA_FK200": ctx_area_fk
         }
 
-        headers = self._get_headers(
-            tr_id="TTTS3035R" if not is_mock else "VTTS3035R",
-            custtype="P"
-        )
-
-        try:
-            # [FIX] Rate limit 보호
-            self._apply_rate_limit()
-
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
+        tr_id = "TTTS3035R" if not is_mock else "VTTS3035R"
+        return url, tr_id, params
+
+    @staticmethod
+    def _fill_status_error(reason: str) -> dict:
+        """체결 조회 실패 결과"""
+        return FillStatusPoller.error_status(reason)
+
+    @staticmethod
+    def _fill_status_from_row(item: dict) -> dict:
+        """[v4.3] 체결내역 1행 → 체결 상태"""
+        return {
+            "status": item.get("prcs_stat_name", ""),
+            "filled_qty": int(item.get("ft_ccld_qty", "0")),
+            "filled_price": float(item.get("ft_ccld_unpr3", "0")),
+            "unfilled_qty": int(item.get("nccs_qty", "0")),
+            "reject_reason": item.get("rjct_rson_name", "")
+        }
 
-            data = response.json()
+    @classmethod
+    def _parse_fill_status(cls, data: dict, order_no: str) -> dict:
+        """[v4.3] 체결내역 응답에서 주문번호의 체결 상태 추출"""
+        if data.get("rt_cd") == "0":
+            output_list = data.get("output", [])
 
-            if data.get("rt_cd") == "0":
-                output_list = data.get("output", [])
-
-                # 주문번호로 필터링
-                for item in output_list:
-                    if item.get("odno") == order_no:
-                        status = item.get("prcs_stat_name", "")
-                        filled_qty = int(item.get("ft_ccld_qty", "0"))
-                        filled_price = float(item.get("ft_ccld_unpr3", "0"))
-                        unfilled_qty = int(item.get("nccs_qty", "0"))
-                        reject_reason = item.get("rjct_rson_name", "")
-
-                        return {
-                            "status": status,
-                            "filled_qty": filled_qty,
-                            "filled_price": filled_price,
-                            "unfilled_qty": unfilled_qty,
-                            "reject_reason": reject_reason
-                        }
+            # 주문번호로 필터링
+            for item in output_list:
+                if item.get("odno") == order_no:
+                    return cls._fill_status_from_row(item)
 
-                # 주문번호 못 찾음
-                logger.warning(f"주문번호 {order_no}를 찾을 수 없음 (조회된 주문 {len(output_list)}건)")
-                return {
-                    "status": "접수",
-                    "filled_qty": 0,
-                    "filled_price": 0.0,
-                    "unfilled_qty": 0,
-                    "reject_reason": "주문번호를 찾을 수 없음"
-                }
-            else:
-                error_msg = data.get("msg1", "Unknown error")
-                logger.error(f"체결 조회 실패: {error_msg}")
-                return {
-                    "status": "오류",
-                    "filled_qty": 0,
-                    "filled_price": 0.0,
-                    "unfilled_qty": 0,
-                    "reject_reason": error_msg
-                }
-
-        except Exception as e:
-            logger.error(f"체결 조회 예외: {e}", exc_info=True)
+            # 주문번호 못 찾음
+            logger.warning(f"주문번호 {order_no}를 찾을 수 없음 (조회된 주문 {len(output_list)}건)")
             return {
-                "status": "오류",
+                "status": "접수",
                 "filled_qty": 0,
                 "filled_price": 0.0,
                 "unfilled_qty": 0,
-                "reject_reason": str(e)
+                "reject_reason": "주문번호를 찾을 수 없음"
             }
+        else:
+            error_msg = data.get("msg1", "Unknown error")
+            logger.error(f"체결 조회 실패: {error_msg}")
+            return cls._fill_status_error(error_msg)
 
     @property
     def account_list(self) -> List[str]:
@@ -0,0 +1,120 @@
+"""
+Phoenix Trading System v4.3 - KIS Access Token 백그라운드 갱신
+
+만료 전에 별도 스레드에서 토큰을 재발급한다.
+시세/주문 요청 경로에서는 OAuth 요청(토큰 + Approval Key POST, 캐시 파일 저장)을
+수행하지 않으므로, 토큰 만료 시점에도 주문이 지연되지 않는다.
+
+사용 예:
+    manager = KisTokenManager(
+        renew=adapter.renew_token,
+        get_expires_at=lambda: adapter.token_expires_at,
+        refresh_ahead=timedelta(minutes=60),
+    )
+    manager.start()
+    ...
+    manager.stop()
+"""
+import threading
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class KisTokenManager:
+    """
+    토큰 선제 갱신 스레드
+
+    만료 refresh_ahead 전에 renew()를 호출하고, 실패하면 retry_interval 후 재시도한다.
+    토큰 상태 자체는 어댑터가 보관하며, 이 클래스는 갱신 시점만 관리한다.
+    """
+
+    # 만료 시각이 외부에서 바뀌어도 (수동 login 등) 이 간격 안에 다시 계산
+    MAX_SLEEP_SECONDS = 60.0
+
+    def __init__(
+        self,
+        renew: Callable[[], None],
+        get_expires_at: Callable[[], Optional[datetime]],
+        refresh_ahead: timedelta = timedelta(minutes=60),
+        retry_interval: float = 60.0
+    ):
+        """
+        Args:
+            renew: 토큰 재발급 함수 (실패 시 예외)
+            get_expires_at: 현재 토큰 만료 시각 조회 함수
+            refresh_ahead: 만료 몇 분 전에 갱신할지
+            retry_interval: 갱신 실패 시 재시도 간격 (초, KIS 토큰 발급은 분당 1회 제한)
+        """
+        self._renew = renew
+        self._get_expires_at = get_expires_at
+        self.refresh_ahead = refresh_ahead
+        self.retry_interval = retry_interval
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.refresh_count = 0
+        self.failure_count = 0
+        self.last_refreshed_at: Optional[datetime] = None
+
+    def seconds_until_refresh(self) -> float:
+        """다음 갱신까지 남은 시간 (초, 0이면 지금 갱신 필요)"""
+        expires_at = self._get_expires_at()
+        if expires_at is None:
+            return 0.0
+        return max((expires_at - self.refresh_ahead - datetime.now()).total_seconds(), 0.0)
+
+    def refresh_now(self) -> bool:
+        """
+        즉시 갱신 (스레드 루프에서 호출)
+
+        Returns:
+            bool: 갱신 성공 여부
+        """
+        try:
+            self._renew()
+        except Exception as e:
+            self.failure_count += 1
+            logger.error(f"[토큰 관리] 백그라운드 토큰 갱신 실패 ({self.failure_count}회): {e}")
+            return False
+
+        self.refresh_count += 1
+        self.last_refreshed_at = datetime.now()
+        logger.info(f"[토큰 관리] 백그라운드 토큰 갱신 완료 (만료: {self._get_expires_at()})")
+        return True
+
+    def _run(self):
+        """갱신 루프"""
+        while not self._stop_event.is_set():
+            wait = self.seconds_until_refresh()
+            if wait > 0:
+                self._stop_event.wait(min(wait, self.MAX_SLEEP_SECONDS))
+                continue
+
+            if not self.refresh_now():
+                self._stop_event.wait(self.retry_interval)
+
+    def start(self):
+        """백그라운드 갱신 시작 (이미 실행 중이면 무시)"""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="KisTokenManager", daemon=True)
+        self._thread.start()
+        logger.info(f"[토큰 관리] 백그라운드 갱신 시작 (만료 {self.refresh_ahead} 전 갱신)")
+
+    def stop(self, timeout: float = 5.0):
+        """백그라운드 갱신 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
@@ -0,0 +1,325 @@
+"""
+Phoenix Trading System v4.3 - 주문 관리자 (체결 확인 비동기화)
+
+주문 전송 후 체결 확인(_wait_for_fill)을 거래 루프에서 기다리지 않고
+작업 스레드에서 수행한다. 체결이 확인되면 GridEngineV4.confirm_order로 상태를 반영한다.
+
+체결 대기 중에도 틱 처리는 계속되고 매수/매도 배치가 동시에 진행된다.
+같은 Tier로 두 번째 주문이 나가지 않도록, 주문 전송 전에 엔진의 해당 Tier를
+ORDERING(매수) / SELLING(매도)으로 예약하고(예약 실패 시 신호 거부),
+접수되면 예약 번호를 주문번호로 바꿔 주문번호별로 메모리에 보관한다.
+
+사용 예:
+    manager = OrderManager(adapter, engine, ticker="SOXL", wait_for_fill=system._wait_for_fill)
+    manager.submit(signal)      # 주문 전송 + 체결 확인 예약 (즉시 반환)
+    ...
+    manager.shutdown()          # 진행 중인 체결 확인 완료 대기
+"""
+import itertools
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .models import TradeSignal
+
+
+logger = logging.getLogger(__name__)
+
+
+# 주문 전 Tier 예약 번호 접두어 (브로커 주문번호로 교체되기 전까지 Tier의 주문번호 자리에 기록)
+RESERVATION_PREFIX = "RESERVED-"
+
+
+@dataclass
+class PendingOrder:
+    """체결 확인 대기 중인 주문"""
+    order_id: str
+    signal: TradeSignal
+    order_result: dict                  # send_order 응답 (체결 정보 fallback)
+    submitted_at: datetime = field(default_factory=datetime.now)
+    reservation_id: str = ""            # 주문 전 Tier 예약 번호
+
+    @property
+    def tiers(self) -> Tuple[int, ...]:
+        return self.signal.tiers
+
+
+@dataclass(frozen=True)
+class OrderOutcome:
+    """체결 확인 결과 (on_filled / on_failed 콜백 인자)"""
+    order_id: str
+    signal: TradeSignal
+    filled_qty: int
+    filled_price: float
+    profit: float = 0.0                 # 매도 수익금 (매수는 0)
+    error_message: str = ""
+
+
+class OrderManager:
+    """
+    주문 전송 + 체결 확인 비동기 처리 (스레드 안전)
+
+    submit()은 거래 루프에서 호출하며 주문 접수까지만 기다린다.
+    체결 확인은 max_workers개 작업 스레드에서 병렬로 수행한다.
+    """
+
+    def __init__(
+        self,
+        adapter,
+        engine,
+        ticker: str,
+        wait_for_fill: Optional[Callable[[str, int], Tuple[float, int]]] = None,
+        on_filled: Optional[Callable[[OrderOutcome], None]] = None,
+        on_failed: Optional[Callable[[OrderOutcome], None]] = None,
+        max_workers: int = 4,
+        store=None
+    ):
+        """
+        Args:
+            adapter: KisRestAdapter (send_order 호환 메서드 사용)
+            engine: GridEngineV4
+            ticker: 주문 종목
+            wait_for_fill: 체결 대기 함수 (주문번호, 수량) → (체결가, 체결 수량).
+                None이면 주문 접수 = 체결로 간주 (체결 확인 비활성화)
+            on_filled: 체결 반영 후 호출 (텔레그램 알림, 통계 등)
+            on_failed: 주문 실패/미체결 처리 후 호출
+            max_workers: 동시 체결 확인 스레드 수
+            store: [v4.3] StateStore (주문/체결 기록, None이면 기록 안 함)
+        """
+        self.adapter = adapter
+        self.engine = engine
+        self.ticker = ticker
+        self.wait_for_fill = wait_for_fill
+        self.on_filled = on_filled
+        self.on_failed = on_failed
+        self.store = store
+
+        self._pending: Dict[str, PendingOrder] = {}
+        self._lock = threading.Lock()
+        self._reservation_seq = itertools.count(1)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="OrderFill")
+
+        # 통계
+        self.submitted_count = 0
+        self.filled_count = 0
+        self.failed_count = 0
+
+    # ============================================
+    # 조회
+    # ============================================
+
+    @property
+    def pending_count(self) -> int:
+        """체결 확인 대기 중인 주문 수"""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def reserved_buy_amount(self) -> float:
+        """체결 확인 대기 중인 매수 주문 금액 합계 (엔진 잔고에 아직 반영되지 않은 금액)"""
+        with self._lock:
+            return sum(
+                order.signal.quantity * order.signal.price
+                for order in self._pending.values()
+                if order.signal.action == "BUY"
+            )
+
+    def pending_orders(self) -> List[PendingOrder]:
+        """체결 확인 대기 중인 주문 목록 (접수 순)"""
+        with self._lock:
+            return sorted(self._pending.values(), key=lambda order: order.submitted_at)
+
+    # ============================================
+    # 주문
+    # ============================================
+
+    def submit(self, signal: TradeSignal) -> Optional[str]:
+        """
+        Tier 예약 → 주문 전송 → 체결 확인 예약
+
+        Args:
+            signal: 엔진이 생성한 매수/매도 신호 (Tier는 LOCKED / 매도 예약 SELLING)
+
+        Returns:
+            str: 주문번호 (예약 실패/주문 실패 시 None)
+        """
+        reservation_id = f"{RESERVATION_PREFIX}{next(self._reservation_seq)}"
+        if not self.engine.reserve_signal(signal, reservation_id):
+            # 이미 다른 주문이 진행 중인 Tier → 브로커로 보내지 않음
+            logger.error(f"[REJECT] {signal.action} 신호 거부: Tiers {signal.tiers} Tier 예약 실패")
+            self.engine.cancel_signal(signal)
+            return None
+
+        try:
+            result = self.adapter.send_order(
+                side=signal.action,
+                ticker=self.ticker,
+                quantity=signal.quantity,
+                price=signal.price  # 지정가 (현재가)
+            )
+        except Exception:
+            self.engine.release_signal(signal, reservation_id)
+            raise
+
+        if result["status"] != "SUCCESS":
+            message = result.get("message", "주문 실패")
+            logger.error(f"[FAIL] {signal.action} 주문 실패: Tiers {signal.tiers} - {message}")
+            # 예약 해제 (매수 EMPTY / 매도 FILLED로 복원)
+            self._fail(PendingOrder(order_id="", signal=signal, order_result=result, reservation_id=reservation_id), message)
+            return None
+
+        order_id = result["order_id"]
+        pending = PendingOrder(order_id=order_id, signal=signal, order_result=result, reservation_id=reservation_id)
+        self._store("record_order", order_id, signal.action, signal.tiers, signal.quantity, signal.price)
+
+        if not self.engine.submit_order(signal, order_id, reservation_id):
+            # 브로커 접수 후 Tier 상태 불일치 → 추적하지 않고 Tier를 ERROR로 (수동 확인 필요)
+            message = f"주문 접수 후 Tier 상태 전이 실패 (주문번호 {order_id}, 수동 확인 필요)"
+            logger.critical(f"[FLAG] {signal.action} Tiers {signal.tiers}: {message}")
+            self.engine.release_signal(signal, reservation_id, error_message=message)
+            self._store("record_order_failed", order_id, message)
+            with self._lock:
+                self.failed_count += 1
+            self._notify(self.on_failed, OrderOutcome(order_id, signal, 0, 0.0, error_message=message))
+            return None
+
+        with self._lock:
+            self._pending[order_id] = pending
+            self.submitted_count += 1
+        logger.info(f"[ORDER] 주문 접수 완료: {signal.action} Tiers {signal.tiers}, 주문번호 {order_id}")
+
+        if self.wait_for_fill is None:
+            # 체결 확인 비활성화 (기존 동작: 즉시 처리, 위험)
+            logger.warning("[WARN] 체결 확인이 비활성화되어 있습니다. 주문 접수 = 체결로 간주합니다.")
+            self._resolve(
+                pending,
+                result.get("filled_price") or signal.price,
+                result.get("filled_qty") or signal.quantity
+            )
+        else:
+            self._executor.submit(self._track, pending)
+
+        return order_id
+
+    def resume(self, signal: TradeSignal, order_id: str):
+        """
+        [v4.3] 재시작 전에 접수된 주문의 체결 확인 재개 (Tier는 engine.restore_order로 복원된 상태)
+
+        Args:
+            signal: 복구한 주문 신호
+            order_id: 브로커 주문번호
+        """
+        pending = PendingOrder(order_id=order_id, signal=signal, order_result={})
+        with self._lock:
+            self._pending[order_id] = pending
+            self.submitted_count += 1
+        logger.info(f"[ORDER] 체결 확인 재개: {signal.action} Tiers {signal.tiers}, 주문번호 {order_id}")
+
+        if self.wait_for_fill is None:
+            self._resolve(pending, signal.price, signal.quantity)
+        else:
+            self._executor.submit(self._track, pending)
+
+    def _track(self, pending: PendingOrder):
+        """체결 확인 (작업 스레드)"""
+        try:
+            filled_price, filled_qty = self.wait_for_fill(pending.order_id, pending.signal.quantity)
+
+            # [FIX] 체결 확인 타임아웃 시 주문 응답의 체결 정보를 fallback으로 사용
+            if filled_qty == 0 and pending.order_result.get("filled_qty", 0) > 0:
+                filled_qty = pending.order_result["filled_qty"]
+                filled_price = pending.order_result.get("filled_price", 0)
+                logger.warning(
+                    f"[FALLBACK] 체결확인 타임아웃, 주문응답 체결정보 사용: "
+                    f"{filled_qty}주 @ ${filled_price:.2f}"
+                )
+
+            if filled_qty > 0:
+                self._resolve(pending, filled_price, filled_qty)
+            else:
+                self._fail(pending, f"체결 수량 0 (주문번호 {pending.order_id})")
+
+        except Exception as e:
+            logger.error(f"체결 확인 에러: 주문번호 {pending.order_id} - {e}", exc_info=True)
+            self._fail(pending, f"체결 확인 에러: {e}")
+
+    def _resolve(self, pending: PendingOrder, filled_price: float, filled_qty: int):
+        """체결 반영 → GridEngine 상태 업데이트"""
+        signal = pending.signal
+        profit = self.engine.estimate_sell_profit(signal, filled_price) if signal.action == "SELL" else 0.0
+
+        self.engine.confirm_order(
+            signal=signal,
+            order_id=pending.order_id,
+            filled_qty=filled_qty,
+            filled_price=filled_price,
+            success=True
+        )
+        self._finish(pending)
+        self._store("record_fill", pending.order_id, signal.action, filled_qty, filled_price)
+        with self._lock:
+            self.filled_count += 1
+
+        logger.info(
+            f"[OK] {signal.action} 체결: Tiers {signal.tiers} - "
+            f"체결 {filled_qty}주 @ ${filled_price:.2f} (주문번호: {pending.order_id})"
+        )
+        self._notify(self.on_filled, OrderOutcome(pending.order_id, signal, filled_qty, filled_price, profit))
+
+    def _fail(self, pending: PendingOrder, error_message: str):
+        """주문 실패/미체결 → GridEngine 상태 복구"""
+        if not pending.order_id:
+            # 브로커 접수 전 실패 → Tier 예약만 해제
+            self.engine.release_signal(pending.signal, pending.reservation_id)
+        else:
+            self.engine.confirm_order(
+                signal=pending.signal,
+                order_id=pending.order_id,
+                filled_qty=0,
+                filled_price=0,
+                success=False,
+                error_message=error_message
+            )
+        self._finish(pending)
+        if pending.order_id:
+            self._store("record_order_failed", pending.order_id, error_message)
+        with self._lock:
+            self.failed_count += 1
+        self._notify(self.on_failed, OrderOutcome(pending.order_id, pending.signal, 0, 0.0, error_message=error_message))
+
+    def _finish(self, pending: PendingOrder):
+        with self._lock:
+            self._pending.pop(pending.order_id, None)
+
+    def _store(self, method: str, *args):
+        """[v4.3] 저장소 기록 (저장소 없으면 생략, 실패해도 주문 처리는 계속)"""
+        if self.store is None:
+            return
+        try:
+            getattr(self.store, method)(*args)
+        except Exception as e:
+            logger.error(f"주문 기록 저장 실패: {e}", exc_info=True)
+
+    @staticmethod
+    def _notify(callback: Optional[Callable[[OrderOutcome], None]], outcome: OrderOutcome):
+        if callback is None:
+            return
+        try:
+            callback(outcome)
+        except Exception as e:
+            logger.error(f"주문 결과 콜백 실행 실패: {e}", exc_info=True)
+
+    def shutdown(self, wait: bool = True):
+        """
+        체결 확인 스레드 종료
+
+        Args:
+            wait: 진행 중인 체결 확인이 끝날 때까지 대기
+        """
+        pending = self.pending_count
+        if pending:
+            logger.info(f"[ORDER] 체결 확인 대기 중인 주문 {pending}건 {'완료 대기' if wait else '중단'}")
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,156 @@
+"""
+Phoenix Trading System v4.3 - 포지션 리스트 (집계/Tier 인덱스 증분 관리)
+
+GridEngine(v3)의 positions 리스트를 대체한다.
+list 인터페이스를 그대로 유지하면서 추가/삭제 시점에
+보유 수량·투자금 합계와 Tier 인덱스(dict + 비트마스크)를 갱신하여
+집계 조회와 Tier 보유 여부/포지션 조회를 O(1)로 만든다.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from .models import Position
+
+
+class PositionBook(list):
+    """
+    [v4.3] 보유 수량/투자금 합계와 Tier 인덱스를 증분 유지하는 Position 리스트
+
+    list의 변경 메서드를 모두 가로채어 집계와 인덱스를 갱신한다.
+    (정렬/뒤집기는 합계에 영향이 없으므로 그대로 사용)
+    같은 Tier 포지션이 여러 개면 리스트에서 먼저 나온 것을 대표로 조회한다.
+    """
+
+    def __init__(self, positions: Iterable[Position] = ()):
+        super().__init__(positions)
+        self._recount()
+
+    # ============================================
+    # 집계 조회
+    # ============================================
+
+    @property
+    def total_quantity(self) -> int:
+        """보유 수량 합계"""
+        return self._total_quantity
+
+    @property
+    def total_invested(self) -> float:
+        """투자금 합계"""
+        return self._total_invested
+
+    # ============================================
+    # Tier 인덱스 조회
+    # ============================================
+
+    def holds(self, tier: int) -> bool:
+        """해당 Tier 보유 여부 (O(1))"""
+        return tier >= 0 and bool(self._held_mask >> tier & 1)
+
+    def get_tier(self, tier: int) -> Optional[Position]:
+        """해당 Tier 포지션 (없으면 None, O(1))"""
+        positions = self._by_tier.get(tier)
+        return positions[0] if positions else None
+
+    @property
+    def held_mask(self) -> int:
+        """보유 Tier 비트마스크 (bit i = Tier i 보유)"""
+        return self._held_mask
+
+    @property
+    def max_tier(self) -> int:
+        """보유 중인 최고 Tier (없으면 0)"""
+        return max(self._held_mask.bit_length() - 1, 0)
+
+    # ============================================
+    # 내부 집계 갱신
+    # ============================================
+
+    def _recount(self):
+        """전체 재집계 + 인덱스 재구성"""
+        self._total_quantity = sum(pos.quantity for pos in self)
+        self._total_invested = sum(pos.invested_amount for pos in self)
+        self._by_tier: Dict[int, List[Position]] = {}
+        self._held_mask = 0
+        for pos in self:
+            self._index_add(pos)
+
+    def _index_add(self, pos: Position):
+        self._by_tier.setdefault(pos.tier, []).append(pos)
+        self._held_mask |= 1 << pos.tier
+
+    def _index_sub(self, pos: Position):
+        positions = self._by_tier[pos.tier]
+        positions.remove(pos)
+        if not positions:
+            del self._by_tier[pos.tier]
+            self._held_mask &= ~(1 << pos.tier)
+
+    def _add(self, pos: Position):
+        self._total_quantity += pos.quantity
+        self._total_invested += pos.invested_amount
+        self._index_add(pos)
+
+    def _sub(self, pos: Position):
+        self._total_quantity -= pos.quantity
+        self._total_invested -= pos.invested_amount
+        self._index_sub(pos)
+        # 부동소수점 누적 오차 제거
+        if not self:
+            self._total_quantity = 0
+            self._total_invested = 0.0
+
+    # ============================================
+    # list 변경 메서드
+    # ============================================
+
+    def append(self, pos: Position):
+        super().append(pos)
+        self._add(pos)
+
+    def insert(self, index, pos: Position):
+        super().insert(index, pos)
+        self._recount()  # 같은 Tier 대표 순서 유지
+
+    def extend(self, positions: Iterable[Position]):
+        positions = list(positions)
+        super().extend(positions)
+        for pos in positions:
+            self._add(pos)
+
+    def __iadd__(self, positions: Iterable[Position]):
+        self.extend(positions)
+        return self
+
+    def remove(self, pos: Position):
+        super().remove(pos)
+        self._sub(pos)
+
+    def pop(self, index=-1) -> Position:
+        pos = super().pop(index)
+        self._sub(pos)
+        return pos
+
+    def clear(self):
+        super().clear()
+        self._recount()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            self._recount()
+            return
+        old = self[index]
+        super().__setitem__(index, value)
+        if old.tier == value.tier:
+            # 같은 Tier 내 순서 유지 (부분 매도 후 교체 등)
+            self._total_quantity += value.quantity - old.quantity
+            self._total_invested += value.invested_amount - old.invested_amount
+            positions = self._by_tier[old.tier]
+            positions[positions.index(old)] = value
+        else:
+            self._sub(old)
+            self._add(value)
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._recount()
@@ -0,0 +1,158 @@
+"""
+Phoenix Trading System v4.3 - 실시간 시세 Mailbox
+
+WebSocket 수신 스레드와 거래 루프 사이에서 최신 시세만 보관한다.
+거래 루프가 느려도 큐가 쌓이지 않으며, 그 사이 고가/저가를 함께 보관해
+트리거 가격을 스쳐 지나간 틱도 놓치지 않는다.
+
+사용 예:
+    mailbox = TickMailbox()
+    adapter.subscribe_real_price("SOXL", mailbox.post)
+
+    while running:
+        batch = mailbox.take(timeout=1.0)
+        if batch:
+            signals = engine.process_tick_batch(batch)
+"""
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TickBatch:
+    """수신 구간 동안 병합된 시세 (불변)"""
+    last: float          # 마지막 가격
+    high: float          # 구간 최고가
+    low: float           # 구간 최저가
+    count: int           # 병합된 틱 수
+    high_first: bool     # 최고가가 최저가보다 먼저 발생했는지
+    first_at: float      # 첫 틱 수신 시각 (time.monotonic)
+    last_at: float       # 마지막 틱 수신 시각 (time.monotonic)
+
+    def prices(self) -> List[float]:
+        """
+        처리 순서대로 정리한 가격 목록 (먼저 발생한 극값 → 나중 극값 → 마지막 가격)
+
+        연속 중복 가격은 한 번만 포함한다.
+        """
+        ordered = [self.high, self.low] if self.high_first else [self.low, self.high]
+        ordered.append(self.last)
+
+        result: List[float] = []
+        for price in ordered:
+            if not result or result[-1] != price:
+                result.append(price)
+        return result
+
+
+class TickMailbox:
+    """
+    최신값 보관형 시세 Mailbox (스레드 안전)
+
+    post()는 대기 없이 현재 구간에 가격을 병합하고,
+    take()는 병합된 구간을 꺼내고 새 구간을 시작한다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._closed = False
+        self._reset()
+
+        # 통계
+        self.posted_count = 0     # 수신한 전체 틱 수
+        self.batch_count = 0      # 꺼내간 구간 수
+
+    def _reset(self):
+        """현재 구간 초기화 (Lock 보유 상태에서 호출)"""
+        self._last: Optional[float] = None
+        self._high = 0.0
+        self._low = 0.0
+        self._count = 0
+        self._high_seq = 0
+        self._low_seq = 0
+        self._first_at = 0.0
+        self._last_at = 0.0
+
+    def post(self, price: float):
+        """
+        시세 수신 (WebSocket 콜백으로 사용)
+
+        Args:
+            price: 현재가 (0 이하는 무시)
+        """
+        if price is None or price <= 0:
+            logger.debug(f"유효하지 않은 시세 무시: {price}")
+            return
+
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                return
+
+            self._count += 1
+            if self._last is None:
+                self._high = self._low = price
+                self._high_seq = self._low_seq = self._count
+                self._first_at = now
+            else:
+                if price > self._high:
+                    self._high = price
+                    self._high_seq = self._count
+                if price < self._low:
+                    self._low = price
+                    self._low_seq = self._count
+
+            self._last = price
+            self._last_at = now
+            self.posted_count += 1
+            self._cond.notify()
+
+    def take(self, timeout: Optional[float] = None) -> Optional[TickBatch]:
+        """
+        병합된 시세 구간 꺼내기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무한 대기, 0이면 즉시 반환)
+
+        Returns:
+            TickBatch 또는 None (시간 초과/닫힘)
+        """
+        with self._cond:
+            if self._last is None and not self._closed:
+                self._cond.wait_for(lambda: self._last is not None or self._closed, timeout)
+
+            if self._last is None:
+                return None
+
+            batch = TickBatch(
+                last=self._last,
+                high=self._high,
+                low=self._low,
+                count=self._count,
+                high_first=self._high_seq <= self._low_seq,
+                first_at=self._first_at,
+                last_at=self._last_at,
+            )
+            self._reset()
+            self.batch_count += 1
+            return batch
+
+    def poll(self) -> Optional[TickBatch]:
+        """대기 없이 꺼내기 (없으면 None)"""
+        return self.take(timeout=0)
+
+    def close(self):
+        """Mailbox 닫기 (대기 중인 take() 깨움, 이후 post() 무시)"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
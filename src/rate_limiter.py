@@ -0,0 +1,173 @@
+"""
+Phoenix Trading System v4.3 - KIS API 요청 속도 제한기
+
+Token Bucket 방식으로 초당 요청 수를 제한한다.
+메인 루프, WebSocket 스레드, 잔고 동기화, 체결 확인이 동시에 호출해도
+토큰은 Lock 안에서만 차감되므로 KIS 초당 한도를 넘지 않는다.
+
+우선순위 (숫자가 작을수록 먼저):
+    ORDER (주문) → FILL (체결 확인) → QUOTE (시세) → BALANCE (잔고)
+
+대기 중인 상위 우선순위 요청이 있으면 하위 요청은 토큰을 가져가지 않는다.
+따라서 주문은 정기 잔고 조회 뒤에 줄 서지 않는다.
+
+사용 예:
+    limiter = TokenBucketRateLimiter(rate=5, burst=1)
+    limiter.acquire(RequestPriority.ORDER)                 # 스레드
+    await limiter.acquire_async(RequestPriority.QUOTE)     # asyncio
+"""
+import asyncio
+import threading
+import time
+import logging
+from enum import IntEnum
+from typing import Dict
+
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """KIS API 요청 우선순위 (작을수록 우선)"""
+    ORDER = 0     # 매수/매도 주문 (+ Hashkey)
+    FILL = 1      # 체결 확인
+    QUOTE = 2     # 시세 조회
+    BALANCE = 3   # 잔고/예수금 조회
+
+
+class TokenBucketRateLimiter:
+    """
+    우선순위 Token Bucket (스레드/asyncio 공용)
+
+    토큰은 초당 rate개씩 채워지고 최대 burst개까지 쌓인다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 토큰 충전 수 (KIS 초당 요청 한도)
+            burst: 최대 토큰 수 (순간 연속 요청 허용 수, 1이면 균등 간격)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        if burst < 1:
+            raise ValueError(f"burst는 1 이상이어야 합니다: {burst}")
+
+        self.rate = float(rate)
+        self.burst = int(burst)
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._waiting: Dict[RequestPriority, int] = {p: 0 for p in RequestPriority}
+
+        # 통계
+        self.acquired_count: Dict[RequestPriority, int] = {p: 0 for p in RequestPriority}
+        self.wait_seconds: Dict[RequestPriority, float] = {p: 0.0 for p in RequestPriority}
+
+    # ============================================
+    # 내부 (Lock 보유 상태에서 호출)
+    # ============================================
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _try_take(self, priority: RequestPriority) -> float:
+        """
+        토큰 차감 시도
+
+        Returns:
+            0.0이면 성공, 아니면 다시 시도할 때까지의 대기 시간 (초)
+        """
+        now = time.monotonic()
+        self._refill(now)
+
+        shortage = max(1.0 - self._tokens, 0.0) / self.rate
+        if any(self._waiting[p] for p in RequestPriority if p < priority):
+            # 상위 우선순위 대기 중 - 그 요청이 토큰을 가져간 뒤 다시 확인
+            return max(shortage, 1.0 / self.rate)
+        if shortage > 0:
+            return shortage
+
+        self._tokens -= 1.0
+        self.acquired_count[priority] += 1
+        return 0.0
+
+    def _enter(self, priority: RequestPriority) -> float:
+        """첫 시도, 실패하면 대기열 등록"""
+        with self._lock:
+            wait = self._try_take(priority)
+            if wait:
+                self._waiting[priority] += 1
+            return wait
+
+    def _retry(self, priority: RequestPriority, started: float) -> float:
+        """대기 후 재시도, 성공하면 대기열 해제"""
+        with self._lock:
+            wait = self._try_take(priority)
+            if not wait:
+                self._waiting[priority] -= 1
+                self.wait_seconds[priority] += time.monotonic() - started
+            return wait
+
+    def _cancel(self, priority: RequestPriority):
+        """대기 중 취소 (asyncio CancelledError 등)"""
+        with self._lock:
+            self._waiting[priority] -= 1
+
+    # ============================================
+    # 공개 API
+    # ============================================
+
+    def acquire(self, priority: RequestPriority = RequestPriority.QUOTE):
+        """
+        토큰 1개 획득 (스레드용, 필요하면 대기)
+
+        Args:
+            priority: 요청 우선순위
+        """
+        started = time.monotonic()
+        wait = self._enter(priority)
+        if not wait:
+            return
+
+        try:
+            while wait:
+                time.sleep(wait)
+                wait = self._retry(priority, started)
+        except BaseException:
+            self._cancel(priority)
+            raise
+
+    async def acquire_async(self, priority: RequestPriority = RequestPriority.QUOTE):
+        """
+        토큰 1개 획득 (asyncio용, 이벤트 루프를 막지 않음)
+
+        Args:
+            priority: 요청 우선순위
+        """
+        started = time.monotonic()
+        wait = self._enter(priority)
+        if not wait:
+            return
+
+        try:
+            while wait:
+                await asyncio.sleep(wait)
+                wait = self._retry(priority, started)
+        except BaseException:
+            self._cancel(priority)
+            raise
+
+    def try_acquire(self, priority: RequestPriority = RequestPriority.QUOTE) -> bool:
+        """대기 없이 토큰 획득 시도 (성공 여부 반환)"""
+        with self._lock:
+            return self._try_take(priority) == 0.0
+
+    @property
+    def available_tokens(self) -> float:
+        """현재 남은 토큰 수"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
@@ -0,0 +1,255 @@
+"""
+Phoenix Trading System v4.3 - 재시작 상태 복구
+
+재시작하면 GridEngineV4는 모든 Tier가 EMPTY인 상태로 만들어지고 Tier 1 기준가도 현재가로 바뀌어,
+보유 포지션 / 진행 중 주문 / High Water Mark를 손으로 다시 입력해야 했다.
+Tier 상태의 영속 기록은 StateStore(SQLite WAL)의 tiers 테이블 하나뿐이며,
+시작 시 이 테이블과 meta(Tier 1 기준가)에서 마지막 상태를 읽어 엔진에 복원한다.
+
+- 복구 대상: 보유(FILLED/PARTIAL_FILLED) + 주문 진행 중(ORDERING 매수 / SELLING 매도) Tier
+- EMPTY/SOLD/ERROR/LOCKED Tier는 재시작 시 EMPTY로 시작
+
+복구 후에는 reconcile()로 저장된 주문번호의 당일 체결내역(1회 조회)을 확인해 주문별로
+복원(체결/미체결 종료) 또는 재추적(브로커에서 아직 진행 중)을 결정하고,
+체결내역으로 확인할 수 없는 주문만 브로커 보유 수량과 대조해 추정한다.
+
+사용 예:
+    recovered = load_recovered_state(store)              # 저장소 기록 시작 전 1회
+    plan = reconcile(recovered, broker_qty, adapter.fetch_fill_statuses())
+    engine.restore_positions(recovered.meta.get("tier1_price", current_price), plan.positions)
+    for order in plan.live_orders:
+        engine.restore_order(order.signal, order.order_id)
+        order_manager.resume(order.signal, order.order_id)
+"""
+import time
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from tier_state_machine import TierState
+
+from .fill_status_poller import normalize_order_no
+from .models import Position, TradeSignal
+from .order_manager import RESERVATION_PREFIX
+
+
+logger = logging.getLogger(__name__)
+
+
+# 복구 대상 상태 (나머지는 재시작 시 EMPTY로 시작)
+HELD_STATES = (                                     # 보유 수량이 있는 상태 (SELLING: 매도 체결 전)
+    TierState.FILLED.name, TierState.PARTIAL_FILLED.name, TierState.SELLING.name
+)
+RECOVERED_STATES = HELD_STATES + (TierState.ORDERING.name,)
+
+RECOVERY_REASON = "재시작 복구"
+
+# 복구에 사용하는 meta 키
+META_KEYS = ("tier1_price",)
+
+
+@dataclass
+class RecoveredState:
+    """저장소 복구 결과"""
+    tiers: Dict[int, Dict[str, Any]] = field(default_factory=dict)   # tier_id → tiers 테이블 행
+    meta: Dict[str, Any] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    def by_state(self, states: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """상태별 Tier 레코드 (Tier 번호 오름차순)"""
+        return [self.tiers[t] for t in sorted(self.tiers) if self.tiers[t]["state"] in states]
+
+    @property
+    def held_quantity(self) -> int:
+        """기록 기준 보유 수량 (FILLED + PARTIAL_FILLED + SELLING)"""
+        return sum(record["quantity"] for record in self.by_state(HELD_STATES))
+
+
+def load_recovered_state(store) -> RecoveredState:
+    """
+    StateStore에서 복구 대상 Tier + meta 조회
+
+    주문번호가 있는 Tier에는 orders 테이블의 주문가를 order_price로 붙인다 (재추적/체결가 추정용).
+
+    Args:
+        store: StateStore
+
+    Returns:
+        RecoveredState: 마지막 상태 (기록이 없으면 빈 상태)
+    """
+    started = time.perf_counter()
+    state = RecoveredState()
+
+    for record in store.load_tiers():
+        if record["state"] not in RECOVERED_STATES:
+            continue
+        order = store.get_order(record["order_id"]) if record["order_id"] else None
+        record["order_price"] = order["price"] if order else 0.0
+        state.tiers[record["tier_id"]] = record
+
+    for key in META_KEYS:
+        value = store.get_meta(key)
+        if value is not None:
+            state.meta[key] = value
+
+    state.elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"상태 저장소 복구: Tier {len(state.tiers)}개 ({state.elapsed_ms:.1f}ms)")
+    return state
+
+
+@dataclass(frozen=True)
+class LiveOrder:
+    """재시작 시점에 브로커에서 아직 진행 중인 주문 (엔진에 다시 걸고 체결 추적)"""
+    order_id: str
+    signal: TradeSignal
+
+
+@dataclass
+class RecoveryPlan:
+    """reconcile() 결과"""
+    positions: List[Position] = field(default_factory=list)     # FILLED로 복원 (진행 중 매도 주문 Tier 포함)
+    live_orders: List[LiveOrder] = field(default_factory=list)  # 재추적할 주문
+    unmatched: int = 0           # 대조 후 남은 수량 차이 (브로커 - 복원, 수동 확인 필요)
+    resolved: int = 0            # 체결내역으로 확인한 주문 수
+
+
+def _is_open(status: dict, filled: int, ordered: int) -> bool:
+    """체결내역 기준 주문이 아직 진행 중인지 (미체결 잔량이 남아 있고 거부되지 않음)"""
+    return status["status"] != "거부" and filled < ordered and status["unfilled_qty"] > 0
+
+
+def _order_signal(action: str, records: List[Dict[str, Any]], quantity: int) -> TradeSignal:
+    """저장된 Tier 레코드 → 재추적용 신호"""
+    tiers = tuple(record["tier_id"] for record in records)
+    return TradeSignal(
+        action=action,
+        tier=tiers[0],
+        tiers=tiers,
+        price=records[0].get("order_price", 0.0),
+        quantity=quantity,
+        reason=RECOVERY_REASON
+    )
+
+
+def reconcile(
+    recovered: RecoveredState,
+    broker_qty: Optional[int],
+    statuses: Optional[Dict[str, dict]] = None
+) -> RecoveryPlan:
+    """
+    저장된 주문을 체결내역으로 확인하고 브로커 보유 수량과 한 번 대조해 복구 계획 결정
+
+    주문별 처리 (체결내역에 주문번호가 있는 경우):
+    - 매수: 진행 중이면 재추적, 종료됐으면 체결 수량만큼 FILLED로 복원 (체결 0이면 EMPTY)
+    - 매도: 진행 중이면 보유 유지 + 재추적, 종료됐으면 체결 수량만큼 높은 Tier부터 매도 처리
+    - 예약 번호만 있는 주문(브로커 접수 전 중단)은 전송되지 않은 것으로 본다
+
+    보유(FILLED) / 부분 체결(PARTIAL_FILLED, 체결 수량) Tier는 그대로 복원하고,
+    체결내역으로 확인하지 못한 주문만 브로커 보유 수량과의 차이로 추정한다:
+    - 브로커 수량이 더 많으면: 해당 매수 Tier를 낮은 Tier부터 주문 수량만큼 체결로 간주 (주문가 기준)
+    - 브로커 수량이 더 적으면: 해당 매도 Tier를 높은 Tier부터 매도 체결로 간주
+
+    Args:
+        recovered: load_recovered_state() 결과
+        broker_qty: 브로커 보유 수량 (조회 실패 시 None → 추정 없이 보유 Tier 유지)
+        statuses: 당일 체결내역 {정규화 주문번호: 체결 상태} (조회 실패 시 None)
+
+    Returns:
+        RecoveryPlan: 복원할 포지션 / 재추적할 주문 / 남은 수량 차이
+    """
+    plan = RecoveryPlan()
+    held: Dict[int, Dict[str, Any]] = {}     # tier_id → 복원할 보유 레코드
+    unknown_buys: List[Dict[str, Any]] = []
+    unknown_sells: List[Dict[str, Any]] = []
+    live_filled = 0                          # 진행 중 매수 주문의 체결분 (브로커 보유에는 포함)
+
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for record in recovered.by_state(RECOVERED_STATES):
+        state, order_id = record["state"], record["order_id"]
+        if state == TierState.FILLED.name or state == TierState.PARTIAL_FILLED.name:
+            held[record["tier_id"]] = record
+        elif state == TierState.SELLING.name and (not order_id or order_id.startswith(RESERVATION_PREFIX)):
+            held[record["tier_id"]] = record             # 매도 주문 전송 전 중단
+        elif state == TierState.ORDERING.name and order_id.startswith(RESERVATION_PREFIX):
+            continue                                     # 매수 주문 전송 전 중단
+        else:
+            groups.setdefault(order_id, []).append(record)
+
+    for order_id, records in groups.items():
+        status = statuses.get(normalize_order_no(order_id)) if statuses is not None else None
+        is_buy = records[0]["state"] == TierState.ORDERING.name
+
+        if status is None or status["status"] == "오류":
+            if is_buy:
+                unknown_buys.extend(records)
+            else:
+                unknown_sells.extend(records)
+                held.update((record["tier_id"], record) for record in records)
+            continue
+
+        plan.resolved += 1
+        filled = status["filled_qty"]
+
+        if is_buy:
+            ordered = sum(record["ordered_qty"] for record in records)
+            if _is_open(status, filled, ordered):
+                plan.live_orders.append(LiveOrder(order_id, _order_signal("BUY", records, ordered)))
+                live_filled += filled
+                continue
+            # 종료된 주문: 체결 수량을 낮은 Tier부터 주문 수량만큼 배분
+            price = status["filled_price"] or records[0].get("order_price", 0.0)
+            for record in records:
+                qty = min(record["ordered_qty"], filled)
+                if qty > 0:
+                    held[record["tier_id"]] = dict(record, quantity=qty, avg_price=price, invested_amount=qty * price)
+                    filled -= qty
+        else:
+            held.update((record["tier_id"], record) for record in records)
+            total = sum(record["quantity"] for record in records)
+            if _is_open(status, filled, total):
+                plan.live_orders.append(LiveOrder(order_id, _order_signal("SELL", records, total)))
+                continue
+            # 종료된 주문: 체결 수량만큼 높은 Tier부터 매도 처리
+            for record in reversed(records):
+                sold = min(record["quantity"], filled)
+                filled -= sold
+                if sold == record["quantity"]:
+                    del held[record["tier_id"]]
+                elif sold > 0:
+                    remaining = record["quantity"] - sold
+                    held[record["tier_id"]] = dict(
+                        record, quantity=remaining, invested_amount=remaining * record["avg_price"]
+                    )
+
+    if broker_qty is not None:
+        diff = broker_qty - sum(record["quantity"] for record in held.values()) - live_filled
+
+        if diff > 0:
+            for record in sorted(unknown_buys, key=lambda r: r["tier_id"]):
+                qty = record["ordered_qty"]
+                if 0 < qty <= diff:
+                    price = record["avg_price"] or record.get("order_price", 0.0)
+                    held[record["tier_id"]] = dict(
+                        record, quantity=qty, avg_price=price, invested_amount=qty * price
+                    )
+                    diff -= qty
+        elif diff < 0:
+            for record in sorted(unknown_sells, key=lambda r: r["tier_id"], reverse=True):
+                if record["quantity"] <= -diff:
+                    del held[record["tier_id"]]
+                    diff += record["quantity"]
+        plan.unmatched = diff
+
+    plan.positions = [
+        Position(
+            tier=record["tier_id"],
+            quantity=record["quantity"],
+            avg_price=record["avg_price"],
+            invested_amount=record["invested_amount"],
+            opened_at=datetime.fromisoformat(record["opened_at"]) if record["opened_at"] else datetime.now()
+        )
+        for _, record in sorted(held.items())
+        if record["quantity"] > 0
+    ]
+    return plan
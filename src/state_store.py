@@ -0,0 +1,269 @@
+"""
+Phoenix Trading System v4.3 - SQLite 상태 저장소 (WAL)
+
+Tier 상태/포지션, 주문, 체결을 내장 SQLite(WAL 모드)에 이벤트마다 작은 트랜잭션으로 기록한다.
+Excel은 사용자가 파일을 열어 두면 저장이 막히고 저장할 때마다 통합 문서 전체를 다시 쓰지만,
+SQLite 기록은 파일 잠금과 무관하고 한 건당 한 행만 쓴다. Excel은 주기적인 보기(내보내기) 용도로 남는다.
+
+- tiers: Tier별 최신 상태 (TierStateMachine 리스너로 변경 시마다 upsert)
+- orders / fills: 주문 접수·결과, 체결 내역 (OrderManager에서 기록)
+- meta: Tier 1 기준가, 잔고 등 단일 값
+
+운용 히스토리는 여기에 두지 않는다 (기록 원본은 HistoryLog JSONL, 내보내기는 export_history.py).
+
+여러 스레드(거래 루프, 체결 확인, 저장)에서 연결 하나를 Lock으로 공유한다.
+
+사용 예:
+    store = StateStore(config.STATE_DB_PATH)
+    engine.state_machine.add_listener(store.save_tier)
+    store.record_order("0030123456", "BUY", (3, 4), 20, 25.5)
+    store.load_tiers()          # 보고/복구용 조회
+"""
+import json
+import sqlite3
+import threading
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from tier_state_machine import TierInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tiers (
+    tier_id INTEGER PRIMARY KEY,
+    state TEXT NOT NULL,                -- TierState 이름 (EMPTY, FILLED, ...)
+    order_id TEXT,
+    ordered_qty INTEGER NOT NULL DEFAULT 0,
+    filled_qty INTEGER NOT NULL DEFAULT 0,
+    filled_price REAL NOT NULL DEFAULT 0,
+    quantity INTEGER NOT NULL DEFAULT 0,
+    avg_price REAL NOT NULL DEFAULT 0,
+    invested_amount REAL NOT NULL DEFAULT 0,
+    opened_at TEXT,
+    error_message TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS orders (
+    order_id TEXT PRIMARY KEY,
+    side TEXT NOT NULL,
+    tiers TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    price REAL NOT NULL,
+    status TEXT NOT NULL,
+    filled_qty INTEGER NOT NULL DEFAULT 0,
+    filled_price REAL NOT NULL DEFAULT 0,
+    error_message TEXT NOT NULL DEFAULT '',
+    submitted_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id TEXT NOT NULL,
+    side TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    price REAL NOT NULL,
+    filled_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fills_order ON fills(order_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+# 주문 상태
+ORDER_SUBMITTED = "SUBMITTED"
+ORDER_FILLED = "FILLED"
+ORDER_FAILED = "FAILED"
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class StateStore:
+    """
+    SQLite 상태 저장소 (스레드 안전)
+
+    쓰기 메서드는 각각 하나의 트랜잭션으로 커밋한다 (synchronous=NORMAL: WAL에서 커밋당 fsync 없음).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: DB 파일 경로 (폴더가 없으면 생성, ":memory:" 가능)
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self.journal_mode = self._conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        # 통계
+        self.write_count = 0
+
+        logger.info(f"상태 저장소 연결: {self.path} (journal={self.journal_mode})")
+
+    def _write(self, sql: str, params: Sequence = ()):
+        """단일 문장 트랜잭션"""
+        with self._lock, self._conn:
+            self._conn.execute(sql, params)
+            self.write_count += 1
+
+    def _write_many(self, sql: str, rows: Iterable[Sequence]):
+        """여러 행 단일 트랜잭션"""
+        with self._lock, self._conn:
+            self._conn.executemany(sql, rows)
+            self.write_count += 1
+
+    def _query(self, sql: str, params: Sequence = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self):
+        """연결 닫기 (WAL 내용을 DB 파일에 반영)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ============================================
+    # Tier 상태
+    # ============================================
+
+    _TIER_UPSERT = """
+        INSERT INTO tiers (tier_id, state, order_id, ordered_qty, filled_qty, filled_price,
+                           quantity, avg_price, invested_amount, opened_at, error_message, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(tier_id) DO UPDATE SET
+            state = excluded.state, order_id = excluded.order_id, ordered_qty = excluded.ordered_qty,
+            filled_qty = excluded.filled_qty, filled_price = excluded.filled_price,
+            quantity = excluded.quantity, avg_price = excluded.avg_price,
+            invested_amount = excluded.invested_amount, opened_at = excluded.opened_at,
+            error_message = excluded.error_message, updated_at = excluded.updated_at
+    """
+
+    @staticmethod
+    def _tier_row(tier: TierInfo) -> tuple:
+        return (
+            tier.tier_id, tier.state.name, tier.order_id, tier.ordered_qty, tier.filled_qty,
+            tier.filled_price, tier.quantity, tier.avg_price, tier.invested_amount,
+            _iso(tier.opened_at), tier.error_message, _iso(tier.last_updated or datetime.now())
+        )
+
+    def save_tier(self, tier: TierInfo):
+        """
+        Tier 1건 저장 (TierStateMachine.add_listener에 등록)
+
+        Args:
+            tier: 변경된 Tier (읽기 전용 뷰)
+        """
+        self._write(self._TIER_UPSERT, self._tier_row(tier))
+
+    def save_tiers(self, tiers: Iterable[TierInfo]):
+        """전체 Tier 일괄 저장 (시작 시 현재 상태 기록)"""
+        self._write_many(self._TIER_UPSERT, (self._tier_row(tier) for tier in tiers))
+
+    def load_tiers(self, state: Optional[str] = None) -> List[Dict]:
+        """
+        저장된 Tier 조회
+
+        Args:
+            state: 상태 필터 (TierState 이름, 예: "FILLED", None이면 전체)
+
+        Returns:
+            list: Tier별 dict (tier_id 오름차순)
+        """
+        if state is None:
+            rows = self._query("SELECT * FROM tiers ORDER BY tier_id")
+        else:
+            rows = self._query("SELECT * FROM tiers WHERE state = ? ORDER BY tier_id", (state,))
+        return [dict(row) for row in rows]
+
+    # ============================================
+    # 주문 / 체결
+    # ============================================
+
+    def record_order(self, order_id: str, side: str, tiers: Sequence[int], quantity: int, price: float):
+        """주문 접수 기록"""
+        now = datetime.now().isoformat()
+        self._write(
+            "INSERT OR REPLACE INTO orders (order_id, side, tiers, quantity, price, status, submitted_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (order_id, side, json.dumps(list(tiers)), quantity, price, ORDER_SUBMITTED, now, now)
+        )
+
+    def record_fill(self, order_id: str, side: str, quantity: int, price: float):
+        """
+        체결 기록 + 주문 상태 FILLED (단일 트랜잭션)
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO fills (order_id, side, quantity, price, filled_at) VALUES (?, ?, ?, ?, ?)",
+                (order_id, side, quantity, price, now)
+            )
+            self._conn.execute(
+                "UPDATE orders SET status = ?, filled_qty = filled_qty + ?, filled_price = ?, updated_at = ? "
+                "WHERE order_id = ?",
+                (ORDER_FILLED, quantity, price, now, order_id)
+            )
+            self.write_count += 1
+
+    def record_order_failed(self, order_id: str, error_message: str):
+        """주문 실패/미체결 기록"""
+        self._write(
+            "UPDATE orders SET status = ?, error_message = ?, updated_at = ? WHERE order_id = ?",
+            (ORDER_FAILED, error_message, datetime.now().isoformat(), order_id)
+        )
+
+    def get_order(self, order_id: str) -> Optional[Dict]:
+        """주문 조회 (없으면 None)"""
+        rows = self._query("SELECT * FROM orders WHERE order_id = ?", (order_id,))
+        if not rows:
+            return None
+        order = dict(rows[0])
+        order["tiers"] = tuple(json.loads(order["tiers"]))
+        return order
+
+    def get_fills(self, since: Optional[str] = None) -> List[Dict]:
+        """
+        체결 내역 조회
+
+        Args:
+            since: 이 시각(ISO 형식, 예: "2026-01-16") 이후만
+
+        Returns:
+            list: 체결 순서대로
+        """
+        rows = self._query(
+            "SELECT * FROM fills WHERE filled_at >= ? ORDER BY id", (since or "",)
+        )
+        return [dict(row) for row in rows]
+
+    # ============================================
+    # 단일 값
+    # ============================================
+
+    def set_meta(self, **values: Any):
+        """단일 값 저장 (예: set_meta(tier1_price=30.0, account_balance=5000.0))"""
+        self._write_many(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value, default=str)) for key, value in values.items()]
+        )
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        """단일 값 조회"""
+        rows = self._query("SELECT value FROM meta WHERE key = ?", (key,))
+        return json.loads(rows[0]["value"]) if rows else default
@@ -318,6 +318,252 @@ def test_full_scenario(engine):
     print("[OK] 통합 시나리오 통과!")
 
 
+# ============================================
+# [v4.3] 트리거 가격 Fast Path 테스트
+# ============================================
+
+def test_tick_between_triggers_skips_scan(engine):
+    """
+    [v4.3] 트리거 사이 가격이면 Tier 스캔 없이 즉시 반환
+
+    시나리오:
+    - Tier 5 보유 (매도가 = Tier 5 매수가 × 1.03)
+    - 현재가: 남은 EMPTY Tier 최고 매수가 초과, 매도가 미만
+    - get_tier / get_filled_tiers 호출 없이 빈 신호 반환
+    """
+    buy_price = engine.calculate_tier_price(5)
+    signals = engine.process_tick(buy_price)
+    buy_signal = next(s for s in signals if s.action == "BUY")
+    engine.confirm_order(buy_signal, "BUY123", buy_signal.quantity, buy_price)
+
+    next_buy, next_sell = engine.state_machine.get_trigger_bounds(start_tier=1)
+    assert next_buy < next_sell
+
+    engine.state_machine.get_tier = Mock(side_effect=AssertionError("스캔 발생"))
+    engine.state_machine.get_filled_tiers = Mock(side_effect=AssertionError("스캔 발생"))
+
+    assert engine.process_tick((next_buy + next_sell) / 2) == []
+
+
+def test_trigger_bounds_follow_state_changes(engine):
+    """
+    [v4.3] 체결/매도 후 트리거 가격 갱신
+
+    - 매수 체결 전: 매도 트리거 없음 (+inf)
+    - 매수 체결 후: 최저 매도가 = 보유 Tier 중 최저 sell_price
+    - 매도 트리거 도달 시 Fast Path를 건너뛰고 매도 신호 생성
+    """
+    _, next_sell = engine.state_machine.get_trigger_bounds()
+    assert next_sell == float("inf")
+
+    buy_price = engine.calculate_tier_price(3)
+    buy_signal = next(s for s in engine.process_tick(buy_price) if s.action == "BUY")
+    engine.confirm_order(buy_signal, "BUY123", buy_signal.quantity, buy_price)
+
+    expected_sell = min(t.sell_price for t in engine.state_machine.get_filled_tiers())
+    _, next_sell = engine.state_machine.get_trigger_bounds()
+    assert next_sell == expected_sell
+
+    signals = engine.process_tick(expected_sell)
+    assert any(s.action == "SELL" for s in signals)
+
+
+# ============================================
+# [v4.3] 매도가 인덱스 테스트
+# ============================================
+
+def test_sell_candidates_only_crossed_tiers(engine):
+    """
+    [v4.3] 매도가 인덱스: 현재가 이상 도달한 Tier만 반환 (높은 Tier부터)
+
+    - Tier 2~6 보유 상태 복원
+    - Tier 4 매도가에서 조회 시 Tier 4~6만 반환
+    - 조회 후에도 인덱스 유지 (주문 실패 시 재시도 가능)
+    """
+    sm = engine.state_machine
+    for tier_id in range(2, 7):
+        sm.restore_position(tier_id, 10, engine.calculate_tier_price(tier_id), 100.0)
+
+    sell_price = sm.get_tier(4).sell_price
+    candidates = sm.get_sell_candidates(sell_price)
+    assert [t.tier_id for t in candidates] == [6, 5, 4]
+
+    assert [t.tier_id for t in sm.get_sell_candidates(sell_price)] == [6, 5, 4]
+    assert sm.peek_min_sell_price() == sm.get_tier(6).sell_price
+
+
+def test_sell_index_drops_stale_entries(engine):
+    """
+    [v4.3] 매도/리셋/가격 변경된 Tier는 인덱스에서 제외
+    """
+    sm = engine.state_machine
+    for tier_id in (3, 4):
+        sm.restore_position(tier_id, 10, engine.calculate_tier_price(tier_id), 100.0)
+
+    sm.reset_tier(4)
+    assert sm.peek_min_sell_price() == sm.get_tier(3).sell_price
+
+    tier3 = sm.get_tier(3)
+    sm.set_tier_prices(3, tier3.buy_price, tier3.sell_price + 1.0)
+    assert sm.get_sell_candidates(tier3.sell_price) == []
+    assert [t.tier_id for t in sm.get_sell_candidates(tier3.sell_price + 1.0)] == [3]
+
+    sm.reset_tier(3)
+    assert sm.peek_min_sell_price() == float("inf")
+
+
+# ============================================
+# [v4.3] 매수 후보 구간 테스트
+# ============================================
+
+def test_buy_scan_limited_to_reachable_tiers(engine):
+    """
+    [v4.3] 매수 스캔은 현재가로 도달 가능한 EMPTY Tier만 확인
+
+    - Tier 3 보유, 현재가 = Tier 6 매수가
+    - get_tier 조회 대상: Tier 1(기준가) + Tier 1, 2, 4~7 (EMPTY, 경계 +1)
+    - 매수 신호: Tier 1, 2, 4, 5, 6
+    """
+    sm = engine.state_machine
+    sm.restore_position(3, 10, engine.calculate_tier_price(3), 100.0)
+    assert list(sm.iter_empty_tiers(1, 7)) == [1, 2, 4, 5, 6, 7]
+
+    visited = []
+    original_get_tier = sm.get_tier
+
+    def tracking_get_tier(tier_id):
+        visited.append(tier_id)
+        return original_get_tier(tier_id)
+
+    sm.get_tier = tracking_get_tier
+
+    signal = engine._process_buy_batch(engine.calculate_tier_price(6))
+    assert signal.tiers == (1, 2, 4, 5, 6)
+    assert visited == [1, 1, 2, 4, 5, 6, 7]
+
+
+# ============================================
+# [v4.3] 상태 스냅샷 테스트
+# ============================================
+
+def test_snapshot_shared_until_state_changes(engine):
+    """
+    [v4.3] 스냅샷은 변경 전까지 같은 객체, 변경 시 바뀐 Tier 뷰만 재생성
+    """
+    sm = engine.state_machine
+    snap1 = sm.snapshot()
+    assert sm.snapshot() is snap1
+    assert snap1.state_counts[TierState.EMPTY] == engine.settings.total_tiers
+
+    sm.restore_position(5, 10, engine.calculate_tier_price(5), 100.0)
+    snap2 = sm.snapshot()
+    assert snap2 is not snap1
+    assert snap2.tiers[3] is snap1.tiers[3]        # Tier 4: 변경 없음 → 뷰 공유
+    assert snap2.tiers[4] is not snap1.tiers[4]    # Tier 5: 재생성
+    assert snap2.state_counts[TierState.FILLED] == 1
+    assert snap2.state_counts[TierState.EMPTY] == engine.settings.total_tiers - 1
+
+    status = engine.get_status()
+    assert status['state_summary']['FILLED'] == 1
+    assert engine.positions[0].tier == 5
+
+
+def test_tier_view_is_read_only(engine):
+    """
+    [v4.3] 조회 결과 수정 시 AttributeError (상태머신 원본 보호)
+    """
+    tier = engine.state_machine.get_tier(5)
+    with pytest.raises(AttributeError):
+        tier.state = TierState.FILLED
+    assert engine.state_machine.get_tier(5).state == TierState.EMPTY
+
+
+# ============================================
+# [v4.3] 포지션 집계 테스트
+# ============================================
+
+def test_position_totals_follow_fills_and_sells(engine):
+    """
+    [v4.3] 매수/매도 체결 시 보유 집계 증분 갱신 (전체 재합산과 일치)
+    """
+    sm = engine.state_machine
+    buy_price = engine.calculate_tier_price(4)
+    buy_signal = next(s for s in engine.process_tick(buy_price) if s.action == "BUY")
+    engine.confirm_order(buy_signal, "BUY123", buy_signal.quantity, buy_price)
+
+    filled = sm.get_filled_tiers()
+    totals = sm.get_total_positions(buy_price)
+    assert totals['position_count'] == len(filled) == len(buy_signal.tiers)
+    assert totals['total_quantity'] == sum(t.quantity for t in filled)
+    assert totals['total_invested'] == pytest.approx(sum(t.quantity * t.avg_price for t in filled))
+
+    sell_price = max(t.sell_price for t in filled)
+    sell_signal = next(s for s in engine.process_tick(sell_price) if s.action == "SELL")
+    engine.confirm_order(sell_signal, "SELL123", sell_signal.quantity, sell_price)
+
+    totals = sm.get_total_positions(sell_price)
+    assert totals['position_count'] == 0
+    assert totals['total_quantity'] == 0
+    assert totals['total_invested'] == 0.0
+
+
+# ============================================
+# [v4.3] 컬럼형 Tier 테이블 테스트
+# ============================================
+
+def test_tier_table_columns_back_tier_api(engine):
+    """
+    [v4.3] Tier 값은 컬럼 배열에 저장, get_tier()는 TierInfo 뷰로 제공
+    """
+    from tier_state_machine import TierInfo
+
+    sm = engine.state_machine
+    sm.restore_position(7, 12, 9.0, 108.0)
+
+    assert sm._tiers.column("quantity")[7] == 12
+    assert sm._tiers.column("buy_price")[7] == engine.calculate_tier_price(7)
+
+    tier = sm.get_tier(7)
+    assert isinstance(tier, TierInfo)
+    assert (tier.state, tier.quantity, tier.avg_price) == (TierState.FILLED, 12, 9.0)
+
+    # 총 Tier 수를 넘는 번호도 추가 가능 (배열 자동 확장)
+    sm.initialize_tier(engine.settings.total_tiers + 5, 1.0, 1.03)
+    assert sm.get_tier(engine.settings.total_tiers + 5).state == TierState.EMPTY
+    assert len(sm._tiers) == engine.settings.total_tiers + 1
+
+
+# ============================================
+# [v4.3] 일괄 가격 재계산 테스트
+# ============================================
+
+def test_bulk_reprice_on_tier1_update(engine):
+    """
+    [v4.3] Tier 1 갱신 시 전체 가격을 한 번에 재계산 (상태 보존, 버전 1회 증가)
+    """
+    sm = engine.state_machine
+    sm.restore_position(3, 10, engine.calculate_tier_price(3), 100.0)
+    sm.try_lock_for_buy(4)
+
+    from dataclasses import replace
+    engine.settings = replace(engine.settings, tier1_auto_update=True)
+
+    version = sm.version
+    updated, _ = engine.update_tier1(engine.tier1_price + 1.0)
+    assert updated
+    assert sm.version == version + 1
+
+    for tier_id in range(1, engine.settings.total_tiers + 1):
+        tier = sm.get_tier(tier_id)
+        assert tier.buy_price == engine.calculate_tier_price(tier_id)
+        assert tier.sell_price == pytest.approx(tier.buy_price * (1 + engine.settings.sell_target))
+
+    assert sm.get_tier(3).state == TierState.FILLED
+    assert sm.get_tier(3).quantity == 10
+    assert sm.get_tier(4).state == TierState.LOCKED
+    assert sm.peek_min_sell_price() == sm.get_tier(3).sell_price
+
+
 # ============================================
 # 실행
 # ============================================
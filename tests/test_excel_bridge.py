@@ -216,6 +216,42 @@ class TestUpdateProgramArea:
 
         bridge.close_workbook()
 
+    def test_update_program_area_writes_only_changed_cells(self, temp_excel_file):
+        """[v4.3] 두 번째 호출부터는 바뀐 Tier의 셀만 기록"""
+        bridge = ExcelBridge(temp_excel_file)
+        bridge.load_workbook()
+
+        position = Position(tier=3, quantity=10, avg_price=9.9, invested_amount=99.0, opened_at=datetime.now())
+        bridge.update_program_area([], tier1_price=10.0)
+
+        with patch.object(bridge.ws_master, "cell", wraps=bridge.ws_master.cell) as mock_cell:
+            bridge.update_program_area([], tier1_price=10.0)
+            assert mock_cell.call_count == 0  # 변경 없음
+
+            bridge.update_program_area([position], tier1_price=10.0)
+            written = {(c.kwargs["row"], c.kwargs["column"]) for c in mock_cell.call_args_list}
+
+        assert {row for row, _ in written} == {20}          # Tier 3 행만
+        assert (20, 7) not in written                       # 티어 번호는 그대로
+        assert bridge.ws_master.cell(row=20, column=8).value == 10
+        assert bridge.ws_master.cell(row=20, column=11).value == ""
+
+        bridge.close_workbook()
+
+    def test_update_program_area_full_write_after_reload(self, temp_excel_file):
+        """[v4.3] 워크북을 다시 열면 전체 기록"""
+        bridge = ExcelBridge(temp_excel_file)
+        bridge.load_workbook()
+        bridge.update_program_area([], tier1_price=10.0)
+        bridge.close_workbook()
+
+        bridge.load_workbook()
+        with patch.object(bridge.ws_master, "cell", wraps=bridge.ws_master.cell) as mock_cell:
+            bridge.update_program_area([], tier1_price=10.0)
+        assert mock_cell.call_count == 240 * 8
+
+        bridge.close_workbook()
+
 
 class TestAppendHistoryLog:
     """append_history_log() 테스트"""
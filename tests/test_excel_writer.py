@@ -0,0 +1,121 @@
+"""
+src/excel_writer.py 단위 테스트
+
+테스트 범위:
+1. submit()은 저장을 기다리지 않음 (파일 잠금/느린 저장 중에도 즉시 반환)
+2. 연속 요청 병합 (최신 상태만, 히스토리는 모두)
+3. 저장 간격 제한 / flush() 강제 저장
+4. 저장 실패 시 재시도
+5. 실제 Excel 파일 저장
+"""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import openpyxl
+
+from src.excel_bridge import ExcelBridge
+from src.excel_writer import ExcelWriter
+from src.models import Position, SystemState
+
+
+def make_state(price=10.0, tier=1):
+    return SystemState(
+        current_price=price, tier1_price=10.0, current_tier=tier, account_balance=5000.0,
+        total_quantity=0, total_invested=0.0, stock_value=0.0, total_profit=0.0, profit_rate=0.0,
+        buy_status="대기", sell_status="대기", last_update=datetime(2026, 1, 16, 9, 30)
+    )
+
+
+class TestExcelWriter:
+    """ExcelWriter 테스트 (Mock ExcelBridge)"""
+
+    def test_submit_does_not_wait_for_locked_workbook(self):
+        """저장이 막혀 있어도 submit()은 즉시 반환"""
+        gate = threading.Event()
+        bridge = Mock()
+        bridge.save_workbook.side_effect = lambda: gate.wait(5) or True
+        writer = ExcelWriter(bridge, min_interval=0)
+        writer.start()
+
+        writer.submit(state=make_state())
+        started = time.monotonic()
+        for i in range(100):
+            writer.submit(state=make_state(price=10.0 + i))
+        assert time.monotonic() - started < 0.5
+
+        gate.set()
+        assert writer.stop()
+        bridge.update_program_info.assert_called_with(make_state(price=109.0))
+
+    def test_burst_merged_into_one_save(self):
+        """간격 내 연속 요청은 1회 저장 (상태는 최신값, 히스토리는 순서대로 모두)"""
+        bridge = Mock()
+        bridge.save_workbook.return_value = True
+        writer = ExcelWriter(bridge, min_interval=60)
+
+        for i in range(5):
+            writer.submit(state=make_state(price=10.0 + i), history_entry={"tier": i})
+        writer.submit(positions=[Position(tier=1, quantity=10, avg_price=10.0, invested_amount=100.0,
+                                        opened_at=datetime(2026, 1, 16))],
+                      tier1_price=10.0, buy_interval=0.005)
+        assert writer.flush()
+
+        assert bridge.save_workbook.call_count == 1
+        bridge.update_program_info.assert_called_once_with(make_state(price=14.0))
+        assert [c.args[0]["tier"] for c in bridge.append_history_log.call_args_list] == [0, 1, 2, 3, 4]
+        assert bridge.update_program_area.call_args.args[1:] == (10.0, 0.005)
+
+    def test_rate_limited_until_flush(self):
+        """최소 간격 전에는 저장하지 않고, flush() 요청 시 즉시 저장"""
+        bridge = Mock()
+        bridge.save_workbook.return_value = True
+        writer = ExcelWriter(bridge, min_interval=60)
+        writer.start()
+
+        writer.submit(state=make_state())
+        deadline = time.monotonic() + 5
+        while bridge.save_workbook.call_count < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        writer.submit(cells={"B15": False})
+        time.sleep(0.1)
+        assert bridge.save_workbook.call_count == 1   # 간격 제한 중
+
+        assert writer.flush(timeout=5)
+        assert bridge.save_workbook.call_count == 2
+        bridge.update_cell.assert_called_once_with("B15", False)
+        writer.stop()
+
+    def test_failed_save_retried(self):
+        """저장 실패 시 다음 flush()에서 다시 저장"""
+        bridge = Mock()
+        bridge.save_workbook.side_effect = [False, True]
+        writer = ExcelWriter(bridge, min_interval=60)
+        writer.start()
+
+        writer.submit(state=make_state())
+        assert not writer.flush(timeout=5)
+        assert writer.flush(timeout=5)
+
+        assert bridge.save_workbook.call_count == 2
+        assert (writer.failed_count, writer.save_count) == (1, 1)
+        writer.stop()
+
+    def test_saves_real_workbook(self, temp_excel_file):
+        """실제 파일에 반영"""
+        bridge = ExcelBridge(temp_excel_file)
+        bridge.load_workbook()
+        writer = ExcelWriter(bridge, min_interval=0)
+        writer.start()
+
+        writer.submit(state=make_state(price=12.5, tier=3), cells={"B15": False})
+        assert writer.stop()
+        bridge.close_workbook()
+
+        ws = openpyxl.load_workbook(temp_excel_file)["01_매매전략_기준설정"]
+        assert ws["E3"].value == 3
+        assert ws["E4"].value == 12.5
+        assert ws["B15"].value is False
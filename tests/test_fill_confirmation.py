@@ -32,7 +32,7 @@ class TestOrderFillStatus:
         adapter.token_expires_at = datetime.now() + timedelta(hours=1)
         return adapter
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_order_fill_status_completed(self, mock_get, adapter):
         """체결 완료 상태 조회"""
         # Mock 응답
@@ -60,7 +60,7 @@ class TestOrderFillStatus:
         assert result["filled_price"] == 45.52
         assert result["unfilled_qty"] == 0
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_order_fill_status_pending(self, mock_get, adapter):
         """체결 대기 상태 조회"""
         mock_response = Mock()
@@ -84,7 +84,7 @@ class TestOrderFillStatus:
         assert result["filled_qty"] == 0
         assert result["unfilled_qty"] == 100
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_order_fill_status_rejected(self, mock_get, adapter):
         """주문 거부 상태 조회"""
         mock_response = Mock()
@@ -108,7 +108,7 @@ class TestOrderFillStatus:
         assert result["reject_reason"] == "잔고 부족"
         assert result["filled_qty"] == 0
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_order_fill_status_partial_fill(self, mock_get, adapter):
         """부분 체결 상태 조회"""
         mock_response = Mock()
@@ -0,0 +1,214 @@
+"""
+src/fill_registry.py 단위 테스트
+
+테스트 범위:
+1. 체결통보 해석 (H0GSCNI0 필드)
+2. 주문번호별 누적 (평균 체결가, 앞자리 0 표기 차이)
+3. 다른 스레드의 통보로 대기 해제 / 연결 종료 시 즉시 반환
+4. 어댑터 WebSocket 프레임 처리 (구독 응답, 체결통보)
+5. _wait_for_fill 체결통보 경로
+"""
+
+import base64
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.fill_registry import FillNotice, FillRegistry, parse_fill_notice, decrypt_notice
+from src.kis_rest_adapter import KisRestAdapter
+
+
+def notice_fields(order_no="0030000001", side="02", qty="5", price="25.50", rejected="0", filled="2"):
+    """체결통보 필드 ('^' 분리 결과)"""
+    return [
+        "hts_id", "1234567801", order_no, "", side, "0", "00", "SOXL",
+        qty, price, "093001", rejected, filled, "1", "", "10",
+    ]
+
+
+def make_notice(order_no="0030000001", qty=5, price=25.5, filled=True, rejected=False):
+    return FillNotice(order_no=order_no, side="BUY", ticker="SOXL", qty=qty, price=price,
+                      filled=filled, rejected=rejected)
+
+
+class TestParseFillNotice:
+    """체결통보 해석 테스트"""
+
+    def test_fill(self):
+        notice = parse_fill_notice(notice_fields(side="01"))
+
+        assert notice.order_no == "0030000001"
+        assert notice.side == "SELL"
+        assert (notice.qty, notice.price) == (5, 25.5)
+        assert notice.filled and not notice.rejected
+
+    def test_invalid(self):
+        assert parse_fill_notice(["a", "b"]) is None
+        assert parse_fill_notice(notice_fields(qty="abc")) is None
+
+    def test_decrypt(self):
+        """AES-256-CBC 복호화 (pycryptodome 설치 시)"""
+        pytest.importorskip("Crypto")
+        from Crypto.Cipher import AES
+        from Crypto.Util.Padding import pad
+
+        key, iv = "k" * 32, "i" * 16
+        plain = "^".join(notice_fields())
+        cipher = AES.new(key.encode(), AES.MODE_CBC, iv.encode())
+        encrypted = base64.b64encode(cipher.encrypt(pad(plain.encode(), AES.block_size))).decode()
+
+        assert decrypt_notice(encrypted, key, iv) == plain
+
+
+class TestFillRegistry:
+    """FillRegistry 테스트"""
+
+    def test_accumulates_partial_fills(self):
+        """부분 체결 통보를 누적하고 평균 체결가 계산"""
+        registry = FillRegistry()
+        registry.record(make_notice(qty=2, price=25.0))
+        state = registry.record(make_notice(qty=3, price=26.0))
+
+        assert state.filled_qty == 5
+        assert state.avg_price == pytest.approx(25.6)
+        assert state.notice_count == 2
+
+    def test_order_no_leading_zeros(self):
+        """REST 주문번호와 통보 주문번호의 앞자리 0 차이 무시"""
+        registry = FillRegistry()
+        registry.record(make_notice(order_no="0030000001"))
+
+        assert registry.get("30000001").filled_qty == 5
+
+    def test_acceptance_notice_does_not_fill(self):
+        """접수 통보는 체결 수량에 포함하지 않음"""
+        registry = FillRegistry()
+        state = registry.record(make_notice(filled=False, qty=10))
+
+        assert state.filled_qty == 0
+
+    def test_wait_released_by_notice(self):
+        """다른 스레드의 체결통보로 대기 즉시 해제"""
+        registry = FillRegistry()
+        registry.set_live(True)
+
+        timer = threading.Timer(0.05, lambda: registry.record(make_notice(qty=5)))
+        timer.start()
+        started = time.monotonic()
+        state = registry.wait("0030000001", 5, timeout=5.0)
+        timer.join()
+
+        assert state.filled_qty == 5
+        assert time.monotonic() - started < 1.0
+
+    def test_wait_returns_notice_received_before_wait(self):
+        """주문 응답보다 먼저 도착한 통보도 사용"""
+        registry = FillRegistry()
+        registry.set_live(True)
+        registry.record(make_notice(rejected=True, filled=False, qty=0))
+
+        assert registry.wait("0030000001", 5, timeout=5.0).rejected is True
+
+    def test_wait_returns_when_not_live(self):
+        """연결 종료 시 대기 중단"""
+        registry = FillRegistry()
+        registry.set_live(True)
+
+        timer = threading.Timer(0.05, lambda: registry.set_live(False))
+        timer.start()
+        started = time.monotonic()
+        state = registry.wait("0030000001", 5, timeout=5.0)
+        timer.join()
+
+        assert state is None
+        assert time.monotonic() - started < 1.0
+
+    def test_bounded_size(self):
+        """오래된 주문부터 제거"""
+        registry = FillRegistry()
+        for i in range(FillRegistry.MAX_ORDERS + 10):
+            registry.record(make_notice(order_no=str(i + 1)))
+
+        assert registry.get("1") is None
+        assert registry.get(str(FillRegistry.MAX_ORDERS + 10)) is not None
+
+
+class TestAdapterFillNotice:
+    """KisRestAdapter WebSocket 체결통보 처리 테스트"""
+
+    @pytest.fixture
+    def adapter(self):
+        return KisRestAdapter(app_key="test_app_key", app_secret="test_app_secret", account_no="12345678-01")
+
+    def test_subscribe_response_enables_registry(self, adapter):
+        adapter._on_fill_notice_subscribed({
+            "header": {"tr_id": "H0GSCNI0"},
+            "body": {"rt_cd": "0", "msg1": "SUBSCRIBE SUCCESS", "output": {"key": "k" * 32, "iv": "i" * 16}}
+        })
+
+        assert adapter.fill_registry.is_live is True
+        assert adapter._fill_notice_cipher == ("k" * 32, "i" * 16)
+
+    def test_subscribe_failure_keeps_polling(self, adapter):
+        adapter._on_fill_notice_subscribed({"body": {"rt_cd": "1", "msg1": "invalid tr_key"}})
+
+        assert adapter.fill_registry.is_live is False
+
+    def test_plain_frame_recorded(self, adapter):
+        adapter._handle_ws_frame("0|H0GSCNI0|001|" + "^".join(notice_fields()))
+
+        assert adapter.fill_registry.get("0030000001").filled_qty == 5
+
+    def test_other_frames_ignored(self, adapter):
+        adapter._handle_ws_frame("0|HDFSCNT0|001|DAMSSOXL^...")
+        adapter._handle_ws_frame("1|H0GSCNI0|001|encrypted")  # 복호화 키 없음
+
+        assert adapter.fill_registry.notice_count == 0
+
+
+class TestWaitForFillNotice:
+    """_wait_for_fill 체결통보 경로 테스트"""
+
+    @pytest.fixture
+    def system(self):
+        system = MagicMock()
+        system.settings.fill_check_max_retries = 3
+        system.settings.fill_check_interval = 0.1
+        system.kis_adapter.fill_registry = FillRegistry()
+        system.kis_adapter.fill_registry.set_live(True)
+        system.kis_adapter.get_order_fill_status.return_value = {
+            "status": "접수", "filled_qty": 0, "filled_price": 0.0, "unfilled_qty": 5, "reject_reason": ""
+        }
+        return system
+
+    def _wait(self, system, order_id="0030000001", qty=5):
+        from phoenix_main import PhoenixTradingSystem
+
+        system._wait_for_fill_notice = lambda *args: PhoenixTradingSystem._wait_for_fill_notice(system, *args)
+        return PhoenixTradingSystem._wait_for_fill(system, order_id, qty)
+
+    def test_full_fill_without_rest_polling(self, system):
+        system.kis_adapter.fill_registry.record(make_notice(qty=5, price=25.5))
+
+        assert self._wait(system) == (25.5, 5)
+        system.kis_adapter.get_order_fill_status.assert_not_called()
+
+    def test_missing_notice_reconciled_by_rest(self, system):
+        """통보 누락 시 REST 체결내역 1회 조회로 확인"""
+        system.kis_adapter.get_order_fill_status.return_value = {
+            "status": "완료", "filled_qty": 5, "filled_price": 25.4, "unfilled_qty": 0, "reject_reason": ""
+        }
+
+        assert self._wait(system) == (25.4, 5)
+        assert system.kis_adapter.get_order_fill_status.call_count == 1
+
+    def test_partial_fill(self, system):
+        system.kis_adapter.fill_registry.record(make_notice(qty=2, price=25.5))
+
+        assert self._wait(system) == (25.5, 2)
+
+    def test_timeout(self, system):
+        assert self._wait(system) == (0.0, 0)
+        assert system.kis_adapter.get_order_fill_status.call_count == 1
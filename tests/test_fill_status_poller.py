@@ -0,0 +1,129 @@
+"""
+src/fill_status_poller.py 단위 테스트
+
+테스트 범위:
+1. TTL 동안 여러 주문이 조회 1회 공유
+2. 동시 요청 시 조회 1회 (single-flight)
+3. 조회 실패 / 주문번호 없음
+4. 어댑터 체결내역 연속조회 (CTX_AREA_*, tr_cont)
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.fill_status_poller import FillStatusPoller
+from src.kis_rest_adapter import KisRestAdapter
+
+
+def status(filled_qty=0, state="접수"):
+    return {"status": state, "filled_qty": filled_qty, "filled_price": 25.0 if filled_qty else 0.0,
+            "unfilled_qty": 0, "reject_reason": ""}
+
+
+class TestFillStatusPoller:
+    """FillStatusPoller 테스트"""
+
+    def test_orders_share_one_fetch_within_ttl(self):
+        fetch = Mock(return_value={"1": status(5, "완료"), "2": status()})
+        poller = FillStatusPoller(fetch, ttl=60)
+
+        assert poller.get("0001")["filled_qty"] == 5   # 앞자리 0 무시
+        assert poller.get("2")["status"] == "접수"
+        assert fetch.call_count == 1
+        assert poller.hit_count == 1
+
+    def test_refetch_after_ttl(self):
+        fetch = Mock(return_value={"1": status()})
+        poller = FillStatusPoller(fetch, ttl=0.01)
+
+        poller.get("1")
+        time.sleep(0.02)
+        poller.get("1")
+
+        assert fetch.call_count == 2
+
+    def test_concurrent_waiters_single_fetch(self):
+        """동시에 요청한 체결 확인 스레드들은 진행 중인 조회 결과를 공유"""
+        def slow_fetch():
+            time.sleep(0.05)
+            return {str(i): status(i) for i in range(1, 6)}
+
+        fetch = Mock(side_effect=slow_fetch)
+        poller = FillStatusPoller(fetch, ttl=60)
+        results = {}
+
+        threads = [
+            threading.Thread(target=lambda i=i: results.__setitem__(i, poller.get(str(i))))
+            for i in range(1, 6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert fetch.call_count == 1
+        assert {i: r["filled_qty"] for i, r in results.items()} == {i: i for i in range(1, 6)}
+
+    def test_fetch_failure_and_missing_order(self):
+        fetch = Mock(side_effect=[None, {}])
+        poller = FillStatusPoller(fetch, ttl=60)
+
+        assert poller.get("1")["status"] == "오류"
+        assert poller.get("1")["reject_reason"] == "주문번호를 찾을 수 없음"  # 실패는 캐시하지 않음
+        assert fetch.call_count == 2
+
+
+class TestAdapterFetchFillStatuses:
+    """KisRestAdapter.fetch_fill_statuses 연속조회 테스트"""
+
+    @pytest.fixture
+    def adapter(self):
+        adapter = KisRestAdapter(app_key="test_app_key", app_secret="test_app_secret", account_no="12345678-01")
+        adapter.access_token = "test_token"
+        adapter.token_expires_at = datetime.now() + timedelta(hours=1)
+        return adapter
+
+    @staticmethod
+    def page(rows, tr_cont, fk="", nk=""):
+        response = Mock(status_code=200, headers={"tr_cont": tr_cont})
+        response.json.return_value = {
+            "rt_cd": "0",
+            "output": [
+                {"odno": odno, "ft_ccld_qty": qty, "ft_ccld_unpr3": "25.0", "nccs_qty": "0",
+                 "prcs_stat_name": "완료", "rjct_rson_name": ""}
+                for odno, qty in rows
+            ],
+            "ctx_area_fk200": fk,
+            "ctx_area_nk200": nk,
+        }
+        return response
+
+    @patch('src.kis_rest_adapter.requests.Session.get')
+    def test_follows_continuation(self, mock_get, adapter):
+        mock_get.side_effect = [
+            self.page([("0000000001", "3")], "M", fk="FK1   ", nk="NK1   "),
+            self.page([("0000000002", "4")], "D"),
+        ]
+
+        statuses = adapter.fetch_fill_statuses()
+
+        assert statuses["1"]["filled_qty"] == 3 and statuses["2"]["filled_qty"] == 4
+        first, second = mock_get.call_args_list
+        assert first.kwargs["params"]["ODNO"] == ""              # 당일 전체
+        assert "tr_cont" not in first.kwargs["headers"]
+        assert second.kwargs["headers"]["tr_cont"] == "N"
+        assert second.kwargs["params"]["CTX_AREA_FK200"] == "FK1"
+        assert second.kwargs["params"]["CTX_AREA_NK200"] == "NK1"
+
+    @patch('src.kis_rest_adapter.requests.Session.get')
+    def test_pending_orders_share_query(self, mock_get, adapter):
+        """대기 중인 주문 여러 건의 체결 조회가 ccnl 1회로 처리"""
+        mock_get.return_value = self.page([("0000000001", "3"), ("0000000002", "0")], "D")
+
+        assert adapter.get_order_fill_status("0000000001")["filled_qty"] == 3
+        assert adapter.get_order_fill_status("0000000002")["filled_qty"] == 0
+        assert mock_get.call_count == 1
@@ -479,6 +479,58 @@ class TestStateConsistency:
         total_invested = sum(p.invested_amount for p in engine.positions)
         assert engine.account_balance + total_invested == pytest.approx(initial_balance, rel=1e-2)
 
+    def test_running_totals_match_positions(self, grid_settings_tier1_enabled):
+        """[v4.3] 증분 집계값이 포지션 합계와 일치 (매수/부분매도/대입)"""
+        engine = GridEngine(grid_settings_tier1_enabled)
+
+        for tier in [1, 2, 3]:
+            engine.execute_buy(TradeSignal(
+                action="BUY", tier=tier, price=10.0, quantity=10,
+                reason="Test", timestamp=datetime.now()
+            ))
+        engine.execute_sell(TradeSignal(
+            action="SELL", tier=2, price=10.5, quantity=4,
+            reason="Test", timestamp=datetime.now()
+        ))
+
+        state = engine.get_system_state(11.0)
+        assert state.total_quantity == sum(p.quantity for p in engine.positions) == 26
+        assert state.total_invested == pytest.approx(sum(p.invested_amount for p in engine.positions))
+        assert state.stock_value == pytest.approx(26 * 11.0)
+
+        engine.positions = []
+        assert engine.get_system_state(11.0).total_quantity == 0
+
+    def test_held_tier_index_follows_positions(self, grid_settings_tier1_enabled):
+        """[v4.3] Tier 인덱스(보유 여부/포지션 조회)가 매수/부분매도/전체매도/대입을 따라감"""
+        engine = GridEngine(grid_settings_tier1_enabled)
+
+        for tier in [2, 5]:
+            engine.execute_buy(TradeSignal(
+                action="BUY", tier=tier, price=10.0, quantity=10,
+                reason="Test", timestamp=datetime.now()
+            ))
+        assert engine.positions.holds(2) and engine.positions.holds(5)
+        assert not engine.positions.holds(3)
+        assert engine.positions.max_tier == 5
+
+        engine.execute_sell(TradeSignal(
+            action="SELL", tier=5, price=10.5, quantity=4,
+            reason="Test", timestamp=datetime.now()
+        ))
+        assert engine.positions.get_tier(5).quantity == 6
+
+        engine.execute_sell(TradeSignal(
+            action="SELL", tier=5, price=10.5, quantity=6,
+            reason="Test", timestamp=datetime.now()
+        ))
+        assert not engine.positions.holds(5)
+        assert engine.positions.get_tier(5) is None
+        assert engine.positions.max_tier == 2
+
+        engine.positions = [replace(engine.positions[0], tier=7)]
+        assert engine.positions.holds(7) and not engine.positions.holds(2)
+
 
 class TestEdgeCases:
     """엣지 케이스 테스트"""
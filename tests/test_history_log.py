@@ -0,0 +1,83 @@
+"""
+src/history_log.py 단위 테스트
+
+테스트 범위:
+1. JSONL 추가 / 기록 순서대로 읽기
+2. 크기 초과 시 파일 교체 (기록 유지)
+3. 깨진 줄 건너뛰기
+4. xlsx 내보내기 (시트 2와 같은 컬럼)
+5. ExcelBridge 시트 2 최근 구간 유지 (history_window)
+"""
+
+import openpyxl
+
+from src.excel_bridge import ExcelBridge, HISTORY_COLUMNS
+from src.history_log import HistoryLog, export_history
+
+
+def entry(i, date="2026-01-16"):
+    return {"update_time": f"{date} 09:30:{i:02d}", "date": date, "ticker": "SOXL", "tier": i, "buy_qty": i}
+
+
+class TestHistoryLog:
+    """HistoryLog 테스트"""
+
+    def test_append_and_read_in_order(self, tmp_path):
+        history = HistoryLog(tmp_path)
+        for i in range(3):
+            history.append(entry(i))
+
+        assert [e["tier"] for e in history.iter_entries()] == [0, 1, 2]
+        history.close()
+
+    def test_rotation_keeps_all_records(self, tmp_path):
+        history = HistoryLog(tmp_path, max_bytes=200)
+        for i in range(20):
+            history.append(entry(i))
+        history.close()
+
+        assert history.rotate_count > 0
+        assert len(history.segments()) == history.rotate_count + 1
+        assert [e["tier"] for e in HistoryLog(tmp_path).iter_entries()] == list(range(20))  # 재시작 후에도
+
+    def test_broken_line_skipped(self, tmp_path):
+        history = HistoryLog(tmp_path)
+        history.append(entry(0))
+        history.close()
+        with open(history.path, "a", encoding="utf-8") as f:
+            f.write('{"tier": 1, "upd')      # 비정상 종료로 잘린 줄
+
+        assert [e["tier"] for e in history.iter_entries()] == [0]
+
+    def test_export(self, tmp_path):
+        history = HistoryLog(tmp_path / "history")
+        history.append(entry(1, date="2026-01-15"))
+        history.append(entry(2))
+        history.append(entry(3))
+
+        output = tmp_path / "full.xlsx"
+        assert export_history(history, output, since="2026-01-16") == 2
+        history.close()
+
+        rows = list(openpyxl.load_workbook(output)["02_운용로그_히스토리"].values)
+        assert rows[0] == tuple(header for _, header, _ in HISTORY_COLUMNS)
+        assert [row[4] for row in rows[1:]] == [2, 3]      # 티어
+        assert rows[1][2] == "Main"                        # 기본값 (시트)
+
+
+class TestHistorySheetWindow:
+    """ExcelBridge.history_window 테스트"""
+
+    def test_sheet_keeps_recent_rows(self, temp_excel_file):
+        bridge = ExcelBridge(temp_excel_file, history_window=5)
+        bridge.load_workbook()
+
+        for i in range(12):
+            bridge.append_history_log(entry(i))
+
+        ws = bridge.ws_history
+        assert ws.max_row == 6                                   # 헤더 + 5행
+        assert ws.cell(row=1, column=1).value == "업데이트"
+        assert [ws.cell(row=r, column=5).value for r in range(2, 7)] == [7, 8, 9, 10, 11]
+
+        bridge.close_workbook()
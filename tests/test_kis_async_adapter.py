@@ -0,0 +1,215 @@
+"""
+src/kis_async_adapter.py 단위 테스트
+
+HTTP 계층(_request)만 대체하고 요청 구성/응답 해석/Rate limiter는 실제 코드를 사용한다.
+
+테스트 범위:
+1. 시세/예수금/잔고 동시 조회 (동기 어댑터와 같은 결과)
+2. 주문 (Hashkey 모드, 지연 통계)
+3. 체결 조회 (일괄 조회 캐시 공유, 오류 처리)
+4. AsyncKisRunner (전용 루프에서 클라이언트 유지)
+5. phoenix_main 동시 조회 / 순차 조회 대체
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.kis_async_adapter import AsyncKisRestAdapter, AsyncKisRunner
+from src.kis_rest_adapter import KisRestAdapter
+
+
+@pytest.fixture
+def rest():
+    """로그인 상태의 동기 어댑터"""
+    adapter = KisRestAdapter(
+        app_key="test_app_key",
+        app_secret="test_app_secret",
+        account_no="12345678-01"
+    )
+    adapter.access_token = "test_token"
+    adapter.token_expires_at = datetime.now() + timedelta(hours=1)
+    return adapter
+
+
+def make_client(rest, responses):
+    """URL 경로별 응답을 돌려주는 클라이언트 ({경로 일부: (status, data)})"""
+    client = AsyncKisRestAdapter(rest)
+    calls = []
+
+    async def fake_request(method, url, kind, headers, params=None, json_body=None):
+        calls.append((method, url, headers, params))
+        await asyncio.sleep(0)
+        for path, (status, data) in responses.items():
+            if path in url:
+                return status, data, str(data)
+        raise AssertionError(f"예상하지 못한 요청: {url}")
+
+    client._request = fake_request
+    return client, calls
+
+
+class TestAsyncKisRestAdapter:
+    """AsyncKisRestAdapter 테스트"""
+
+    def test_fan_out_quote_cash_balance(self, rest):
+        """시세/예수금/잔고를 gather로 동시에 조회"""
+        client, calls = make_client(rest, {
+            "quotations/price": (200, {"rt_cd": "0", "output": {"last": "25.50", "tvol": "100"}}),
+            "inquire-psamount": (200, {"rt_cd": "0", "output": {"ord_psbl_frcr_amt": "1234.5"}}),
+            "inquire-balance": (200, {"rt_cd": "0", "output1": [], "output2": {"frcr_drwg_psbl_amt_1": "99.0"}}),
+        })
+
+        async def main():
+            async with client:
+                return await asyncio.gather(
+                    client.get_overseas_price("SOXL"),
+                    client.get_cash_balance("SOXL", 25.0),
+                    client.get_balance(),
+                )
+
+        quote, cash, balance = asyncio.run(main())
+
+        assert quote["price"] == 25.50 and quote["volume"] == 100
+        assert cash == 1234.5
+        assert balance == 99.0
+        assert len(calls) == 3
+        # 사전 등록 거래소(SOXL → AMS) 사용, 주문 거래소 코드도 동일 소스
+        price_call = next(c for c in calls if "quotations/price" in c[1])
+        assert price_call[3]["EXCD"] == "AMS"
+        psamount_call = next(c for c in calls if "inquire-psamount" in c[1])
+        assert psamount_call[3]["OVRS_EXCG_CD"] == "AMEX"
+
+    def test_order_with_skip_hashkey(self, rest):
+        """SKIP 모드 주문은 POST 1회, 지연 통계 기록"""
+        rest.hashkey_mode = "SKIP"
+        client, calls = make_client(rest, {
+            "trading/order": (200, {"rt_cd": "0", "output": {"ODNO": "A1"}, "msg1": "OK"}),
+        })
+
+        result = asyncio.run(client.send_buy_order("SOXL", 3, 25.0))
+
+        assert result.status == "success" and result.order_no == "A1"
+        assert len(calls) == 1
+        assert "hashkey" not in calls[0][2]
+        assert rest.order_latency.summary()["total"]["count"] == 1
+
+    def test_order_with_hashkey(self, rest):
+        """ALWAYS 모드는 Hashkey 발급 후 헤더에 포함"""
+        rest.hashkey_mode = "ALWAYS"
+        client, calls = make_client(rest, {
+            "hashkey": (200, {"HASH": "h123"}),
+            "trading/order": (200, {"rt_cd": "1", "msg1": "주문가능수량 초과"}),
+        })
+
+        result = asyncio.run(client.send_sell_order("SOXL", 3, 25.0))
+
+        assert result.status == "failed"
+        assert [c[0] for c in calls] == ["POST", "POST"]
+        assert calls[1][2]["hashkey"] == "h123"
+
+    def test_fill_status_uses_shared_poller(self, rest):
+        """체결 조회는 동기 어댑터의 체결내역 일괄 조회 캐시를 공유"""
+        rest.fetch_fill_statuses = Mock(return_value={
+            "1": {"status": "완료", "filled_qty": 3, "filled_price": 25.0, "unfilled_qty": 0, "reject_reason": ""},
+        })
+        rest.fill_poller._fetch = rest.fetch_fill_statuses
+        client, calls = make_client(rest, {})
+
+        async def main():
+            return await asyncio.gather(
+                client.get_order_fill_status("0000000001"),
+                client.get_order_fill_status("1"),
+            )
+        statuses = asyncio.run(main())
+
+        assert [s["filled_qty"] for s in statuses] == [3, 3]
+        assert rest.fetch_fill_statuses.call_count == 1
+        assert calls == []
+
+    def test_fill_status_fetch_error(self, rest):
+        """체결내역 조회 실패는 '오류' 상태로 반환"""
+        rest.fill_poller._fetch = Mock(return_value=None)
+        client, _ = make_client(rest, {})
+
+        status = asyncio.run(client.get_order_fill_status("A1"))
+
+        assert status["status"] == "오류"
+        assert status["filled_qty"] == 0
+
+
+class TestAsyncKisRunner:
+    """AsyncKisRunner 테스트"""
+
+    def test_reuses_client_on_one_loop(self, rest):
+        """호출마다 같은 클라이언트/이벤트 루프를 사용하고 close()로 정리"""
+        runner = AsyncKisRunner(rest)
+
+        async def loop_of(client):
+            return client, asyncio.get_running_loop()
+
+        first, second = runner.run(loop_of), runner.run(loop_of)
+        assert first == second
+        assert first[0] is runner.client
+
+        runner.close()
+        runner.close()
+        with pytest.raises(RuntimeError):
+            runner.run(loop_of)
+
+
+class TestPhoenixFetchPriceAndCash:
+    """phoenix_main._fetch_price_and_cash 테스트"""
+
+    def _system(self, rest):
+        from phoenix_main import PhoenixTradingSystem
+
+        system = PhoenixTradingSystem.__new__(PhoenixTradingSystem)
+        system.settings = Mock(ticker="SOXL")
+        system.kis_adapter = rest
+        system.async_http = None
+        return system
+
+    def test_concurrent_path(self, rest, monkeypatch):
+        """aiohttp 사용 가능 시 비동기 클라이언트로 동시 조회"""
+        import phoenix_main
+
+        async def fake_price(self, ticker):
+            return {"price": 25.0}
+
+        async def fake_cash(self, ticker="SOXL", price=1.0, account_no=""):
+            return price * 100
+
+        monkeypatch.setattr(phoenix_main, "AIOHTTP_AVAILABLE", True)
+        monkeypatch.setattr(phoenix_main.config, "KIS_ASYNC_HTTP", True)
+        monkeypatch.setattr(AsyncKisRestAdapter, "get_overseas_price", fake_price)
+        monkeypatch.setattr(AsyncKisRestAdapter, "get_cash_balance", fake_cash)
+
+        system = self._system(rest)
+        try:
+            price_data, balance = system._fetch_price_and_cash(price_hint=24.0)
+            assert price_data == {"price": 25.0}
+            assert balance == 2400.0  # 직전 시세 기준 예수금 조회
+
+            runner = system.async_http
+            price_data, balance = system._fetch_price_and_cash()
+            assert balance == 2500.0  # 직전 시세 없음(시작 시) → 조회한 현재가 기준
+            assert system.async_http is runner  # 같은 클라이언트/루프 재사용
+        finally:
+            system.async_http.close()
+        assert not runner._thread.is_alive()
+
+    def test_sequential_fallback(self, rest, monkeypatch):
+        """aiohttp 미설치 시 동기 어댑터로 순차 조회"""
+        import phoenix_main
+
+        monkeypatch.setattr(phoenix_main, "AIOHTTP_AVAILABLE", False)
+        rest.get_overseas_price = Mock(return_value={"price": 25.0})
+        rest.get_cash_balance = Mock(return_value=500.0)
+
+        price_data, balance = self._system(rest)._fetch_price_and_cash()
+
+        assert (price_data, balance) == ({"price": 25.0}, 500.0)
+        rest.get_cash_balance.assert_called_once_with(ticker="SOXL", price=25.0)
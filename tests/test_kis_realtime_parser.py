@@ -0,0 +1,118 @@
+"""
+src/kis_realtime_parser.py 단위 테스트
+
+테스트 범위:
+1. 데이터 프레임 헤더 분리 / 제어 메시지 구분
+2. HDFSCNT0 단건/다건 레코드 해석
+3. 형식 오류 프레임
+4. PINGPONG 판별
+5. 어댑터 프레임 처리 (체결가 콜백, 다건 체결통보, 구독 키)
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.fill_registry import FillRegistry
+from src.kis_realtime_parser import (
+    HDFSCNT0_FIELD_COUNT, RealtimeTick, is_data_frame, split_frame, parse_price_ticks,
+    parse_control, is_pingpong
+)
+from src.kis_rest_adapter import KisRestAdapter
+
+
+def price_record(last="25.50", evol="10", tvol="1000", bid="25.49", ask="25.51", xhms="093001"):
+    """HDFSCNT0 레코드 1건 ('^' 구분 필드 26개)"""
+    fields = ["0"] * HDFSCNT0_FIELD_COUNT
+    fields[0], fields[1], fields[4], fields[5] = "DAMSSOXL", "SOXL", "20260116", xhms
+    fields[11], fields[15], fields[16], fields[19], fields[20] = last, bid, ask, evol, tvol
+    return "^".join(fields)
+
+
+def price_frame(*records):
+    return f"0|HDFSCNT0|{len(records):03d}|" + "^".join(records)
+
+
+PINGPONG = json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "20260116093001"}})
+
+
+class TestFrame:
+    """프레임 헤더 / 제어 메시지 테스트"""
+
+    def test_split_frame(self):
+        frame = split_frame("1|H0GSCNI0|002|ciphertext")
+        assert (frame.encrypted, frame.tr_id, frame.count, frame.payload) == (True, "H0GSCNI0", 2, "ciphertext")
+
+    def test_data_frame_vs_control(self):
+        assert is_data_frame(price_frame(price_record()))
+        assert not is_data_frame(PINGPONG)
+
+    def test_pingpong(self):
+        assert is_pingpong(parse_control(PINGPONG))
+        assert not is_pingpong(parse_control('{"header": {"tr_id": "HDFSCNT0"}, "body": {"rt_cd": "0"}}'))
+        assert parse_control("not json") == {}
+
+
+class TestParsePriceTicks:
+    """HDFSCNT0 해석 테스트"""
+
+    def test_single_record(self):
+        frame = split_frame(price_frame(price_record()))
+        assert parse_price_ticks(frame.payload, frame.count) == [
+            RealtimeTick("SOXL", 25.5, 10, 25.49, 25.51, 1000, "20260116093001")
+        ]
+
+    def test_multi_record_in_order(self):
+        frame = split_frame(price_frame(
+            price_record(last="25.50", xhms="093001"),
+            price_record(last="25.60", xhms="093002"),
+            price_record(last="25.40", xhms="093003"),
+        ))
+        ticks = parse_price_ticks(frame.payload, frame.count)
+        assert [t.price for t in ticks] == [25.5, 25.6, 25.4]
+        assert ticks[-1].exchange_time == "20260116093003"
+
+    @pytest.mark.parametrize("message", [
+        "0|HDFSCNT0|001|DAMSSOXL^SOXL^4",                          # 필드 부족
+        "0|HDFSCNT0|002|" + price_record() + "^extra",             # 레코드 수 불일치
+    ])
+    def test_malformed_frame(self, message):
+        frame = split_frame(message)
+        assert parse_price_ticks(frame.payload, frame.count) == []
+
+    def test_bad_header_and_bad_value(self):
+        assert split_frame("0|HDFSCNT0") is None
+        assert split_frame("0|HDFSCNT0|abc|x") is None
+
+        frame = split_frame(price_frame(price_record(last="x"), price_record(last="25.60")))
+        assert [t.price for t in parse_price_ticks(frame.payload, frame.count)] == [25.6]
+
+
+class TestAdapterFrames:
+    """KisRestAdapter 실시간 프레임 처리 테스트"""
+
+    @pytest.fixture
+    def adapter(self):
+        adapter = KisRestAdapter(app_key="test_app_key", app_secret="test_app_secret", account_no="12345678-01")
+        adapter.fill_registry = FillRegistry()
+        return adapter
+
+    def test_ticks_dispatched_to_callback(self, adapter):
+        adapter.price_callback = MagicMock()
+        adapter._handle_ws_frame(price_frame(price_record(last="25.50"), price_record(last="25.60")))
+
+        ticks = [call.args[0] for call in adapter.price_callback.call_args_list]
+        assert [t.price for t in ticks] == [25.5, 25.6]
+
+    def test_multi_record_fill_notice(self, adapter):
+        def notice(order_no, qty):
+            return "^".join(["hts_id", "1234567801", order_no, "", "02", "0", "00", "SOXL",
+                             qty, "25.50", "093001", "0", "2", "1", "", "10"])
+
+        adapter._handle_ws_frame("0|H0GSCNI0|002|" + notice("0030000001", "3") + "^" + notice("0030000001", "2"))
+        assert adapter.fill_registry.get("30000001").filled_qty == 5
+
+    def test_price_subscription_key(self, adapter):
+        adapter._quote_exchange_order = MagicMock(return_value=["AMS", "NAS", "NYS"])
+        assert adapter._price_tr_key("SOXL") == "DAMSSOXL"
@@ -3,6 +3,7 @@ Phoenix Trading System - KisRestAdapter 테스트
 
 한국투자증권(KIS) REST API 어댑터 단위 테스트 (Mock 기반)
 """
+import threading
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
@@ -101,7 +102,7 @@ class TestKisRestAdapter:
     # =====================
 
     @patch('src.kis_rest_adapter.Path.exists')
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_login_success(self, mock_post, mock_path_exists, adapter):
         """로그인 성공 테스트 - Token + Approval Key 발급"""
         # 토큰 캐시 파일 없음
@@ -146,7 +147,7 @@ class TestKisRestAdapter:
         assert "secretkey" in mock_post.call_args_list[1][1]["json"]
 
     @patch('src.kis_rest_adapter.Path.exists')
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_login_failure(self, mock_post, mock_path_exists, adapter):
         """로그인 실패 테스트"""
         # 토큰 캐시 파일 없음
@@ -167,7 +168,7 @@ class TestKisRestAdapter:
     # 2. 시세 조회 테스트
     # =====================
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_overseas_price_success(self, mock_get, adapter):
         """시세 조회 성공 테스트"""
         # 토큰 설정 (인증 통과)
@@ -201,7 +202,7 @@ class TestKisRestAdapter:
         assert result["low"] == 44.50
         assert result["volume"] == 1234567
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_overseas_price_failure(self, mock_get, adapter):
         """시세 조회 실패 테스트 - HTTP 에러"""
         # 토큰 설정
@@ -219,7 +220,7 @@ class TestKisRestAdapter:
         # 검증
         assert result is None
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_price_query_business_error(self, mock_get, adapter):
         """🔥 실제 KIS API 에러 형식 - HTTP 200 + rt_cd='1'"""
         # 토큰 설정
@@ -242,11 +243,55 @@ class TestKisRestAdapter:
         # 검증: rt_cd="1"일 때 None 반환
         assert result is None
 
+    @patch('src.kis_rest_adapter.requests.Session.get')
+    def test_price_exchange_cache(self, mock_get, adapter):
+        """[v4.3] 조회에 성공한 거래소를 기억하고, 실패하면 재탐색"""
+        adapter.access_token = "test_token"
+        adapter.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        def respond(url, **kwargs):
+            resp = Mock(status_code=200)
+            listed = kwargs["params"]["EXCD"] == listed_on[0]
+            resp.json.return_value = {"rt_cd": "0", "output": {"last": "25.50" if listed else ""}}
+            return resp
+
+        mock_get.side_effect = respond
+        listed_on = ["NYS"]
+
+        # 첫 조회: NAS → AMS → NYS 탐색, 이후 NYS만 조회
+        assert adapter.get_overseas_price("TEST")["price"] == 25.50
+        assert mock_get.call_count == 3
+        assert adapter.get_overseas_price("TEST")["price"] == 25.50
+        assert mock_get.call_count == 4
+        assert adapter.get_order_exchange("TEST") == "NYSE"
+
+        # 거래소 변경: 캐시된 NYS 실패 → NAS에서 재발견
+        listed_on[0] = "NAS"
+        mock_get.reset_mock()
+        assert adapter.get_overseas_price("TEST")["price"] == 25.50
+        assert [c.kwargs["params"]["EXCD"] for c in mock_get.call_args_list] == ["NYS", "NAS"]
+        assert adapter.get_order_exchange("TEST") == "NASD"
+
+    @patch('src.kis_rest_adapter.requests.Session.get')
+    def test_preloaded_exchange_queried_first(self, mock_get, adapter):
+        """[v4.3] config 사전 등록 종목(SOXL → AMS)은 첫 조회부터 1회 왕복"""
+        adapter.access_token = "test_token"
+        adapter.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        price_resp = Mock(status_code=200)
+        price_resp.json.return_value = {"rt_cd": "0", "output": {"last": "25.50"}}
+        mock_get.return_value = price_resp
+
+        assert adapter.get_overseas_price("SOXL")["price"] == 25.50
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["params"]["EXCD"] == "AMS"
+        assert adapter.get_order_exchange("SOXL") == "AMEX"
+
     # =====================
     # 3. 주문 실행 테스트
     # =====================
 
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_send_buy_order_success(self, mock_post, adapter):
         """매수 주문 성공 테스트"""
         # 토큰 설정
@@ -273,7 +318,7 @@ class TestKisRestAdapter:
         assert result.order_no == "ORDER123456"
         assert result.status == "success"
 
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_send_sell_order_success(self, mock_post, adapter):
         """매도 주문 성공 테스트"""
         # 토큰 설정
@@ -300,7 +345,7 @@ class TestKisRestAdapter:
         assert result.order_no == "ORDER789012"
         assert result.status == "success"
 
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_send_order_failure(self, mock_post, adapter):
         """주문 실패 테스트"""
         # 토큰 설정
@@ -324,7 +369,7 @@ class TestKisRestAdapter:
         assert result.status == "failed"
         assert "잔고 부족" in result.message
 
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_order_requires_hashkey(self, mock_post, adapter):
         """🔥 Hashkey 강제 검증 - 실거래 필수 테스트"""
         # 토큰 설정
@@ -364,7 +409,7 @@ class TestKisRestAdapter:
         assert "hashkey" in order_call[1]["headers"]
         assert order_call[1]["headers"]["hashkey"] == "deadbeef123456"
 
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_order_business_error_with_msg_cd(self, mock_post, adapter):
         """🔥 주문 비즈니스 에러 - rt_cd='1' + msg_cd 검증"""
         # 토큰 설정
@@ -397,11 +442,87 @@ class TestKisRestAdapter:
         assert "주문가능수량" in result.message
         # msg_cd가 로그에 기록되는지는 로그 확인 필요 (현재 코드는 msg1만 사용)
 
+    @patch('src.kis_rest_adapter.requests.Session.post')
+    def test_order_hashkey_skip_mode(self, mock_post, adapter):
+        """[v4.3] SKIP 모드: Hashkey 왕복 없이 주문 1회 POST + 지연 통계 기록"""
+        adapter.access_token = "test_token"
+        adapter.token_expires_at = datetime.now() + timedelta(hours=1)
+        adapter.hashkey_mode = "SKIP"
+
+        order_resp = Mock(status_code=200)
+        order_resp.json.return_value = {"rt_cd": "0", "output": {"ODNO": "ORDER1"}, "msg1": "OK"}
+        mock_post.return_value = order_resp
+
+        result = adapter.send_buy_order("SOXL", 10, 45.0)
+
+        assert result.status == "success"
+        assert mock_post.call_count == 1
+        assert "hashkey" not in mock_post.call_args.kwargs["headers"]
+        stats = adapter.order_latency.summary()
+        assert stats["total"]["count"] == 1
+        assert stats["hashkey"]["max"] < 1.0
+
+    @patch('src.kis_rest_adapter.requests.Session.post')
+    def test_order_hashkey_cache_mode(self, mock_post, adapter):
+        """[v4.3] CACHE 모드: 같은 주문 내용이면 Hashkey 재사용"""
+        adapter.access_token = "test_token"
+        adapter.token_expires_at = datetime.now() + timedelta(hours=1)
+        adapter.hashkey_mode = "CACHE"
+
+        hashkey_resp = Mock(status_code=200)
+        hashkey_resp.json.return_value = {"HASH": "cached_hash"}
+        order_resp = Mock(status_code=200)
+        order_resp.json.return_value = {"rt_cd": "0", "output": {"ODNO": "ORDER1"}, "msg1": "OK"}
+        mock_post.side_effect = [hashkey_resp, order_resp, order_resp]
+
+        adapter.send_buy_order("SOXL", 10, 45.0)
+        adapter.send_buy_order("SOXL", 10, 45.0)
+
+        assert mock_post.call_count == 3  # hashkey 1 + 주문 2
+        assert mock_post.call_args.kwargs["headers"]["hashkey"] == "cached_hash"
+        assert adapter.order_latency.hashkey_cache_hits == 1
+
+    def test_hashkey_cache_lru_eviction(self, adapter, monkeypatch):
+        """[v4.3] Hashkey 캐시는 가득 차면 가장 오래 쓰지 않은 항목만 제거"""
+        monkeypatch.setattr("src.kis_rest_adapter.HASHKEY_CACHE_SIZE", 2)
+        adapter.hashkey_mode = "CACHE"
+        payloads = [{"ORD_QTY": str(qty)} for qty in (1, 2, 3)]
+
+        for index, payload in enumerate(payloads[:2]):
+            _, cache_key = adapter._hashkey_lookup(payload)
+            adapter._hashkey_store(cache_key, f"h{index}")
+        assert adapter._hashkey_lookup(payloads[0])[0] == "h0"     # 1번 최근 사용
+        _, cache_key = adapter._hashkey_lookup(payloads[2])
+        adapter._hashkey_store(cache_key, "h2")
+
+        assert [adapter._hashkey_lookup(p)[0] for p in payloads] == ["h0", None, "h2"]
+
+    def test_hashkey_cache_thread_safe(self, adapter):
+        """[v4.3] 여러 스레드에서 Hashkey 캐시/통계를 갱신해도 누락 없음"""
+        adapter.hashkey_mode = "CACHE"
+        _, cache_key = adapter._hashkey_lookup({"ORD_QTY": "1"})
+        adapter._hashkey_store(cache_key, "h1")
+
+        def worker(n):
+            for i in range(200):
+                adapter._hashkey_lookup({"ORD_QTY": "1"})
+                _, key = adapter._hashkey_lookup({"ORD_QTY": f"{n}-{i}"})
+                adapter._hashkey_store(key, "h")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert adapter.order_latency.hashkey_cache_hits == 8 * 200
+        assert len(adapter._hashkey_cache) <= 256
+
     # =====================
     # 4. 계좌 조회 테스트
     # =====================
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_balance_success(self, mock_get, adapter):
         """계좌 잔고 조회 성공 테스트"""
         # 토큰 설정
@@ -426,7 +547,7 @@ class TestKisRestAdapter:
         # 검증
         assert balance == 5000.50
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_balance_failure(self, mock_get, adapter):
         """계좌 잔고 조회 실패 테스트"""
         # 토큰 설정
@@ -448,7 +569,7 @@ class TestKisRestAdapter:
     # 5. 호환성 메서드 테스트
     # =====================
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_us_stock_price_compatibility(self, mock_get, adapter):
         """get_us_stock_price 호환성 메서드 테스트"""
         # 토큰 설정
@@ -476,7 +597,7 @@ class TestKisRestAdapter:
         # 검증
         assert price == 50.25
 
-    @patch('src.kis_rest_adapter.requests.get')
+    @patch('src.kis_rest_adapter.requests.Session.get')
     def test_get_account_balance_compatibility(self, mock_get, adapter):
         """get_account_balance 호환성 메서드 테스트"""
         # 토큰 설정
@@ -501,7 +622,7 @@ class TestKisRestAdapter:
         # 검증
         assert balance == 10000.00
 
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_send_order_compatibility(self, mock_post, adapter):
         """send_order 호환성 메서드 테스트"""
         # 토큰 설정
@@ -553,7 +674,7 @@ class TestKisRestAdapter:
     # =====================
 
     @patch('src.kis_rest_adapter.Path.exists')
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_token_refresh(self, mock_post, mock_path_exists, adapter):
         """🔥 토큰 자동 갱신 테스트 - Token + Approval Key 모두 갱신"""
         # 토큰 캐시 파일 없음
@@ -592,8 +713,8 @@ class TestKisRestAdapter:
         assert "Bearer new_token_67890" in headers["authorization"]
 
     @patch('src.kis_rest_adapter.Path.exists')
-    @patch('src.kis_rest_adapter.requests.get')
-    @patch('src.kis_rest_adapter.requests.post')
+    @patch('src.kis_rest_adapter.requests.Session.get')
+    @patch('src.kis_rest_adapter.requests.Session.post')
     def test_api_call_with_expired_token(self, mock_post, mock_get, mock_path_exists, adapter):
         """🔥 만료 토큰 자동 갱신 후 API 호출 성공 시나리오"""
         # 토큰 캐시 파일 없음
@@ -638,6 +759,57 @@ class TestKisRestAdapter:
         assert mock_post.call_count == 2  # token + approval
         assert mock_get.call_count == 1  # price query
 
+    @patch('src.kis_rest_adapter.requests.Session.post')
+    def test_background_refresh_ahead_of_expiry(self, mock_post, adapter):
+        """[v4.3] 갱신 시점이 되면 백그라운드 스레드가 토큰 교체, 요청 경로는 갱신하지 않음"""
+        import threading
+
+        adapter.access_token = "old_token"
+        adapter.approval_key = "old_approval"
+        adapter.token_expires_at = datetime.now() + timedelta(minutes=30)  # 갱신 기준(60분) 이내
+
+        token_resp = Mock(status_code=200)
+        token_resp.json.return_value = {"access_token": "bg_token", "expires_in": 86400}
+        approval_resp = Mock(status_code=200)
+        approval_resp.json.return_value = {"approval_key": "bg_approval"}
+        mock_post.side_effect = [token_resp, approval_resp]
+
+        # 요청 경로: 만료 5분 전이 아니므로 OAuth 호출 없이 기존 토큰 헤더
+        old_headers = adapter._get_headers(tr_id="TEST_TR_ID")
+        assert old_headers["authorization"] == "Bearer old_token"
+        assert mock_post.call_count == 0
+
+        refreshed = threading.Event()
+        original_renew = adapter.token_manager._renew
+        adapter.token_manager._renew = lambda: (original_renew(), refreshed.set())
+
+        with patch('builtins.open', MagicMock()):
+            adapter.token_manager.start()
+            assert refreshed.wait(timeout=5)
+            adapter.token_manager.stop()
+
+        assert adapter.token_manager.refresh_count == 1
+        assert adapter.token_manager.seconds_until_refresh() > 0
+        assert adapter.approval_key == "bg_approval"
+        assert adapter._get_headers(tr_id="TEST_TR_ID")["authorization"] == "Bearer bg_token"
+
+    def test_headers_cached_per_tr_id(self, adapter):
+        """[v4.3] 같은 tr_id 헤더는 재사용, hashkey는 복사본에만 추가"""
+        adapter.access_token = "test_token"
+        adapter.token_expires_at = datetime.now() + timedelta(hours=1)
+
+        first = adapter._get_headers(tr_id="TR_A")
+        assert adapter._get_headers(tr_id="TR_A") is first
+        assert adapter._get_headers(tr_id="TR_B")["tr_id"] == "TR_B"
+
+        with_hash = adapter._get_headers(tr_id="TR_A", hashkey="HASH")
+        assert with_hash["hashkey"] == "HASH"
+        assert "hashkey" not in first
+
+        # 토큰 교체 시 캐시 무효화
+        adapter.access_token = "new_token"
+        assert adapter._get_headers(tr_id="TR_A")["authorization"] == "Bearer new_token"
+
     # =====================
     # 7. 연결 상태 테스트
     # =====================
@@ -681,6 +853,28 @@ class TestKisRestAdapter:
         assert adapter.access_token is None
         assert adapter.token_expires_at is None
 
+    @patch('src.kis_rest_adapter.requests.Session.get')
+    def test_requests_share_pooled_session(self, mock_get, adapter):
+        """[v4.3] 모든 REST 호출은 같은 연결 풀 세션 + 종류별 타임아웃 사용"""
+        import config
+
+        pool = adapter.session.get_adapter(adapter.BASE_URL)
+        assert pool._pool_maxsize == config.KIS_HTTP_POOL_SIZE
+        assert pool.max_retries.read == 0
+        assert "POST" not in pool.max_retries.allowed_methods
+
+        adapter.access_token = "test_token"
+        adapter.token_expires_at = datetime.now() + timedelta(hours=1)
+        price_resp = Mock(status_code=200)
+        price_resp.json.return_value = {"rt_cd": "0", "output": {"last": "25.50"}}
+        mock_get.return_value = price_resp
+
+        adapter.get_overseas_price("SOXL")
+        adapter.get_overseas_price("SOXL")
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["timeout"] == config.KIS_HTTP_TIMEOUTS["quote"]
+
     # =====================
     # 8. JSON Schema 검증 테스트 (실제 API 스펙 준수 확인)
     # =====================
@@ -795,9 +989,10 @@ class TestKisRestAdapter:
 
         jsonschema.validate(instance=error_response, schema=PRICE_RESPONSE_SCHEMA)
 
-    @patch('src.kis_rest_adapter.requests.post')
-    def test_mock_responses_follow_schema(self, mock_post, adapter):
+    @patch('src.kis_rest_adapter.requests.Session.post')
+    def test_mock_responses_follow_schema(self, mock_post, adapter, tmp_path, monkeypatch):
         """🔥 Mock 응답이 실제 스키마를 준수하는지 검증 (통합 테스트)"""
+        monkeypatch.chdir(tmp_path)  # login()의 토큰 캐시 파일을 저장소 밖에 기록
         # Token 응답 Mock
         token_resp = Mock()
         token_resp.status_code = 200
@@ -0,0 +1,211 @@
+"""
+src/order_manager.py 단위 테스트
+
+실제 GridEngineV4와 함께 사용하고, 주문 API(send_order)와 체결 대기 함수만 대체한다.
+
+테스트 범위:
+1. 전송 전 Tier 예약 (매수 ORDERING / 매도 SELLING) → 체결 대기 중 중복 신호/중복 주문 없음
+2. 체결 확인 스레드에서 confirm_order 반영
+3. 매수/매도 주문 동시 대기
+4. 주문 실패 / 미체결 처리 / 접수 후 상태 불일치
+"""
+
+import threading
+from dataclasses import replace
+from itertools import count
+from unittest.mock import Mock
+
+import pytest
+
+from src.grid_engine_v4_state_machine import GridEngineV4
+from src.order_manager import OrderManager
+from tier_state_machine import TierState
+
+
+@pytest.fixture
+def engine(grid_settings_tier1_enabled):
+    settings = replace(grid_settings_tier1_enabled, tier1_auto_update=False)
+    return GridEngineV4(settings)
+
+
+@pytest.fixture
+def adapter():
+    order_ids = count(1)
+    adapter = Mock()
+    adapter.send_order.side_effect = lambda **kw: {
+        "status": "SUCCESS", "order_id": f"A{next(order_ids)}", "filled_qty": 0, "filled_price": 0.0, "message": ""
+    }
+    return adapter
+
+
+class GatedFill:
+    """release() 전까지 체결 대기를 막는 wait_for_fill 대체 함수"""
+
+    def __init__(self, filled_qty=None, filled_price=None):
+        self.filled_qty = filled_qty
+        self.filled_price = filled_price
+        self.started = threading.Semaphore(0)
+        self._gate = threading.Event()
+
+    def __call__(self, order_id, expected_qty):
+        self.started.release()
+        self._gate.wait(5)
+        qty = expected_qty if self.filled_qty is None else self.filled_qty
+        return self.filled_price or 0.0, qty
+
+    def release(self):
+        self._gate.set()
+
+
+def buy_signal(engine, tier=3):
+    signals = engine.process_tick(engine.calculate_tier_price(tier))
+    return next(s for s in signals if s.action == "BUY")
+
+
+def states(engine, tiers):
+    return [engine.state_machine.get_tier(t).state for t in tiers]
+
+
+class TestOrderManager:
+    """OrderManager 테스트"""
+
+    def test_buy_resolved_in_background(self, engine, adapter):
+        """체결 대기 중에도 틱 처리가 계속되고, 체결 후 Tier가 FILLED로"""
+        fill = GatedFill(filled_price=9.9)
+        filled = []
+        manager = OrderManager(adapter, engine, "SOXL", wait_for_fill=fill, on_filled=filled.append)
+
+        signal = buy_signal(engine)
+        assert manager.submit(signal) == "A1"
+        assert fill.started.acquire(timeout=5)
+
+        # 체결 대기 중: ORDERING 상태, 같은 가격 틱에서 중복 매수 신호 없음
+        assert states(engine, signal.tiers) == [TierState.ORDERING] * len(signal.tiers)
+        assert manager.pending_count == 1
+        assert manager.reserved_buy_amount == pytest.approx(signal.quantity * signal.price)
+        assert engine.process_tick(signal.price) == []
+
+        fill.release()
+        manager.shutdown()
+
+        assert states(engine, signal.tiers) == [TierState.FILLED] * len(signal.tiers)
+        assert sum(p.quantity for p in engine.positions) == signal.quantity
+        assert manager.pending_count == 0
+        assert filled[0].order_id == "A1" and filled[0].filled_qty == signal.quantity
+
+    def test_buy_and_sell_pending_together(self, engine, adapter):
+        """매도 체결 대기 중에도 매수 주문이 접수되어 동시에 대기"""
+        held = buy_signal(engine, tier=1)
+        engine.execute_buy(held, actual_filled_price=held.price, actual_filled_qty=held.quantity)
+
+        fill = GatedFill()
+        manager = OrderManager(adapter, engine, "SOXL", wait_for_fill=fill)
+
+        sell_price = engine.state_machine.get_tier(1).sell_price
+        sell = next(s for s in engine.process_tick(sell_price) if s.action == "SELL")
+        manager.submit(sell)
+        assert states(engine, sell.tiers) == [TierState.SELLING]
+        assert engine.process_tick(sell_price) == []  # SELLING Tier는 다시 매도 대상 아님
+
+        manager.submit(buy_signal(engine, tier=4))
+        assert fill.started.acquire(timeout=5) and fill.started.acquire(timeout=5)
+        assert manager.pending_count == 2
+
+        fill.release()
+        manager.shutdown()
+
+        assert states(engine, sell.tiers) == [TierState.EMPTY]
+        assert manager.filled_count == 2
+
+    def test_unfilled_sell_keeps_position(self, engine, adapter):
+        """매도 미체결 시 FILLED로 복원 (다음 틱에서 다시 매도 대상)"""
+        held = buy_signal(engine, tier=1)
+        engine.execute_buy(held, actual_filled_price=held.price, actual_filled_qty=held.quantity)
+
+        failed = []
+        manager = OrderManager(adapter, engine, "SOXL", wait_for_fill=lambda *a: (0.0, 0), on_failed=failed.append)
+
+        sell_price = engine.state_machine.get_tier(1).sell_price
+        manager.submit(next(s for s in engine.process_tick(sell_price) if s.action == "SELL"))
+        manager.shutdown()
+
+        assert states(engine, (1,)) == [TierState.FILLED]
+        assert failed and "체결 수량 0" in failed[0].error_message
+        assert any(s.action == "SELL" for s in engine.process_tick(sell_price))
+
+    def test_order_rejected(self, engine, adapter):
+        """주문 접수 실패 시 매수 Tier 예약 해제 (EMPTY로 복원, 다음 틱에서 재시도)"""
+        adapter.send_order.side_effect = None
+        adapter.send_order.return_value = {"status": "FAILED", "order_id": "", "message": "잔고 부족"}
+        wait = Mock()
+        manager = OrderManager(adapter, engine, "SOXL", wait_for_fill=wait)
+
+        signal = buy_signal(engine)
+        assert manager.submit(signal) is None
+
+        assert states(engine, signal.tiers) == [TierState.EMPTY] * len(signal.tiers)
+        assert manager.pending_count == 0 and manager.failed_count == 1
+        wait.assert_not_called()
+
+    def test_duplicate_sell_signal_refused(self, engine, adapter):
+        """이미 매도 주문이 나간 Tier의 두 번째 신호는 브로커로 보내지 않음"""
+        held = buy_signal(engine, tier=1)
+        engine.execute_buy(held, actual_filled_price=held.price, actual_filled_qty=held.quantity)
+        fill = GatedFill()
+        manager = OrderManager(adapter, engine, "SOXL", wait_for_fill=fill)
+
+        sell_price = engine.state_machine.get_tier(1).sell_price
+        sell = next(s for s in engine.process_tick(sell_price) if s.action == "SELL")
+        assert manager.submit(sell) == "A1"
+        assert manager.submit(sell) is None
+
+        assert adapter.send_order.call_count == 1
+        assert engine.state_machine.get_tier(1).order_id == "A1"
+        fill.release()
+        manager.shutdown()
+        assert states(engine, (1,)) == [TierState.EMPTY]
+
+    def test_accepted_order_flagged_when_transition_fails(self, engine, adapter, monkeypatch):
+        """브로커 접수 후 Tier 전이 실패 시 추적하지 않고 ERROR로 표시"""
+        failed = []
+        wait = Mock()
+        manager = OrderManager(adapter, engine, "SOXL", wait_for_fill=wait, on_failed=failed.append)
+        monkeypatch.setattr(engine, "submit_order", lambda *a: False)
+
+        signal = buy_signal(engine)
+        assert manager.submit(signal) is None
+
+        assert states(engine, signal.tiers) == [TierState.ERROR] * len(signal.tiers)
+        assert manager.pending_count == 0
+        assert failed[0].order_id == "A1" and "수동 확인" in failed[0].error_message
+        wait.assert_not_called()
+
+    def test_fill_check_disabled(self, engine, adapter):
+        """체결 확인 비활성화 시 접수 = 체결로 즉시 반영"""
+        manager = OrderManager(adapter, engine, "SOXL", wait_for_fill=None)
+
+        signal = buy_signal(engine)
+        manager.submit(signal)
+
+        assert states(engine, signal.tiers) == [TierState.FILLED] * len(signal.tiers)
+        assert manager.pending_count == 0
+
+
+class TestPhoenixProcessSignal:
+    """phoenix_main._process_signal 주문 관리자 연동 테스트"""
+
+    def test_buy_deferred_when_pending_buys_reserve_balance(self, engine):
+        """체결 대기 중인 매수 금액을 제외하면 잔고 부족 → 신호만 취소 (긴급 정지 아님)"""
+        from phoenix_main import PhoenixTradingSystem
+
+        system = PhoenixTradingSystem.__new__(PhoenixTradingSystem)
+        system.grid_engine = engine
+        system.telegram = None
+        system.order_manager = Mock(reserved_buy_amount=engine.account_balance)
+
+        signal = buy_signal(engine)
+        system._process_signal(signal)
+
+        system.order_manager.submit.assert_not_called()
+        assert states(engine, signal.tiers) == [TierState.EMPTY] * len(signal.tiers)
+        assert not getattr(system, "stop_signal", False)
@@ -0,0 +1,198 @@
+"""
+src/price_mailbox.py 단위 테스트
+
+테스트 범위:
+1. 틱 병합 (최신값 + 구간 고가/저가)
+2. 극값 발생 순서 보존
+3. take() 대기/시간 초과/닫기
+4. GridEngineV4.process_tick_batch 연동
+5. phoenix_main 실시간 시세 루프 (STREAM 모드 + REST Watchdog)
+"""
+
+import threading
+from datetime import datetime
+from dataclasses import replace
+
+import pytest
+
+from src.kis_realtime_parser import RealtimeTick
+from src.models import Position
+from src.price_mailbox import TickMailbox, TickBatch
+
+
+class TestTickMailbox:
+    """TickMailbox 테스트"""
+
+    def test_coalesces_burst_into_one_batch(self):
+        """연속 수신 틱은 하나의 구간으로 병합"""
+        mailbox = TickMailbox()
+        for price in [10.0, 10.5, 9.8, 10.1]:
+            mailbox.post(price)
+
+        batch = mailbox.poll()
+        assert (batch.last, batch.high, batch.low, batch.count) == (10.1, 10.5, 9.8, 4)
+        assert batch.high_first is True
+        assert batch.prices() == [10.5, 9.8, 10.1]
+
+        # 꺼낸 뒤에는 비어 있음
+        assert mailbox.poll() is None
+
+    def test_prices_follow_extreme_order(self):
+        """저가가 먼저 발생하면 저가 → 고가 → 마지막 순서, 중복 제거"""
+        mailbox = TickMailbox()
+        for price in [10.0, 9.5, 10.4]:
+            mailbox.post(price)
+
+        assert mailbox.poll().prices() == [9.5, 10.4]
+
+    def test_invalid_prices_ignored(self):
+        """0 이하/None 시세는 무시"""
+        mailbox = TickMailbox()
+        mailbox.post(0)
+        mailbox.post(-1.0)
+        mailbox.post(None)
+        assert mailbox.poll() is None
+
+    def test_take_waits_for_post(self):
+        """take()는 다른 스레드의 post()까지 대기"""
+        mailbox = TickMailbox()
+        timer = threading.Timer(0.05, mailbox.post, args=(12.3,))
+        timer.start()
+
+        batch = mailbox.take(timeout=2.0)
+        assert batch.last == 12.3
+
+    def test_take_timeout_and_close(self):
+        """시간 초과 시 None, close() 후 post() 무시"""
+        mailbox = TickMailbox()
+        assert mailbox.take(timeout=0.01) is None
+
+        mailbox.close()
+        mailbox.post(10.0)
+        assert mailbox.take() is None
+        assert mailbox.closed
+
+
+class TestProcessTickBatch:
+    """GridEngineV4.process_tick_batch 연동 테스트"""
+
+    def test_batch_catches_crossed_extreme(self, grid_settings_tier1_enabled):
+        """구간 저가가 매수가를 스친 경우, 마지막 가격이 회복해도 매수 신호 생성"""
+        from src.grid_engine_v4_state_machine import GridEngineV4
+
+        settings = replace(grid_settings_tier1_enabled, tier1_auto_update=False)
+        engine = GridEngineV4(settings)
+
+        mailbox = TickMailbox()
+        mailbox.post(engine.calculate_tier_price(1) * 1.01)
+        mailbox.post(engine.calculate_tier_price(3))
+        mailbox.post(engine.calculate_tier_price(1) * 1.01)
+
+        signals = engine.process_tick_batch(mailbox.poll())
+        buy_signals = [s for s in signals if s.action == "BUY"]
+        assert len(buy_signals) == 1
+        assert buy_signals[0].tiers == (1, 2, 3)
+        assert engine.current_price == pytest.approx(engine.calculate_tier_price(1) * 1.01)
+
+    def test_batch_sells_held_tier_once_at_last_price(self, grid_settings_tier1_enabled):
+        """고가/저가/마지막 가격 모두 매도가 이상이어도 매도 신호는 1건 (마지막 가격 주문, Tier 예약)"""
+        from src.grid_engine_v4_state_machine import GridEngineV4
+        from tier_state_machine import TierState
+
+        engine = GridEngineV4(replace(grid_settings_tier1_enabled, tier1_auto_update=False))
+        buy_price = engine.calculate_tier_price(5)
+        engine.positions = [Position(tier=5, quantity=2, avg_price=buy_price, invested_amount=2 * buy_price, opened_at=datetime.now())]
+        sell_price = engine.state_machine.get_tier(5).sell_price
+
+        batch = TickBatch(
+            last=sell_price * 1.008, high=sell_price * 1.01, low=sell_price * 1.006,
+            count=3, high_first=True, first_at=0.0, last_at=0.0
+        )
+        signals = engine.process_tick_batch(batch)
+
+        sell_signals = [s for s in signals if s.action == "SELL"]
+        assert len(sell_signals) == 1
+        assert sell_signals[0].tiers == (5,)
+        assert sell_signals[0].price == pytest.approx(batch.last)
+        assert engine.state_machine.get_tier(5).state == TierState.SELLING
+        assert [s for s in engine.process_tick_batch(batch) if s.action == "SELL"] == []
+
+        engine.cancel_signal(sell_signals[0])                # 전송 전 취소 → 보유 상태 복원
+        assert engine.state_machine.get_tier(5).state == TierState.FILLED
+
+
+    def test_dip_then_rally_uses_grid_before_tier1_update(self, grid_settings_tier1_enabled):
+        """저가 후 고가 구간은 틱을 하나씩 처리한 것과 같은 결과 (갱신된 격자로 매수하지 않음)"""
+        from src.grid_engine_v4_state_machine import GridEngineV4
+
+        settings = replace(grid_settings_tier1_enabled, tier1_price=100.0, tier_interval=0.005,
+                           tier1_trading_enabled=False)
+        batch = TickBatch(last=101.0, high=101.0, low=99.6, count=2, high_first=False, first_at=0.0, last_at=0.0)
+
+        engine = GridEngineV4(settings)
+        assert engine.process_tick_batch(batch) == []
+        assert engine.tier1_price == 101.0
+
+        sequential = GridEngineV4(settings)
+        assert sequential.process_tick(99.6) + sequential.process_tick(101.0) == []
+
+    def test_order_price_capped_at_tier_prices(self, grid_settings_tier1_enabled):
+        """트리거를 스친 뒤 되돌아온 구간: 매수는 Tier 매수가 이하, 매도는 Tier 매도가 이상으로 주문"""
+        from src.grid_engine_v4_state_machine import GridEngineV4
+
+        engine = GridEngineV4(replace(grid_settings_tier1_enabled, tier1_auto_update=False,
+                                      tier1_trading_enabled=False))
+        tier3_price = engine.calculate_tier_price(3)
+        batch = TickBatch(last=engine.tier1_price, high=engine.tier1_price, low=tier3_price,
+                          count=2, high_first=True, first_at=0.0, last_at=0.0)
+        [buy] = engine.process_tick_batch(batch)
+        assert buy.tiers == (2, 3)
+        assert buy.price == pytest.approx(tier3_price)
+
+        buy_price = engine.calculate_tier_price(5)
+        engine.positions = [Position(tier=5, quantity=2, avg_price=buy_price, invested_amount=2 * buy_price, opened_at=datetime.now())]
+        sell_price = engine.state_machine.get_tier(5).sell_price
+        batch = TickBatch(last=sell_price * 0.99, high=sell_price * 1.01, low=sell_price * 0.99,
+                          count=2, high_first=True, first_at=0.0, last_at=0.0)
+        [sell] = engine.process_tick_batch(batch)
+        assert sell.tiers == (5,)
+        assert sell.price == pytest.approx(sell_price)
+
+
+class TestStreamLoop:
+    """phoenix_main 실시간 시세 루프 테스트 (STREAM 모드)"""
+
+    def test_stream_drives_ticks_and_watchdog_falls_back_to_rest(self, monkeypatch):
+        """실시간 시세는 병합 처리, 시세가 끊기면 REST 조회로 대체"""
+        import asyncio
+        from unittest.mock import Mock
+        import config
+        from phoenix_main import PhoenixTradingSystem
+
+        monkeypatch.setattr(config, "STREAM_STALE_SECONDS", 0.05)
+
+        async def fake_subscribe(ticker, callback):
+            callback(RealtimeTick("SOXL", 10.0, 1, 0.0, 0.0, 1, ""))
+            await asyncio.sleep(3600)
+
+        system = PhoenixTradingSystem.__new__(PhoenixTradingSystem)
+        system.is_running = True
+        system.stop_requested = False
+        system.settings = Mock(ticker="SOXL")
+        system.kis_adapter = Mock()
+        system.kis_adapter.subscribe_realtime_price = fake_subscribe
+        system.kis_adapter.get_overseas_price.return_value = {"price": 11.0}
+
+        handled = []
+
+        def fake_handle_price(price, batch=None):
+            handled.append((price, batch))
+            return len(handled) < 2
+
+        system._handle_price = fake_handle_price
+
+        asyncio.run(system._run_stream_loop())
+
+        assert handled[0][0] == 10.0 and handled[0][1].count == 1
+        assert handled[1] == (11.0, None)
+        system.kis_adapter.unsubscribe_realtime_price.assert_called_once()
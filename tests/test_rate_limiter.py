@@ -0,0 +1,98 @@
+"""
+src/rate_limiter.py 단위 테스트
+
+테스트 범위:
+1. 초당 한도 준수 (burst 소진 후 대기)
+2. 여러 스레드 동시 호출 시 한도 준수
+3. 우선순위 (대기 중인 주문이 잔고 조회보다 먼저)
+4. asyncio 대기
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.rate_limiter import TokenBucketRateLimiter, RequestPriority
+
+
+class TestTokenBucketRateLimiter:
+    """TokenBucketRateLimiter 테스트"""
+
+    def test_burst_then_throttle(self):
+        """burst만큼 즉시 통과, 이후 충전 속도로 제한"""
+        limiter = TokenBucketRateLimiter(rate=50, burst=3)
+
+        assert all(limiter.try_acquire() for _ in range(3))
+        assert limiter.try_acquire() is False
+
+        started = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - started >= 0.015
+
+    def test_threads_share_budget(self):
+        """동시 호출해도 토큰 수 이상 통과하지 않음"""
+        limiter = TokenBucketRateLimiter(rate=100, burst=1)
+        stamps = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(5):
+                limiter.acquire(RequestPriority.QUOTE)
+                with lock:
+                    stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stamps.sort()
+        # 20건 = 초기 토큰 1 + 충전 19 → 최소 0.19초 (스케줄링 여유 포함)
+        assert stamps[-1] - stamps[0] >= 0.17
+        assert limiter.acquired_count[RequestPriority.QUOTE] == 20
+
+    def test_order_jumps_ahead_of_waiting_balance(self):
+        """토큰 부족 시 대기 중인 주문이 잔고 조회보다 먼저 통과"""
+        limiter = TokenBucketRateLimiter(rate=20, burst=1)
+        limiter.acquire()  # 토큰 소진
+
+        order = []
+        balance = threading.Thread(
+            target=lambda: (limiter.acquire(RequestPriority.BALANCE), order.append("BALANCE"))
+        )
+        balance.start()
+        time.sleep(0.01)  # 잔고 조회가 먼저 대기열에 들어감
+
+        limiter.acquire(RequestPriority.ORDER)
+        order.append("ORDER")
+        balance.join()
+
+        assert order == ["ORDER", "BALANCE"]
+
+    def test_acquire_async(self):
+        """asyncio 대기는 이벤트 루프를 막지 않음"""
+        limiter = TokenBucketRateLimiter(rate=50, burst=1)
+        limiter.acquire()
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.001)
+
+        async def main():
+            await asyncio.gather(limiter.acquire_async(RequestPriority.FILL), ticker())
+
+        asyncio.run(main())
+        assert len(ticks) == 3
+        assert limiter.acquired_count[RequestPriority.FILL] == 1
+
+    def test_invalid_settings(self):
+        """잘못된 설정은 ValueError"""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate=5, burst=0)
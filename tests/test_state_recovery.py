@@ -0,0 +1,214 @@
+"""
+src/state_recovery.py 단위 테스트
+
+테스트 범위:
+1. StateStore 기록 → 재시작 후 복구 대상 Tier / Tier 1 기준가 조회
+2. 주문별 체결내역 확인 + 브로커 보유 수량 대조 (reconcile)
+3. GridEngineV4.restore_positions / restore_order + OrderManager.resume
+4. 잔고 조회 응답 보유 수량 해석
+"""
+
+from dataclasses import replace
+from unittest.mock import Mock
+
+import pytest
+
+from src.grid_engine_v4_state_machine import GridEngineV4
+from src.kis_rest_adapter import KisRestAdapter
+from src.order_manager import OrderManager
+from src.state_recovery import RecoveredState, load_recovered_state, reconcile
+from src.state_store import StateStore
+from tier_state_machine import TierStateMachine, TierState
+
+
+def make_machine(tiers=5):
+    machine = TierStateMachine(total_tiers=tiers, account_balance=1000.0)
+    for tier_id in range(1, tiers + 1):
+        machine.initialize_tier(tier_id, buy_price=10.0 - tier_id * 0.1, sell_price=10.5)
+    return machine
+
+
+def buy(machine, tier_id, qty, price, order_id, fill=True):
+    machine.try_lock_for_buy(tier_id)
+    machine.mark_ordering(tier_id, order_id, qty)
+    if fill:
+        machine.fill_tier(tier_id, qty, price)
+        machine.mark_filled(tier_id, qty, price)
+
+
+def fill_status(status, filled_qty, unfilled_qty, price=0.0):
+    return {"status": status, "filled_qty": filled_qty, "filled_price": price,
+            "unfilled_qty": unfilled_qty, "reject_reason": ""}
+
+
+def record(tier_id, state, quantity=0, ordered_qty=0, avg_price=0.0, order_price=10.0):
+    return {"tier_id": tier_id, "state": state, "order_id": f"A{tier_id}", "ordered_qty": ordered_qty,
+            "quantity": quantity, "avg_price": avg_price, "invested_amount": quantity * avg_price,
+            "order_price": order_price, "opened_at": None}
+
+
+class TestLoadRecoveredState:
+    """StateStore 기반 복구 테스트"""
+
+    def test_recover_after_restart(self, tmp_path):
+        path = tmp_path / "state.db"
+        store = StateStore(path)
+        machine = make_machine()
+        store.save_tiers(machine.snapshot().tiers)
+        machine.add_listener(store.save_tier)
+
+        buy(machine, 1, 10, 9.9, "A1")
+        store.record_order("A2", "BUY", (2,), 20, 9.8)
+        buy(machine, 2, 20, 9.8, "A2", fill=False)          # 주문 중 중단
+        buy(machine, 3, 30, 9.7, "A3")
+        machine.transition(3, TierState.SELLING)
+        machine.sell_tier(3, 10.2)
+        machine.transition(3, TierState.SOLD)
+        machine.transition(3, TierState.EMPTY)               # 매도 완료 → 복구 대상 아님
+        store.set_meta(tier1_price=10.0, account_balance=500.0)
+        store.close()                                         # 비정상 종료 가정
+
+        reopened = StateStore(path)
+        recovered = load_recovered_state(reopened)
+        reopened.close()
+
+        assert {t: r["state"] for t, r in recovered.tiers.items()} == {1: "FILLED", 2: "ORDERING"}
+        assert recovered.tiers[1]["quantity"] == 10 and recovered.tiers[2]["ordered_qty"] == 20
+        assert recovered.tiers[2]["order_price"] == 9.8
+        assert recovered.meta == {"tier1_price": 10.0}
+        assert recovered.held_quantity == 10
+
+    def test_empty_store(self, tmp_path):
+        store = StateStore(tmp_path / "state.db")
+        recovered = load_recovered_state(store)
+        store.close()
+
+        assert recovered.tiers == {} and recovered.meta == {}
+
+
+class TestReconcile:
+    """브로커 보유 수량 대조 테스트"""
+
+    @pytest.fixture
+    def recovered(self):
+        return RecoveredState(tiers={
+            1: record(1, "FILLED", quantity=10, avg_price=10.0),
+            2: record(2, "SELLING", quantity=20, avg_price=9.9),
+            3: record(3, "ORDERING", ordered_qty=30, order_price=9.8),
+        })
+
+    def test_matched(self, recovered):
+        plan = reconcile(recovered, 30)
+        assert [(p.tier, p.quantity) for p in plan.positions] == [(1, 10), (2, 20)]
+        assert plan.unmatched == 0 and plan.live_orders == []
+
+    def test_buy_filled_during_downtime(self, recovered):
+        plan = reconcile(recovered, 60)
+        assert [(p.tier, p.quantity, p.avg_price) for p in plan.positions] == [(1, 10, 10.0), (2, 20, 9.9), (3, 30, 9.8)]
+        assert plan.unmatched == 0
+
+    def test_sell_filled_during_downtime(self, recovered):
+        plan = reconcile(recovered, 10)
+        assert [p.tier for p in plan.positions] == [1]
+        assert plan.unmatched == 0
+
+    def test_unmatched_and_unknown(self, recovered):
+        assert reconcile(recovered, 35).unmatched == 5
+        plan = reconcile(recovered, None)  # 조회 실패 → 저장된 보유 Tier만
+        assert [p.tier for p in plan.positions] == [1, 2] and plan.unmatched == 0
+
+    def test_partial_filled_counts_filled_quantity(self):
+        recovered = RecoveredState(tiers={4: record(4, "PARTIAL_FILLED", quantity=7, ordered_qty=10, avg_price=9.7)})
+        plan = reconcile(recovered, 7)
+        assert [(p.tier, p.quantity) for p in plan.positions] == [(4, 7)]
+        assert plan.unmatched == 0
+
+    def test_open_orders_retracked(self, recovered):
+        statuses = {"A2": fill_status("접수", 0, 20), "A3": fill_status("접수", 5, 25)}
+        plan = reconcile(recovered, 35, statuses)
+
+        assert [(p.tier, p.quantity) for p in plan.positions] == [(1, 10), (2, 20)]   # 매도 주문 Tier는 보유 유지
+        assert [(o.order_id, o.signal.action, o.signal.tiers, o.signal.quantity) for o in plan.live_orders] == [
+            ("A2", "SELL", (2,), 20), ("A3", "BUY", (3,), 30)
+        ]
+        assert plan.live_orders[1].signal.price == 9.8
+        assert (plan.resolved, plan.unmatched) == (2, 0)
+
+    def test_closed_orders_restored(self, recovered):
+        statuses = {"A2": fill_status("완료", 20, 0), "A3": fill_status("완료", 30, 0, price=9.75)}
+        plan = reconcile(recovered, 40, statuses)
+
+        assert [(p.tier, p.quantity, p.avg_price) for p in plan.positions] == [(1, 10, 10.0), (3, 30, 9.75)]
+        assert plan.live_orders == [] and plan.unmatched == 0
+
+    def test_rejected_and_partly_sold(self):
+        recovered = RecoveredState(tiers={
+            2: dict(record(2, "SELLING", quantity=20, avg_price=9.9), order_id="S1"),
+            3: dict(record(3, "SELLING", quantity=30, avg_price=9.8), order_id="S1"),
+            4: record(4, "ORDERING", ordered_qty=40),
+        })
+        statuses = {"S1": fill_status("완료", 35, 0), "A4": fill_status("거부", 0, 40)}
+        plan = reconcile(recovered, 15, statuses)
+
+        assert [(p.tier, p.quantity) for p in plan.positions] == [(2, 15)]           # 높은 Tier부터 매도 처리
+        assert plan.live_orders == [] and plan.unmatched == 0
+
+    def test_reserved_orders_not_sent(self):
+        recovered = RecoveredState(tiers={
+            2: dict(record(2, "SELLING", quantity=20, avg_price=9.9), order_id="RESERVED-1"),
+            3: dict(record(3, "ORDERING", ordered_qty=30), order_id="RESERVED-2"),
+        })
+        plan = reconcile(recovered, 20, {})
+        assert [(p.tier, p.quantity) for p in plan.positions] == [(2, 20)]
+        assert plan.live_orders == [] and plan.unmatched == 0
+
+
+class TestRestorePositions:
+    """GridEngineV4.restore_positions / restore_order 테스트"""
+
+    @pytest.fixture
+    def engine(self, grid_settings_tier1_enabled):
+        return GridEngineV4(replace(grid_settings_tier1_enabled, tier1_auto_update=False))
+
+    def test_restores_high_water_mark_and_positions(self, engine):
+        recovered = RecoveredState(tiers={3: record(3, "FILLED", quantity=10, avg_price=9.5)})
+        plan = reconcile(recovered, 10)
+
+        assert engine.restore_positions(12.0, plan.positions) == 1
+
+        assert engine.tier1_price == 12.0
+        assert engine.state_machine.get_tier(1).buy_price == 12.0
+        assert [(p.tier, p.quantity) for p in engine.positions] == [(3, 10)]
+        assert engine.state_machine.get_tier(3).state == TierState.FILLED
+
+    def test_live_orders_restored_and_resumed(self, engine):
+        recovered = RecoveredState(tiers={
+            2: record(2, "SELLING", quantity=20, avg_price=9.0, order_price=9.5),
+            5: record(5, "ORDERING", ordered_qty=30, order_price=8.0),
+        })
+        plan = reconcile(recovered, 20, {"A2": fill_status("접수", 0, 20), "A5": fill_status("접수", 0, 30)})
+        engine.restore_positions(10.0, plan.positions)
+
+        for order in plan.live_orders:
+            assert engine.restore_order(order.signal, order.order_id)
+        assert [(t.state, t.order_id) for t in map(engine.state_machine.get_tier, (2, 5))] == [
+            (TierState.SELLING, "A2"), (TierState.ORDERING, "A5")
+        ]
+        assert engine.process_tick(engine.state_machine.get_tier(2).sell_price) == []   # 같은 Tier로 두 번째 매도 없음
+
+        manager = OrderManager(Mock(), engine, "SOXL", wait_for_fill=lambda order_id, qty: (9.6 if order_id == "A2" else 8.0, qty))
+        for order in plan.live_orders:
+            manager.resume(order.signal, order.order_id)
+        manager.shutdown()
+
+        assert [engine.state_machine.get_tier(t).state for t in (2, 5)] == [TierState.EMPTY, TierState.FILLED]
+        assert manager.filled_count == 2
+        manager.adapter.send_order.assert_not_called()
+
+
+def test_parse_holdings():
+    data = {"rt_cd": "0", "output1": [
+        {"ovrs_pdno": "SOXL", "ovrs_cblc_qty": "120"},
+        {"ovrs_pdno": "", "ovrs_cblc_qty": "0"},
+    ]}
+    assert KisRestAdapter._parse_holdings(data) == {"SOXL": 120}
@@ -0,0 +1,122 @@
+"""
+src/state_store.py 단위 테스트
+
+테스트 범위:
+1. WAL 모드 / 재연결 후 데이터 유지
+2. TierStateMachine 리스너로 Tier 변경 기록
+3. 리스너 예외가 상태 전이를 막지 않음
+4. OrderManager 주문/체결/실패 기록
+"""
+
+from dataclasses import replace
+from unittest.mock import Mock
+
+import pytest
+
+from src.grid_engine_v4_state_machine import GridEngineV4
+from src.order_manager import OrderManager
+from src.state_store import StateStore, ORDER_FILLED, ORDER_FAILED
+from tier_state_machine import TierStateMachine, TierState
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StateStore(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+def make_machine(tiers=3):
+    machine = TierStateMachine(total_tiers=tiers, account_balance=1000.0)
+    for tier_id in range(1, tiers + 1):
+        machine.initialize_tier(tier_id, buy_price=10.0 - tier_id * 0.1, sell_price=10.5)
+    return machine
+
+
+class TestStateStore:
+    """StateStore 테스트"""
+
+    def test_wal_and_persistence(self, tmp_path):
+        path = tmp_path / "state.db"
+        store = StateStore(path)
+        assert store.journal_mode == "wal"
+        store.set_meta(tier1_price=30.0)
+        store.close()
+
+        reopened = StateStore(path)
+        assert reopened.get_meta("tier1_price") == 30.0
+        assert reopened.get_meta("missing", 0) == 0
+        reopened.close()
+
+    def test_listener_records_tier_changes(self, store):
+        machine = make_machine()
+        store.save_tiers(machine.snapshot().tiers)
+        machine.add_listener(store.save_tier)
+
+        machine.try_lock_for_buy(2)
+        machine.mark_ordering(2, "A1", 10)
+        machine.fill_tier(2, 10, 9.8)
+        machine.mark_filled(2, 10, 9.8)
+
+        tiers = {row["tier_id"]: row for row in store.load_tiers()}
+        assert set(tiers) == {1, 2, 3}
+        assert tiers[1]["state"] == "EMPTY"
+        assert (tiers[2]["state"], tiers[2]["order_id"], tiers[2]["quantity"]) == ("FILLED", "A1", 10)
+        assert tiers[2]["invested_amount"] == pytest.approx(98.0)
+        assert [row["tier_id"] for row in store.load_tiers("FILLED")] == [2]
+
+        machine.remove_listener(store.save_tier)
+        machine.reset_tier(2)
+        assert store.load_tiers("FILLED")[0]["tier_id"] == 2    # 해제 후에는 기록 안 함
+
+    def test_listener_error_does_not_block_transition(self):
+        machine = make_machine()
+        machine.add_listener(Mock(side_effect=RuntimeError("disk full")))
+
+        assert machine.try_lock_for_buy(1)
+        assert machine.get_tier(1).state == TierState.LOCKED
+
+
+class TestOrderRecords:
+    """OrderManager 주문/체결 기록 테스트"""
+
+    @pytest.fixture
+    def engine(self, grid_settings_tier1_enabled):
+        return GridEngineV4(replace(grid_settings_tier1_enabled, tier1_auto_update=False))
+
+    @staticmethod
+    def adapter(order_id="A1", status="SUCCESS"):
+        adapter = Mock()
+        adapter.send_order.return_value = {
+            "status": status, "order_id": order_id, "filled_qty": 0, "filled_price": 0.0, "message": "거부"
+        }
+        return adapter
+
+    @staticmethod
+    def buy_signal(engine):
+        return next(s for s in engine.process_tick(engine.calculate_tier_price(3)) if s.action == "BUY")
+
+    def test_order_and_fill_recorded(self, engine, store):
+        engine.state_machine.add_listener(store.save_tier)
+        manager = OrderManager(self.adapter(), engine, "SOXL", wait_for_fill=lambda o, q: (9.9, q), store=store)
+
+        signal = self.buy_signal(engine)
+        manager.submit(signal)
+        manager.shutdown()
+
+        order = store.get_order("A1")
+        assert (order["side"], order["tiers"], order["status"]) == ("BUY", signal.tiers, ORDER_FILLED)
+        assert order["filled_qty"] == signal.quantity
+        assert [(f["quantity"], f["price"]) for f in store.get_fills()] == [(signal.quantity, 9.9)]
+        assert {row["tier_id"] for row in store.load_tiers("FILLED")} == set(signal.tiers)
+
+    def test_unfilled_order_recorded(self, engine, store):
+        manager = OrderManager(self.adapter(), engine, "SOXL", wait_for_fill=lambda o, q: (0.0, 0), store=store)
+
+        manager.submit(self.buy_signal(engine))
+        manager.shutdown()
+
+        order = store.get_order("A1")
+        assert order["status"] == ORDER_FAILED
+        assert "체결 수량 0" in order["error_message"]
+        assert store.get_fills() == []
@@ -10,12 +10,13 @@ Tier State Machine - Phoenix Trading System
 5. [v4.1] 포지션 정보(수량, 평단, 투자금)를 TierInfo에서 통합 관리
 """
 
-import copy
+import heapq
 import threading
 import logging
+from array import array
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Tuple
+from dataclasses import dataclass, field, fields
+from typing import Callable, Optional, Dict, Iterator, List, Sequence, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -61,6 +62,207 @@ class TierInfo:
     retry_count: int = 0
 
 
+class TierView(TierInfo):
+    """
+    [v4.3] 읽기 전용 Tier 정보 (스냅샷 공유용)
+
+    상태머신이 변경 시점에 한 번만 만들어 여러 조회자가 복사 없이 공유한다.
+    """
+
+    @classmethod
+    def of(cls, tier) -> "TierView":
+        """TierInfo 또는 TierRecord에서 뷰 생성"""
+        view = object.__new__(cls)
+        view.__dict__.update(tier.to_dict() if isinstance(tier, TierRecord) else tier.__dict__)
+        return view
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"TierView는 읽기 전용입니다: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"TierView는 읽기 전용입니다: {name}")
+
+
+@dataclass(frozen=True)
+class TierSnapshot:
+    """[v4.3] 특정 버전의 전체 Tier 상태 (불변, Tier 번호 오름차순)"""
+    version: int
+    tiers: Tuple[TierView, ...]
+    state_counts: Dict[TierState, int] = field(default_factory=dict)
+
+    def by_state(self, state: TierState) -> List[TierView]:
+        """특정 상태의 Tier 목록"""
+        return [tier for tier in self.tiers if tier.state == state]
+
+    def filled(self) -> List[TierView]:
+        """FILLED 상태이면서 quantity > 0인 Tier 목록"""
+        return [
+            tier for tier in self.tiers
+            if tier.state == TierState.FILLED and tier.quantity > 0
+        ]
+
+
+# ============================================
+# [v4.3] 컬럼형 Tier 테이블 (struct-of-arrays)
+# ============================================
+
+_STATES: Tuple[TierState, ...] = tuple(TierState)
+_STATE_CODES: Dict[TierState, int] = {state: code for code, state in enumerate(_STATES)}
+_ABSENT = -1  # 상태 코드: Tier 없음
+
+# 숫자 필드: (이름, array typecode, 기본값)
+_NUMERIC_COLUMNS = (
+    ("buy_price", "d", 0.0),
+    ("sell_price", "d", 0.0),
+    ("ordered_qty", "q", 0),
+    ("filled_qty", "q", 0),
+    ("filled_price", "d", 0.0),
+    ("quantity", "q", 0),
+    ("avg_price", "d", 0.0),
+    ("invested_amount", "d", 0.0),
+    ("retry_count", "q", 0),
+)
+
+# 객체 필드: (이름, 기본값) - 일반 list에 보관
+_OBJECT_COLUMNS = (
+    ("order_id", None),
+    ("opened_at", None),
+    ("last_updated", None),
+    ("error_message", ""),
+)
+
+_FIELD_NAMES = tuple(f.name for f in fields(TierInfo))
+
+
+class TierTable:
+    """
+    [v4.3] Tier 정보 컬럼형 저장소
+
+    Tier 번호를 인덱스로 하는 필드별 배열에 값을 보관한다.
+    (숫자 필드는 array, 문자열/시각 필드는 list)
+    Tier 객체 240개 대신 배열 십여 개만 유지하므로 메모리가 작고,
+    column()으로 가격/수량 배열을 직접 읽어 일괄 연산할 수 있다.
+
+    dict[int, TierInfo]와 같은 방식으로 사용하며,
+    get()/[]는 배열을 직접 읽고 쓰는 TierRecord를 반환한다.
+    """
+
+    __slots__ = ("_state", "_columns", "_count")
+
+    def __init__(self, capacity: int = 0):
+        self._state = array("b", [_ABSENT]) * (capacity + 1)
+        self._columns: Dict[str, object] = {}
+        for name, typecode, default in _NUMERIC_COLUMNS:
+            self._columns[name] = array(typecode, [default]) * (capacity + 1)
+        for name, default in _OBJECT_COLUMNS:
+            self._columns[name] = [default] * (capacity + 1)
+        self._count = 0
+
+    def _ensure(self, tier_id: int):
+        """tier_id를 담을 수 있도록 배열 확장"""
+        grow = tier_id + 1 - len(self._state)
+        if grow <= 0:
+            return
+        self._state.extend(array("b", [_ABSENT]) * grow)
+        for name, typecode, default in _NUMERIC_COLUMNS:
+            self._columns[name].extend(array(typecode, [default]) * grow)
+        for name, default in _OBJECT_COLUMNS:
+            self._columns[name].extend([default] * grow)
+
+    def column(self, name: str):
+        """필드 배열 조회 (읽기 전용으로 사용, 인덱스 = Tier 번호)"""
+        return self._state if name == "state" else self._columns[name]
+
+    # ---------- dict 호환 인터페이스 ----------
+
+    def __contains__(self, tier_id) -> bool:
+        return 0 <= tier_id < len(self._state) and self._state[tier_id] != _ABSENT
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        state = self._state
+        return (tier_id for tier_id in range(len(state)) if state[tier_id] != _ABSENT)
+
+    def __getitem__(self, tier_id: int) -> "TierRecord":
+        if tier_id not in self:
+            raise KeyError(tier_id)
+        return TierRecord(self, tier_id)
+
+    def __setitem__(self, tier_id: int, info: TierInfo):
+        """TierInfo 값으로 Tier 생성/덮어쓰기"""
+        self._ensure(tier_id)
+        if self._state[tier_id] == _ABSENT:
+            self._count += 1
+        record = TierRecord(self, tier_id)
+        for name in _FIELD_NAMES:
+            if name != "tier_id":
+                setattr(record, name, getattr(info, name))
+
+    def get(self, tier_id: int, default=None) -> Optional["TierRecord"]:
+        return TierRecord(self, tier_id) if tier_id in self else default
+
+    def keys(self) -> List[int]:
+        return list(self)
+
+    def values(self) -> List["TierRecord"]:
+        return [TierRecord(self, tier_id) for tier_id in self]
+
+    def items(self) -> List[Tuple[int, "TierRecord"]]:
+        return [(tier_id, TierRecord(self, tier_id)) for tier_id in self]
+
+
+class TierRecord:
+    """
+    [v4.3] TierTable 한 행에 대한 접근자
+
+    TierInfo와 같은 속성 이름으로 배열 값을 읽고 쓴다 (객체 자체는 값을 보관하지 않음).
+    """
+
+    __slots__ = ("_table", "tier_id")
+
+    def __init__(self, table: TierTable, tier_id: int):
+        self._table = table
+        self.tier_id = tier_id
+
+    @property
+    def state(self) -> TierState:
+        return _STATES[self._table._state[self.tier_id]]
+
+    @state.setter
+    def state(self, value: TierState):
+        self._table._state[self.tier_id] = _STATE_CODES[value]
+
+    def to_dict(self) -> Dict:
+        """TierInfo 필드 딕셔너리"""
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+    def __repr__(self) -> str:
+        return f"TierRecord(tier_id={self.tier_id}, state={self.state.name})"
+
+
+def _column_property(name: str, typecode: Optional[str] = None) -> property:
+    """TierRecord 필드 접근 프로퍼티 생성 (정수 컬럼은 int 변환)"""
+    def getter(record):
+        return record._table._columns[name][record.tier_id]
+
+    if typecode == "q":
+        def setter(record, value):
+            record._table._columns[name][record.tier_id] = int(value)
+    else:
+        def setter(record, value):
+            record._table._columns[name][record.tier_id] = value
+
+    return property(getter, setter)
+
+
+for _name, _typecode, _ in _NUMERIC_COLUMNS:
+    setattr(TierRecord, _name, _column_property(_name, _typecode))
+for _name, _ in _OBJECT_COLUMNS:
+    setattr(TierRecord, _name, _column_property(_name))
+
+
 class TierStateMachine:
     """
     Tier 상태 머신 관리자
@@ -90,15 +292,260 @@ class TierStateMachine:
             account_balance: 초기 투자금 (잔고)
         """
         self.total_tiers = total_tiers
-        self._tiers: Dict[int, TierInfo] = {}
+        self._tiers = TierTable(total_tiers)  # [v4.3] 컬럼형 저장소 (dict 호환)
         self._lock = threading.RLock()  # 재진입 가능 Lock
 
         # [v4.1] 잔고 관리 (단일 데이터 소스)
         self.account_balance: float = account_balance
         self.initial_investment: float = account_balance  # 원금 기록
 
+        # [v4.3] 상태 변경 카운터 (전이/체결/가격 변경 시 증가, 캐시 무효화용)
+        self._version: int = 0
+
+        # [v4.3] FILLED Tier 매도가 인덱스 (min-heap, 지연 삭제 방식)
+        # 항목: (sell_price, tier_id) - 상태/가격이 바뀐 항목은 조회 시 폐기
+        self._sell_heap: List[Tuple[float, int]] = []
+
+        # [v4.3] EMPTY Tier 비트맵 (bit i = Tier i가 EMPTY)
+        self._empty_mask: int = 0
+
+        # [v4.3] 읽기 전용 뷰/스냅샷 캐시 + 상태별 개수 (변경 시 증분 갱신)
+        self._views: Dict[int, TierView] = {}
+        self._snapshot: Optional[TierSnapshot] = None
+        self._state_counts: Dict[TierState, int] = {state: 0 for state in TierState}
+        self._counted_states = array("b", [_ABSENT]) * (total_tiers + 1)  # Tier별 집계된 상태 코드
+
+        # [v4.3] 보유 포지션 집계 (FILLED + quantity > 0 Tier 합계, 변경 시 증분 갱신)
+        self._total_quantity: int = 0
+        self._total_invested: float = 0.0
+        self._position_count: int = 0
+        self._position_contrib: Dict[int, Tuple[int, float]] = {}  # tier_id -> (수량, 투자금)
+
+        # [v4.3] Tier 변경 리스너 (영속 저장소 등)
+        self._listeners: List[Callable[[TierView], None]] = []
+
         logger.info(f"TierStateMachine 초기화: {total_tiers}개 Tier, 잔고=${account_balance:.2f}")
 
+    @property
+    def version(self) -> int:
+        """
+        [v4.3] 상태 버전
+
+        Tier 상태, 포지션, 가격이 바뀔 때마다 증가한다.
+        엔진은 이 값이 같으면 캐시한 트리거 가격을 그대로 재사용한다.
+        """
+        return self._version
+
+    def _touch(self, tier: TierRecord):
+        """
+        Tier 변경 기록 (Lock 보유 상태에서 호출)
+
+        버전 증가, 상태별 개수/EMPTY 비트맵/매도가 인덱스 갱신, 읽기 전용 뷰 폐기
+        """
+        self._version += 1
+
+        counted = self._counted_states
+        if tier.tier_id >= len(counted):
+            counted.extend(array("b", [_ABSENT]) * (tier.tier_id + 1 - len(counted)))
+        prev_code = counted[tier.tier_id]
+        code = _STATE_CODES[tier.state]
+        if prev_code != code:
+            if prev_code != _ABSENT:
+                self._state_counts[_STATES[prev_code]] -= 1
+            self._state_counts[tier.state] += 1
+            counted[tier.tier_id] = code
+
+        self._views.pop(tier.tier_id, None)
+        self._index_empty(tier)
+        self._index_sell(tier)
+        self._update_totals(tier)
+
+        if self._listeners:
+            self._notify_listeners(tier)
+
+    def add_listener(self, listener: Callable[[TierView], None]):
+        """
+        [v4.3] Tier 변경 리스너 등록
+
+        Tier 상태/포지션이 바뀔 때마다 변경된 Tier의 읽기 전용 뷰로 호출된다.
+        상태머신 Lock을 잡은 채 호출되므로 짧게 처리해야 하며, 예외는 로그만 남긴다.
+        가격 일괄 갱신(reprice_tiers)은 새로 만들거나 초기화한 Tier만 통지한다.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[TierView], None]):
+        """[v4.3] Tier 변경 리스너 해제"""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify_listeners(self, tier: TierRecord):
+        """Tier 변경 통지 (Lock 보유 상태에서 호출)"""
+        view = self._view(tier)
+        for listener in self._listeners:
+            try:
+                listener(view)
+            except Exception as e:
+                logger.error(f"Tier {tier.tier_id} 변경 리스너 실패: {e}", exc_info=True)
+
+    def _update_totals(self, tier: TierRecord):
+        """보유 포지션 집계 증분 갱신 (Lock 보유 상태에서 호출)"""
+        old = self._position_contrib.pop(tier.tier_id, None)
+        if old is not None:
+            self._total_quantity -= old[0]
+            self._total_invested -= old[1]
+            self._position_count -= 1
+
+        if tier.state == TierState.FILLED and tier.quantity > 0:
+            new = (tier.quantity, tier.quantity * tier.avg_price)
+            self._position_contrib[tier.tier_id] = new
+            self._total_quantity += new[0]
+            self._total_invested += new[1]
+            self._position_count += 1
+
+        # 부동소수점 누적 오차 제거
+        if self._position_count == 0:
+            self._total_invested = 0.0
+
+    def _view(self, tier: TierRecord) -> TierView:
+        """Tier 읽기 전용 뷰 (변경 전까지 재사용, Lock 보유 상태에서 호출)"""
+        view = self._views.get(tier.tier_id)
+        if view is None:
+            view = TierView.of(tier)
+            self._views[tier.tier_id] = view
+        return view
+
+    def snapshot(self) -> TierSnapshot:
+        """
+        [v4.3] 현재 버전의 전체 Tier 스냅샷
+
+        버전이 바뀌지 않았으면 같은 객체를 반환하고, 바뀐 경우에도
+        변경된 Tier의 뷰만 새로 만든다 (나머지는 이전 뷰 공유).
+
+        Returns:
+            TierSnapshot: 불변 스냅샷 (호출자 간 공유, 수정 금지)
+        """
+        with self._lock:
+            snap = self._snapshot
+            if snap is None or snap.version != self._version:
+                snap = TierSnapshot(
+                    version=self._version,
+                    tiers=tuple(self._view(tier) for tier in self._tiers.values()),
+                    state_counts=dict(self._state_counts),
+                )
+                self._snapshot = snap
+            return snap
+
+    def count_by_state(self, state: TierState) -> int:
+        """[v4.3] 특정 상태의 Tier 개수 (O(1))"""
+        with self._lock:
+            return self._state_counts[state]
+
+    def _index_empty(self, tier: TierRecord):
+        """EMPTY 비트맵 갱신 (Lock 보유 상태에서 호출)"""
+        bit = 1 << tier.tier_id
+        if tier.state == TierState.EMPTY:
+            self._empty_mask |= bit
+        else:
+            self._empty_mask &= ~bit
+
+    def iter_empty_tiers(self, start_tier: int, end_tier: int) -> Iterator[int]:
+        """
+        [v4.3] 구간 내 EMPTY Tier 번호 순회 (오름차순, 비트맵 기반)
+
+        호출 시점의 비트맵 스냅샷을 순회하므로, 실제 사용 전에는
+        try_lock_for_buy()로 상태를 다시 확인해야 한다.
+
+        Args:
+            start_tier: 시작 Tier (포함)
+            end_tier: 끝 Tier (포함)
+
+        Yields:
+            int: EMPTY 상태인 Tier 번호
+        """
+        if end_tier < start_tier:
+            return
+        with self._lock:
+            mask = self._empty_mask
+
+        mask = (mask >> start_tier) & ((1 << (end_tier - start_tier + 1)) - 1)
+        while mask:
+            low = mask & -mask
+            yield start_tier + low.bit_length() - 1
+            mask ^= low
+
+    def _index_sell(self, tier: TierRecord):
+        """FILLED Tier를 매도가 인덱스에 등록 (Lock 보유 상태에서 호출)"""
+        if tier.state == TierState.FILLED and tier.quantity > 0:
+            heapq.heappush(self._sell_heap, (tier.sell_price, tier.tier_id))
+
+            # 폐기 항목이 너무 쌓이면 재구성
+            if len(self._sell_heap) > 2 * len(self._tiers) + 16:
+                self._rebuild_sell_index()
+
+    def _rebuild_sell_index(self):
+        """매도가 인덱스 재구성 (Lock 보유 상태에서 호출)"""
+        self._sell_heap = [
+            (tier.sell_price, tier.tier_id)
+            for tier in self._tiers.values()
+            if tier.state == TierState.FILLED and tier.quantity > 0
+        ]
+        heapq.heapify(self._sell_heap)
+
+    def _is_live_sell_entry(self, sell_price: float, tier_id: int) -> bool:
+        """인덱스 항목이 현재 상태와 일치하는지 확인 (Lock 보유 상태에서 호출)"""
+        tier = self._tiers.get(tier_id)
+        return (
+            tier is not None
+            and tier.state == TierState.FILLED
+            and tier.quantity > 0
+            and tier.sell_price == sell_price
+        )
+
+    def peek_min_sell_price(self) -> float:
+        """
+        [v4.3] FILLED Tier 중 최저 매도가 (O(1), 폐기 항목 정리 포함)
+
+        Returns:
+            float: 최저 매도가 (보유 Tier 없으면 +inf)
+        """
+        with self._lock:
+            heap = self._sell_heap
+            while heap and not self._is_live_sell_entry(*heap[0]):
+                heapq.heappop(heap)
+            return heap[0][0] if heap else float("inf")
+
+    def get_sell_candidates(self, current_price: float) -> List[TierInfo]:
+        """
+        [v4.3] 현재가가 매도가 이상인 FILLED Tier 조회 - O(k log n)
+
+        매도가 인덱스에서 도달한 항목만 꺼내고 다시 넣는다
+        (주문이 실패해도 FILLED 상태는 그대로이므로 인덱스 유지)
+
+        Args:
+            current_price: 현재가
+
+        Returns:
+            매도 대상 Tier 리스트 (읽기 전용 뷰, Tier 번호 내림차순)
+        """
+        with self._lock:
+            heap = self._sell_heap
+            crossed: Dict[int, TierInfo] = {}
+
+            while heap and heap[0][0] <= current_price:
+                sell_price, tier_id = heapq.heappop(heap)
+                if tier_id not in crossed and self._is_live_sell_entry(sell_price, tier_id):
+                    crossed[tier_id] = self._tiers[tier_id]
+
+            for tier in crossed.values():
+                heapq.heappush(heap, (tier.sell_price, tier.tier_id))
+
+            return [
+                self._view(crossed[tier_id])
+                for tier_id in sorted(crossed, reverse=True)
+            ]
+
     def initialize_tier(self, tier_id: int, buy_price: float, sell_price: float):
         """Tier 초기화"""
         with self._lock:
@@ -109,16 +556,147 @@ class TierStateMachine:
                 sell_price=sell_price,
                 last_updated=datetime.now()
             )
+            self._touch(self._tiers[tier_id])
             logger.debug(f"Tier {tier_id} 초기화: 매수가=${buy_price:.2f}, 매도가=${sell_price:.2f}")
 
+    def reprice_tiers(
+        self,
+        buy_prices: Sequence[float],
+        sell_prices: Sequence[float],
+        first_tier: int = 1,
+        reset_unfilled: bool = False
+    ) -> int:
+        """
+        [v4.3] 연속된 Tier 가격 일괄 갱신 (단일 Lock, 버전 1회 증가)
+
+        기존 Tier는 상태/주문/포지션 정보를 보존하고 가격 컬럼만 덮어쓴다.
+        없는 Tier는 EMPTY로 생성한다.
+
+        Args:
+            buy_prices: first_tier부터 순서대로 매수가
+            sell_prices: first_tier부터 순서대로 매도가
+            first_tier: 첫 Tier 번호
+            reset_unfilled: True면 보유 중(FILLED + quantity > 0)이 아닌 Tier를 EMPTY로 초기화
+
+        Returns:
+            int: 상태를 보존한 보유 Tier 개수
+        """
+        if len(buy_prices) != len(sell_prices):
+            raise ValueError("buy_prices와 sell_prices 길이가 다릅니다")
+
+        with self._lock:
+            table = self._tiers
+            last_tier = first_tier + len(buy_prices) - 1
+            table._ensure(last_tier)
+            states = table.column("state")
+            quantities = table.column("quantity")
+            filled_code = _STATE_CODES[TierState.FILLED]
+            now = datetime.now()
+            preserved = 0
+
+            for offset, tier_id in enumerate(range(first_tier, last_tier + 1)):
+                code = states[tier_id]
+                if code == filled_code and quantities[tier_id] > 0:
+                    preserved += 1
+                elif code == _ABSENT or reset_unfilled:
+                    table[tier_id] = TierInfo(
+                        tier_id=tier_id,
+                        state=TierState.EMPTY,
+                        buy_price=buy_prices[offset],
+                        sell_price=sell_prices[offset],
+                        last_updated=now
+                    )
+                    self._touch(table[tier_id])
+
+            # 가격 컬럼 일괄 덮어쓰기
+            table.column("buy_price")[first_tier:last_tier + 1] = array("d", buy_prices)
+            table.column("sell_price")[first_tier:last_tier + 1] = array("d", sell_prices)
+
+            # 가격이 바뀐 뷰/매도가 인덱스 재구성
+            self._views.clear()
+            self._rebuild_sell_index()
+            self._version += 1
+
+            logger.debug(f"Tier {first_tier}~{last_tier} 가격 일괄 갱신 (보존: {preserved}개)")
+            return preserved
+
+    def set_tier_prices(self, tier_id: int, buy_price: float, sell_price: float) -> bool:
+        """
+        [v4.3] Tier 가격만 갱신 (상태/주문/포지션 정보 보존)
+
+        Args:
+            tier_id: Tier 번호
+            buy_price: 새 매수 목표가
+            sell_price: 새 매도 목표가
+
+        Returns:
+            bool: 성공 여부 (Tier 없으면 False)
+        """
+        with self._lock:
+            tier = self._tiers.get(tier_id)
+            if not tier:
+                return False
+            tier.buy_price = buy_price
+            tier.sell_price = sell_price
+            self._touch(tier)
+            return True
+
+    def restore_position(
+        self,
+        tier_id: int,
+        quantity: int,
+        avg_price: float,
+        invested_amount: float,
+        opened_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        [v4.3] 보유 포지션 직접 복원 (전이 검증 및 잔고 변경 없음)
+
+        하위 호환 positions setter 등 외부 데이터로 상태를 재구성할 때만 사용
+
+        Returns:
+            bool: 성공 여부 (Tier 없으면 False)
+        """
+        with self._lock:
+            tier = self._tiers.get(tier_id)
+            if not tier:
+                return False
+            tier.state = TierState.FILLED
+            tier.quantity = quantity
+            tier.avg_price = avg_price
+            tier.invested_amount = invested_amount
+            tier.opened_at = opened_at
+            tier.last_updated = datetime.now()
+            self._touch(tier)
+            return True
+
+    def reset_tier(self, tier_id: int) -> bool:
+        """
+        [v4.3] Tier를 EMPTY로 강제 초기화 (포지션 정보 삭제, 잔고 변경 없음)
+
+        Returns:
+            bool: 성공 여부 (Tier 없으면 False)
+        """
+        with self._lock:
+            tier = self._tiers.get(tier_id)
+            if not tier:
+                return False
+            tier.state = TierState.EMPTY
+            tier.quantity = 0
+            tier.avg_price = 0.0
+            tier.invested_amount = 0.0
+            tier.opened_at = None
+            tier.last_updated = datetime.now()
+            self._touch(tier)
+            return True
+
     def get_tier(self, tier_id: int) -> Optional[TierInfo]:
         """Tier 정보 조회 (읽기 전용)"""
         with self._lock:
             tier = self._tiers.get(tier_id)
             if tier:
-                # 복사본 반환 (외부 수정 방지)
-                import copy
-                return copy.deepcopy(tier)
+                # [v4.3] 읽기 전용 뷰 반환 (외부 수정 방지, 변경 전까지 재사용)
+                return self._view(tier)
             return None
 
     def can_transition(self, tier_id: int, new_state: TierState) -> bool:
@@ -194,6 +772,8 @@ class TierStateMachine:
             if error_message:
                 tier.error_message = error_message
 
+            self._touch(tier)
+
             logger.info(
                 f"Tier {tier_id}: {old_state.value} → {new_state.value} "
                 f"(주문={order_id}, 체결={filled_qty}주)"
@@ -220,6 +800,62 @@ class TierStateMachine:
                 logger.debug(f"Tier {tier_id}: 이미 사용 중 (상태={tier.state.value})")
                 return False
 
+    def try_lock_for_sell(self, tier_id: int) -> bool:
+        """
+        [v4.3] 매도 신호 생성 시 Tier 예약 (FILLED → SELLING, 주문번호 비움)
+
+        매수의 LOCKED와 같은 역할로, 주문번호가 붙기 전까지 다음 틱에서
+        같은 Tier로 매도 신호가 다시 생성되지 않게 한다.
+
+        Returns:
+            bool: 예약 성공 여부
+        """
+        with self._lock:
+            tier = self._tiers.get(tier_id)
+            if not tier or tier.state != TierState.FILLED or tier.quantity <= 0:
+                return False
+            tier.order_id = None
+            return self.transition(tier_id, TierState.SELLING)
+
+    def mark_selling(self, tier_id: int, order_id: str) -> bool:
+        """
+        [v4.3] 매도 주문 전송 완료 마킹
+
+        FILLED면 SELLING으로 전이하고, try_lock_for_sell()로 예약된 SELLING이면 주문번호만 기록한다.
+        """
+        with self._lock:
+            tier = self._tiers.get(tier_id)
+            if not tier:
+                return False
+            if tier.state == TierState.FILLED:
+                return self.transition(tier_id, TierState.SELLING, order_id=order_id)
+            if tier.state == TierState.SELLING and not tier.order_id:
+                tier.order_id = order_id
+                tier.last_updated = datetime.now()
+                self._touch(tier)
+                return True
+            return False
+
+    def reassign_order(self, tier_id: int, old_order_id: str, new_order_id: str) -> bool:
+        """
+        [v4.3] 주문번호 교체 (예약 번호 → 브로커 주문번호)
+
+        Returns:
+            bool: 성공 여부 (ORDERING/SELLING이 아니거나 현재 주문번호가 다르면 False)
+        """
+        with self._lock:
+            tier = self._tiers.get(tier_id)
+            if (
+                not tier
+                or tier.state not in (TierState.ORDERING, TierState.SELLING)
+                or tier.order_id != old_order_id
+            ):
+                return False
+            tier.order_id = new_order_id
+            tier.last_updated = datetime.now()
+            self._touch(tier)
+            return True
+
     def unlock(self, tier_id: int, restore_state: TierState):
         """Tier Unlock (원래 상태로 복원)"""
         with self._lock:
@@ -270,14 +906,8 @@ class TierStateMachine:
             return self.transition(tier_id, TierState.ERROR, error_message=error_message)
 
     def get_tiers_by_state(self, state: TierState) -> List[TierInfo]:
-        """특정 상태의 모든 Tier 조회"""
-        with self._lock:
-            import copy
-            return [
-                copy.deepcopy(tier)
-                for tier in self._tiers.values()
-                if tier.state == state
-            ]
+        """특정 상태의 모든 Tier 조회 (읽기 전용 뷰)"""
+        return self.snapshot().by_state(state)
 
     def fill_tier(self, tier_id: int, quantity: int, price: float) -> bool:
         """
@@ -303,6 +933,7 @@ class TierStateMachine:
             tier.avg_price = price
             tier.invested_amount = invested
             tier.opened_at = datetime.now()
+            self._touch(tier)
 
             # 잔고 차감
             self.account_balance -= invested
@@ -353,6 +984,7 @@ class TierStateMachine:
             tier.avg_price = 0.0
             tier.invested_amount = 0.0
             tier.opened_at = None
+            self._touch(tier)
 
             return profit, total_proceeds
 
@@ -361,14 +993,30 @@ class TierStateMachine:
         [v4.1] FILLED 상태이면서 quantity > 0인 Tier 목록
 
         Returns:
-            보유 중인 Tier 리스트 (복사본)
+            보유 중인 Tier 리스트 (읽기 전용 뷰)
+        """
+        return self.snapshot().filled()
+
+    def get_trigger_bounds(self, start_tier: int = 1) -> Tuple[float, float]:
+        """
+        [v4.3] 다음 매수/매도 트리거 가격 조회
+
+        Args:
+            start_tier: 매수 대상 시작 Tier (Tier 1 거래 비활성화 시 2)
+
+        Returns:
+            Tuple[float, float]: (EMPTY Tier 중 최고 매수가, FILLED Tier 중 최저 매도가)
+            해당 Tier가 없으면 각각 -inf, +inf
         """
         with self._lock:
-            return [
-                copy.deepcopy(tier)
-                for tier in self._tiers.values()
-                if tier.state == TierState.FILLED and tier.quantity > 0
-            ]
+            # [v4.3] EMPTY 비트맵 + 매수가 컬럼으로 일괄 조회
+            buy_prices = self._tiers.column("buy_price")
+            next_buy = max(
+                (buy_prices[tier_id] for tier_id in self.iter_empty_tiers(start_tier, len(buy_prices) - 1)),
+                default=float("-inf")
+            )
+
+            return next_buy, self.peek_min_sell_price()
 
     def get_total_positions(self, current_price: float = 0.0) -> Dict:
         """
@@ -381,15 +1029,10 @@ class TierStateMachine:
             Dict: 집계 정보
         """
         with self._lock:
-            total_quantity = 0
-            total_invested = 0.0
-            position_count = 0
-
-            for tier in self._tiers.values():
-                if tier.state == TierState.FILLED and tier.quantity > 0:
-                    total_quantity += tier.quantity
-                    total_invested += tier.quantity * tier.avg_price
-                    position_count += 1
+            # [v4.3] 증분 집계값 사용 (O(1), 잔고와 같은 Lock 안에서 일관성 보장)
+            total_quantity = self._total_quantity
+            total_invested = self._total_invested
+            position_count = self._position_count
 
             stock_value = total_quantity * current_price if current_price > 0 else 0.0
 